@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Benchmarking the BasicTokenizer and WordpieceTokenizer of the slow BERT tokenizer against the character loops """
+
+import argparse
+import glob
+import os
+import time
+import unicodedata
+
+import transformers
+from transformers import BertTokenizer
+from transformers.models.bert.tokenization_bert import BasicTokenizer, WordpieceTokenizer, whitespace_tokenize
+from transformers.tokenization_utils import _is_control, _is_whitespace
+
+
+class CharacterLoopBasicTokenizer(BasicTokenizer):
+    """The BasicTokenizer previously used by the slow BERT tokenizer, looping over the characters in Python."""
+
+    def tokenize(self, text, never_split=None):
+        never_split = self.never_split.union(set(never_split)) if never_split else self.never_split
+        text = self._clean_text(text)
+        if self.tokenize_chinese_chars:
+            text = self._tokenize_chinese_chars(text)
+        orig_tokens = whitespace_tokenize(text)
+        split_tokens = []
+        for token in orig_tokens:
+            if token not in never_split:
+                if self.do_lower_case:
+                    token = token.lower()
+                    if self.strip_accents is not False:
+                        token = self._run_strip_accents(token)
+                elif self.strip_accents:
+                    token = self._run_strip_accents(token)
+            split_tokens.extend(self._run_split_on_punc(token, never_split))
+        return whitespace_tokenize(" ".join(split_tokens))
+
+    def _run_strip_accents(self, text):
+        text = unicodedata.normalize("NFD", text)
+        return "".join(char for char in text if unicodedata.category(char) != "Mn")
+
+    def _tokenize_chinese_chars(self, text):
+        output = []
+        for char in text:
+            if self._is_chinese_char(ord(char)):
+                output.extend((" ", char, " "))
+            else:
+                output.append(char)
+        return "".join(output)
+
+    def _clean_text(self, text):
+        output = []
+        for char in text:
+            cp = ord(char)
+            if cp == 0 or cp == 0xFFFD or _is_control(char):
+                continue
+            output.append(" " if _is_whitespace(char) else char)
+        return "".join(output)
+
+
+class ScanningWordpieceTokenizer(WordpieceTokenizer):
+    """The WordpieceTokenizer previously used by the slow BERT tokenizer, trying every prefix from the longest."""
+
+    def tokenize(self, text):
+        output_tokens = []
+        for token in whitespace_tokenize(text):
+            chars = list(token)
+            if len(chars) > self.max_input_chars_per_word:
+                output_tokens.append(self.unk_token)
+                continue
+            is_bad = False
+            start = 0
+            sub_tokens = []
+            while start < len(chars):
+                end = len(chars)
+                cur_substr = None
+                while start < end:
+                    substr = "".join(chars[start:end])
+                    if start > 0:
+                        substr = "##" + substr
+                    if substr in self.vocab:
+                        cur_substr = substr
+                        break
+                    end -= 1
+                if cur_substr is None:
+                    is_bad = True
+                    break
+                sub_tokens.append(cur_substr)
+                start = end
+            if is_bad:
+                output_tokens.append(self.unk_token)
+            else:
+                output_tokens.extend(sub_tokens)
+        return output_tokens
+
+
+def get_corpus(args):
+    if args.corpus_file is not None:
+        with open(args.corpus_file, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    else:
+        # the sources of the library are a large corpus available offline
+        lines = []
+        for file in sorted(
+            glob.glob(os.path.join(os.path.dirname(transformers.__file__), "**", "*.py"), recursive=True)
+        ):
+            with open(file, encoding="utf-8") as f:
+                lines.extend(f.read().splitlines())
+    lines = [line for line in lines if line.strip()]
+    return lines[: args.max_lines] if args.max_lines is not None else lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokenizer_name_or_path", type=str, default="bert-base-uncased")
+    parser.add_argument("--vocab_file", type=str, default=None, help="Vocabulary file used instead of the tokenizer.")
+    parser.add_argument(
+        "--corpus_file", type=str, default=None, help="Text file to tokenize, defaults to the library sources."
+    )
+    parser.add_argument("--max_lines", type=int, default=None)
+    parser.add_argument("--cased", action="store_true", help="Do not lower case with --vocab_file.")
+    args = parser.parse_args()
+
+    if args.vocab_file is not None:
+        tokenizer = BertTokenizer(args.vocab_file, do_lower_case=not args.cased)
+    else:
+        tokenizer = BertTokenizer.from_pretrained(args.tokenizer_name_or_path)
+    lines = get_corpus(args)
+    print(f"{len(lines)} lines of {sum(len(line) for line in lines)} characters")
+
+    basic_tokenizer = tokenizer.basic_tokenizer
+    loop_basic_tokenizer = CharacterLoopBasicTokenizer(
+        do_lower_case=basic_tokenizer.do_lower_case,
+        never_split=basic_tokenizer.never_split,
+        tokenize_chinese_chars=basic_tokenizer.tokenize_chinese_chars,
+        strip_accents=basic_tokenizer.strip_accents,
+    )
+    for name, basic in (("character loops", loop_basic_tokenizer), ("translation tables", basic_tokenizer)):
+        start_time = time.time()
+        words = [basic.tokenize(line) for line in lines]
+        print(f"{name}: basic tokenization in {time.time() - start_time:.2f}s")
+        if basic is loop_basic_tokenizer:
+            expected_words = words
+        elif words != expected_words:
+            raise ValueError("The basic tokenization differs from the character loops.")
+
+    words = [word for line_words in expected_words for word in line_words]
+    wordpiece_tokenizer = tokenizer.wordpiece_tokenizer
+    scanning_wordpiece_tokenizer = ScanningWordpieceTokenizer(
+        vocab=wordpiece_tokenizer.vocab,
+        unk_token=wordpiece_tokenizer.unk_token,
+        max_input_chars_per_word=wordpiece_tokenizer.max_input_chars_per_word,
+    )
+    # build the prefix tables outside of the timed loop
+    wordpiece_tokenizer.tokenize("")
+    for name, wordpiece in (("prefix scanning", scanning_wordpiece_tokenizer), ("prefix tables", wordpiece_tokenizer)):
+        start_time = time.time()
+        tokens = [wordpiece.tokenize(word) for word in words]
+        print(f"{name}: wordpiece tokenization of {len(words)} words in {time.time() - start_time:.2f}s")
+        if wordpiece is scanning_wordpiece_tokenizer:
+            expected_tokens = tokens
+        elif tokens != expected_tokens:
+            raise ValueError("The wordpiece tokenization differs from the prefix scanning.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Benchmarking the priority queue BPE merges and the BPE cache of the slow BPE tokenizers against the merge loop """
+
+import argparse
+import glob
+import inspect
+import os
+import time
+
+import transformers
+from transformers import AutoTokenizer
+from transformers.tokenization_utils import BPECache, bpe_merge
+
+
+def loop_bpe_merge(word, bpe_ranks):
+    """The merge loop previously used by the slow BPE tokenizers, rescanning all the pairs after each merge."""
+    pairs = set(zip(word[:-1], word[1:]))
+    while pairs:
+        bigram = min(pairs, key=lambda pair: bpe_ranks.get(pair, float("inf")))
+        if bigram not in bpe_ranks:
+            break
+        first, second = bigram
+        new_word = []
+        i = 0
+        while i < len(word):
+            try:
+                j = word.index(first, i)
+            except ValueError:
+                new_word.extend(word[i:])
+                break
+            else:
+                new_word.extend(word[i:j])
+                i = j
+
+            if word[i] == first and i < len(word) - 1 and word[i + 1] == second:
+                new_word.append(first + second)
+                i += 2
+            else:
+                new_word.append(word[i])
+                i += 1
+        word = tuple(new_word)
+        if len(word) == 1:
+            break
+        pairs = set(zip(word[:-1], word[1:]))
+    return word
+
+
+def get_corpus(args):
+    if args.corpus_file is not None:
+        with open(args.corpus_file, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    else:
+        # the sources of the library are a large corpus available offline
+        lines = []
+        for file in sorted(
+            glob.glob(os.path.join(os.path.dirname(transformers.__file__), "**", "*.py"), recursive=True)
+        ):
+            with open(file, encoding="utf-8") as f:
+                lines.extend(f.read().splitlines())
+    lines = [line for line in lines if line.strip()]
+    return lines[: args.max_lines] if args.max_lines is not None else lines
+
+
+def tokenize_corpus(tokenizer, lines, merge_fn, cache):
+    # the tokenizers call the bpe_merge function of their module
+    bpe_module = inspect.getmodule(type(tokenizer).bpe)
+    bpe_module.bpe_merge = merge_fn
+    tokenizer.cache = cache
+    start_time = time.time()
+    try:
+        for line in lines:
+            tokenizer.tokenize(line)
+    finally:
+        bpe_module.bpe_merge = bpe_merge
+    return time.time() - start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokenizer_name_or_path", type=str, default="gpt2")
+    parser.add_argument(
+        "--corpus_file", type=str, default=None, help="Text file to tokenize, defaults to the library sources."
+    )
+    parser.add_argument("--max_lines", type=int, default=None)
+    parser.add_argument("--cache_size", type=int, default=65536, help="Maximum size of the BPECache.")
+    args = parser.parse_args()
+
+    tokenizer = AutoTokenizer.from_pretrained(args.tokenizer_name_or_path, use_fast=False)
+    if not hasattr(tokenizer, "bpe_ranks"):
+        raise ValueError(f"{tokenizer.__class__.__name__} is not a BPE tokenizer.")
+    lines = get_corpus(args)
+
+    # collect the words given to the merges
+    words = []
+
+    def recording_bpe_merge(word, bpe_ranks):
+        words.append(word)
+        return bpe_merge(word, bpe_ranks)
+
+    tokenize_corpus(tokenizer, lines, recording_bpe_merge, BPECache(max_size=None))
+    print(f"{len(lines)} lines, {len(words)} unique words of {sum(len(word) for word in words)} symbols")
+
+    for name, merge_fn in (("merge loop", loop_bpe_merge), ("priority queue", bpe_merge)):
+        start_time = time.time()
+        merged_words = [merge_fn(word, tokenizer.bpe_ranks) for word in words]
+        print(f"{name}: merged the unique words in {time.time() - start_time:.2f}s")
+        if merge_fn is loop_bpe_merge:
+            expected_merged_words = merged_words
+        elif merged_words != expected_merged_words:
+            raise ValueError("The priority queue merges differ from the merge loop.")
+
+    for name, merge_fn in (("merge loop", loop_bpe_merge), ("priority queue", bpe_merge)):
+        elapsed = tokenize_corpus(tokenizer, lines, merge_fn, BPECache(max_size=0))
+        print(f"{name}: tokenized the corpus without cache in {elapsed:.2f}s")
+
+    cache = BPECache(max_size=args.cache_size)
+    elapsed = tokenize_corpus(tokenizer, lines, bpe_merge, cache)
+    hit_rate = cache.hits / max(cache.hits + cache.misses, 1)
+    print(
+        f"priority queue: tokenized the corpus with a cache of {args.cache_size} words in {elapsed:.2f}s "
+        f"({cache.hits} hits, {cache.misses} misses, hit rate {hit_rate:.1%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
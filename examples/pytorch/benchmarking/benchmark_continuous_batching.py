@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Benchmarking continuous batching against static batching for generation with skewed output lengths """
+
+import argparse
+import random
+import time
+
+import torch
+
+from transformers import (
+    AutoConfig,
+    AutoModelForCausalLM,
+    ContinuousBatchingScheduler,
+    GenerationRequest,
+    MaxLengthCriteria,
+    StoppingCriteriaList,
+)
+
+
+def get_requests(args, vocab_size):
+    rng = random.Random(args.seed)
+    requests = []
+    for request_idx in range(args.num_requests):
+        prompt_length = rng.randint(args.min_prompt_length, args.max_prompt_length)
+        # most requests are short, a few are long: the long ones stall static batches
+        if rng.random() < args.long_fraction:
+            max_new_tokens = args.max_new_tokens
+        else:
+            max_new_tokens = rng.randint(1, max(1, args.max_new_tokens // 8))
+        input_ids = torch.tensor([rng.randrange(vocab_size - 1) for _ in range(prompt_length)])
+        stopping_criteria = StoppingCriteriaList([MaxLengthCriteria(max_length=prompt_length + max_new_tokens)])
+        requests.append(
+            GenerationRequest(input_ids=input_ids, stopping_criteria=stopping_criteria, request_id=request_idx)
+        )
+    return requests
+
+
+def run_static_batching(model, requests, batch_size, pad_token_id):
+    for start in range(0, len(requests), batch_size):
+        batch = requests[start : start + batch_size]
+        max_prompt_length = max(len(request.input_ids) for request in batch)
+        input_ids = torch.full((len(batch), max_prompt_length), pad_token_id, dtype=torch.long)
+        attention_mask = torch.zeros_like(input_ids)
+        for batch_idx, request in enumerate(batch):
+            input_ids[batch_idx, max_prompt_length - len(request.input_ids) :] = request.input_ids
+            attention_mask[batch_idx, max_prompt_length - len(request.input_ids) :] = 1
+        max_new_tokens = max(request.stopping_criteria[0].max_length - len(request.input_ids) for request in batch)
+        model.generate(
+            input_ids.to(model.device),
+            attention_mask=attention_mask.to(model.device),
+            max_length=max_prompt_length + max_new_tokens,
+            pad_token_id=pad_token_id,
+        )
+
+
+def run_continuous_batching(model, requests, batch_size, pad_token_id):
+    scheduler = ContinuousBatchingScheduler(model, max_batch_size=batch_size, pad_token_id=pad_token_id)
+    for _ in scheduler.generate(requests):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model_name_or_path", type=str, default="gpt2")
+    parser.add_argument(
+        "--random_weights",
+        action="store_true",
+        help="Only download the configuration and use a small randomly initialized model.",
+    )
+    parser.add_argument("--num_requests", type=int, default=64)
+    parser.add_argument("--batch_size", type=int, default=8)
+    parser.add_argument("--min_prompt_length", type=int, default=4)
+    parser.add_argument("--max_prompt_length", type=int, default=32)
+    parser.add_argument("--max_new_tokens", type=int, default=128)
+    parser.add_argument("--long_fraction", type=float, default=0.1, help="Fraction of requests using max_new_tokens.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no_cuda", action="store_true")
+    args = parser.parse_args()
+
+    device = torch.device("cuda" if torch.cuda.is_available() and not args.no_cuda else "cpu")
+    if args.random_weights:
+        config = AutoConfig.from_pretrained(args.model_name_or_path, n_layer=2)
+        model = AutoModelForCausalLM.from_config(config)
+    else:
+        model = AutoModelForCausalLM.from_pretrained(args.model_name_or_path)
+    model.to(device).eval()
+    # generate until the requested length so that both strategies produce the same number of tokens
+    model.config.eos_token_id = None
+    pad_token_id = model.config.pad_token_id if model.config.pad_token_id is not None else 0
+
+    requests = get_requests(args, model.config.vocab_size)
+    num_new_tokens = sum(request.stopping_criteria[0].max_length - len(request.input_ids) for request in requests)
+
+    for name, run in (("static batching", run_static_batching), ("continuous batching", run_continuous_batching)):
+        start_time = time.time()
+        with torch.no_grad():
+            run(model, requests, args.batch_size, pad_token_id)
+        elapsed = time.time() - start_time
+        print(f"{name}: {elapsed:.2f}s, {num_new_tokens / elapsed:.1f} generated tokens/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Benchmarking the time and the number of modules needed to import the library in a fresh interpreter """
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+# Run in the child interpreter: times the statement and reports the modules it imported.
+MEASURE_SCRIPT = """
+import json
+import sys
+import time
+
+modules_before = set(sys.modules)
+start_time = time.perf_counter()
+{statement}
+elapsed_time = time.perf_counter() - start_time
+new_modules = set(sys.modules) - modules_before
+print(json.dumps({{
+    "time": elapsed_time,
+    "num_modules": len(new_modules),
+    "num_transformers_modules": len([name for name in new_modules if name.split(".")[0] == "transformers"]),
+}}))
+"""
+
+
+def measure(statement, src_dir=None, python=sys.executable):
+    """Runs ``statement`` in a new interpreter and returns its wall time and the number of modules it imported."""
+    env = os.environ.copy()
+    if src_dir is not None:
+        env["PYTHONPATH"] = os.pathsep.join([os.path.abspath(src_dir)] + env.get("PYTHONPATH", "").split(os.pathsep))
+    script = MEASURE_SCRIPT.format(statement=statement)
+    result = subprocess.run([python, "-c", script], env=env, check=True, capture_output=True)
+    return json.loads(result.stdout.decode().strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--statements",
+        type=str,
+        nargs="+",
+        default=[
+            "import transformers",
+            "from transformers import AutoModel",
+            "from transformers import AutoTokenizer",
+        ],
+        help="The statements to time, each one is run in a new interpreter.",
+    )
+    parser.add_argument(
+        "--src_dirs",
+        type=str,
+        nargs="*",
+        default=None,
+        help="Source directories of the library to compare (e.g. the `src` folder of two checkouts of the repo), "
+        "defaults to the installed library.",
+    )
+    parser.add_argument("--num_runs", type=int, default=5)
+    args = parser.parse_args()
+
+    src_dirs = args.src_dirs if args.src_dirs else [None]
+    print(f"{'source':<30} {'statement':<45} {'time (s)':>9} {'modules':>8} {'transformers modules':>21}")
+    for statement in args.statements:
+        for src_dir in src_dirs:
+            results = [measure(statement, src_dir=src_dir) for _ in range(args.num_runs)]
+            elapsed_time = statistics.median(result["time"] for result in results)
+            source = "installed" if src_dir is None else src_dir
+            print(
+                f"{source:<30} {statement:<45} {elapsed_time:>9.2f} {results[-1]['num_modules']:>8} "
+                f"{results[-1]['num_transformers_modules']:>21}"
+            )
+
+
+if __name__ == "__main__":
+    main()
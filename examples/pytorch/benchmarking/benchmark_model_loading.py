@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Benchmarking the time and the memory needed by `from_pretrained` to load a model in a fresh interpreter """
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+
+# The keyword arguments of `from_pretrained` for each loading mode
+LOADING_MODES = {
+    "default": {},
+    "use_mmap": {"use_mmap": True},
+    "low_cpu_mem_usage": {"low_cpu_mem_usage": True},
+    "parallel_shards": {"num_loading_workers": 4},
+}
+
+# Run in the child interpreter: loads the model, then reads all its weights so that they are resident in memory.
+MEASURE_SCRIPT = """
+import json
+import resource
+import threading
+import time
+
+import torch
+import transformers
+
+
+def memory_status():
+    with open("/proc/self/status") as f:
+        status = dict(line.split(":", 1) for line in f)
+    return {{key: int(status[key].split()[0]) / 1024 for key in ("VmRSS", "RssAnon", "RssFile")}}
+
+
+model_class = getattr(transformers, "{model_class}")
+kwargs = json.loads('{kwargs}')
+if "torch_dtype" in kwargs and kwargs["torch_dtype"] != "auto":
+    kwargs["torch_dtype"] = getattr(torch, kwargs["torch_dtype"])
+
+# The peak of RSS also counts the pages of a memory-mapped checkpoint, so the private memory is sampled during the load
+peak_private = [0]
+loaded = threading.Event()
+
+
+def sample_private_memory():
+    while not loaded.wait(0.005):
+        peak_private[0] = max(peak_private[0], memory_status()["RssAnon"])
+
+
+sampler = threading.Thread(target=sample_private_memory)
+status_before = memory_status()
+sampler.start()
+start_time = time.perf_counter()
+model = model_class.from_pretrained("{model_name_or_path}", **kwargs)
+elapsed_time = time.perf_counter() - start_time
+loaded.set()
+sampler.join()
+peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+with torch.no_grad():
+    for param in model.parameters():
+        param.sum()
+status = memory_status()
+print(json.dumps({{
+    "time": elapsed_time,
+    "peak": peak_rss - status_before["VmRSS"],
+    "peak_private": max(peak_private[0], status["RssAnon"]) - status_before["RssAnon"],
+    "private": status["RssAnon"],
+    "shared": status["RssFile"],
+}}))
+"""
+
+
+def measure(model_name_or_path, model_class="AutoModel", python=sys.executable, **kwargs):
+    """
+    Loads a model in a new interpreter and returns the time taken by ``from_pretrained``, the peaks of memory and of
+    private memory during the load and the private and file-backed (shareable) memory of the process once all the
+    weights have been read, in MB.
+    """
+    script = MEASURE_SCRIPT.format(
+        model_class=model_class, model_name_or_path=model_name_or_path, kwargs=json.dumps(kwargs)
+    )
+    result = subprocess.run([python, "-c", script], check=True, capture_output=True)
+    return json.loads(result.stdout.decode().strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--model_name_or_path",
+        type=str,
+        required=True,
+        help="Checkpoint or local directory of the model, download it beforehand to not measure the download.",
+    )
+    parser.add_argument("--model_class", type=str, default="AutoModel")
+    parser.add_argument(
+        "--modes",
+        type=str,
+        nargs="+",
+        default=list(LOADING_MODES.keys()),
+        choices=list(LOADING_MODES.keys()),
+        help="The loading modes to compare.",
+    )
+    parser.add_argument("--torch_dtype", type=str, default=None, help="e.g. `float16` or `auto`.")
+    parser.add_argument("--num_runs", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'mode':<20} {'time (s)':>9} {'peak (MB)':>10} {'peak private (MB)':>18} {'private (MB)':>13} "
+        f"{'shared (MB)':>12}"
+    )
+    for mode in args.modes:
+        kwargs = dict(LOADING_MODES[mode])
+        if args.torch_dtype is not None:
+            kwargs["torch_dtype"] = args.torch_dtype
+        results = [
+            measure(args.model_name_or_path, model_class=args.model_class, **kwargs) for _ in range(args.num_runs)
+        ]
+        elapsed_time = statistics.median(result["time"] for result in results)
+        peak = statistics.median(result["peak"] for result in results)
+        peak_private = statistics.median(result["peak_private"] for result in results)
+        print(
+            f"{mode:<20} {elapsed_time:>9.2f} {peak:>10.0f} {peak_private:>18.0f} {results[-1]['private']:>13.0f} "
+            f"{results[-1]['shared']:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
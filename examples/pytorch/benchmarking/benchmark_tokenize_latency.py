@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Benchmarking the latency of the slow tokenizers on short texts """
+
+import argparse
+import statistics
+import time
+
+from transformers import AutoTokenizer
+from transformers.models.auto.tokenization_auto import TOKENIZER_MAPPING
+
+
+SHORT_TEXTS = [
+    "Hello world!",
+    "How are you doing today?",
+    "The quick brown fox jumps over the lazy dog.",
+    "I can't believe it's already Friday.",
+    "Transformers provides thousands of pretrained models.",
+    "What is the capital of France?",
+    "Paris.",
+    "This movie was absolutely wonderful, I loved it!",
+]
+
+
+def get_default_tokenizers():
+    """Returns one checkpoint for each slow tokenizer of the library, with the class of the tokenizer."""
+    tokenizers = {}
+    for slow_tokenizer_class, _ in TOKENIZER_MAPPING.values():
+        if slow_tokenizer_class is None or slow_tokenizer_class in tokenizers:
+            continue
+        names = list(getattr(slow_tokenizer_class, "max_model_input_sizes", None) or {})
+        if names:
+            tokenizers[slow_tokenizer_class] = names[0]
+    return [(checkpoint, tokenizer_class) for tokenizer_class, checkpoint in tokenizers.items()]
+
+
+def measure(function, texts, num_runs):
+    """Returns the median latency of ``function`` on one text in microseconds."""
+    for text in texts:
+        function(text)
+    latencies = []
+    for _ in range(num_runs):
+        for text in texts:
+            start_time = time.perf_counter()
+            function(text)
+            latencies.append(time.perf_counter() - start_time)
+    return statistics.median(latencies) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--tokenizer_names",
+        type=str,
+        nargs="*",
+        default=None,
+        help="Checkpoints or local directories of the tokenizers, defaults to one checkpoint per slow tokenizer.",
+    )
+    parser.add_argument(
+        "--texts_file", type=str, default=None, help="File with one short text per line, defaults to a few sentences."
+    )
+    parser.add_argument("--num_runs", type=int, default=200)
+    parser.add_argument(
+        "--num_additional_special_tokens",
+        type=int,
+        default=0,
+        help="Number of additional special tokens added to each tokenizer, e.g. to mimic the 100 extra ids of T5.",
+    )
+    args = parser.parse_args()
+
+    if args.texts_file is not None:
+        with open(args.texts_file, encoding="utf-8") as f:
+            texts = [line for line in f.read().splitlines() if line.strip()]
+    else:
+        texts = SHORT_TEXTS
+    if args.tokenizer_names:
+        tokenizers = [(tokenizer_name, None) for tokenizer_name in args.tokenizer_names]
+    else:
+        tokenizers = get_default_tokenizers()
+
+    print(f"{'tokenizer':<30} {'checkpoint':<40} {'tokenize (us)':>14} {'__call__ (us)':>14}")
+    for tokenizer_name, tokenizer_class in tokenizers:
+        try:
+            if tokenizer_class is None:
+                tokenizer = AutoTokenizer.from_pretrained(tokenizer_name, use_fast=False)
+            else:
+                tokenizer = tokenizer_class.from_pretrained(tokenizer_name)
+        except Exception as e:
+            print(f"Skipping {tokenizer_name}: {e.__class__.__name__}: {str(e).splitlines()[0]}")
+            continue
+        if args.num_additional_special_tokens > 0:
+            tokenizer.add_special_tokens(
+                {"additional_special_tokens": [f"<benchmark_{i}>" for i in range(args.num_additional_special_tokens)]}
+            )
+
+        tokenize_latency = measure(tokenizer.tokenize, texts, args.num_runs)
+        call_latency = measure(tokenizer, texts, args.num_runs)
+        print(
+            f"{tokenizer.__class__.__name__:<30} {tokenizer_name:<40} {tokenize_latency:>14.1f} {call_latency:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
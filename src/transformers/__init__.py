@@ -70,6 +70,7 @@ _import_structure = {
         "SquadFeatures",
         "SquadV1Processor",
         "SquadV2Processor",
+        "StreamingCorpusReader",
         "glue_compute_metrics",
         "glue_convert_examples_to_features",
         "glue_output_modes",
@@ -91,6 +92,7 @@ _import_structure = {
         "TF2_WEIGHTS_NAME",
         "TF_WEIGHTS_NAME",
         "TRANSFORMERS_CACHE",
+        "WEIGHTS_INDEX_NAME",
         "WEIGHTS_NAME",
         "TensorType",
         "add_end_docstrings",
@@ -277,11 +279,13 @@ _import_structure = {
         "ZeroShotClassificationPipeline",
         "pipeline",
     ],
+    "tokenization_cache_utils": ["TokenizationCache"],
     "tokenization_utils": ["PreTrainedTokenizer"],
     "tokenization_utils_base": [
         "AddedToken",
         "BatchEncoding",
         "CharSpan",
+        "IncrementalDecoder",
         "PreTrainedTokenizerBase",
         "SpecialTokensMixin",
         "TokenSpan",
@@ -464,7 +468,13 @@ if is_torch_available():
         "TextDataset",
         "TextDatasetForNextSentencePrediction",
     ]
-    _import_structure["generation_beam_search"] = ["BeamScorer", "BeamSearchScorer"]
+    _import_structure["generation_beam_search"] = ["BeamScorer", "BeamSearchScorer", "TensorizedBeamSearchScorer"]
+    _import_structure["generation_cache_utils"] = ["EncoderOutputCache"]
+    _import_structure["generation_continuous_batching"] = [
+        "ContinuousBatchingScheduler",
+        "GenerationRequest",
+        "GenerationResult",
+    ]
     _import_structure["generation_logits_process"] = [
         "ForcedBOSTokenLogitsProcessor",
         "ForcedEOSTokenLogitsProcessor",
@@ -480,6 +490,7 @@ if is_torch_available():
         "RepetitionPenaltyLogitsProcessor",
         "TemperatureLogitsWarper",
         "TopKLogitsWarper",
+        "TopKTopPLogitsWarper",
         "TopPLogitsWarper",
     ]
     _import_structure["generation_stopping_criteria"] = [
@@ -488,6 +499,7 @@ if is_torch_available():
         "StoppingCriteria",
         "StoppingCriteriaList",
     ]
+    _import_structure["generation_streamers"] = ["TextIteratorStreamer", "TextStreamer"]
     _import_structure["generation_utils"] = ["top_k_top_p_filtering"]
     _import_structure["modeling_utils"] = ["Conv1D", "PreTrainedModel", "apply_chunking_to_forward", "prune_layer"]
 
@@ -1695,6 +1707,7 @@ if TYPE_CHECKING:
         SquadFeatures,
         SquadV1Processor,
         SquadV2Processor,
+        StreamingCorpusReader,
         glue_compute_metrics,
         glue_convert_examples_to_features,
         glue_output_modes,
@@ -1720,6 +1733,7 @@ if TYPE_CHECKING:
         TF2_WEIGHTS_NAME,
         TF_WEIGHTS_NAME,
         TRANSFORMERS_CACHE,
+        WEIGHTS_INDEX_NAME,
         WEIGHTS_NAME,
         TensorType,
         add_end_docstrings,
@@ -1907,11 +1921,13 @@ if TYPE_CHECKING:
     )
 
     # Tokenization
+    from .tokenization_cache_utils import TokenizationCache
     from .tokenization_utils import PreTrainedTokenizer
     from .tokenization_utils_base import (
         AddedToken,
         BatchEncoding,
         CharSpan,
+        IncrementalDecoder,
         PreTrainedTokenizerBase,
         SpecialTokensMixin,
         TokenSpan,
@@ -2055,7 +2071,9 @@ if TYPE_CHECKING:
             TextDataset,
             TextDatasetForNextSentencePrediction,
         )
-        from .generation_beam_search import BeamScorer, BeamSearchScorer
+        from .generation_beam_search import BeamScorer, BeamSearchScorer, TensorizedBeamSearchScorer
+        from .generation_cache_utils import EncoderOutputCache
+        from .generation_continuous_batching import ContinuousBatchingScheduler, GenerationRequest, GenerationResult
         from .generation_logits_process import (
             ForcedBOSTokenLogitsProcessor,
             ForcedEOSTokenLogitsProcessor,
@@ -2071,6 +2089,7 @@ if TYPE_CHECKING:
             RepetitionPenaltyLogitsProcessor,
             TemperatureLogitsWarper,
             TopKLogitsWarper,
+            TopKTopPLogitsWarper,
             TopPLogitsWarper,
         )
         from .generation_stopping_criteria import (
@@ -2079,6 +2098,7 @@ if TYPE_CHECKING:
             StoppingCriteria,
             StoppingCriteriaList,
         )
+        from .generation_streamers import TextIteratorStreamer, TextStreamer
         from .generation_utils import top_k_top_p_filtering
         from .modeling_utils import Conv1D, PreTrainedModel, apply_chunking_to_forward, prune_layer
         from .models.albert import (
@@ -16,6 +16,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .corpus_reader import StreamingCorpusReader
 from .metrics import glue_compute_metrics, xnli_compute_metrics
 from .processors import (
     DataProcessor,
@@ -0,0 +1,212 @@
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Streaming reader of large text corpora, e.g. to train tokenizers with
+:meth:`~transformers.PreTrainedTokenizerFast.train_new_from_iterator`.
+"""
+
+import codecs
+import glob
+import gzip
+import io
+import mmap
+import os
+import random
+import time
+from typing import Iterator, List, Optional, Tuple, Union
+
+from tqdm.auto import tqdm
+
+from ..utils import logging
+
+
+logger = logging.get_logger(__name__)
+
+
+class StreamingCorpusReader:
+    """
+    Iterable over the lines of one or several text files, yielded in batches of bounded size so that corpora much
+    larger than the memory can be used, for instance to train a new tokenizer with
+    :meth:`~transformers.PreTrainedTokenizerFast.train_new_from_iterator`. The files are read line by line (or
+    memory-mapped with :obj:`use_mmap=True`) and only the current batch is kept in memory. Files ending with ``.gz`` are
+    decompressed on the fly.
+
+    The reader can be iterated several times, each iteration reads the files again (with the same sampled lines if
+    :obj:`seed` is set). The progress and the throughput are reported with a progress bar over the bytes of the files,
+    and logged at the end of each iteration.
+
+    Args:
+        files (:obj:`str` or :obj:`List[str]`):
+            The paths of the text files, or glob patterns matching them (e.g. ``"corpus/shard-*.txt"``).
+        batch_size (:obj:`int`, `optional`, defaults to 1000):
+            The maximum number of lines in a batch.
+        max_batch_chars (:obj:`int`, `optional`):
+            If set, the maximum number of characters in a batch (a single line longer than that is yielded in its own
+            batch).
+        sample_fraction (:obj:`float`, `optional`, defaults to 1.0):
+            The fraction of the lines to keep, each line being kept with this probability.
+        seed (:obj:`int`, `optional`):
+            The seed of the sampling of the lines. If not set, each iteration samples different lines.
+        skip_empty_lines (:obj:`bool`, `optional`, defaults to :obj:`True`):
+            Whether or not to skip the lines containing only whitespaces.
+        use_mmap (:obj:`bool`, `optional`, defaults to :obj:`False`):
+            Whether or not to memory-map the (uncompressed) files instead of reading them with buffered reads.
+        encoding (:obj:`str`, `optional`, defaults to :obj:`"utf-8"`):
+            The encoding of the files. Undecodable bytes are replaced. The files in an encoding where a line break is not
+            a single newline byte (like UTF-16 or UTF-32) are decoded as text streams, and can't be memory-mapped.
+        disable_progress_bar (:obj:`bool`, `optional`, defaults to :obj:`False`):
+            Whether or not to disable the progress bar.
+
+    Example::
+
+        >>> from transformers import AutoTokenizer, StreamingCorpusReader
+
+        >>> tokenizer = AutoTokenizer.from_pretrained("gpt2")
+        >>> corpus = StreamingCorpusReader("corpus/*.txt.gz", batch_size=1000, sample_fraction=0.1, seed=42)
+        >>> new_tokenizer = tokenizer.train_new_from_iterator(corpus, vocab_size=52000)
+    """
+
+    def __init__(
+        self,
+        files: Union[str, List[str]],
+        batch_size: int = 1000,
+        max_batch_chars: Optional[int] = None,
+        sample_fraction: float = 1.0,
+        seed: Optional[int] = None,
+        skip_empty_lines: bool = True,
+        use_mmap: bool = False,
+        encoding: str = "utf-8",
+        disable_progress_bar: bool = False,
+    ):
+        if batch_size < 1:
+            raise ValueError(f"batch_size should be a positive integer, but is {batch_size}.")
+        if not 0.0 < sample_fraction <= 1.0:
+            raise ValueError(f"sample_fraction should be in ]0, 1], but is {sample_fraction}.")
+
+        self.files = self._resolve_files(files)
+        self.batch_size = batch_size
+        self.max_batch_chars = max_batch_chars
+        self.sample_fraction = sample_fraction
+        self.seed = seed
+        self.skip_empty_lines = skip_empty_lines
+        self.use_mmap = use_mmap
+        self.encoding = codecs.lookup(encoding).name
+        self.disable_progress_bar = disable_progress_bar
+
+        # Statistics of the last iteration
+        self.num_lines = 0
+        self.num_bytes = 0
+        self.num_batches = 0
+
+    @staticmethod
+    def _resolve_files(files: Union[str, List[str]]) -> List[str]:
+        if isinstance(files, str):
+            files = [files]
+        resolved_files = []
+        for pattern in files:
+            if os.path.isfile(pattern):
+                resolved_files.append(pattern)
+                continue
+            matches = sorted(glob.glob(pattern))
+            if not matches:
+                raise FileNotFoundError(f"No file found matching {pattern}.")
+            resolved_files.extend(matches)
+        return resolved_files
+
+    def _iter_raw_lines(self, file: str) -> Iterator[Tuple[Union[bytes, str], int]]:
+        """
+        Yields the lines of :obj:`file` with the number of bytes read for each of them. The lines are split on the
+        newline bytes and decoded later when the encoding allows it, and decoded as a text stream otherwise.
+        """
+        if "\n".encode(self.encoding) != b"\n":
+            with gzip.open(file, "rb") if file.endswith(".gz") else open(file, "rb", buffering=1024 * 1024) as f:
+                # the text stream reads ahead, so the bytes are counted by chunk
+                text_stream = io.TextIOWrapper(f, encoding=self.encoding, errors="replace", newline="\n")
+                position = 0
+                for line in text_stream:
+                    yield line, f.tell() - position
+                    position = f.tell()
+        elif file.endswith(".gz"):
+            with gzip.open(file, "rb") as f:
+                for raw_line in f:
+                    yield raw_line, len(raw_line)
+        elif self.use_mmap and os.path.getsize(file) > 0:
+            with open(file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for raw_line in iter(mm.readline, b""):
+                    yield raw_line, len(raw_line)
+        else:
+            with open(file, "rb", buffering=1024 * 1024) as f:
+                for raw_line in f:
+                    yield raw_line, len(raw_line)
+
+    def __iter__(self) -> Iterator[List[str]]:
+        rng = random.Random(self.seed)
+        self.num_lines = 0
+        self.num_bytes = 0
+        self.num_batches = 0
+        start_time = time.time()
+        progress = tqdm(
+            unit="B",
+            unit_scale=True,
+            total=sum(os.path.getsize(file) for file in self.files),
+            desc="Reading corpus",
+            disable=self.disable_progress_bar,
+        )
+
+        # the progress bar is also closed when the iteration is stopped early
+        try:
+            batch = []
+            batch_chars = 0
+            for file in self.files:
+                # Compressed files are counted in compressed bytes
+                file_size = os.path.getsize(file) if file.endswith(".gz") else None
+                for raw_line, num_bytes in self._iter_raw_lines(file):
+                    if file_size is None:
+                        progress.update(num_bytes)
+                    self.num_bytes += num_bytes
+                    if self.sample_fraction < 1.0 and rng.random() >= self.sample_fraction:
+                        continue
+                    if isinstance(raw_line, bytes):
+                        raw_line = raw_line.decode(self.encoding, errors="replace")
+                    line = raw_line.rstrip("\r\n")
+                    if self.skip_empty_lines and not line.strip():
+                        continue
+
+                    if batch and (
+                        len(batch) >= self.batch_size
+                        or (self.max_batch_chars is not None and batch_chars + len(line) > self.max_batch_chars)
+                    ):
+                        self.num_batches += 1
+                        yield batch
+                        batch = []
+                        batch_chars = 0
+                    batch.append(line)
+                    batch_chars += len(line)
+                    self.num_lines += 1
+                if file_size is not None:
+                    progress.update(file_size)
+
+            if batch:
+                self.num_batches += 1
+                yield batch
+        finally:
+            progress.close()
+
+        elapsed_time = max(time.time() - start_time, 1e-6)
+        logger.info(
+            f"Read {self.num_lines} lines in {self.num_batches} batches from {len(self.files)} files "
+            f"({self.num_bytes / 1e6:.1f}MB) in {elapsed_time:.1f}s: {self.num_bytes / 1e6 / elapsed_time:.1f}MB/s, "
+            f"{self.num_lines / elapsed_time:.0f} lines/s."
+        )
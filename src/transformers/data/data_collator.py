@@ -108,20 +108,30 @@ class DataCollatorWithPadding:
 
             This is especially useful to enable the use of Tensor Cores on NVIDIA hardware with compute capability >=
             7.5 (Volta).
+        pad_to_buckets (:obj:`List[int]`, `optional`):
+            If set, when padding to the longest sequence, will pad the sequences to the smallest of these lengths that
+            fits the longest sequence of the batch (or to the longest sequence if it doesn't fit any of them).
+
+            This limits the number of different shapes of the batches, and thus the recompilations of the models
+            traced with TorchScript, exported to ONNX or compiled with XLA.
     """
 
     tokenizer: PreTrainedTokenizerBase
     padding: Union[bool, str, PaddingStrategy] = True
     max_length: Optional[int] = None
     pad_to_multiple_of: Optional[int] = None
+    pad_to_buckets: Optional[List[int]] = None
 
     def __call__(self, features: List[Dict[str, Union[List[int], torch.Tensor]]]) -> Dict[str, torch.Tensor]:
+        # Only passed when set, as some tokenizers override `pad` without this argument
+        pad_kwargs = {"pad_to_buckets": self.pad_to_buckets} if self.pad_to_buckets is not None else {}
         batch = self.tokenizer.pad(
             features,
             padding=self.padding,
             max_length=self.max_length,
             pad_to_multiple_of=self.pad_to_multiple_of,
             return_tensors="pt",
+            **pad_kwargs,
         )
         if "label" in batch:
             batch["labels"] = batch["label"]
@@ -20,6 +20,7 @@ import fnmatch
 import functools
 import importlib.util
 import io
+import itertools
 import json
 import os
 import re
@@ -28,8 +29,11 @@ import subprocess
 import sys
 import tarfile
 import tempfile
+import threading
+import time
 import types
-from collections import OrderedDict, UserDict
+from collections import OrderedDict, UserDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import fields
 from enum import Enum
@@ -241,8 +245,15 @@ PYTORCH_TRANSFORMERS_CACHE = os.getenv("PYTORCH_TRANSFORMERS_CACHE", PYTORCH_PRE
 TRANSFORMERS_CACHE = os.getenv("TRANSFORMERS_CACHE", PYTORCH_TRANSFORMERS_CACHE)
 SESSION_ID = uuid4().hex
 DISABLE_TELEMETRY = os.getenv("DISABLE_TELEMETRY", False) in ENV_VARS_TRUE_VALUES
+# Number of connections used to download a file bigger than DOWNLOAD_CHUNK_SIZE, in chunks fetched with range requests
+DOWNLOAD_WORKERS = int(os.getenv("TRANSFORMERS_DOWNLOAD_WORKERS", 8))
+DOWNLOAD_CHUNK_SIZE = 10 * 2 ** 20
+# Number of seconds during which the ETag of a url is reused instead of being checked again (0, the default, to always
+# check it)
+ETAG_CACHE_TTL = float(os.getenv("TRANSFORMERS_ETAG_CACHE_TTL", 0))
 
 WEIGHTS_NAME = "pytorch_model.bin"
+WEIGHTS_INDEX_NAME = "pytorch_model.bin.index.json"
 TF2_WEIGHTS_NAME = "tf_model.h5"
 TF_WEIGHTS_NAME = "model.ckpt"
 FLAX_WEIGHTS_NAME = "flax_model.msgpack"
@@ -1462,17 +1473,150 @@ def http_user_agent(user_agent: Union[Dict, str, None] = None) -> str:
     return ua
 
 
-def http_get(url: str, temp_file: BinaryIO, proxies=None, resume_size=0, headers: Optional[Dict[str, str]] = None):
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+_etag_cache = {}
+_etag_cache_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the :obj:`requests.Session` used for all the downloads, which keeps a pool of connections open to each
+    host so that consecutive (or parallel) requests don't each open a new connection. A new session is created in the
+    processes forked after the session was created, which must not share its connections with their parent.
+    """
+    global _session, _session_pid
+    with _session_lock:
+        if _session is None or _session_pid != os.getpid():
+            _session = requests.Session()
+            _session_pid = os.getpid()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(DOWNLOAD_WORKERS, 10))
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+    return _session
+
+
+def clear_etag_cache():
+    """
+    Forgets the ETags looked up recently, so that the next calls to :func:`~transformers.file_utils.get_from_cache`
+    check them again (e.g. after pushing new versions of the files).
+    """
+    with _etag_cache_lock:
+        _etag_cache.clear()
+
+
+def _get_request_headers(user_agent: Union[Dict, str, None] = None, use_auth_token: Union[bool, str, None] = None):
+    headers = {"user-agent": http_user_agent(user_agent)}
+    if isinstance(use_auth_token, str):
+        headers["authorization"] = f"Bearer {use_auth_token}"
+    elif use_auth_token:
+        token = HfFolder.get_token()
+        if token is None:
+            raise EnvironmentError("You specified use_auth_token=True, but a huggingface token was not found.")
+        headers["authorization"] = f"Bearer {token}"
+    return headers
+
+
+def _head_request(url: str, headers: Dict[str, str], proxies=None, timeout=10, use_cache=True) -> requests.Response:
+    """
+    Sends a HEAD request to ``url`` (without following redirects), or returns the response received less than
+    ``ETAG_CACHE_TTL`` seconds ago. Only the successful (2xx) responses are cached, connection errors are raised.
+    """
+    cache_key = (url, headers.get("authorization"))
+    if use_cache and ETAG_CACHE_TTL > 0:
+        with _etag_cache_lock:
+            if cache_key in _etag_cache:
+                request_time, response = _etag_cache[cache_key]
+                if time.monotonic() - request_time < ETAG_CACHE_TTL:
+                    return response
+    response = get_session().head(url, headers=headers, allow_redirects=False, proxies=proxies, timeout=timeout)
+    # The errors may be transient and a redirection may change, they are checked again on the next call
+    if ETAG_CACHE_TTL > 0 and 200 <= response.status_code < 300:
+        with _etag_cache_lock:
+            _etag_cache[cache_key] = (time.monotonic(), response)
+    return response
+
+
+def resolve_etags(
+    urls: List[str],
+    proxies=None,
+    etag_timeout=10,
+    user_agent: Union[Dict, str, None] = None,
+    use_auth_token: Union[bool, str, None] = None,
+) -> Dict[str, Optional[str]]:
+    """
+    Checks the ETags of several urls at once, with HEAD requests sent in parallel on the pooled connections of
+    :func:`~transformers.file_utils.get_session`. When the ETags are cached (with a ``TRANSFORMERS_ETAG_CACHE_TTL``
+    environment variable bigger than 0), resolving the urls first makes the following calls to
+    :func:`~transformers.file_utils.get_from_cache` on the urls of successful responses skip the network.
+
+    Returns:
+        :obj:`Dict[str, Optional[str]]`: The ETag of each url, or :obj:`None` if it couldn't be retrieved (the errors
+        are raised by :func:`~transformers.file_utils.get_from_cache` when the file is actually requested).
+    """
+    headers = _get_request_headers(user_agent, use_auth_token)
+
+    def resolve_etag(url):
+        try:
+            r = _head_request(url, headers, proxies=proxies, timeout=etag_timeout)
+        except requests.exceptions.RequestException:
+            return None
+        if not r.ok and not r.is_redirect:
+            return None
+        return r.headers.get("X-Linked-Etag") or r.headers.get("ETag")
+
+    urls = list(dict.fromkeys(urls))
+    if len(urls) <= 1:
+        return {url: resolve_etag(url) for url in urls}
+    with ThreadPoolExecutor(max_workers=min(len(urls), DOWNLOAD_WORKERS)) as executor:
+        return dict(zip(urls, executor.map(resolve_etag, urls)))
+
+
+def _get_content_range(response: requests.Response) -> Optional[Tuple[int, int, int]]:
+    # The header of a partial response looks like "bytes 0-1023/146515"
+    match = re.fullmatch(r"bytes (\d+)-(\d+)/(\d+)", response.headers.get("Content-Range", ""))
+    if response.status_code != 206 or match is None:
+        return None
+    return tuple(int(value) for value in match.groups())
+
+
+def http_get(
+    url: str,
+    temp_file: BinaryIO,
+    proxies=None,
+    resume_size=0,
+    headers: Optional[Dict[str, str]] = None,
+    checksum=None,
+):
     """
     Download remote file. Do not gobble up errors.
+
+    The first request only asks for the first ``DOWNLOAD_CHUNK_SIZE`` bytes: if the server supports range requests
+    and the file is bigger, the other chunks are downloaded in parallel by ``DOWNLOAD_WORKERS`` threads, and written
+    in order in ``temp_file``. ``checksum`` is an optional :mod:`hashlib` object updated with the downloaded content.
     """
-    headers = copy.deepcopy(headers)
-    if resume_size > 0:
+    headers = copy.deepcopy(headers) if headers is not None else {}
+    session = get_session()
+    if DOWNLOAD_WORKERS > 1:
+        headers["Range"] = f"bytes={resume_size}-{resume_size + DOWNLOAD_CHUNK_SIZE - 1}"
+    elif resume_size > 0:
         headers["Range"] = f"bytes={resume_size}-"
-    r = requests.get(url, stream=True, proxies=proxies, headers=headers)
+    r = session.get(url, stream=True, proxies=proxies, headers=headers)
+    if r.status_code == 416 and resume_size == 0 and "Range" in headers:
+        # Range requests are not satisfiable for empty files
+        del headers["Range"]
+        r = session.get(url, stream=True, proxies=proxies, headers=headers)
     r.raise_for_status()
-    content_length = r.headers.get("Content-Length")
-    total = resume_size + int(content_length) if content_length is not None else None
+
+    content_range = _get_content_range(r)
+    if content_range is not None:
+        # The server sent the first chunk and the size of the file
+        total = content_range[2]
+    else:
+        # The server ignored the range, if any, and sends the whole file
+        content_length = r.headers.get("Content-Length")
+        total = resume_size + int(content_length) if content_length is not None else None
     progress = tqdm(
         unit="B",
         unit_scale=True,
@@ -1485,9 +1629,48 @@ def http_get(url: str, temp_file: BinaryIO, proxies=None, resume_size=0, headers
         if chunk:  # filter out keep-alive new chunks
             progress.update(len(chunk))
             temp_file.write(chunk)
+            if checksum is not None:
+                checksum.update(chunk)
+
+    if content_range is not None and content_range[1] + 1 < total:
+
+        def download_chunk(start):
+            end = min(start + DOWNLOAD_CHUNK_SIZE, total) - 1
+            chunk_headers = dict(headers, Range=f"bytes={start}-{end}")
+            chunk_response = session.get(url, proxies=proxies, headers=chunk_headers)
+            chunk_response.raise_for_status()
+            if (
+                _get_content_range(chunk_response) != (start, end, total)
+                or len(chunk_response.content) != end - start + 1
+            ):
+                raise EnvironmentError(f"Received an invalid response for the range {start}-{end} of {url}.")
+            return chunk_response.content
+
+        # The chunks are downloaded ahead by the workers, and written in order to keep the memory bounded
+        starts = iter(range(content_range[1] + 1, total, DOWNLOAD_CHUNK_SIZE))
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = deque(
+                executor.submit(download_chunk, start) for start in itertools.islice(starts, DOWNLOAD_WORKERS)
+            )
+            while len(futures) > 0:
+                chunk = futures.popleft().result()
+                start = next(starts, None)
+                if start is not None:
+                    futures.append(executor.submit(download_chunk, start))
+                progress.update(len(chunk))
+                temp_file.write(chunk)
+                if checksum is not None:
+                    checksum.update(chunk)
     progress.close()
 
 
+def _etag_to_sha256(etag: str) -> Optional[str]:
+    # The ETag of the files stored with git-lfs on huggingface.co is the SHA-256 of their content
+    etag = etag[2:] if etag.startswith("W/") else etag
+    etag = etag.strip('"')
+    return etag if re.fullmatch(r"[0-9a-f]{64}", etag) else None
+
+
 def get_from_cache(
     url: str,
     cache_dir=None,
@@ -1516,20 +1699,13 @@ def get_from_cache(
 
     os.makedirs(cache_dir, exist_ok=True)
 
-    headers = {"user-agent": http_user_agent(user_agent)}
-    if isinstance(use_auth_token, str):
-        headers["authorization"] = f"Bearer {use_auth_token}"
-    elif use_auth_token:
-        token = HfFolder.get_token()
-        if token is None:
-            raise EnvironmentError("You specified use_auth_token=True, but a huggingface token was not found.")
-        headers["authorization"] = f"Bearer {token}"
+    headers = _get_request_headers(user_agent, use_auth_token)
 
     url_to_download = url
     etag = None
     if not local_files_only:
         try:
-            r = requests.head(url, headers=headers, allow_redirects=False, proxies=proxies, timeout=etag_timeout)
+            r = _head_request(url, headers, proxies=proxies, timeout=etag_timeout, use_cache=not force_download)
             r.raise_for_status()
             etag = r.headers.get("X-Linked-Etag") or r.headers.get("ETag")
             # We favor a custom header indicating the etag of the linked resource, and
@@ -1617,12 +1793,35 @@ def get_from_cache(
             temp_file_manager = partial(tempfile.NamedTemporaryFile, mode="wb", dir=cache_dir, delete=False)
             resume_size = 0
 
+        # The content of the files whose ETag is a SHA-256 is checked while it's downloaded
+        expected_sha256 = _etag_to_sha256(etag)
+        checksum = sha256() if expected_sha256 is not None else None
+
         # Download to temporary file, then copy to cache dir once finished.
         # Otherwise you get corrupt cache entries if the download gets interrupted.
         with temp_file_manager() as temp_file:
             logger.info(f"{url} not found in cache or force_download set to True, downloading to {temp_file.name}")
 
-            http_get(url_to_download, temp_file, proxies=proxies, resume_size=resume_size, headers=headers)
+            if checksum is not None and resume_size > 0:
+                with open(incomplete_path, "rb") as f:
+                    for block in iter(partial(f.read, 2 ** 20), b""):
+                        checksum.update(block)
+
+            http_get(
+                url_to_download,
+                temp_file,
+                proxies=proxies,
+                resume_size=resume_size,
+                headers=headers,
+                checksum=checksum,
+            )
+
+        if checksum is not None and checksum.hexdigest() != expected_sha256:
+            os.remove(temp_file.name)
+            raise EnvironmentError(
+                f"The file downloaded from {url} is corrupted: its SHA-256 is {checksum.hexdigest()} instead of "
+                f"{expected_sha256}. Please try again."
+            )
 
         logger.info(f"storing {url} in cache at {cache_path}")
         os.replace(temp_file.name, cache_path)
@@ -1641,6 +1840,80 @@ def get_from_cache(
     return cache_path
 
 
+def convert_file_size_to_int(size: Union[int, str]) -> int:
+    """
+    Converts a size expressed as a string with a unit (e.g. ``"5MB"`` or ``"5MiB"``) to an integer number of bytes.
+
+    Args:
+        size (:obj:`int` or :obj:`str`): The size to convert. Integers are returned as is.
+
+    Example::
+
+        >>> convert_file_size_to_int("1MiB")
+        1048576
+    """
+    if isinstance(size, int):
+        return size
+    units = {"KIB": 2 ** 10, "MIB": 2 ** 20, "GIB": 2 ** 30, "KB": 10 ** 3, "MB": 10 ** 6, "GB": 10 ** 9}
+    for unit, multiplier in units.items():
+        if size.upper().endswith(unit):
+            return int(float(size[: -len(unit)]) * multiplier)
+    raise ValueError(f"`size` should be an integer or a string like '5GB' or '500MiB', but is {size}.")
+
+
+def get_checkpoint_shard_files(
+    pretrained_model_name_or_path: str,
+    index_filename: str,
+    cache_dir=None,
+    force_download=False,
+    proxies=None,
+    resume_download=False,
+    local_files_only=False,
+    use_auth_token: Union[bool, str, None] = None,
+    user_agent: Union[Dict, str, None] = None,
+    revision: Optional[str] = None,
+    mirror: Optional[str] = None,
+) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Resolves the shards of a sharded checkpoint from its index, downloading them if ``pretrained_model_name_or_path``
+    is a model id on huggingface.co (the other arguments are the ones of :func:`~transformers.file_utils.cached_path`).
+
+    Returns:
+        :obj:`Tuple[List[str], Dict[str, str]]`: The local paths of the shards and the weight map of the index, which
+        maps each key of the checkpoint to the name of the shard containing it.
+    """
+    with open(index_filename, "r", encoding="utf-8") as f:
+        index = json.load(f)
+    weight_map = index["weight_map"]
+    shard_filenames = sorted(set(weight_map.values()))
+
+    if os.path.isdir(pretrained_model_name_or_path):
+        return [os.path.join(pretrained_model_name_or_path, filename) for filename in shard_filenames], weight_map
+
+    shard_urls = [
+        hf_bucket_url(pretrained_model_name_or_path, filename=shard_filename, revision=revision, mirror=mirror)
+        for shard_filename in shard_filenames
+    ]
+    if not local_files_only and not force_download and not is_offline_mode():
+        resolve_etags(shard_urls, proxies=proxies, user_agent=user_agent, use_auth_token=use_auth_token)
+
+    resolved_shard_files = []
+    for shard_url in shard_urls:
+        resolved_shard_files.append(
+            cached_path(
+                shard_url,
+                cache_dir=cache_dir,
+                force_download=force_download,
+                proxies=proxies,
+                resume_download=resume_download,
+                local_files_only=local_files_only,
+                use_auth_token=use_auth_token,
+                user_agent=user_agent,
+            )
+        )
+    return resolved_shard_files, weight_map
+
+
 class cached_property(property):
     """
     Descriptor that mimics @property but caches output in member variable.
@@ -2147,4 +2420,7 @@ class PushToHubMixin:
             else:
                 commit_message = "add model"
 
-        return repo.push_to_hub(commit_message=commit_message)
+        url = repo.push_to_hub(commit_message=commit_message)
+        # The files that were just pushed have new ETags
+        clear_etag_cache()
+        return url
@@ -16,7 +16,7 @@
 import warnings
 from abc import ABC, abstractmethod
 from collections import UserDict
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import torch
 
@@ -162,6 +162,7 @@ class BeamSearchScorer(BeamScorer):
         num_beam_groups: Optional[int] = 1,
         **kwargs,
     ):
+        self.batch_size = batch_size
         self.num_beams = num_beams
         self.device = device
         self.length_penalty = length_penalty
@@ -203,6 +204,9 @@ class BeamSearchScorer(BeamScorer):
     def is_done(self) -> bool:
         return self._done.all()
 
+    def _get_finished_hypotheses(self, batch_idx: int) -> List[torch.LongTensor]:
+        return [hyp for _, hyp in self._beam_hyps[batch_idx].beams]
+
     def process(
         self,
         input_ids: torch.LongTensor,
@@ -344,6 +348,270 @@ class BeamSearchScorer(BeamScorer):
         )
 
 
+class TensorizedBeamSearchScorer(BeamScorer):
+    r"""
+    :class:`transformers.BeamScorer` implementing standard beam search decoding with the same results as
+    :class:`~transformers.BeamSearchScorer`, but keeping the finished hypotheses of the whole batch in tensors of fixed
+    size instead of one list of :class:`~transformers.generation_beam_search.BeamHypotheses` per batch item.
+
+    The end-of-sequence detection, the insertion of finished hypotheses and the :obj:`is_done` checks are batched
+    tensor operations instead of Python loops over the :obj:`batch_size * 2 * num_beams` candidates of each step, and
+    :meth:`~transformers.TensorizedBeamSearchScorer.finalize` gathers the best hypotheses of all the batch items at
+    once.
+
+    Args:
+        batch_size (:obj:`int`):
+            Batch Size of :obj:`input_ids` for which standard beam search decoding is run in parallel.
+        num_beams (:obj:`int`):
+            Number of beams for beam search.
+        device (:obj:`torch.device`):
+            Defines the device type (*e.g.*, :obj:`"cpu"` or :obj:`"cuda"`) on which this instance of
+            :obj:`TensorizedBeamSearchScorer` will be allocated.
+        length_penalty (:obj:`float`, `optional`, defaults to 1.0):
+            Exponential penalty to the length. 1.0 means no penalty. Set to values < 1.0 in order to encourage the
+            model to generate shorter sequences, to a value > 1.0 in order to encourage the model to produce longer
+            sequences.
+        do_early_stopping (:obj:`bool`, `optional`, defaults to :obj:`False`):
+            Whether to stop the beam search when at least ``num_beams`` sentences are finished per batch or not.
+        num_beam_hyps_to_keep (:obj:`int`, `optional`, defaults to 1):
+            The number of beam hypotheses that shall be returned upon calling
+            :meth:`~transformer.TensorizedBeamSearchScorer.finalize`.
+        num_beam_groups (:obj:`int`):
+            Number of groups to divide :obj:`num_beams` into in order to ensure diversity among different groups of
+            beams. See `this paper <https://arxiv.org/pdf/1610.02424.pdf>`__ for more details.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        num_beams: int,
+        device: torch.device,
+        length_penalty: Optional[float] = 1.0,
+        do_early_stopping: Optional[bool] = False,
+        num_beam_hyps_to_keep: Optional[int] = 1,
+        num_beam_groups: Optional[int] = 1,
+        **kwargs,
+    ):
+        self.batch_size = batch_size
+        self.num_beams = num_beams
+        self.device = device
+        self.length_penalty = length_penalty
+        self.do_early_stopping = do_early_stopping
+        self.num_beam_hyps_to_keep = num_beam_hyps_to_keep
+        self.num_beam_groups = num_beam_groups
+        self.group_size = self.num_beams // self.num_beam_groups
+
+        self._done = torch.zeros(batch_size, dtype=torch.bool, device=self.device)
+
+        # finished hypotheses: the first `_num_hyps` slots of each batch item are used, and the insertion order breaks
+        # ties between scores like the order of the list of `BeamHypotheses`
+        self._slot_ids = torch.arange(num_beams, device=self.device)
+        self._num_hyps = torch.zeros(batch_size, dtype=torch.long, device=self.device)
+        self._hyp_scores = torch.zeros((batch_size, num_beams), dtype=torch.float64, device=self.device)
+        self._hyp_order = torch.zeros((batch_size, num_beams), dtype=torch.long, device=self.device)
+        self._hyp_lengths = torch.zeros((batch_size, num_beams), dtype=torch.long, device=self.device)
+        # allocated on the first insertion and grown with the length of the hypotheses
+        self._hyp_tokens = None
+        self._num_insertions = 0
+
+        if not isinstance(num_beams, int) or num_beams <= 1:
+            raise ValueError(
+                f"`num_beams` has to be an integer strictly greater than 1, but is {num_beams}. For `num_beams` == 1, one should make use of `greedy_search` instead."
+            )
+
+        if not isinstance(num_beam_groups, int) or (num_beam_groups > num_beams) or (num_beams % num_beam_groups != 0):
+            raise ValueError(
+                f"`num_beam_groups` has to be an integer smaller or equal than `num_beams` and `num_beams` "
+                f"has to be divisible by `num_beam_groups`, but is {num_beam_groups} with `num_beams` being {num_beams}."
+            )
+
+        if "max_length" in kwargs:
+            warnings.warn(
+                "Passing `max_length` to TensorizedBeamSearchScorer is deprecated and has no effect."
+                "`max_length` should be passed directly to `beam_search(...)`, `beam_sample(...)`"
+                ",or `group_beam_search(...)`."
+            )
+
+    @property
+    def is_done(self) -> bool:
+        return self._done.all()
+
+    def _get_worst_scores(self) -> torch.DoubleTensor:
+        is_used = self._slot_ids[None, :] < self._num_hyps[:, None]
+        return self._hyp_scores.masked_fill(~is_used, float("inf")).min(dim=-1).values
+
+    def _add_hypotheses(self, hyps: torch.LongTensor, sum_logprobs: torch.FloatTensor, mask: torch.BoolTensor):
+        """
+        Batched :meth:`~transformers.generation_beam_search.BeamHypotheses.add` of the hypothesis :obj:`hyps[i]` to
+        the batch item :obj:`i` for each :obj:`i` where :obj:`mask` is set.
+        """
+        hyps, sum_logprobs, mask = hyps.to(self.device), sum_logprobs.to(self.device), mask.to(self.device)
+        length = hyps.shape[-1]
+        scores = sum_logprobs.to(torch.float64) / (length ** self.length_penalty)
+
+        worst_scores = self._get_worst_scores()
+        is_full = self._num_hyps >= self.num_beams
+        mask = mask & (~is_full | (scores > worst_scores))
+        batch_idx = mask.nonzero().view(-1)
+        if len(batch_idx) == 0:
+            return
+
+        # a full batch item replaces its worst hypothesis, the earliest inserted one among equal scores
+        is_worst = (self._hyp_scores == worst_scores[:, None]) & (self._slot_ids[None, :] < self._num_hyps[:, None])
+        worst_slots = self._hyp_order.masked_fill(~is_worst, self._num_insertions + 1).argmin(dim=-1)
+        slots = torch.where(is_full, worst_slots, self._num_hyps)[batch_idx]
+
+        if self._hyp_tokens is None:
+            self._hyp_tokens = hyps.new_zeros((self.batch_size, self.num_beams, length))
+        elif self._hyp_tokens.shape[-1] < length:
+            capacity = max(length, 2 * self._hyp_tokens.shape[-1])
+            padding = self._hyp_tokens.new_zeros(
+                (self.batch_size, self.num_beams, capacity - self._hyp_tokens.shape[-1])
+            )
+            self._hyp_tokens = torch.cat([self._hyp_tokens, padding], dim=-1)
+
+        self._hyp_scores[batch_idx, slots] = scores[batch_idx]
+        self._hyp_order[batch_idx, slots] = self._num_insertions
+        self._hyp_lengths[batch_idx, slots] = length
+        self._hyp_tokens[batch_idx, slots, :length] = hyps[batch_idx]
+        self._num_hyps[batch_idx] = torch.clamp(self._num_hyps[batch_idx] + 1, max=self.num_beams)
+        self._num_insertions += 1
+
+    def _get_finished_hypotheses(self, batch_idx: int) -> List[torch.LongTensor]:
+        return [
+            self._hyp_tokens[batch_idx, slot, : self._hyp_lengths[batch_idx, slot]]
+            for slot in range(int(self._num_hyps[batch_idx]))
+        ]
+
+    def process(
+        self,
+        input_ids: torch.LongTensor,
+        next_scores: torch.FloatTensor,
+        next_tokens: torch.LongTensor,
+        next_indices: torch.LongTensor,
+        pad_token_id: Optional[int] = None,
+        eos_token_id: Optional[int] = None,
+    ) -> Tuple[torch.Tensor]:
+        cur_len = input_ids.shape[-1]
+        assert self.batch_size == (input_ids.shape[0] // self.group_size)
+
+        device = input_ids.device
+        num_candidates = next_tokens.shape[-1]
+        done = self._done.to(device)
+        if done.any():
+            assert (
+                self._num_hyps[self._done] >= self.num_beams
+            ).all(), f"Batch can only be done if at least {self.num_beams} beams have been generated"
+            assert (
+                eos_token_id is not None and pad_token_id is not None
+            ), "generated beams >= num_beams -> eos_token_id and pad_token have to be defined"
+
+        batch_beam_indices = next_indices + torch.arange(self.batch_size, device=device)[:, None] * self.group_size
+        if eos_token_id is not None:
+            is_eos = next_tokens == eos_token_id
+        else:
+            is_eos = torch.zeros_like(next_tokens, dtype=torch.bool)
+
+        # end-of-sequence tokens within the top `group_size` candidates finish their hypothesis
+        for rank in range(min(self.group_size, num_candidates)):
+            is_finished = is_eos[:, rank] & ~done
+            if is_finished.any():
+                self._add_hypotheses(input_ids[batch_beam_indices[:, rank]], next_scores[:, rank], is_finished)
+
+        # the next beams are the best `group_size` candidates that are not end-of-sequence tokens
+        num_open_candidates = num_candidates - is_eos.sum(dim=-1)
+        is_invalid = (num_open_candidates < self.group_size) & ~done
+        if is_invalid.any():
+            batch_idx = int(is_invalid.nonzero()[0])
+            raise ValueError(
+                f"At most {self.group_size} tokens in {next_tokens[batch_idx]} can be equal to `eos_token_id: {eos_token_id}`. Make sure {next_tokens[batch_idx]} are corrected."
+            )
+        candidate_order = (is_eos.long() * num_candidates + torch.arange(num_candidates, device=device)).argsort(
+            dim=-1
+        )
+        candidate_order = candidate_order[:, : self.group_size]
+
+        next_beam_scores = next_scores.gather(-1, candidate_order).masked_fill(done[:, None], 0)
+        next_beam_tokens = next_tokens.gather(-1, candidate_order)
+        next_beam_indices = batch_beam_indices.gather(-1, candidate_order).masked_fill(done[:, None], 0)
+        if pad_token_id is not None:
+            # pad the batch
+            next_beam_tokens = next_beam_tokens.masked_fill(done[:, None], pad_token_id)
+
+        # check if we are done so that we can save a pad step if all(done)
+        is_full = self._num_hyps >= self.num_beams
+        if self.do_early_stopping:
+            is_done = is_full
+        else:
+            best_scores = next_scores.max(dim=-1).values.to(self.device, torch.float64) / (
+                cur_len ** self.length_penalty
+            )
+            is_done = is_full & (self._get_worst_scores() >= best_scores)
+        self._done |= is_done
+
+        return UserDict(
+            {
+                "next_beam_scores": next_beam_scores.view(-1),
+                "next_beam_tokens": next_beam_tokens.view(-1),
+                "next_beam_indices": next_beam_indices.view(-1),
+            }
+        )
+
+    def finalize(
+        self,
+        input_ids: torch.LongTensor,
+        final_beam_scores: torch.FloatTensor,
+        final_beam_tokens: torch.LongTensor,
+        final_beam_indices: torch.LongTensor,
+        max_length: int,
+        pad_token_id: Optional[int] = None,
+        eos_token_id: Optional[int] = None,
+    ) -> Tuple[torch.LongTensor]:
+        # finalize all open beam hypotheses and add to generated hypotheses
+        input_ids = input_ids.view(self.batch_size, self.num_beams, -1)
+        final_beam_scores = final_beam_scores.view(self.batch_size, self.num_beams)
+        for beam_id in range(self.num_beams):
+            self._add_hypotheses(input_ids[:, beam_id], final_beam_scores[:, beam_id], ~self._done)
+
+        # rank the hypotheses by score, the latest inserted one first among equal scores
+        scores, order = self._hyp_scores, self._hyp_order
+        is_better = (scores[:, None, :] > scores[:, :, None]) | (
+            (scores[:, None, :] == scores[:, :, None]) & (order[:, None, :] > order[:, :, None])
+        )
+        is_used = self._slot_ids[None, :] < self._num_hyps[:, None]
+        ranks = (is_better & is_used[:, None, :]).sum(dim=-1).masked_fill(~is_used, self.num_beams)
+        best_slots = ranks.argsort(dim=-1)[:, : self.num_beam_hyps_to_keep]
+
+        # select the best hypotheses
+        batch_idx = torch.arange(self.batch_size, device=self.device)[:, None]
+        sent_lengths = self._hyp_lengths[batch_idx, best_slots].view(-1)
+        best_scores = self._hyp_scores[batch_idx, best_slots].view(-1).to(torch.float32)
+        best = self._hyp_tokens[batch_idx, best_slots].view(self.batch_size * self.num_beam_hyps_to_keep, -1)
+
+        # prepare for adding eos
+        sent_max_len = min(sent_lengths.max().item() + 1, max_length)
+        if best.shape[-1] < sent_max_len:
+            best = torch.cat([best, best.new_zeros((best.shape[0], sent_max_len - best.shape[-1]))], dim=-1)
+        decoded = best[:, :sent_max_len]
+        positions = torch.arange(sent_max_len, device=self.device)[None, :]
+        # shorter batches are padded if needed
+        if sent_lengths.min().item() != sent_lengths.max().item():
+            assert pad_token_id is not None, "`pad_token_id` has to be defined"
+            decoded = decoded.masked_fill(positions >= sent_lengths[:, None], pad_token_id)
+
+        # fill with eos_token_id if the latter fits in
+        if eos_token_id is not None:
+            decoded = decoded.masked_fill(
+                (positions == sent_lengths[:, None]) & (sent_lengths[:, None] < max_length), eos_token_id
+            )
+        return UserDict(
+            {
+                "sequences": decoded.to(input_ids.device),
+                "sequence_scores": best_scores,
+            }
+        )
+
+
 class BeamHypotheses:
     def __init__(self, num_beams: int, length_penalty: float, early_stopping: bool):
         """
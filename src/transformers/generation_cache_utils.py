@@ -0,0 +1,224 @@
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections.abc
+import hashlib
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import torch
+
+from .file_utils import ModelOutput
+
+
+class StaticLayerKeyValueCache:
+    """
+    Key/value cache of a single attention layer, stored in buffers of shape :obj:`(batch_size, num_heads,
+    max_length, head_dim)` that are allocated on the first update and written in place afterwards.
+
+    Indexing the cache like a :obj:`(key, value)` tuple returns views over the valid prefix of the buffers.
+
+    Args:
+        max_length (:obj:`int`):
+            The maximum number of positions the cache can hold.
+    """
+
+    def __init__(self, max_length: int):
+        self.max_length = max_length
+        self.key = None
+        self.value = None
+        self.seq_length = 0
+        # buffers the beams are reordered into by `reorder_cache`, allocated on the first reordering
+        self._reordered_key = None
+        self._reordered_value = None
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, idx: int) -> torch.Tensor:
+        buffer = (self.key, self.value)[idx]
+        if buffer is None:
+            return torch.empty((0, 0, 0, 0))
+        return buffer[:, :, : self.seq_length]
+
+    def __iter__(self):
+        yield self[0]
+        yield self[1]
+
+    def update(self, key: torch.Tensor, value: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Writes the key/value states of the new positions after the valid prefix.
+
+        Args:
+            key (:obj:`torch.Tensor` of shape :obj:`(batch_size, num_heads, new_length, head_dim)`):
+                The key states of the new positions.
+            value (:obj:`torch.Tensor` of shape :obj:`(batch_size, num_heads, new_length, head_dim)`):
+                The value states of the new positions.
+
+        Return:
+            :obj:`Tuple[torch.Tensor, torch.Tensor]`: Views over the key and value states of all the valid positions.
+        """
+        if self.key is None:
+            batch_size, num_heads, _, head_dim = key.shape
+            buffer_shape = (batch_size, num_heads, self.max_length, head_dim)
+            self.key = torch.zeros(buffer_shape, dtype=key.dtype, device=key.device)
+            self.value = torch.zeros(buffer_shape, dtype=value.dtype, device=value.device)
+
+        new_seq_length = self.seq_length + key.shape[-2]
+        if new_seq_length > self.max_length:
+            raise ValueError(
+                f"The static cache can hold {self.max_length} positions, but {new_seq_length} positions were written. "
+                "Make sure `max_length` covers the whole generated sequence."
+            )
+
+        self.key[:, :, self.seq_length : new_seq_length] = key
+        self.value[:, :, self.seq_length : new_seq_length] = value
+        self.seq_length = new_seq_length
+        return self[0], self[1]
+
+    def reorder_cache(self, beam_idx: torch.LongTensor):
+        """
+        Reorders the valid prefix of the buffers along the batch dimension. The states are selected into a second pair
+        of preallocated buffers, which are then swapped with the current ones, so no memory is allocated at each step.
+        """
+        if self.key is None:
+            return
+        if self._reordered_key is None:
+            self._reordered_key = torch.empty_like(self.key)
+            self._reordered_value = torch.empty_like(self.value)
+        beam_idx = beam_idx.to(self.key.device)
+        torch.index_select(self[0], 0, beam_idx, out=self._reordered_key[:, :, : self.seq_length])
+        torch.index_select(self[1], 0, beam_idx, out=self._reordered_value[:, :, : self.seq_length])
+        self.key, self._reordered_key = self._reordered_key, self.key
+        self.value, self._reordered_value = self._reordered_value, self.value
+
+
+class StaticKeyValueCache:
+    """
+    Preallocated key/value cache used by :meth:`~transformers.generation_utils.GenerationMixin.generate` when called
+    with ``cache_implementation="static"``. It holds one :class:`~transformers.generation_cache_utils.StaticLayerKeyValueCache`
+    per layer and can be used in place of the :obj:`past_key_values` tuple by models with
+    :obj:`supports_static_cache=True`.
+
+    Instead of concatenating the states of every new position to the past ones, which reallocates and copies the whole
+    cache at each generation step, the attention layers write the new states in place with
+    :meth:`~transformers.generation_cache_utils.StaticLayerKeyValueCache.update` and only attend to the valid prefix
+    of the buffers.
+
+    An empty cache evaluates to :obj:`False`, so that the first forward pass processes the whole prompt.
+
+    Args:
+        num_layers (:obj:`int`):
+            The number of attention layers of the model.
+        max_length (:obj:`int`):
+            The maximum number of positions the cache can hold.
+    """
+
+    def __init__(self, num_layers: int, max_length: int):
+        self.max_length = max_length
+        self.layers = tuple(StaticLayerKeyValueCache(max_length) for _ in range(num_layers))
+
+    def __len__(self):
+        return len(self.layers)
+
+    def __getitem__(self, layer_idx: int) -> StaticLayerKeyValueCache:
+        return self.layers[layer_idx]
+
+    def __iter__(self):
+        return iter(self.layers)
+
+    def __bool__(self):
+        return self.get_seq_length() > 0
+
+    def get_seq_length(self, layer_idx: Optional[int] = 0) -> int:
+        """Returns the number of valid positions held by the cache of layer :obj:`layer_idx`."""
+        return self.layers[layer_idx].seq_length
+
+    def reorder_cache(self, beam_idx: torch.LongTensor):
+        """Reorders the cache of every layer in place to follow the hypotheses selected by beam search."""
+        for layer in self.layers:
+            layer.reorder_cache(beam_idx)
+
+
+class EncoderOutputCache:
+    """
+    Least-recently-used cache of the encoder outputs of encoder-decoder models, which can be passed to
+    :meth:`~transformers.generation_utils.GenerationMixin.generate` as :obj:`encoder_output_cache` so that calling
+    :meth:`~transformers.generation_utils.GenerationMixin.generate` several times on the same inputs, e.g. with
+    different decoding parameters or decoder prefixes, only runs the encoder once.
+
+    The entries are keyed by a weak reference to the model and a hash of the encoder inputs (:obj:`input_ids`,
+    :obj:`attention_mask` and the other encoder keyword arguments), so the cache doesn't keep the model alive. The cache
+    does not track updates of the model weights, so it should be cleared with :meth:`clear` after modifying the model.
+
+    Args:
+        max_size (:obj:`int`, `optional`, defaults to 8):
+            The maximum number of encoder outputs kept in the cache. The least recently used outputs are evicted first.
+    """
+
+    def __init__(self, max_size: int = 8):
+        if not isinstance(max_size, int) or max_size <= 0:
+            raise ValueError(f"`max_size` has to be a strictly positive integer, but is {max_size}")
+
+        self.max_size = max_size
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _get_key(model: torch.nn.Module, encoder_kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        """Returns the key of the encoder inputs, or :obj:`None` if they cannot be cached."""
+        # a weak reference, so that the entries of a deleted model are never matched by a new model reusing its id
+        key = [weakref.ref(model)]
+        for name, value in sorted(encoder_kwargs.items()):
+            if isinstance(value, torch.Tensor):
+                if value.dtype == torch.bfloat16:
+                    return None
+                value = (tuple(value.shape), str(value.dtype), hashlib.sha1(value.cpu().numpy().tobytes()).digest())
+            elif not isinstance(value, collections.abc.Hashable):
+                return None
+            key.append((name, value))
+        return tuple(key)
+
+    def get(self, model: torch.nn.Module, encoder_kwargs: Dict[str, Any]) -> Optional[ModelOutput]:
+        """
+        Returns the cached encoder outputs of :obj:`model` for :obj:`encoder_kwargs`, or :obj:`None` if they are not
+        cached. The returned :class:`~transformers.file_utils.ModelOutput` is a shallow copy that can be modified.
+        """
+        key = self._get_key(model, encoder_kwargs)
+        if key is None or key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        encoder_outputs = self._entries[key]
+        return encoder_outputs.__class__(**encoder_outputs)
+
+    def put(self, model: torch.nn.Module, encoder_kwargs: Dict[str, Any], encoder_outputs: ModelOutput):
+        """Caches the encoder outputs of :obj:`model` for :obj:`encoder_kwargs`, evicting the oldest entry if needed."""
+        key = self._get_key(model, encoder_kwargs)
+        if key is None:
+            return
+        # drop the outputs of the models that were deleted
+        for dead_key in [key for key in self._entries if key[0]() is None]:
+            del self._entries[dead_key]
+        self._entries[key] = encoder_outputs.__class__(**encoder_outputs)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Removes all the cached encoder outputs."""
+        self._entries.clear()
@@ -0,0 +1,319 @@
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import torch
+from torch import nn
+
+from .generation_logits_process import LogitsProcessorList
+from .generation_stopping_criteria import MaxLengthCriteria, StoppingCriteriaList
+from .utils import logging
+
+
+logger = logging.get_logger(__name__)
+
+
+@dataclass
+class GenerationRequest:
+    """
+    A prompt to be completed by a :class:`~transformers.ContinuousBatchingScheduler`.
+
+    Args:
+        input_ids (:obj:`torch.LongTensor` of shape :obj:`(sequence_length,)`):
+            The sequence used as a prompt for the generation.
+        logits_processor (:obj:`LogitsProcessorList`, `optional`):
+            An instance of :class:`~transformers.LogitsProcessorList` used to modify the prediction scores of this
+            request at each generation step.
+        logits_warper (:obj:`LogitsProcessorList`, `optional`):
+            An instance of :class:`~transformers.LogitsProcessorList` of :class:`~transformers.LogitsWarper`. If set,
+            the next tokens of this request are sampled from the warped distribution, otherwise they are picked
+            greedily.
+        stopping_criteria (:obj:`StoppingCriteriaList`, `optional`):
+            An instance of :class:`~transformers.StoppingCriteriaList` telling when this request is complete. Defaults
+            to a :class:`~transformers.MaxLengthCriteria` with :obj:`model.config.max_length`.
+        request_id (:obj:`Any`, `optional`):
+            An identifier returned with the result of the request.
+    """
+
+    input_ids: torch.LongTensor
+    logits_processor: Optional[LogitsProcessorList] = None
+    logits_warper: Optional[LogitsProcessorList] = None
+    stopping_criteria: Optional[StoppingCriteriaList] = None
+    request_id: Optional[Any] = None
+
+
+@dataclass
+class GenerationResult:
+    """
+    A completed :class:`~transformers.GenerationRequest`.
+
+    Args:
+        request_id (:obj:`Any`):
+            The :obj:`request_id` of the request.
+        sequences (:obj:`torch.LongTensor` of shape :obj:`(sequence_length,)`):
+            The prompt followed by the generated tokens.
+    """
+
+    request_id: Any
+    sequences: torch.LongTensor
+
+
+class _Slot:
+    """A request being generated and the tokens generated so far."""
+
+    def __init__(self, request: GenerationRequest, max_length: int, device: torch.device):
+        self.request = request
+        # the generated tokens are appended on the device of the model
+        self.input_ids = request.input_ids.view(1, -1).to(device)
+        self.logits_processor = (
+            request.logits_processor if request.logits_processor is not None else LogitsProcessorList()
+        )
+        self.logits_warper = request.logits_warper
+        self.stopping_criteria = (
+            request.stopping_criteria
+            if request.stopping_criteria is not None
+            else StoppingCriteriaList([MaxLengthCriteria(max_length=max_length)])
+        )
+
+
+def _left_pad(tensor: torch.Tensor, length: int, dim: int, value: int = 0) -> torch.Tensor:
+    padding = [0, 0] * (tensor.dim() - 1 - dim % tensor.dim()) + [length - tensor.shape[dim], 0]
+    return nn.functional.pad(tensor, padding, value=value)
+
+
+class ContinuousBatchingScheduler:
+    r"""
+    Generates completions for a stream of :class:`~transformers.GenerationRequest` with continuous (in-flight)
+    batching.
+
+    Unlike :meth:`~transformers.generation_utils.GenerationMixin.generate`, which runs a fixed batch until all of its
+    sequences are done, the scheduler evicts each sequence from the batch as soon as it is complete and admits the
+    next queued prompts into the freed slots between two decoding steps. Newly admitted prompts are encoded in a
+    separate forward pass and their past key/values are left-padded to the length of the running batch, the padding
+    being masked through the attention mask.
+
+    The scheduler works with decoder-only models whose :obj:`past_key_values` are tuples of tensors with the sequence
+    on the second to last dimension and which build their position ids from the attention mask in
+    :obj:`prepare_inputs_for_generation` (e.g. GPT-2).
+
+    Args:
+        model (:class:`~transformers.PreTrainedModel`):
+            The decoder-only model with a language modeling head used for generation.
+        max_batch_size (:obj:`int`, `optional`, defaults to 8):
+            The maximum number of sequences decoded together.
+        pad_token_id (:obj:`int`, `optional`):
+            The id of the `padding` token. Defaults to :obj:`model.config.pad_token_id`, or to :obj:`eos_token_id` if
+            the model has no padding token.
+        eos_token_id (:obj:`int`, `optional`):
+            The id of the `end-of-sequence` token. Defaults to :obj:`model.config.eos_token_id`.
+
+    Examples::
+
+        >>> from transformers import AutoTokenizer, AutoModelForCausalLM, ContinuousBatchingScheduler, GenerationRequest
+
+        >>> tokenizer = AutoTokenizer.from_pretrained("gpt2")
+        >>> model = AutoModelForCausalLM.from_pretrained("gpt2")
+
+        >>> prompts = ["Today is a beautiful day, and", "My cute dog", "Hello, my name is"]
+        >>> requests = (
+        ...     GenerationRequest(tokenizer(prompt, return_tensors="pt").input_ids[0], request_id=idx)
+        ...     for idx, prompt in enumerate(prompts)
+        ... )
+
+        >>> scheduler = ContinuousBatchingScheduler(model, max_batch_size=2)
+        >>> for result in scheduler.generate(requests):
+        ...     print(result.request_id, tokenizer.decode(result.sequences, skip_special_tokens=True))
+    """
+
+    def __init__(
+        self,
+        model,
+        max_batch_size: int = 8,
+        pad_token_id: Optional[int] = None,
+        eos_token_id: Optional[int] = None,
+    ):
+        if model.config.is_encoder_decoder:
+            raise ValueError("`ContinuousBatchingScheduler` only supports decoder-only models.")
+        if not isinstance(max_batch_size, int) or max_batch_size <= 0:
+            raise ValueError(f"`max_batch_size` has to be a strictly positive integer, but is {max_batch_size}")
+
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.eos_token_id = eos_token_id if eos_token_id is not None else model.config.eos_token_id
+        pad_token_id = pad_token_id if pad_token_id is not None else model.config.pad_token_id
+        if pad_token_id is None and self.eos_token_id is not None:
+            logger.warning(f"Setting `pad_token_id` to `eos_token_id`:{self.eos_token_id} for open-end generation.")
+            pad_token_id = self.eos_token_id
+        if pad_token_id is None:
+            raise ValueError("`pad_token_id` or `eos_token_id` has to be defined to pad the prompts.")
+        self.pad_token_id = pad_token_id
+
+    @torch.no_grad()
+    def generate(
+        self, requests: Union[Iterable[GenerationRequest], "queue.Queue[Optional[GenerationRequest]]"]
+    ) -> Iterator[GenerationResult]:
+        """
+        Generates the completions of :obj:`requests`, yielding each result as soon as its request is complete.
+        Results are therefore not necessarily yielded in the order of the requests.
+
+        Args:
+            requests (:obj:`Iterable[GenerationRequest]` or :obj:`queue.Queue`):
+                The requests to complete. When a :obj:`queue.Queue` is passed, requests put in the queue while
+                generating are admitted at the next decoding step, and putting :obj:`None` in the queue marks the end
+                of the requests.
+
+        Return:
+            :obj:`Iterator[GenerationResult]`: The completed requests.
+        """
+        next_request = self._get_request_reader(requests)
+
+        slots: List[_Slot] = []
+        past = attention_mask = next_token_logits = None
+        while True:
+            # admit queued requests into the free slots, only waiting for them when the batch is empty
+            new_slots = []
+            while len(slots) + len(new_slots) < self.max_batch_size:
+                request = next_request(len(slots) + len(new_slots) == 0)
+                if request is None:
+                    break
+                new_slots.append(_Slot(request, max_length=self.model.config.max_length, device=self.model.device))
+
+            if len(new_slots) > 0:
+                new_past, new_attention_mask, new_next_token_logits = self._prefill(new_slots)
+                if len(slots) == 0:
+                    past, attention_mask, next_token_logits = new_past, new_attention_mask, new_next_token_logits
+                else:
+                    past, attention_mask = self._concat_batches(past, attention_mask, new_past, new_attention_mask)
+                    next_token_logits = torch.cat([next_token_logits, new_next_token_logits], dim=0)
+                slots.extend(new_slots)
+
+            if len(slots) == 0:
+                return
+
+            next_tokens = self._get_next_tokens(slots, next_token_logits)
+
+            unfinished_idx = []
+            for batch_idx, (slot, next_token) in enumerate(zip(slots, next_tokens)):
+                slot.input_ids = torch.cat([slot.input_ids, next_token.view(1, 1)], dim=-1)
+                is_eos = self.eos_token_id is not None and next_token.item() == self.eos_token_id
+                if is_eos or slot.stopping_criteria(slot.input_ids, None):
+                    yield GenerationResult(request_id=slot.request.request_id, sequences=slot.input_ids[0])
+                else:
+                    unfinished_idx.append(batch_idx)
+
+            if len(unfinished_idx) < len(slots):
+                # evict the finished sequences
+                slots = [slots[batch_idx] for batch_idx in unfinished_idx]
+                if len(slots) == 0:
+                    continue
+                unfinished_idx = torch.tensor(unfinished_idx, dtype=torch.long, device=next_tokens.device)
+                next_tokens = next_tokens[unfinished_idx]
+                past, attention_mask = self._select_batch(past, attention_mask, unfinished_idx)
+
+            attention_mask = torch.cat([attention_mask, attention_mask.new_ones((attention_mask.shape[0], 1))], dim=-1)
+            next_token_logits, past = self._forward(next_tokens[:, None], attention_mask, past)
+
+    @staticmethod
+    def _get_request_reader(requests) -> Callable[[bool], Optional[GenerationRequest]]:
+        if isinstance(requests, queue.Queue):
+            is_exhausted = False
+
+            def next_request(block: bool) -> Optional[GenerationRequest]:
+                nonlocal is_exhausted
+                if is_exhausted:
+                    return None
+                try:
+                    request = requests.get(block=block)
+                except queue.Empty:
+                    return None
+                is_exhausted = request is None
+                return request
+
+        else:
+            iterator = iter(requests)
+
+            def next_request(block: bool) -> Optional[GenerationRequest]:
+                return next(iterator, None)
+
+        return next_request
+
+    def _forward(
+        self, input_ids: torch.LongTensor, attention_mask: torch.LongTensor, past: Optional[Tuple]
+    ) -> Tuple[torch.FloatTensor, Tuple]:
+        model_inputs = self.model.prepare_inputs_for_generation(
+            input_ids, past=past, attention_mask=attention_mask, use_cache=True
+        )
+        outputs = self.model(**model_inputs, return_dict=True)
+        if outputs.past_key_values is None:
+            raise ValueError(f"{self.model.__class__.__name__} did not return `past_key_values`.")
+        return outputs.logits[:, -1, :], outputs.past_key_values
+
+    def _prefill(self, slots: List[_Slot]) -> Tuple[Tuple, torch.LongTensor, torch.FloatTensor]:
+        max_prompt_length = max(slot.input_ids.shape[-1] for slot in slots)
+        input_ids = torch.cat(
+            [_left_pad(slot.input_ids, max_prompt_length, dim=-1, value=self.pad_token_id) for slot in slots], dim=0
+        )
+        attention_mask = torch.cat(
+            [_left_pad(torch.ones_like(slot.input_ids), max_prompt_length, dim=-1, value=0) for slot in slots], dim=0
+        )
+        next_token_logits, past = self._forward(input_ids, attention_mask, None)
+        return past, attention_mask, next_token_logits
+
+    @staticmethod
+    def _concat_batches(
+        past: Tuple, attention_mask: torch.LongTensor, new_past: Tuple, new_attention_mask: torch.LongTensor
+    ) -> Tuple[Tuple, torch.LongTensor]:
+        length = max(attention_mask.shape[-1], new_attention_mask.shape[-1])
+        past = tuple(
+            tuple(
+                torch.cat([_left_pad(state, length, dim=-2), _left_pad(new_state, length, dim=-2)], dim=0)
+                for state, new_state in zip(layer_past, new_layer_past)
+            )
+            for layer_past, new_layer_past in zip(past, new_past)
+        )
+        attention_mask = torch.cat(
+            [_left_pad(attention_mask, length, dim=-1), _left_pad(new_attention_mask, length, dim=-1)], dim=0
+        )
+        return past, attention_mask
+
+    @staticmethod
+    def _select_batch(
+        past: Tuple, attention_mask: torch.LongTensor, batch_idx: torch.LongTensor
+    ) -> Tuple[Tuple, torch.LongTensor]:
+        attention_mask = attention_mask.index_select(0, batch_idx)
+        # drop the leading positions that are padding for all the remaining sequences
+        start = int(attention_mask.any(dim=0).long().argmax())
+        attention_mask = attention_mask[:, start:]
+        past = tuple(
+            tuple(state.index_select(0, batch_idx.to(state.device))[..., start:, :] for state in layer_past)
+            for layer_past in past
+        )
+        return past, attention_mask
+
+    @staticmethod
+    def _get_next_tokens(slots: List[_Slot], next_token_logits: torch.FloatTensor) -> torch.LongTensor:
+        next_tokens = []
+        for slot, logits in zip(slots, next_token_logits):
+            scores = slot.logits_processor(slot.input_ids, logits[None, :])
+            if slot.logits_warper is not None:
+                scores = slot.logits_warper(slot.input_ids, scores)
+                probs = nn.functional.softmax(scores, dim=-1)
+                next_tokens.append(torch.multinomial(probs, num_samples=1)[0, 0])
+            else:
+                next_tokens.append(torch.argmax(scores, dim=-1)[0])
+        return torch.stack(next_tokens)
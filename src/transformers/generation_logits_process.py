@@ -16,7 +16,8 @@
 import inspect
 import math
 from abc import ABC
-from typing import Callable, Iterable, List
+from collections import deque
+from typing import Callable, Iterable, List, Optional, Tuple
 
 import numpy as np
 import torch
@@ -93,6 +94,19 @@ class LogitsProcessorList(list):
                 scores = processor(input_ids, scores)
         return scores
 
+    def reorder_state(self, beam_idx: torch.LongTensor):
+        """
+        Reorders the internal state of the stateful processors in the list (the ones implementing
+        :obj:`reorder_state`) so that it follows the hypotheses selected by beam search at the current step.
+
+        Args:
+            beam_idx (:obj:`torch.LongTensor` of shape :obj:`(batch_size * num_beams,)`):
+                For each hypothesis of the next step, the index of the hypothesis of the current step it extends.
+        """
+        for processor in self:
+            if hasattr(processor, "reorder_state"):
+                processor.reorder_state(beam_idx)
+
 
 class MinLengthLogitsProcessor(LogitsProcessor):
     r"""
@@ -239,6 +253,128 @@ class TopKLogitsWarper(LogitsWarper):
         return scores
 
 
+class TopKTopPLogitsWarper(LogitsWarper):
+    r"""
+    :class:`transformers.LogitsWarper` applying :class:`~transformers.TemperatureLogitsWarper`,
+    :class:`~transformers.TopKLogitsWarper` and :class:`~transformers.TopPLogitsWarper` in a single pass: the scores are
+    reduced once to the :obj:`top_k` highest ones, on which the temperature and the top-p filtering are applied, instead
+    of sorting the whole vocabulary. :meth:`sample` additionally samples the next tokens from these candidates directly.
+
+    Args:
+        top_k (:obj:`int`):
+            The number of highest probability vocabulary tokens to keep for top-k-filtering.
+        top_p (:obj:`float`, `optional`, defaults to 1.0):
+            If set to < 1, only the most probable tokens with probabilities that add up to :obj:`top_p` or higher are
+            kept for generation.
+        temperature (:obj:`float`, `optional`, defaults to 1.0):
+            The value used to module the logits distribution.
+        filter_value (:obj:`float`, `optional`, defaults to :obj:`-float("Inf")`):
+            All filtered values will be set to this float value.
+        min_tokens_to_keep (:obj:`int`, `optional`, defaults to 1):
+            Minimum number of tokens that cannot be filtered.
+    """
+
+    def __init__(
+        self,
+        top_k: int,
+        top_p: float = 1.0,
+        temperature: float = 1.0,
+        filter_value: float = -float("Inf"),
+        min_tokens_to_keep: int = 1,
+    ):
+        # the separate warpers validate the arguments and are used for the rows where a single pass is not exact
+        self.warpers = LogitsProcessorList()
+        if temperature != 1.0:
+            self.warpers.append(TemperatureLogitsWarper(temperature))
+        self.warpers.append(TopKLogitsWarper(top_k, filter_value=filter_value, min_tokens_to_keep=min_tokens_to_keep))
+        if top_p < 1.0:
+            self.warpers.append(
+                TopPLogitsWarper(top_p, filter_value=filter_value, min_tokens_to_keep=min_tokens_to_keep)
+            )
+
+        self.top_k = top_k
+        self.top_p = top_p
+        self.temperature = temperature
+        self.filter_value = filter_value
+        self.min_tokens_to_keep = min_tokens_to_keep
+
+    def _get_candidates(self, scores: torch.FloatTensor) -> Optional[Tuple[torch.FloatTensor, torch.LongTensor]]:
+        """
+        Returns the warped scores of the :obj:`top_k` highest scores of each row, sorted in descending order, along
+        with their indices, or :obj:`None` if a row has more than :obj:`top_k` tokens tied with its :obj:`top_k`-th
+        highest score, which :class:`~transformers.TopKLogitsWarper` would all keep.
+        """
+        top_k = min(max(self.top_k, self.min_tokens_to_keep), scores.size(-1))
+        candidate_scores, candidate_indices = torch.topk(scores, top_k)
+
+        kth_scores = candidate_scores[..., -1:]
+        has_ties = (scores >= kth_scores).sum(dim=-1) > top_k
+        if self.filter_value == -float("Inf"):
+            # the tokens tied with a filtered k-th score are filtered anyway
+            has_ties &= kth_scores.squeeze(-1) > self.filter_value
+        if has_ties.any():
+            return None
+
+        if self.temperature != 1.0:
+            candidate_scores = candidate_scores / self.temperature
+
+        if self.top_p < 1.0:
+            cumulative_probs = candidate_scores.softmax(dim=-1).cumsum(dim=-1)
+
+            # same filtering as `TopPLogitsWarper`, on scores that are already sorted
+            sorted_indices_to_remove = cumulative_probs > self.top_p
+            if self.min_tokens_to_keep > 1:
+                sorted_indices_to_remove[..., : self.min_tokens_to_keep - 1] = 0
+            sorted_indices_to_remove[..., 1:] = sorted_indices_to_remove[..., :-1].clone()
+            sorted_indices_to_remove[..., 0] = 0
+            candidate_scores = candidate_scores.masked_fill(sorted_indices_to_remove, self.filter_value)
+
+        return candidate_scores, candidate_indices
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.FloatTensor:
+        candidates = self._get_candidates(scores)
+        if candidates is None:
+            return self.warpers(input_ids, scores)
+
+        candidate_scores, candidate_indices = candidates
+        return scores.new_full(scores.shape, self.filter_value).scatter_(-1, candidate_indices, candidate_scores)
+
+    def sample(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.LongTensor:
+        """
+        Samples the next token of each row from the distribution of the warped :obj:`scores`, without building the
+        warped scores of the whole vocabulary.
+
+        Args:
+            input_ids (:obj:`torch.LongTensor` of shape :obj:`(batch_size, sequence_length)`):
+                Indices of input sequence tokens in the vocabulary.
+            scores (:obj:`torch.FloatTensor` of shape :obj:`(batch_size, config.vocab_size)`):
+                Prediction scores of a language modeling head.
+
+        Return:
+            :obj:`torch.LongTensor` of shape :obj:`(batch_size,)`: The sampled tokens.
+        """
+        candidates = self._get_candidates(scores)
+        if candidates is None or self.filter_value != -float("Inf"):
+            # the filtered tokens keep a non-zero probability with a finite `filter_value`
+            probs = self(input_ids, scores).softmax(dim=-1)
+            return torch.multinomial(probs, num_samples=1).squeeze(1)
+
+        candidate_scores, candidate_indices = candidates
+        candidate_idx = torch.multinomial(candidate_scores.softmax(dim=-1), num_samples=1)
+        return candidate_indices.gather(-1, candidate_idx).squeeze(1)
+
+
+def _extends_input_ids(previous_input_ids: Optional[torch.LongTensor], input_ids: torch.LongTensor) -> bool:
+    """Whether :obj:`input_ids` are :obj:`previous_input_ids` with exactly one more token appended to each row."""
+    return (
+        previous_input_ids is not None
+        and previous_input_ids.device == input_ids.device
+        and previous_input_ids.shape[0] == input_ids.shape[0]
+        and previous_input_ids.shape[-1] + 1 == input_ids.shape[-1]
+        and torch.equal(previous_input_ids, input_ids[:, :-1])
+    )
+
+
 def _get_ngrams(ngram_size: int, prev_input_ids: torch.Tensor, num_hypos: int):
     generated_ngrams = [{} for _ in range(num_hypos)]
     for idx in range(num_hypos):
@@ -257,28 +393,16 @@ def _get_generated_ngrams(banned_ngrams, prev_input_ids, ngram_size, cur_len):
     return banned_ngrams.get(ngram_idx, [])
 
 
-def _calc_banned_ngram_tokens(
-    ngram_size: int, prev_input_ids: torch.Tensor, num_hypos: int, cur_len: int
-) -> List[Iterable[int]]:
-    """Copied from fairseq for no_repeat_ngram in beam_search"""
-    if cur_len + 1 < ngram_size:
-        # return no banned tokens if we haven't generated no_repeat_ngram_size tokens yet
-        return [[] for _ in range(num_hypos)]
-
-    generated_ngrams = _get_ngrams(ngram_size, prev_input_ids, num_hypos)
-
-    banned_tokens = [
-        _get_generated_ngrams(generated_ngrams[hypo_idx], prev_input_ids[hypo_idx], ngram_size, cur_len)
-        for hypo_idx in range(num_hypos)
-    ]
-    return banned_tokens
-
-
 class NoRepeatNGramLogitsProcessor(LogitsProcessor):
     r"""
     :class:`transformers.LogitsProcessor` that enforces no repetition of n-grams. See `Fairseq
     <https://github.com/pytorch/fairseq/blob/a07cb6f40480928c9e0548b737aadd36ee66ac76/fairseq/sequence_generator.py#L345>`__.
 
+    The processor keeps an index of the n-grams generated so far by each hypothesis. When it is called on the
+    :obj:`input_ids` of the previous call extended by one token, only the newly completed n-grams are added to the
+    index. Beam search keeps the index aligned with the selected hypotheses through :meth:`reorder_state`. In any
+    other case, the index is rebuilt from :obj:`input_ids`.
+
     Args:
         ngram_size (:obj:`int`):
             All ngrams of size :obj:`ngram_size` can only occur once.
@@ -288,17 +412,67 @@ class NoRepeatNGramLogitsProcessor(LogitsProcessor):
         if not isinstance(ngram_size, int) or ngram_size <= 0:
             raise ValueError(f"`ngram_size` has to be a strictly positive integer, but is {ngram_size}")
         self.ngram_size = ngram_size
+        self._generated_ngrams = None
+        self._input_ids = None
 
     def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.FloatTensor:
         num_batch_hypotheses = scores.shape[0]
         cur_len = input_ids.shape[-1]
-        banned_batch_tokens = _calc_banned_ngram_tokens(self.ngram_size, input_ids, num_batch_hypotheses, cur_len)
 
-        for i, banned_tokens in enumerate(banned_batch_tokens):
-            scores[i, banned_tokens] = -float("inf")
+        if _extends_input_ids(self._input_ids, input_ids):
+            self._add_last_ngrams(input_ids)
+        else:
+            self._generated_ngrams = _get_ngrams(self.ngram_size, input_ids, num_batch_hypotheses)
+        self._input_ids = input_ids
+
+        if cur_len + 1 < self.ngram_size:
+            # no banned tokens if we haven't generated no_repeat_ngram_size tokens yet
+            return scores
+
+        banned_rows, banned_tokens = [], []
+        prev_ngrams = input_ids[:, cur_len + 1 - self.ngram_size :].tolist()
+        for hypo_idx, prev_ngram in enumerate(prev_ngrams):
+            hypo_banned_tokens = self._generated_ngrams[hypo_idx].get(tuple(prev_ngram), [])
+            banned_rows.extend([hypo_idx] * len(hypo_banned_tokens))
+            banned_tokens.extend(hypo_banned_tokens)
+
+        if len(banned_tokens) > 0:
+            scores[banned_rows, banned_tokens] = -float("inf")
 
         return scores
 
+    def reorder_state(self, beam_idx: torch.LongTensor):
+        """
+        Reorders the n-gram index so that it follows the hypotheses selected by beam search.
+
+        Args:
+            beam_idx (:obj:`torch.LongTensor` of shape :obj:`(batch_size * num_beams,)`):
+                For each hypothesis of the next step, the index of the hypothesis of the current step it extends.
+        """
+        if self._generated_ngrams is None:
+            return
+
+        reordered_ngrams = []
+        used_hypo_idx = set()
+        for hypo_idx in beam_idx.tolist():
+            generated_ngram = self._generated_ngrams[hypo_idx]
+            if hypo_idx in used_hypo_idx:
+                # the n-gram lists are never modified in place so a shallow copy is enough
+                generated_ngram = dict(generated_ngram)
+            used_hypo_idx.add(hypo_idx)
+            reordered_ngrams.append(generated_ngram)
+
+        self._generated_ngrams = reordered_ngrams
+        self._input_ids = self._input_ids.index_select(0, beam_idx.to(self._input_ids.device))
+
+    def _add_last_ngrams(self, input_ids: torch.LongTensor):
+        if input_ids.shape[-1] < self.ngram_size:
+            return
+
+        for generated_ngram, ngram in zip(self._generated_ngrams, input_ids[:, -self.ngram_size :].tolist()):
+            prev_ngram_tuple = tuple(ngram[:-1])
+            generated_ngram[prev_ngram_tuple] = generated_ngram.get(prev_ngram_tuple, []) + [ngram[-1]]
+
 
 class EncoderNoRepeatNGramLogitsProcessor(LogitsProcessor):
     r"""
@@ -345,6 +519,11 @@ class NoBadWordsLogitsProcessor(LogitsProcessor):
     """
     :class:`transformers.LogitsProcessor` that enforces that specified sequences will never be sampled.
 
+    The banned sequences are compiled once into an Aho-Corasick automaton over their token ids. Each hypothesis
+    carries its automaton state forward by one token per generation step, and the tokens completing a banned sequence
+    from that state are masked with tensor operations. Banned sequences of a single token are applied as a static
+    mask.
+
     Args:
         bad_words_ids (:obj:`List[List[int]]`):
             List of list of token ids that are not allowed to be generated. In order to get the tokens of the words
@@ -373,75 +552,125 @@ class NoBadWordsLogitsProcessor(LogitsProcessor):
         for banned_token_seq in self.bad_words_ids:
             assert len(banned_token_seq) > 0, f"Banned words token sequences {bad_words_ids} cannot have an empty list"
 
-    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.FloatTensor:
-        banned_tokens = self._calc_banned_bad_words_ids(input_ids)
-        scores = self._set_scores_to_inf_for_banned_tokens(scores, banned_tokens)
+        self._build_automaton()
 
-        return scores
+        # tensors depending on the vocabulary size and device, built on the first call
+        self._static_bad_words_mask = None
+        self._banned_tokens_per_state = None
 
-    def _tokens_match(self, prev_tokens: torch.LongTensor, tokens: List[int]) -> bool:
-        if len(tokens) == 0:
-            # if bad word tokens is just one token always ban it
-            return True
-        elif len(tokens) > len(prev_tokens):
-            # if bad word tokens are longer then prev input_ids they can't be equal
-            return False
-        elif prev_tokens[-len(tokens) :].tolist() == tokens:
-            # if tokens match
-            return True
-        else:
-            return False
+        # automaton state of each hypothesis after reading `self._input_ids`
+        self._states = None
+        self._input_ids = None
 
-    def _calc_banned_bad_words_ids(self, prev_input_ids: Iterable[int]) -> Iterable[int]:
-        banned_tokens = []
-        for prev_input_ids_slice in prev_input_ids:
-            banned_tokens_slice = []
-            for banned_token_seq in self.bad_words_ids:
-                if self._tokens_match(prev_input_ids_slice, banned_token_seq[:-1]) is False:
-                    # if tokens do not match continue
-                    continue
+    def _build_automaton(self):
+        # trie of the banned sequences without their last token, state 0 being the root. `banned_next_tokens[state]`
+        # holds the last tokens of the banned sequences whose prefix is the trie node `state`.
+        self._goto = [{}]
+        banned_next_tokens = [set()]
+        for banned_token_seq in self.bad_words_ids:
+            state = 0
+            for token in banned_token_seq[:-1]:
+                token = int(token)
+                if token not in self._goto[state]:
+                    self._goto[state][token] = len(self._goto)
+                    self._goto.append({})
+                    banned_next_tokens.append(set())
+                state = self._goto[state][token]
+            banned_next_tokens[state].add(int(banned_token_seq[-1]))
+
+        self._static_bad_words_ids = sorted(banned_next_tokens[0])
+
+        # failure links point to the longest proper suffix of a state which is also a state. Walking them in
+        # breadth-first order lets each state inherit the banned tokens of its suffixes (except the root's, which
+        # are handled by the static mask).
+        self._fail = [0] * len(self._goto)
+        self._banned_tokens = [set() for _ in self._goto]
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            self._banned_tokens[state] = banned_next_tokens[state] | self._banned_tokens[self._fail[state]]
+            for token, next_state in self._goto[state].items():
+                fail_state = self._fail[state]
+                while fail_state != 0 and token not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                self._fail[next_state] = self._goto[fail_state].get(token, 0)
+                queue.append(next_state)
+
+    def _next_state(self, state: int, token: int) -> int:
+        while state != 0 and token not in self._goto[state]:
+            state = self._fail[state]
+        return self._goto[state].get(token, 0)
+
+    def _prepare_banned_tokens_tensors(self, scores: torch.FloatTensor):
+        vocab_size = scores.shape[-1]
+        if self._static_bad_words_mask is not None and self._static_bad_words_mask.shape[-1] == vocab_size:
+            self._static_bad_words_mask = self._static_bad_words_mask.to(scores.device)
+            self._banned_tokens_per_state = self._banned_tokens_per_state.to(scores.device)
+            return
 
-                banned_tokens_slice.append(banned_token_seq[-1])
+        invalid_bad_words_ids = sorted(
+            {token for banned_token_seq in self.bad_words_ids for token in banned_token_seq if token >= vocab_size}
+        )
+        for token in invalid_bad_words_ids:
+            logger.error(
+                f"An invalid bad word ID is defined: {token}. This ID is not contained in the"
+                f"vocabulary, and is therefore ignored."
+            )
+
+        static_bad_words_ids = [token for token in self._static_bad_words_ids if token < vocab_size]
+        self._static_bad_words_mask = torch.zeros(vocab_size, dtype=torch.bool, device=scores.device)
+        self._static_bad_words_mask[static_bad_words_ids] = True
+
+        # one row per state, padded with `vocab_size` which points to a scratch column of the mask
+        max_num_banned_tokens = max(len(banned_tokens) for banned_tokens in self._banned_tokens)
+        banned_tokens_per_state = torch.full(
+            (len(self._banned_tokens), max_num_banned_tokens), vocab_size, dtype=torch.long
+        )
+        for state, banned_tokens in enumerate(self._banned_tokens):
+            banned_tokens = [token for token in banned_tokens if token < vocab_size]
+            banned_tokens_per_state[state, : len(banned_tokens)] = torch.tensor(banned_tokens, dtype=torch.long)
+        self._banned_tokens_per_state = banned_tokens_per_state.to(scores.device)
 
-            banned_tokens.append(banned_tokens_slice)
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.FloatTensor:
+        if _extends_input_ids(self._input_ids, input_ids):
+            self._states = [
+                self._next_state(state, token) for state, token in zip(self._states, input_ids[:, -1].tolist())
+            ]
+        else:
+            self._states = []
+            for prev_input_ids_slice in input_ids.tolist():
+                state = 0
+                for token in prev_input_ids_slice:
+                    state = self._next_state(state, token)
+                self._states.append(state)
+        self._input_ids = input_ids
+
+        self._prepare_banned_tokens_tensors(scores)
+        banned_mask = self._static_bad_words_mask.expand_as(scores)
+
+        if self._banned_tokens_per_state.shape[-1] > 0:
+            states = torch.tensor(self._states, dtype=torch.long, device=scores.device)
+            banned_tokens = self._banned_tokens_per_state[states]
+            dynamic_banned_mask = torch.zeros(
+                (scores.shape[0], scores.shape[-1] + 1), dtype=torch.bool, device=scores.device
+            ).scatter_(1, banned_tokens, True)
+            banned_mask = banned_mask | dynamic_banned_mask[:, :-1]
 
-        return banned_tokens
+        scores = scores.masked_fill(banned_mask, -float("inf"))
+        return scores
 
-    def _set_scores_to_inf_for_banned_tokens(self, scores: torch.Tensor, banned_tokens: List[List[int]]) -> None:
+    def reorder_state(self, beam_idx: torch.LongTensor):
         """
-        Modifies the scores in place by setting the banned token positions to `-inf`. Banned token is expected to be a
-        list of list of banned tokens to ban in the format [[batch index, vocabulary position],...
+        Reorders the automaton states so that they follow the hypotheses selected by beam search.
 
         Args:
-            scores: logits distribution of shape (batch size, vocabulary size)
-            banned_tokens: list of list of tokens to ban of length (batch_size)
+            beam_idx (:obj:`torch.LongTensor` of shape :obj:`(batch_size * num_beams,)`):
+                For each hypothesis of the next step, the index of the hypothesis of the current step it extends.
         """
-        banned_mask_list = []
-        for idx, batch_banned_tokens in enumerate(banned_tokens):
-            for token in batch_banned_tokens:
-                # Eliminates invalid bad word IDs that are over the vocabulary size.
-                if token <= scores.shape[1]:
-                    banned_mask_list.append([idx, token])
-                else:
-                    logger.error(
-                        f"An invalid bad word ID is defined: {token}. This ID is not contained in the"
-                        f"vocabulary, and is therefore ignored."
-                    )
-        if not banned_mask_list:
-            return scores
-
-        banned_mask = torch.LongTensor(banned_mask_list)
-        indices = torch.ones(len(banned_mask))
-        # A sparse tensor is generated from a list of coordinates: [[0, 1], [0, 2], [2, 0]]. A conversion to dense tensor generates:
-        # [ 0  1  1 ]
-        # [ 0  0  0 ]
-        # [ 1  0  0 ]
-
-        banned_mask = (
-            torch.sparse.LongTensor(banned_mask.t(), indices, scores.size()).to(scores.device).to_dense().bool()
-        )
-        scores = scores.masked_fill(banned_mask, -float("inf"))
-        return scores
+        if self._states is None:
+            return
+        self._states = [self._states[hypo_idx] for hypo_idx in beam_idx.tolist()]
+        self._input_ids = self._input_ids.index_select(0, beam_idx.to(self._input_ids.device))
 
 
 class PrefixConstrainedLogitsProcessor(LogitsProcessor):
@@ -0,0 +1,191 @@
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from queue import Queue
+from typing import List, Optional
+
+import torch
+
+from .tokenization_utils_base import IncrementalDecoder, PreTrainedTokenizerBase
+
+
+class BaseStreamer:
+    """
+    Base class for all streamers that can be passed to :meth:`~transformers.generation_utils.GenerationMixin.generate`
+    to receive the tokens as soon as they are generated.
+
+    :meth:`~transformers.generation_utils.GenerationMixin.generate` first calls :meth:`put` with the prompt (or the
+    decoder start tokens for encoder-decoder models), then with the newly committed tokens after each generation step,
+    and finally calls :meth:`end` once the generation is over.
+    """
+
+    def put(self, value: torch.LongTensor):
+        """Called with the token ids of shape :obj:`(1, sequence_length)` or :obj:`(1,)` committed at each step."""
+        raise NotImplementedError(
+            f"{self.__class__} is an abstract class. Only classes inheriting this class can be called."
+        )
+
+    def end(self):
+        """Called once the generation is over."""
+        raise NotImplementedError(
+            f"{self.__class__} is an abstract class. Only classes inheriting this class can be called."
+        )
+
+
+class TextStreamer(BaseStreamer):
+    """
+    Streamer decoding the generated tokens incrementally and printing the text to stdout as soon as it is complete.
+
+    The tokens are decoded with an :class:`~transformers.IncrementalDecoder`, so the cost of each step does not grow
+    with the length of the generated sequence and new text is only printed once it does not end with an incomplete
+    UTF-8 character.
+
+    The printing can be changed by overriding :meth:`on_finalized_text`.
+
+    Args:
+        tokenizer (:class:`~transformers.PreTrainedTokenizerBase`):
+            The tokenizer used to decode the tokens.
+        skip_prompt (:obj:`bool`, `optional`, defaults to :obj:`False`):
+            Whether or not to skip the prompt passed to :meth:`~transformers.generation_utils.GenerationMixin.generate`.
+        decode_kwargs:
+            Additional keyword arguments passed to the :obj:`decode` method of the tokenizer, e.g.
+            :obj:`skip_special_tokens`.
+
+    Examples::
+
+        >>> from transformers import AutoModelForCausalLM, AutoTokenizer, TextStreamer
+
+        >>> tokenizer = AutoTokenizer.from_pretrained("gpt2")
+        >>> model = AutoModelForCausalLM.from_pretrained("gpt2")
+        >>> inputs = tokenizer(["An increasing sequence: one,"], return_tensors="pt")
+        >>> streamer = TextStreamer(tokenizer)
+
+        >>> # the text is printed while it is generated
+        >>> _ = model.generate(**inputs, streamer=streamer, max_length=30)
+    """
+
+    # number of prompt tokens kept as decoding context when the prompt is skipped
+    _prompt_context_length = 5
+
+    def __init__(self, tokenizer: PreTrainedTokenizerBase, skip_prompt: bool = False, **decode_kwargs):
+        self.tokenizer = tokenizer
+        self.skip_prompt = skip_prompt
+        self.decode_kwargs = decode_kwargs
+
+        self.decoder = IncrementalDecoder(tokenizer, **decode_kwargs)
+        self.next_tokens_are_prompt = True
+
+    def put(self, value: torch.LongTensor):
+        if value.dim() > 1 and value.shape[0] > 1:
+            raise ValueError(f"{self.__class__.__name__} only supports a batch size of 1, but got {value.shape[0]}.")
+        token_ids = value.view(-1).tolist()
+
+        if self.skip_prompt and self.next_tokens_are_prompt:
+            self.next_tokens_are_prompt = False
+            self.decoder.reset(prefix_token_ids=token_ids[-self._prompt_context_length :])
+            return
+        self.next_tokens_are_prompt = False
+
+        self.on_finalized_text(self.decoder.add(token_ids), token_ids=token_ids)
+
+    def end(self):
+        text = self.decoder.flush()
+        self.next_tokens_are_prompt = True
+        self.on_finalized_text(text, token_ids=[], stream_end=True)
+
+    def on_finalized_text(self, text: str, token_ids: List[int], stream_end: bool = False):
+        """
+        Called after each step with the newly finalized text, which can be empty.
+
+        Args:
+            text (:obj:`str`):
+                The text decoded since the last call.
+            token_ids (:obj:`List[int]`):
+                The token ids committed at this step. Their text can be part of a later call if it was incomplete.
+            stream_end (:obj:`bool`, `optional`, defaults to :obj:`False`):
+                Whether or not the generation is over.
+        """
+        print(text, flush=True, end="" if not stream_end else None)
+
+
+class TextIteratorStreamer(TextStreamer):
+    """
+    Streamer storing the incrementally decoded text in a queue, to be consumed as an iterator. This is useful to
+    access the generated text from another thread than the one running
+    :meth:`~transformers.generation_utils.GenerationMixin.generate`, e.g. in an interactive application.
+
+    Args:
+        tokenizer (:class:`~transformers.PreTrainedTokenizerBase`):
+            The tokenizer used to decode the tokens.
+        skip_prompt (:obj:`bool`, `optional`, defaults to :obj:`False`):
+            Whether or not to skip the prompt passed to :meth:`~transformers.generation_utils.GenerationMixin.generate`.
+        timeout (:obj:`float`, `optional`):
+            The number of seconds to wait for the next text before raising a :obj:`queue.Empty` exception. Waits
+            indefinitely if :obj:`None`.
+        return_token_ids (:obj:`bool`, `optional`, defaults to :obj:`False`):
+            Whether or not to iterate over :obj:`(token_ids, text)` tuples holding the token ids committed at each step
+            along with the newly finalized text, instead of the text only.
+        decode_kwargs:
+            Additional keyword arguments passed to the :obj:`decode` method of the tokenizer, e.g.
+            :obj:`skip_special_tokens`.
+
+    Examples::
+
+        >>> from threading import Thread
+        >>> from transformers import AutoModelForCausalLM, AutoTokenizer, TextIteratorStreamer
+
+        >>> tokenizer = AutoTokenizer.from_pretrained("gpt2")
+        >>> model = AutoModelForCausalLM.from_pretrained("gpt2")
+        >>> inputs = tokenizer(["An increasing sequence: one,"], return_tensors="pt")
+        >>> streamer = TextIteratorStreamer(tokenizer, skip_prompt=True)
+
+        >>> thread = Thread(target=model.generate, kwargs=dict(inputs, streamer=streamer, max_length=30))
+        >>> thread.start()
+        >>> generated_text = ""
+        >>> for new_text in streamer:
+        ...     generated_text += new_text
+    """
+
+    def __init__(
+        self,
+        tokenizer: PreTrainedTokenizerBase,
+        skip_prompt: bool = False,
+        timeout: Optional[float] = None,
+        return_token_ids: bool = False,
+        **decode_kwargs
+    ):
+        super().__init__(tokenizer, skip_prompt=skip_prompt, **decode_kwargs)
+        self.timeout = timeout
+        self.return_token_ids = return_token_ids
+        self.queue = Queue()
+        self.stop_signal = None
+
+    def on_finalized_text(self, text: str, token_ids: List[int], stream_end: bool = False):
+        if self.return_token_ids:
+            if len(text) > 0 or len(token_ids) > 0:
+                self.queue.put((token_ids, text), timeout=self.timeout)
+        elif len(text) > 0:
+            self.queue.put(text, timeout=self.timeout)
+        if stream_end:
+            self.queue.put(self.stop_signal, timeout=self.timeout)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        value = self.queue.get(timeout=self.timeout)
+        if value is self.stop_signal:
+            raise StopIteration()
+        return value
@@ -16,14 +16,15 @@
 
 import warnings
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import torch
 import torch.distributed as dist
 from torch import nn
 
 from .file_utils import ModelOutput
-from .generation_beam_search import BeamScorer, BeamSearchScorer
+from .generation_beam_search import BeamScorer, TensorizedBeamSearchScorer
+from .generation_cache_utils import EncoderOutputCache, StaticKeyValueCache
 from .generation_logits_process import (
     EncoderNoRepeatNGramLogitsProcessor,
     ForcedBOSTokenLogitsProcessor,
@@ -38,6 +39,7 @@ from .generation_logits_process import (
     RepetitionPenaltyLogitsProcessor,
     TemperatureLogitsWarper,
     TopKLogitsWarper,
+    TopKTopPLogitsWarper,
     TopPLogitsWarper,
 )
 from .generation_stopping_criteria import (
@@ -47,9 +49,14 @@ from .generation_stopping_criteria import (
     StoppingCriteriaList,
     validate_stopping_criteria,
 )
+from .generation_streamers import BaseStreamer
 from .utils import logging
 
 
+if TYPE_CHECKING:
+    from .modeling_utils import PreTrainedModel
+
+
 logger = logging.get_logger(__name__)
 
 
@@ -404,7 +411,7 @@ class GenerationMixin:
         return input_ids.new_ones(input_ids.shape, dtype=torch.long)
 
     def _prepare_encoder_decoder_kwargs_for_generation(
-        self, input_ids: torch.LongTensor, model_kwargs
+        self, input_ids: torch.LongTensor, model_kwargs, encoder_output_cache: Optional[EncoderOutputCache] = None
     ) -> Dict[str, Any]:
         if "encoder_outputs" not in model_kwargs:
             # retrieve encoder hidden states
@@ -414,7 +421,15 @@ class GenerationMixin:
                 for argument, value in model_kwargs.items()
                 if not (argument.startswith("decoder_") or argument.startswith("cross_attn"))
             }
-            model_kwargs["encoder_outputs"]: ModelOutput = encoder(input_ids, return_dict=True, **encoder_kwargs)
+            if encoder_output_cache is not None:
+                cache_kwargs = dict(encoder_kwargs, input_ids=input_ids)
+                encoder_outputs = encoder_output_cache.get(encoder, cache_kwargs)
+                if encoder_outputs is None:
+                    encoder_outputs = encoder(input_ids, return_dict=True, **encoder_kwargs)
+                    encoder_output_cache.put(encoder, cache_kwargs, encoder_outputs)
+                model_kwargs["encoder_outputs"]: ModelOutput = encoder_outputs
+            else:
+                model_kwargs["encoder_outputs"]: ModelOutput = encoder(input_ids, return_dict=True, **encoder_kwargs)
         return model_kwargs
 
     def _prepare_decoder_input_ids_for_generation(
@@ -465,6 +480,7 @@ class GenerationMixin:
         is_encoder_decoder: bool = False,
         attention_mask: torch.LongTensor = None,
         encoder_outputs: ModelOutput = None,
+        broadcast_encoder_outputs: bool = False,
         **model_kwargs,
     ) -> Tuple[torch.LongTensor, Dict[str, Any]]:
         expanded_return_idx = (
@@ -481,9 +497,12 @@ class GenerationMixin:
 
         if is_encoder_decoder:
             assert encoder_outputs is not None
-            encoder_outputs["last_hidden_state"] = encoder_outputs.last_hidden_state.index_select(
-                0, expanded_return_idx.to(encoder_outputs.last_hidden_state.device)
-            )
+            # with `broadcast_encoder_outputs`, the cross-attention layers share the encoder hidden states of each input
+            # between its `expand_size` consecutive rows instead of attending to copies of them
+            if not broadcast_encoder_outputs:
+                encoder_outputs["last_hidden_state"] = encoder_outputs.last_hidden_state.index_select(
+                    0, expanded_return_idx.to(encoder_outputs.last_hidden_state.device)
+                )
             model_kwargs["encoder_outputs"] = encoder_outputs
         return input_ids, model_kwargs
 
@@ -516,11 +535,153 @@ class GenerationMixin:
 
         return model_kwargs
 
+    def _get_cache(
+        self, cache_implementation: str, max_length: Optional[int], use_cache: Optional[bool], past: Optional[Any]
+    ) -> StaticKeyValueCache:
+        if cache_implementation != "static":
+            raise ValueError(f"`cache_implementation` has to be 'static', but is {cache_implementation}.")
+        if not self.supports_static_cache:
+            raise ValueError(f"{self.__class__.__name__} does not support `cache_implementation='static'`.")
+        if use_cache is False or (use_cache is None and not self.config.use_cache):
+            raise ValueError("`cache_implementation='static'` requires `use_cache=True`.")
+        if past is not None:
+            raise ValueError("`cache_implementation='static'` cannot be used together with `past`.")
+        if max_length is None:
+            raise ValueError("`max_length` or `max_new_tokens` has to be set to use `cache_implementation='static'`.")
+
+        return StaticKeyValueCache(num_layers=self.config.num_hidden_layers, max_length=max_length)
+
+    def _reorder_past(self, past, beam_idx):
+        if isinstance(past, StaticKeyValueCache):
+            # the buffers are reordered in place
+            past.reorder_cache(beam_idx)
+            return past
+        return self._reorder_cache(past, beam_idx)
+
     def _reorder_cache(self, past, beam_idx):
         raise NotImplementedError(
             f"Make sure that a `_reorder_cache` function is correctly implemented in {self.__class__.__module__} to enable beam search for {self.__class__}"
         )
 
+    def _check_prune_finished_sequences(
+        self,
+        eos_token_id: Optional[int],
+        output_attentions: bool,
+        output_hidden_states: bool,
+        return_dict_in_generate: bool,
+        synced_gpus: Optional[bool],
+        model_kwargs: Dict[str, Any],
+    ):
+        if eos_token_id is None:
+            raise ValueError("`prune_finished_sequences=True` requires `eos_token_id` to be defined.")
+        if return_dict_in_generate and (output_attentions or output_hidden_states):
+            raise ValueError(
+                "`prune_finished_sequences=True` cannot be used together with `output_attentions` or "
+                "`output_hidden_states`."
+            )
+        if synced_gpus:
+            raise ValueError("`prune_finished_sequences=True` cannot be used together with `synced_gpus`.")
+        if isinstance(model_kwargs.get("past"), StaticKeyValueCache):
+            raise ValueError("`prune_finished_sequences=True` cannot be used together with a static cache.")
+
+    @classmethod
+    def _index_select_past(cls, past, index: torch.LongTensor):
+        """Selects the rows :obj:`index` of the first dimension of all the tensors of the nested :obj:`past`."""
+        if isinstance(past, torch.Tensor):
+            return past.index_select(0, index.to(past.device))
+        if isinstance(past, dict):
+            return {key: cls._index_select_past(value, index) for key, value in past.items()}
+        if isinstance(past, (list, tuple)):
+            return type(past)(cls._index_select_past(value, index) for value in past)
+        return past
+
+    def _prune_finished_sequences(
+        self,
+        unfinished_sequences: torch.LongTensor,
+        active_rows: Optional[torch.LongTensor],
+        model_kwargs: Dict[str, Any],
+    ) -> Tuple[Optional[torch.LongTensor], Dict[str, Any]]:
+        """
+        Drops the rows of the sequences that finished since the last call from the batch dimension of
+        :obj:`model_kwargs` and returns the indices of the rows of the full batch that are still running (or
+        :obj:`None` if no row was dropped yet) along with the pruned :obj:`model_kwargs`.
+        """
+        running = unfinished_sequences if active_rows is None else unfinished_sequences[active_rows]
+        if running.all():
+            return active_rows, model_kwargs
+        keep_idx = running.nonzero().view(-1)
+        active_rows = keep_idx if active_rows is None else active_rows[keep_idx]
+
+        if model_kwargs.get("past") is not None:
+            if self.config.is_encoder_decoder or type(self)._reorder_cache is GenerationMixin._reorder_cache:
+                # `_reorder_cache` leaves the cached cross-attention states untouched, they have to be pruned as well.
+                # Models without a `_reorder_cache` use the default layout, with the batch on the first dimension.
+                model_kwargs["past"] = self._index_select_past(model_kwargs["past"], keep_idx)
+            else:
+                model_kwargs["past"] = self._reorder_past(model_kwargs["past"], keep_idx)
+        for key, value in model_kwargs.items():
+            # all the per-row inputs (attention masks, position ids...), the head masks are per layer instead
+            if (
+                key != "past"
+                and isinstance(value, torch.Tensor)
+                and value.dim() > 0
+                and value.shape[0] == len(running)
+                and "head_mask" not in key
+            ):
+                model_kwargs[key] = value.index_select(0, keep_idx.to(value.device))
+        if model_kwargs.get("encoder_outputs") is not None:
+            encoder_outputs = model_kwargs["encoder_outputs"]
+            encoder_outputs["last_hidden_state"] = encoder_outputs.last_hidden_state.index_select(
+                0, keep_idx.to(encoder_outputs.last_hidden_state.device)
+            )
+        return active_rows, model_kwargs
+
+    @staticmethod
+    def _put_committed_beam_tokens(
+        streamer: BaseStreamer, input_ids: torch.LongTensor, beam_scorer: BeamScorer, streamed_length: int
+    ) -> int:
+        """
+        Puts the tokens shared by all the running beams and all the finished hypotheses of a single batch item in
+        :obj:`streamer`, since no later step can change them, and returns the new number of streamed tokens.
+        """
+        if not hasattr(beam_scorer, "_get_finished_hypotheses"):
+            # the finished hypotheses of custom scorers are unknown, their tokens are all streamed at the end
+            return streamed_length
+        candidates = [input_ids] + [hyp[None, :] for hyp in beam_scorer._get_finished_hypotheses(0)]
+        committed_length = min(candidate.shape[-1] for candidate in candidates)
+        reference = input_ids[0, :committed_length]
+        for candidate in candidates:
+            mismatches = (candidate[:, :committed_length] != reference).any(dim=0).nonzero()
+            if len(mismatches) > 0:
+                committed_length = int(mismatches[0])
+                reference = reference[:committed_length]
+
+        if committed_length > streamed_length:
+            streamer.put(input_ids[0, streamed_length:committed_length].cpu())
+            streamed_length = committed_length
+        return streamed_length
+
+    @staticmethod
+    def _forward_with_past(
+        model: "PreTrainedModel", input_ids: torch.LongTensor, past: Optional[Tuple[Tuple[torch.Tensor]]]
+    ) -> Tuple[torch.FloatTensor, Tuple[Tuple[torch.Tensor]]]:
+        """Runs :obj:`model` on the positions of :obj:`input_ids` that are not in :obj:`past` yet."""
+        past_length = past[0][0].shape[-2] if past is not None else 0
+        outputs = model(
+            input_ids=input_ids[:, past_length:],
+            past_key_values=past,
+            attention_mask=input_ids.new_ones(input_ids.shape),
+            position_ids=torch.arange(past_length, input_ids.shape[-1], device=input_ids.device).unsqueeze(0),
+            use_cache=True,
+            return_dict=True,
+        )
+        return outputs.logits, outputs.past_key_values
+
+    @staticmethod
+    def _crop_past(past: Tuple[Tuple[torch.Tensor]], length: int) -> Tuple[Tuple[torch.Tensor]]:
+        """Keeps the states of the first :obj:`length` positions of :obj:`past`."""
+        return tuple(tuple(state[..., :length, :] for state in layer_past) for layer_past in past)
+
     def _get_logits_warper(
         self, top_k: int = None, top_p: float = None, temperature: float = None, num_beams: int = None
     ) -> LogitsProcessorList:
@@ -538,11 +699,24 @@ class GenerationMixin:
 
         # the following idea is largely copied from this PR: https://github.com/huggingface/transformers/pull/5420/files
         # all samplers can be found in `generation_utils_samplers.py`
-        if temperature is not None and temperature != 1.0:
+        use_temperature = temperature is not None and temperature != 1.0
+        use_top_p = top_p is not None and top_p < 1.0
+        if top_k is not None and top_k != 0 and (use_temperature or use_top_p):
+            # a single top-k pass is enough to apply the temperature and the top-p filtering as well
+            warpers.append(
+                TopKTopPLogitsWarper(
+                    top_k=top_k,
+                    top_p=top_p if use_top_p else 1.0,
+                    temperature=temperature if use_temperature else 1.0,
+                    min_tokens_to_keep=(2 if num_beams > 1 else 1),
+                )
+            )
+            return warpers
+        if use_temperature:
             warpers.append(TemperatureLogitsWarper(temperature))
         if top_k is not None and top_k != 0:
             warpers.append(TopKLogitsWarper(top_k=top_k, min_tokens_to_keep=(2 if num_beams > 1 else 1)))
-        if top_p is not None and top_p < 1.0:
+        if use_top_p:
             warpers.append(TopPLogitsWarper(top_p=top_p, min_tokens_to_keep=(2 if num_beams > 1 else 1)))
         return warpers
 
@@ -676,6 +850,12 @@ class GenerationMixin:
         forced_eos_token_id: Optional[int] = None,
         remove_invalid_values: Optional[bool] = None,
         synced_gpus: Optional[bool] = None,
+        cache_implementation: Optional[str] = None,
+        streamer: Optional[BaseStreamer] = None,
+        assistant_model: Optional["PreTrainedModel"] = None,
+        num_assistant_tokens: Optional[int] = None,
+        prune_finished_sequences: Optional[bool] = None,
+        encoder_output_cache: Optional[EncoderOutputCache] = None,
         **model_kwargs,
     ) -> Union[GreedySearchOutput, SampleOutput, BeamSearchOutput, BeamSampleOutput, torch.LongTensor]:
         r"""
@@ -786,6 +966,32 @@ class GenerationMixin:
                 crash. Note that using ``remove_invalid_values`` can slow down generation.
             synced_gpus (:obj:`bool`, `optional`, defaults to :obj:`False`):
                 Whether to continue running the while loop until max_length (needed for ZeRO stage 3)
+            cache_implementation (:obj:`str`, `optional`):
+                The cache used to store the past key/value states. By default, the states of each new token are
+                concatenated to the past ones. If set to :obj:`"static"`, the states are written in place in buffers
+                of :obj:`max_length` positions allocated once (see
+                :class:`~transformers.generation_cache_utils.StaticKeyValueCache`). Only available for models with
+                :obj:`supports_static_cache=True`.
+            streamer (:class:`~transformers.generation_streamers.BaseStreamer`, `optional`):
+                A streamer receiving the prompt, then the tokens as soon as they are committed (see
+                :class:`~transformers.TextStreamer` and :class:`~transformers.TextIteratorStreamer`). Only available
+                for greedy search, sampling and beam search with a single sequence. With beam search, the tokens
+                shared by all the hypotheses are committed at each step and the rest of the best hypothesis at the end.
+            assistant_model (:class:`~transformers.PreTrainedModel`, `optional`):
+                A smaller model sharing the vocabulary of the model, used to propose candidate tokens that the model
+                verifies in a single forward pass (see
+                :meth:`~transformers.generation_utils.GenerationMixin.assisted_decoding`). Only available for greedy
+                search and sampling of a single sequence with decoder-only models.
+            num_assistant_tokens (:obj:`int`, `optional`, defaults to 5):
+                The number of candidate tokens proposed by :obj:`assistant_model` at each step.
+            prune_finished_sequences (:obj:`bool`, `optional`, defaults to :obj:`False`):
+                Whether or not to remove the sequences that generated :obj:`eos_token_id` from the batch passed to the
+                model, so that the next forward passes only run on the unfinished sequences. This saves computation
+                when the generated sequences have very different lengths. Only available for greedy search and
+                sampling.
+            encoder_output_cache (:class:`~transformers.EncoderOutputCache`, `optional`):
+                A cache of encoder outputs, used to skip the encoder when :obj:`generate` is called again on the same
+                inputs, e.g. with different decoding parameters. Only available for encoder-decoder models.
 
             model_kwargs:
                 Additional model specific kwargs will be forwarded to the :obj:`forward` function of the model. If the
@@ -917,9 +1123,14 @@ class GenerationMixin:
         # Storing encoder_input_ids for logits_processor that could use them
         encoder_input_ids = input_ids if self.config.is_encoder_decoder else None
 
+        if encoder_output_cache is not None and not self.config.is_encoder_decoder:
+            raise ValueError("`encoder_output_cache` is only supported for encoder-decoder models.")
+
         if self.config.is_encoder_decoder:
             # add encoder_outputs to model_kwargs
-            model_kwargs = self._prepare_encoder_decoder_kwargs_for_generation(input_ids, model_kwargs)
+            model_kwargs = self._prepare_encoder_decoder_kwargs_for_generation(
+                input_ids, model_kwargs, encoder_output_cache=encoder_output_cache
+            )
 
             # set input_ids as decoder_input_ids
             if "decoder_input_ids" in model_kwargs:
@@ -979,6 +1190,57 @@ class GenerationMixin:
             max_length=max_length, max_time=max_time, max_new_tokens=max_new_tokens, start_length=cur_len
         )
 
+        if cache_implementation is not None:
+            model_kwargs["past"] = self._get_cache(
+                cache_implementation,
+                max_length=stopping_criteria.max_length,
+                use_cache=use_cache,
+                past=model_kwargs.get("past"),
+            )
+
+        if streamer is not None:
+            if is_beam_sample_gen_mode or is_group_beam_gen_mode:
+                raise ValueError("`streamer` is only supported for greedy search, sampling and beam search.")
+            if input_ids.shape[0] > 1 or (num_return_sequences > 1 and not is_beam_gen_mode):
+                raise ValueError("`streamer` only supports the generation of a single sequence.")
+            streamer.put(input_ids.cpu())
+
+        if prune_finished_sequences and not is_greedy_gen_mode and not is_sample_gen_mode:
+            raise ValueError("`prune_finished_sequences` is only supported for greedy search and sampling.")
+
+        if assistant_model is not None:
+            if not is_greedy_gen_mode and not is_sample_gen_mode:
+                raise ValueError("`assistant_model` is only supported for greedy search and sampling.")
+            if num_return_sequences > 1:
+                raise ValueError(
+                    f"num_return_sequences has to be 1, but is {num_return_sequences} when using `assistant_model`."
+                )
+            if cache_implementation is not None:
+                raise ValueError("`assistant_model` cannot be used together with `cache_implementation`.")
+
+            logits_warper = (
+                self._get_logits_warper(top_k=top_k, top_p=top_p, temperature=temperature, num_beams=num_beams)
+                if do_sample
+                else None
+            )
+
+            # assisted decoding
+            return self.assisted_decoding(
+                input_ids,
+                assistant_model,
+                num_assistant_tokens=num_assistant_tokens if num_assistant_tokens is not None else 5,
+                do_sample=do_sample,
+                logits_processor=logits_processor,
+                logits_warper=logits_warper,
+                stopping_criteria=stopping_criteria,
+                pad_token_id=pad_token_id,
+                eos_token_id=eos_token_id,
+                output_scores=output_scores,
+                return_dict_in_generate=return_dict_in_generate,
+                streamer=streamer,
+                **model_kwargs,
+            )
+
         if is_greedy_gen_mode:
             if num_return_sequences > 1:
                 raise ValueError(
@@ -995,6 +1257,8 @@ class GenerationMixin:
                 output_scores=output_scores,
                 return_dict_in_generate=return_dict_in_generate,
                 synced_gpus=synced_gpus,
+                streamer=streamer,
+                prune_finished_sequences=prune_finished_sequences,
                 **model_kwargs,
             )
 
@@ -1023,6 +1287,8 @@ class GenerationMixin:
                 output_scores=output_scores,
                 return_dict_in_generate=return_dict_in_generate,
                 synced_gpus=synced_gpus,
+                streamer=streamer,
+                prune_finished_sequences=prune_finished_sequences,
                 **model_kwargs,
             )
 
@@ -1038,7 +1304,7 @@ class GenerationMixin:
             if stopping_criteria.max_length is None:
                 raise ValueError("`max_length` needs to be a stopping_criteria for now.")
 
-            beam_scorer = BeamSearchScorer(
+            beam_scorer = TensorizedBeamSearchScorer(
                 batch_size=batch_size,
                 num_beams=num_beams,
                 device=self.device,
@@ -1048,7 +1314,11 @@ class GenerationMixin:
             )
             # interleave with `num_beams`
             input_ids, model_kwargs = self._expand_inputs_for_generation(
-                input_ids, expand_size=num_beams, is_encoder_decoder=self.config.is_encoder_decoder, **model_kwargs
+                input_ids,
+                expand_size=num_beams,
+                is_encoder_decoder=self.config.is_encoder_decoder,
+                broadcast_encoder_outputs=self.supports_cross_attention_broadcast,
+                **model_kwargs,
             )
             return self.beam_search(
                 input_ids,
@@ -1060,6 +1330,7 @@ class GenerationMixin:
                 output_scores=output_scores,
                 return_dict_in_generate=return_dict_in_generate,
                 synced_gpus=synced_gpus,
+                streamer=streamer,
                 **model_kwargs,
             )
 
@@ -1073,7 +1344,7 @@ class GenerationMixin:
             length_penalty = length_penalty if length_penalty is not None else self.config.length_penalty
             if stopping_criteria.max_length is None:
                 raise ValueError("`max_length` needs to be a stopping_criteria for now.")
-            beam_scorer = BeamSearchScorer(
+            beam_scorer = TensorizedBeamSearchScorer(
                 batch_size=batch_size,
                 num_beams=num_beams,
                 device=self.device,
@@ -1086,6 +1357,7 @@ class GenerationMixin:
                 input_ids,
                 expand_size=num_beams * num_return_sequences,
                 is_encoder_decoder=self.config.is_encoder_decoder,
+                broadcast_encoder_outputs=self.supports_cross_attention_broadcast,
                 **model_kwargs,
             )
 
@@ -1118,7 +1390,7 @@ class GenerationMixin:
             if stopping_criteria.max_length is None:
                 raise ValueError("`max_length` needs to be a stopping_criteria for now.")
 
-            diverse_beam_scorer = BeamSearchScorer(
+            diverse_beam_scorer = TensorizedBeamSearchScorer(
                 batch_size=batch_size,
                 num_beams=num_beams,
                 max_length=stopping_criteria.max_length,
@@ -1130,7 +1402,11 @@ class GenerationMixin:
             )
             # interleave with `num_beams`
             input_ids, model_kwargs = self._expand_inputs_for_generation(
-                input_ids, expand_size=num_beams, is_encoder_decoder=self.config.is_encoder_decoder, **model_kwargs
+                input_ids,
+                expand_size=num_beams,
+                is_encoder_decoder=self.config.is_encoder_decoder,
+                broadcast_encoder_outputs=self.supports_cross_attention_broadcast,
+                **model_kwargs,
             )
             return self.group_beam_search(
                 input_ids,
@@ -1158,6 +1434,8 @@ class GenerationMixin:
         output_scores: Optional[bool] = None,
         return_dict_in_generate: Optional[bool] = None,
         synced_gpus: Optional[bool] = None,
+        streamer: Optional[BaseStreamer] = None,
+        prune_finished_sequences: Optional[bool] = None,
         **model_kwargs,
     ) -> Union[GreedySearchOutput, torch.LongTensor]:
         r"""
@@ -1195,6 +1473,12 @@ class GenerationMixin:
                 Whether or not to return a :class:`~transformers.file_utils.ModelOutput` instead of a plain tuple.
             synced_gpus (:obj:`bool`, `optional`, defaults to :obj:`False`):
                 Whether to continue running the while loop until max_length (needed for ZeRO stage 3)
+            streamer (:class:`~transformers.generation_streamers.BaseStreamer`, `optional`):
+                A streamer receiving the generated tokens as soon as they are committed.
+            prune_finished_sequences (:obj:`bool`, `optional`, defaults to :obj:`False`):
+                Whether or not to remove the sequences that generated :obj:`eos_token_id` from the batch passed to the
+                model, so that the next forward passes only run on the unfinished sequences. The prediction scores of
+                the finished sequences are then set to 0.
             model_kwargs:
                 Additional model specific keyword arguments will be forwarded to the :obj:`forward` function of the
                 model. If model is an encoder-decoder model the kwargs should include :obj:`encoder_outputs`.
@@ -1272,6 +1556,18 @@ class GenerationMixin:
         unfinished_sequences = input_ids.new(input_ids.shape[0]).fill_(1)
         cur_len = input_ids.shape[-1]
 
+        # rows of the batch still passed to the model when finished sequences are pruned
+        active_rows = None
+        if prune_finished_sequences:
+            self._check_prune_finished_sequences(
+                eos_token_id,
+                output_attentions,
+                output_hidden_states,
+                return_dict_in_generate,
+                synced_gpus,
+                model_kwargs,
+            )
+
         this_peer_finished = False  # used by synced_gpus only
         while True:
 
@@ -1286,7 +1582,9 @@ class GenerationMixin:
                     break
 
             # prepare model inputs
-            model_inputs = self.prepare_inputs_for_generation(input_ids, **model_kwargs)
+            model_inputs = self.prepare_inputs_for_generation(
+                input_ids if active_rows is None else input_ids[active_rows], **model_kwargs
+            )
 
             # forward pass to get next token
             outputs = self(
@@ -1301,6 +1599,10 @@ class GenerationMixin:
                 continue  # don't waste resources running the code we don't need
 
             next_token_logits = outputs.logits[:, -1, :]
+            if active_rows is not None:
+                next_token_logits = next_token_logits.new_zeros(
+                    (input_ids.shape[0], next_token_logits.shape[-1])
+                ).index_copy_(0, active_rows, next_token_logits)
 
             # Store scores, attentions and hidden_states when required
             if return_dict_in_generate:
@@ -1333,6 +1635,8 @@ class GenerationMixin:
 
             # update generated ids, model inputs, and length for next step
             input_ids = torch.cat([input_ids, next_tokens[:, None]], dim=-1)
+            if streamer is not None:
+                streamer.put(next_tokens.cpu())
             model_kwargs = self._update_model_kwargs_for_generation(
                 outputs, model_kwargs, is_encoder_decoder=self.config.is_encoder_decoder
             )
@@ -1349,6 +1653,14 @@ class GenerationMixin:
                 else:
                     this_peer_finished = True
 
+            if prune_finished_sequences:
+                active_rows, model_kwargs = self._prune_finished_sequences(
+                    unfinished_sequences, active_rows, model_kwargs
+                )
+
+        if streamer is not None:
+            streamer.end()
+
         if return_dict_in_generate:
             if self.config.is_encoder_decoder:
                 return GreedySearchEncoderDecoderOutput(
@@ -1384,6 +1696,8 @@ class GenerationMixin:
         output_scores: Optional[bool] = None,
         return_dict_in_generate: Optional[bool] = None,
         synced_gpus: Optional[bool] = None,
+        streamer: Optional[BaseStreamer] = None,
+        prune_finished_sequences: Optional[bool] = None,
         **model_kwargs,
     ) -> Union[SampleOutput, torch.LongTensor]:
         r"""
@@ -1424,6 +1738,12 @@ class GenerationMixin:
                 Whether or not to return a :class:`~transformers.file_utils.ModelOutput` instead of a plain tuple.
             synced_gpus (:obj:`bool`, `optional`, defaults to :obj:`False`):
                 Whether to continue running the while loop until max_length (needed for ZeRO stage 3)
+            streamer (:class:`~transformers.generation_streamers.BaseStreamer`, `optional`):
+                A streamer receiving the generated tokens as soon as they are committed.
+            prune_finished_sequences (:obj:`bool`, `optional`, defaults to :obj:`False`):
+                Whether or not to remove the sequences that generated :obj:`eos_token_id` from the batch passed to the
+                model, so that the next forward passes only run on the unfinished sequences. The prediction scores of
+                the finished sequences are then set to 0.
             model_kwargs:
                 Additional model specific kwargs will be forwarded to the :obj:`forward` function of the model. If
                 model is an encoder-decoder model the kwargs should include :obj:`encoder_outputs`.
@@ -1510,6 +1830,24 @@ class GenerationMixin:
         unfinished_sequences = input_ids.new(input_ids.shape[0]).fill_(1)
         cur_len = input_ids.shape[-1]
 
+        # rows of the batch still passed to the model when finished sequences are pruned
+        active_rows = None
+        if prune_finished_sequences:
+            self._check_prune_finished_sequences(
+                eos_token_id,
+                output_attentions,
+                output_hidden_states,
+                return_dict_in_generate,
+                synced_gpus,
+                model_kwargs,
+            )
+
+        # a single fused warper samples from its reduced set of candidates, unless the warped scores are returned
+        fused_warper = None
+        if len(logits_warper) == 1 and isinstance(logits_warper[0], TopKTopPLogitsWarper):
+            if not (return_dict_in_generate and output_scores):
+                fused_warper = logits_warper[0]
+
         this_peer_finished = False  # used by synced_gpus only
         # auto-regressive generation
         while True:
@@ -1525,7 +1863,9 @@ class GenerationMixin:
                     break
 
             # prepare model inputs
-            model_inputs = self.prepare_inputs_for_generation(input_ids, **model_kwargs)
+            model_inputs = self.prepare_inputs_for_generation(
+                input_ids if active_rows is None else input_ids[active_rows], **model_kwargs
+            )
 
             # forward pass to get next token
             outputs = self(
@@ -1540,10 +1880,15 @@ class GenerationMixin:
                 continue  # don't waste resources running the code we don't need
 
             next_token_logits = outputs.logits[:, -1, :]
+            if active_rows is not None:
+                next_token_logits = next_token_logits.new_zeros(
+                    (input_ids.shape[0], next_token_logits.shape[-1])
+                ).index_copy_(0, active_rows, next_token_logits)
 
             # pre-process distribution
             next_token_scores = logits_processor(input_ids, next_token_logits)
-            next_token_scores = logits_warper(input_ids, next_token_scores)
+            if fused_warper is None:
+                next_token_scores = logits_warper(input_ids, next_token_scores)
 
             # Store scores, attentions and hidden_states when required
             if return_dict_in_generate:
@@ -1564,8 +1909,11 @@ class GenerationMixin:
                     )
 
             # sample
-            probs = nn.functional.softmax(next_token_scores, dim=-1)
-            next_tokens = torch.multinomial(probs, num_samples=1).squeeze(1)
+            if fused_warper is not None:
+                next_tokens = fused_warper.sample(input_ids, next_token_scores)
+            else:
+                probs = nn.functional.softmax(next_token_scores, dim=-1)
+                next_tokens = torch.multinomial(probs, num_samples=1).squeeze(1)
 
             # finished sentences should have their next token be a padding token
             if eos_token_id is not None:
@@ -1574,6 +1922,8 @@ class GenerationMixin:
 
             # update generated ids, model inputs, and length for next step
             input_ids = torch.cat([input_ids, next_tokens[:, None]], dim=-1)
+            if streamer is not None:
+                streamer.put(next_tokens.cpu())
             model_kwargs = self._update_model_kwargs_for_generation(
                 outputs, model_kwargs, is_encoder_decoder=self.config.is_encoder_decoder
             )
@@ -1590,6 +1940,14 @@ class GenerationMixin:
                 else:
                     this_peer_finished = True
 
+            if prune_finished_sequences:
+                active_rows, model_kwargs = self._prune_finished_sequences(
+                    unfinished_sequences, active_rows, model_kwargs
+                )
+
+        if streamer is not None:
+            streamer.end()
+
         if return_dict_in_generate:
             if self.config.is_encoder_decoder:
                 return SampleEncoderDecoderOutput(
@@ -1611,6 +1969,223 @@ class GenerationMixin:
         else:
             return input_ids
 
+    def assisted_decoding(
+        self,
+        input_ids: torch.LongTensor,
+        assistant_model: "PreTrainedModel",
+        num_assistant_tokens: int = 5,
+        do_sample: bool = False,
+        logits_processor: Optional[LogitsProcessorList] = None,
+        logits_warper: Optional[LogitsProcessorList] = None,
+        stopping_criteria: Optional[StoppingCriteriaList] = None,
+        pad_token_id: Optional[int] = None,
+        eos_token_id: Optional[int] = None,
+        output_scores: Optional[bool] = None,
+        return_dict_in_generate: Optional[bool] = None,
+        streamer: Optional[BaseStreamer] = None,
+        **model_kwargs,
+    ) -> Union[GreedySearchOutput, SampleOutput, torch.LongTensor]:
+        r"""
+        Generates sequences for decoder-only models with a language modeling head using assisted (speculative)
+        decoding: at each step, a smaller :obj:`assistant_model` sharing the vocabulary of the model proposes
+        :obj:`num_assistant_tokens` candidate tokens, which the model scores in a single forward pass using its
+        :obj:`past_key_values`.
+
+        With greedy decoding, the longest prefix of candidates matching the argmax of the model is accepted, followed
+        by the token picked by the model after it. With sampling, each candidate is accepted with probability
+        :obj:`min(1, p / q)`, :obj:`p` and :obj:`q` being its probabilities under the model and the assistant, and the
+        first rejected candidate is resampled from :obj:`max(p - q, 0)`, so that the sequences follow the same
+        distribution as with :meth:`~transformers.generation_utils.GenerationMixin.sample`. Either way, each forward
+        pass of the model generates between 1 and :obj:`num_assistant_tokens + 1` tokens.
+
+        Only a single sequence can be generated at a time, and both models have to accept :obj:`past_key_values`
+        holding the states on the second to last dimension and :obj:`position_ids` (e.g. GPT-2).
+
+        Parameters:
+
+            input_ids (:obj:`torch.LongTensor` of shape :obj:`(1, sequence_length)`):
+                The sequence used as a prompt for the generation.
+            assistant_model (:class:`~transformers.PreTrainedModel`):
+                The model proposing the candidate tokens, typically a much smaller model of the same family (e.g.
+                ``distilgpt2`` for ``gpt2-large``).
+            num_assistant_tokens (:obj:`int`, `optional`, defaults to 5):
+                The number of candidate tokens proposed by the assistant model at each step.
+            do_sample (:obj:`bool`, `optional`, defaults to :obj:`False`):
+                Whether or not to use sampling instead of greedy decoding.
+            logits_processor (:obj:`LogitsProcessorList`, `optional`):
+                An instance of :class:`~transformers.LogitsProcessorList`. List of instances of class derived from
+                :class:`~transformers.LogitsProcessor` used to modify the prediction scores of the language modeling
+                head applied at each generation step.
+            logits_warper (:obj:`LogitsProcessorList`, `optional`):
+                An instance of :class:`~transformers.LogitsProcessorList`. List of instances of class derived from
+                :class:`~transformers.LogitsWarper` used to warp the prediction score distribution of the language
+                modeling head applied before multinomial sampling at each generation step. Only used if
+                :obj:`do_sample=True`.
+            stopping_criteria (:obj:`StoppingCriteriaList`, `optional`):
+                An instance of :class:`~transformers.StoppingCriteriaList`. List of instances of class derived from
+                :class:`~transformers.StoppingCriteria` used to tell if the generation loop should stop. Has to hold a
+                :class:`~transformers.MaxLengthCriteria`.
+            pad_token_id (:obj:`int`, `optional`):
+                The id of the `padding` token.
+            eos_token_id (:obj:`int`, `optional`):
+                The id of the `end-of-sequence` token.
+            output_scores (:obj:`bool`, `optional`, defaults to `False`):
+                Whether or not to return the prediction scores. See ``scores`` under returned tensors for more details.
+            return_dict_in_generate (:obj:`bool`, `optional`, defaults to `False`):
+                Whether or not to return a :class:`~transformers.file_utils.ModelOutput` instead of a plain tuple.
+            streamer (:class:`~transformers.generation_streamers.BaseStreamer`, `optional`):
+                A streamer receiving the generated tokens as soon as they are committed.
+            model_kwargs:
+                Only :obj:`attention_mask` is supported, and it may not contain padding.
+
+        Return:
+            :class:`~transformers.generation_utils.GreedySearchDecoderOnlyOutput`,
+            :class:`~transformers.generation_utils.SampleDecoderOnlyOutput` or obj:`torch.LongTensor`: A
+            :obj:`torch.LongTensor` containing the generated tokens (default behaviour) or a
+            :class:`~transformers.generation_utils.GreedySearchDecoderOnlyOutput` (greedy decoding) or
+            :class:`~transformers.generation_utils.SampleDecoderOnlyOutput` (sampling) if
+            ``return_dict_in_generate=True``.
+
+        Examples::
+
+            >>> from transformers import AutoTokenizer, AutoModelForCausalLM, MaxLengthCriteria, StoppingCriteriaList
+
+            >>> tokenizer = AutoTokenizer.from_pretrained("gpt2-large")
+            >>> model = AutoModelForCausalLM.from_pretrained("gpt2-large")
+            >>> assistant_model = AutoModelForCausalLM.from_pretrained("distilgpt2")
+
+            >>> input_ids = tokenizer("Today is a beautiful day, and", return_tensors="pt").input_ids
+            >>> stopping_criteria = StoppingCriteriaList([MaxLengthCriteria(max_length=40)])
+
+            >>> outputs = model.assisted_decoding(input_ids, assistant_model, stopping_criteria=stopping_criteria)
+
+            >>> print("Generated:", tokenizer.batch_decode(outputs, skip_special_tokens=True))
+        """
+        # init values
+        logits_processor = logits_processor if logits_processor is not None else LogitsProcessorList()
+        logits_warper = logits_warper if logits_warper is not None else LogitsProcessorList()
+        stopping_criteria = stopping_criteria if stopping_criteria is not None else StoppingCriteriaList()
+        eos_token_id = eos_token_id if eos_token_id is not None else self.config.eos_token_id
+        output_scores = output_scores if output_scores is not None else self.config.output_scores
+        return_dict_in_generate = (
+            return_dict_in_generate if return_dict_in_generate is not None else self.config.return_dict_in_generate
+        )
+
+        if self.config.is_encoder_decoder or assistant_model.config.is_encoder_decoder:
+            raise ValueError("Assisted decoding is only supported for decoder-only models.")
+        if assistant_model.config.vocab_size != self.config.vocab_size:
+            raise ValueError(
+                f"The assistant model has a vocabulary of size {assistant_model.config.vocab_size}, but the model has "
+                f"a vocabulary of size {self.config.vocab_size}."
+            )
+        if input_ids.shape[0] != 1:
+            raise ValueError(f"Assisted decoding only supports a batch size of 1, but is {input_ids.shape[0]}.")
+        if stopping_criteria.max_length is None:
+            raise ValueError("`max_length` needs to be a stopping_criteria for now.")
+        attention_mask = model_kwargs.pop("attention_mask", None)
+        if attention_mask is not None and not bool(attention_mask.all()):
+            raise ValueError("Assisted decoding does not support padded inputs.")
+        model_kwargs.pop("use_cache", None)
+        # `if value` would take the truth value of the tensors
+        unsupported_kwargs = [key for key, value in model_kwargs.items() if value is not None and value is not False]
+        if len(unsupported_kwargs) > 0:
+            raise ValueError(f"Assisted decoding does not support {', '.join(unsupported_kwargs)}.")
+
+        # init scores tuple
+        scores = () if (return_dict_in_generate and output_scores) else None
+
+        past = assistant_past = None
+        while True:
+            cur_len = input_ids.shape[-1]
+
+            # 1. the assistant model proposes candidate tokens, keeping room for the token picked by the model
+            num_candidates = min(num_assistant_tokens, stopping_criteria.max_length - cur_len - 1)
+            candidate_input_ids = input_ids
+            candidate_probs = []
+            for _ in range(num_candidates):
+                assistant_logits, assistant_past = self._forward_with_past(
+                    assistant_model, candidate_input_ids, assistant_past
+                )
+                assistant_scores = logits_processor(candidate_input_ids, assistant_logits[:, -1, :])
+                if do_sample:
+                    assistant_probs = nn.functional.softmax(
+                        logits_warper(candidate_input_ids, assistant_scores), dim=-1
+                    )
+                    candidate_token = torch.multinomial(assistant_probs, num_samples=1)
+                    candidate_probs.append(assistant_probs)
+                else:
+                    candidate_token = torch.argmax(assistant_scores, dim=-1, keepdim=True)
+                candidate_input_ids = torch.cat([candidate_input_ids, candidate_token], dim=-1)
+                if eos_token_id is not None and candidate_token.item() == eos_token_id:
+                    break
+            num_candidates = candidate_input_ids.shape[-1] - cur_len
+
+            # 2. the model scores all the candidates, and the position after them, in a single forward pass
+            logits, past = self._forward_with_past(self, candidate_input_ids, past)
+            next_tokens_scores = [
+                logits_processor(candidate_input_ids[:, : cur_len + idx], logits[:, idx - num_candidates - 1, :])
+                for idx in range(num_candidates + 1)
+            ]
+            if do_sample:
+                next_tokens_scores = [
+                    logits_warper(candidate_input_ids[:, : cur_len + idx], next_token_scores)
+                    for idx, next_token_scores in enumerate(next_tokens_scores)
+                ]
+
+            # 3. accept the longest valid prefix of candidates and pick the next token with the model
+            if do_sample:
+                num_matches = num_candidates
+                for idx in range(num_candidates):
+                    probs = nn.functional.softmax(next_tokens_scores[idx], dim=-1)
+                    candidate_token = candidate_input_ids[0, cur_len + idx]
+                    # accept the candidate with probability min(1, p / q)
+                    if torch.rand(()) * candidate_probs[idx][0, candidate_token] >= probs[0, candidate_token]:
+                        residual_probs = (probs - candidate_probs[idx]).clamp(min=0)
+                        next_token = torch.multinomial(residual_probs / residual_probs.sum(), num_samples=1)
+                        num_matches = idx
+                        break
+                else:
+                    probs = nn.functional.softmax(next_tokens_scores[-1], dim=-1)
+                    next_token = torch.multinomial(probs, num_samples=1)
+            else:
+                selected_tokens = torch.stack(
+                    [token_scores.argmax(dim=-1) for token_scores in next_tokens_scores], dim=-1
+                )
+                mismatches = (candidate_input_ids[0, cur_len:] != selected_tokens[0, :-1]).nonzero()
+                num_matches = int(mismatches[0]) if len(mismatches) > 0 else num_candidates
+                next_token = selected_tokens[:, num_matches : num_matches + 1]
+
+            new_tokens = torch.cat([candidate_input_ids[:, cur_len : cur_len + num_matches], next_token], dim=-1)
+            # drop the tokens following an end-of-sequence token
+            if eos_token_id is not None:
+                eos_positions = (new_tokens[0] == eos_token_id).nonzero()
+                if len(eos_positions) > 0:
+                    new_tokens = new_tokens[:, : int(eos_positions[0]) + 1]
+
+            if scores is not None:
+                scores += tuple(next_tokens_scores[: new_tokens.shape[-1]])
+
+            # 4. update generated ids and drop the states of the rejected candidates
+            input_ids = torch.cat([input_ids, new_tokens], dim=-1)
+            past = self._crop_past(past, input_ids.shape[-1] - 1)
+            if assistant_past is not None:
+                assistant_past = self._crop_past(assistant_past, input_ids.shape[-1] - 1)
+            if streamer is not None:
+                streamer.put(new_tokens.cpu())
+
+            is_eos = eos_token_id is not None and new_tokens[0, -1].item() == eos_token_id
+            if is_eos or stopping_criteria(input_ids, scores):
+                break
+
+        if streamer is not None:
+            streamer.end()
+
+        if return_dict_in_generate:
+            output_cls = SampleDecoderOnlyOutput if do_sample else GreedySearchDecoderOnlyOutput
+            return output_cls(sequences=input_ids, scores=scores)
+        else:
+            return input_ids
+
     def beam_search(
         self,
         input_ids: torch.LongTensor,
@@ -1625,6 +2200,7 @@ class GenerationMixin:
         output_scores: Optional[bool] = None,
         return_dict_in_generate: Optional[bool] = None,
         synced_gpus: Optional[bool] = None,
+        streamer: Optional[BaseStreamer] = None,
         **model_kwargs,
     ) -> Union[BeamSearchOutput, torch.LongTensor]:
         r"""
@@ -1665,6 +2241,9 @@ class GenerationMixin:
                 Whether or not to return a :class:`~transformers.file_utils.ModelOutput` instead of a plain tuple.
             synced_gpus (:obj:`bool`, `optional`, defaults to :obj:`False`):
                 Whether to continue running the while loop until max_length (needed for ZeRO stage 3)
+            streamer (:class:`~transformers.generation_streamers.BaseStreamer`, `optional`):
+                A streamer receiving the generated tokens as soon as they are committed. With a custom
+                :obj:`beam_scorer`, whose finished hypotheses are unknown, the tokens are only streamed at the end.
             model_kwargs:
                 Additional model specific kwargs will be forwarded to the :obj:`forward` function of the model. If
                 model is an encoder-decoder model the kwargs should include :obj:`encoder_outputs`.
@@ -1759,8 +2338,9 @@ class GenerationMixin:
                 model_kwargs["encoder_outputs"].get("hidden_states") if output_hidden_states else None
             )
 
-        batch_size = len(beam_scorer._beam_hyps)
         num_beams = beam_scorer.num_beams
+        # custom scorers may not have a `batch_size`, it isn't part of the `BeamScorer` interface
+        batch_size = getattr(beam_scorer, "batch_size", input_ids.shape[0] // num_beams)
 
         batch_beam_size, cur_len = input_ids.shape
 
@@ -1772,6 +2352,11 @@ class GenerationMixin:
         beam_scores[:, 1:] = -1e9
         beam_scores = beam_scores.view((batch_size * num_beams,))
 
+        if streamer is not None:
+            if batch_size > 1:
+                raise ValueError("`streamer` only supports beam search with a batch size of 1.")
+            streamed_length = cur_len
+
         this_peer_finished = False  # used by synced_gpus only
         while True:
 
@@ -1853,16 +2438,20 @@ class GenerationMixin:
             beam_idx = beam_outputs["next_beam_indices"]
 
             input_ids = torch.cat([input_ids[beam_idx, :], beam_next_tokens.unsqueeze(-1)], dim=-1)
+            logits_processor.reorder_state(beam_idx)
 
             model_kwargs = self._update_model_kwargs_for_generation(
                 outputs, model_kwargs, is_encoder_decoder=self.config.is_encoder_decoder
             )
             if model_kwargs["past"] is not None:
-                model_kwargs["past"] = self._reorder_cache(model_kwargs["past"], beam_idx)
+                model_kwargs["past"] = self._reorder_past(model_kwargs["past"], beam_idx)
 
             # increase cur_len
             cur_len = cur_len + 1
 
+            if streamer is not None:
+                streamed_length = self._put_committed_beam_tokens(streamer, input_ids, beam_scorer, streamed_length)
+
             if beam_scorer.is_done or stopping_criteria(input_ids, scores):
                 if not synced_gpus:
                     break
@@ -1879,6 +2468,10 @@ class GenerationMixin:
             max_length=stopping_criteria.max_length,
         )
 
+        if streamer is not None:
+            streamer.put(sequence_outputs["sequences"][0, streamed_length:].cpu())
+            streamer.end()
+
         if return_dict_in_generate:
             if not output_scores:
                 sequence_outputs["sequence_scores"] = None
@@ -2063,8 +2656,9 @@ class GenerationMixin:
                 model_kwargs["encoder_outputs"].get("hidden_states") if output_hidden_states else None
             )
 
-        batch_size = len(beam_scorer._beam_hyps)
         num_beams = beam_scorer.num_beams
+        # custom scorers may not have a `batch_size`, it isn't part of the `BeamScorer` interface
+        batch_size = getattr(beam_scorer, "batch_size", input_ids.shape[0] // num_beams)
 
         batch_beam_size, cur_len = input_ids.shape
 
@@ -2157,12 +2751,13 @@ class GenerationMixin:
             beam_idx = beam_outputs["next_beam_indices"]
 
             input_ids = torch.cat([input_ids[beam_idx, :], beam_next_tokens.unsqueeze(-1)], dim=-1)
+            logits_processor.reorder_state(beam_idx)
 
             model_kwargs = self._update_model_kwargs_for_generation(
                 outputs, model_kwargs, is_encoder_decoder=self.config.is_encoder_decoder
             )
             if model_kwargs["past"] is not None:
-                model_kwargs["past"] = self._reorder_cache(model_kwargs["past"], beam_idx)
+                model_kwargs["past"] = self._reorder_past(model_kwargs["past"], beam_idx)
 
             # increase cur_len
             cur_len = cur_len + 1
@@ -2359,8 +2954,9 @@ class GenerationMixin:
                 model_kwargs["encoder_outputs"].get("hidden_states") if output_hidden_states else None
             )
 
-        batch_size = len(beam_scorer._beam_hyps)
         num_beams = beam_scorer.num_beams
+        # custom scorers may not have a `batch_size`, it isn't part of the `BeamScorer` interface
+        batch_size = getattr(beam_scorer, "batch_size", input_ids.shape[0] // num_beams)
         num_beam_groups = beam_scorer.num_beam_groups
         num_sub_beams = num_beams // num_beam_groups
         device = input_ids.device
@@ -2504,7 +3100,7 @@ class GenerationMixin:
                 outputs, model_kwargs, is_encoder_decoder=self.config.is_encoder_decoder
             )
             if model_kwargs["past"] is not None:
-                model_kwargs["past"] = self._reorder_cache(model_kwargs["past"], reordering_indices)
+                model_kwargs["past"] = self._reorder_past(model_kwargs["past"], reordering_indices)
 
             # increase cur_len
             cur_len = cur_len + 1
@@ -32,10 +32,12 @@ from .configuration_utils import PretrainedConfig
 from .file_utils import (
     DUMMY_INPUTS,
     TF2_WEIGHTS_NAME,
+    WEIGHTS_INDEX_NAME,
     WEIGHTS_NAME,
     ModelOutput,
     PushToHubMixin,
     cached_path,
+    get_checkpoint_shard_files,
     hf_bucket_url,
     is_offline_mode,
     is_remote_url,
@@ -1228,11 +1230,16 @@ class TFPreTrainedModel(tf.keras.Model, TFModelUtilsMixin, TFGenerationMixin, Pu
             model_kwargs = kwargs
 
         # Load model
+        is_sharded = False
         if pretrained_model_name_or_path is not None:
             if os.path.isdir(pretrained_model_name_or_path):
                 if from_pt and os.path.isfile(os.path.join(pretrained_model_name_or_path, WEIGHTS_NAME)):
                     # Load from a PyTorch checkpoint in priority if from_pt
                     archive_file = os.path.join(pretrained_model_name_or_path, WEIGHTS_NAME)
+                elif from_pt and os.path.isfile(os.path.join(pretrained_model_name_or_path, WEIGHTS_INDEX_NAME)):
+                    # Load from a sharded PyTorch checkpoint
+                    archive_file = os.path.join(pretrained_model_name_or_path, WEIGHTS_INDEX_NAME)
+                    is_sharded = True
                 elif os.path.isfile(os.path.join(pretrained_model_name_or_path, TF2_WEIGHTS_NAME)):
                     # Load from a TF 2.0 checkpoint
                     archive_file = os.path.join(pretrained_model_name_or_path, TF2_WEIGHTS_NAME)
@@ -1266,17 +1273,56 @@ class TFPreTrainedModel(tf.keras.Model, TFModelUtilsMixin, TFGenerationMixin, Pu
                     user_agent=user_agent,
                 )
             except EnvironmentError as err:
-                logger.error(err)
-                msg = (
-                    f"Can't load weights for '{pretrained_model_name_or_path}'. Make sure that:\n\n"
-                    f"- '{pretrained_model_name_or_path}' is a correct model identifier listed on 'https://huggingface.co/models'\n\n"
-                    f"- or '{pretrained_model_name_or_path}' is the correct path to a directory containing a file named one of {TF2_WEIGHTS_NAME}, {WEIGHTS_NAME}.\n\n"
-                )
-                raise EnvironmentError(msg)
+                resolved_archive_file = None
+                # The PyTorch checkpoint may be sharded, in which case there is an index instead of the weights file
+                if from_pt and archive_file == hf_bucket_url(
+                    pretrained_model_name_or_path, filename=WEIGHTS_NAME, revision=revision, mirror=mirror
+                ):
+                    archive_file = hf_bucket_url(
+                        pretrained_model_name_or_path, filename=WEIGHTS_INDEX_NAME, revision=revision, mirror=mirror
+                    )
+                    try:
+                        resolved_archive_file = cached_path(
+                            archive_file,
+                            cache_dir=cache_dir,
+                            force_download=force_download,
+                            proxies=proxies,
+                            resume_download=resume_download,
+                            local_files_only=local_files_only,
+                            use_auth_token=use_auth_token,
+                            user_agent=user_agent,
+                        )
+                        is_sharded = True
+                    except EnvironmentError:
+                        pass
+                if resolved_archive_file is None:
+                    logger.error(err)
+                    msg = (
+                        f"Can't load weights for '{pretrained_model_name_or_path}'. Make sure that:\n\n"
+                        f"- '{pretrained_model_name_or_path}' is a correct model identifier listed on 'https://huggingface.co/models'\n\n"
+                        f"- or '{pretrained_model_name_or_path}' is the correct path to a directory containing a file named one of {TF2_WEIGHTS_NAME}, {WEIGHTS_NAME}.\n\n"
+                    )
+                    raise EnvironmentError(msg)
             if resolved_archive_file == archive_file:
                 logger.info(f"loading weights file {archive_file}")
             else:
                 logger.info(f"loading weights file {archive_file} from cache at {resolved_archive_file}")
+
+            if is_sharded:
+                # The index is replaced by the list of the shards
+                resolved_archive_file, _ = get_checkpoint_shard_files(
+                    pretrained_model_name_or_path,
+                    resolved_archive_file,
+                    cache_dir=cache_dir,
+                    force_download=force_download,
+                    proxies=proxies,
+                    resume_download=resume_download,
+                    local_files_only=local_files_only,
+                    use_auth_token=use_auth_token,
+                    user_agent=user_agent,
+                    revision=revision,
+                    mirror=mirror,
+                )
         else:
             resolved_archive_file = None
 
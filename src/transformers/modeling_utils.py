@@ -15,9 +15,14 @@
 # limitations under the License.
 
 import inspect
+import itertools
+import json
 import os
 import re
 import warnings
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
@@ -30,21 +35,27 @@ from .activations import get_activation
 from .configuration_utils import PretrainedConfig
 from .deepspeed import deepspeed_config, is_deepspeed_zero3_enabled
 from .file_utils import (
+    CONFIG_NAME,
     DUMMY_INPUTS,
     FLAX_WEIGHTS_NAME,
     TF2_WEIGHTS_NAME,
     TF_WEIGHTS_NAME,
+    WEIGHTS_INDEX_NAME,
     WEIGHTS_NAME,
     ModelOutput,
     PushToHubMixin,
     cached_path,
+    convert_file_size_to_int,
+    get_checkpoint_shard_files,
     hf_bucket_url,
     is_offline_mode,
     is_remote_url,
     replace_return_docstrings,
+    resolve_etags,
 )
 from .generation_utils import GenerationMixin
 from .utils import logging
+from .utils.versions import require_version
 
 
 logger = logging.get_logger(__name__)
@@ -69,6 +80,181 @@ def no_init_weights(_enable=True):
         _init_weights = True
 
 
+@contextmanager
+def init_empty_weights(enable=True):
+    """
+    Context manager under which the parameters of the instantiated modules are moved to the ``meta`` device as soon as
+    they are registered, so that no storage is kept for them. The buffers are still allocated since they are not
+    always saved in the checkpoints (e.g. the ``position_ids`` of most models).
+
+    .. warning::
+
+        This patches :obj:`nn.Module.register_parameter` for the whole process while the context is active, so it is
+        not thread-safe: the modules built by other threads in the meantime also get their parameters on the ``meta``
+        device. Don't instantiate models concurrently under it.
+    """
+    if not enable:
+        yield
+        return
+
+    register_parameter = nn.Module.register_parameter
+
+    def register_empty_parameter(module, name, param):
+        register_parameter(module, name, param)
+        if param is not None and not param.is_meta:
+            module._parameters[name] = nn.Parameter(param.to("meta"), requires_grad=param.requires_grad)
+
+    nn.Module.register_parameter = register_empty_parameter
+    try:
+        yield
+    finally:
+        nn.Module.register_parameter = register_parameter
+
+
+def load_state_dict(checkpoint_file: Union[str, os.PathLike], use_mmap: bool = False) -> Dict[str, torch.Tensor]:
+    """
+    Reads a PyTorch checkpoint file on the CPU.
+
+    Args:
+        checkpoint_file (:obj:`str` or :obj:`os.PathLike`):
+            The path of the checkpoint file.
+        use_mmap (:obj:`bool`, `optional`, defaults to :obj:`False`):
+            Whether or not to memory-map the file instead of reading it in memory. The tensors then directly use the
+            pages of the file, which are only read when accessed and are shared through the page cache by all the
+            processes mapping the same file. Requires PyTorch >= 2.1 and a checkpoint saved with the (default) zipfile
+            serialization of PyTorch >= 1.6.
+
+    Returns:
+        :obj:`Dict[str, torch.Tensor]`: The state dict of the checkpoint.
+    """
+    if use_mmap:
+        require_version("torch>=2.1", "Loading a checkpoint with `use_mmap=True` needs a more recent PyTorch.")
+        return torch.load(checkpoint_file, map_location="cpu", mmap=True)
+    return torch.load(checkpoint_file, map_location="cpu")
+
+
+def _load_checkpoint_shard(shard_file: Union[str, os.PathLike], use_mmap: bool = False) -> Dict[str, torch.Tensor]:
+    """
+    Reads a shard of a sharded checkpoint with :func:`load_state_dict`, naming the shard in the error if it can't be read.
+    """
+    try:
+        return load_state_dict(shard_file, use_mmap=use_mmap)
+    except ImportError:
+        raise
+    except Exception as e:
+        raise OSError(f"Unable to load weights from the pytorch checkpoint shard at '{shard_file}'") from e
+
+
+def shard_checkpoint(
+    state_dict: Dict[str, torch.Tensor], max_shard_size: Union[int, str] = "10GB"
+) -> Tuple[Dict[str, Dict[str, torch.Tensor]], Optional[Dict[str, Any]]]:
+    """
+    Splits a state dict in shards so that each shard is smaller than ``max_shard_size``, keeping the order of the keys.
+    A tensor bigger than ``max_shard_size`` is put in a shard of its own, which is then bigger than ``max_shard_size``.
+
+    Args:
+        state_dict (:obj:`Dict[str, torch.Tensor]`): The state dict of the model to save.
+        max_shard_size (:obj:`int` or :obj:`str`, `optional`, defaults to :obj:`"10GB"`):
+            The maximum size of each shard, in bytes or as a string with a unit (like ``"5MB"``).
+
+    Returns:
+        :obj:`Tuple[Dict[str, Dict[str, torch.Tensor]], Optional[Dict]]`: The shards, indexed by their file names, and
+        the index of the sharded checkpoint (with its total size and the name of the shard of each key), or
+        :obj:`None` if the state dict fits in one shard, which is then named :obj:`WEIGHTS_NAME`.
+    """
+    max_shard_size = convert_file_size_to_int(max_shard_size)
+
+    sharded_state_dicts = [{}]
+    current_shard_size = 0
+    total_size = 0
+    for key, weight in state_dict.items():
+        weight_size = weight.numel() * weight.element_size()
+        if current_shard_size + weight_size > max_shard_size and len(sharded_state_dicts[-1]) > 0:
+            sharded_state_dicts.append({})
+            current_shard_size = 0
+        sharded_state_dicts[-1][key] = weight
+        current_shard_size += weight_size
+        total_size += weight_size
+
+    if len(sharded_state_dicts) == 1:
+        return {WEIGHTS_NAME: sharded_state_dicts[0]}, None
+
+    shards = {}
+    weight_map = {}
+    for idx, shard in enumerate(sharded_state_dicts):
+        shard_file = WEIGHTS_NAME.replace(".bin", f"-{idx + 1:05d}-of-{len(sharded_state_dicts):05d}.bin")
+        shards[shard_file] = shard
+        for key in shard.keys():
+            weight_map[key] = shard_file
+
+    index = {"metadata": {"total_size": total_size}, "weight_map": weight_map}
+    return shards, index
+
+
+def load_sharded_checkpoint(model: nn.Module, folder: Union[str, os.PathLike], strict: bool = True):
+    """
+    The equivalent of :obj:`torch.nn.Module.load_state_dict` for a sharded checkpoint saved in ``folder`` by
+    :func:`~transformers.PreTrainedModel.save_pretrained`. The shards are loaded one at a time, so only the biggest one
+    is in memory at once.
+
+    Args:
+        model (:obj:`torch.nn.Module`): The model in which to load the checkpoint.
+        folder (:obj:`str` or :obj:`os.PathLike`): The folder containing the shards and their index.
+        strict (:obj:`bool`, `optional`, defaults to :obj:`True`):
+            Whether to raise an error if the keys of the checkpoint don't exactly match the ones of ``model``.
+
+    Returns:
+        :obj:`NamedTuple`: A named tuple with ``missing_keys`` and ``unexpected_keys`` fields, like the one returned by
+        :obj:`torch.nn.Module.load_state_dict`.
+    """
+    with open(os.path.join(folder, WEIGHTS_INDEX_NAME), "r", encoding="utf-8") as f:
+        weight_map = json.load(f)["weight_map"]
+
+    model_keys = model.state_dict().keys()
+    missing_keys = [key for key in model_keys if key not in weight_map]
+    unexpected_keys = [key for key in weight_map if key not in model_keys]
+    if strict and (len(missing_keys) > 0 or len(unexpected_keys) > 0):
+        error_message = f"Error(s) in loading state_dict for {model.__class__.__name__}"
+        if len(missing_keys) > 0:
+            error_message += f"\n\tMissing key(s): {', '.join(missing_keys)}."
+        if len(unexpected_keys) > 0:
+            error_message += f"\n\tUnexpected key(s): {', '.join(unexpected_keys)}."
+        raise RuntimeError(error_message)
+
+    for shard_file in sorted(set(weight_map.values())):
+        state_dict = _load_checkpoint_shard(os.path.join(folder, shard_file))
+        model.load_state_dict(state_dict, strict=False)
+        # Release the shard before the next one is loaded
+        del state_dict
+
+    return torch.nn.modules.module._IncompatibleKeys(missing_keys, unexpected_keys)
+
+
+def _iter_checkpoint_shards(shard_files: List[str], use_mmap: bool = False, num_workers: int = 1):
+    """
+    Yields the state dicts of the shards of a checkpoint, in order. With ``num_workers > 1``, the next shards are read by
+    a pool of threads while the current one is used, so at most ``num_workers + 1`` shards are in memory at once.
+    """
+    if num_workers <= 1:
+        for shard_file in shard_files:
+            yield _load_checkpoint_shard(shard_file, use_mmap=use_mmap)
+        return
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        next_shard_files = iter(shard_files)
+        futures = deque(
+            executor.submit(_load_checkpoint_shard, shard_file, use_mmap)
+            for shard_file in itertools.islice(next_shard_files, num_workers)
+        )
+        while len(futures) > 0:
+            state_dict = futures.popleft().result()
+            shard_file = next(next_shard_files, None)
+            if shard_file is not None:
+                futures.append(executor.submit(_load_checkpoint_shard, shard_file, use_mmap))
+            yield state_dict
+            del state_dict
+
+
 try:
     from torch.nn import Identity
 except ImportError:
@@ -124,6 +310,18 @@ def get_parameter_device(parameter: Union[nn.Module, GenerationMixin, "ModuleUti
         return first_tuple[1].device
 
 
+def get_state_dict_float_dtype(state_dict):
+    """
+    Returns the dtype of the first floating point weight of ``state_dict`` (e.g. not the ``position_ids`` buffer), or
+    :obj:`None` if it has no floating point weight.
+    """
+    for t in state_dict.values():
+        if t.is_floating_point():
+            return t.dtype
+
+    return None
+
+
 def get_parameter_dtype(parameter: Union[nn.Module, GenerationMixin, "ModuleUtilsMixin"]):
     try:
         return next(parameter.parameters()).dtype
@@ -435,6 +633,12 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
         - **base_model_prefix** (:obj:`str`) -- A string indicating the attribute associated to the base model in
           derived classes of the same architecture adding modules on top of the base model.
         - **is_parallelizable** (:obj:`bool`) -- A flag indicating whether this model supports model parallelization.
+        - **supports_static_cache** (:obj:`bool`) -- A flag indicating whether this model accepts a
+          :class:`~transformers.generation_cache_utils.StaticKeyValueCache` as :obj:`past_key_values`, i.e. whether it
+          supports ``generate(..., cache_implementation="static")``.
+        - **supports_cross_attention_broadcast** (:obj:`bool`) -- A flag indicating whether the cross-attention layers of
+          this encoder-decoder model accept encoder hidden states shared by consecutive groups of decoder inputs, so
+          that beam search does not copy the encoder outputs for each beam.
     """
     config_class = None
     base_model_prefix = ""
@@ -449,6 +653,8 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
     _keys_to_ignore_on_save = None
 
     is_parallelizable = False
+    supports_static_cache = False
+    supports_cross_attention_broadcast = False
 
     @property
     def dummy_inputs(self) -> Dict[str, torch.Tensor]:
@@ -894,6 +1100,8 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
         state_dict: Optional[dict] = None,
         save_function: Callable = torch.save,
         push_to_hub: bool = False,
+        max_shard_size: Union[int, str] = "10GB",
+        is_main_process: bool = True,
         **kwargs,
     ):
         """
@@ -924,6 +1132,17 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
                     pushing to if it's an existing folder. Pass along :obj:`temp_dir=True` to use a temporary directory
                     instead.
 
+            max_shard_size (:obj:`int` or :obj:`str`, `optional`, defaults to :obj:`"10GB"`):
+                The maximum size of the checkpoint files, in bytes or as a string with a unit (like ``"5GB"`` or
+                ``"500MiB"``). Bigger checkpoints are split in shards (``pytorch_model-00001-of-00003.bin``, ...)
+                saved along an index (:obj:`WEIGHTS_INDEX_NAME`) giving the shard of each weight. Those shards can be
+                loaded one at a time by :func:`~transformers.PreTrainedModel.from_pretrained`. A weight bigger than
+                ``max_shard_size`` is saved in a shard of its own.
+            is_main_process (:obj:`bool`, `optional`, defaults to :obj:`True`):
+                Whether or not the process calling this function is the main one. Useful when in distributed training
+                like TPUs and need to call this function on all processes. In this case, set
+                :obj:`is_main_process=True` only on the main process, which is the only one removing the weights files
+                of a previous save, to avoid race conditions.
             kwargs:
                 Additional key word arguments passed along to the
                 :meth:`~transformers.file_utils.PushToHubMixin.push_to_hub` method.
@@ -961,11 +1180,35 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
         if self._keys_to_ignore_on_save is not None:
             state_dict = {k: v for k, v in state_dict.items() if k not in self._keys_to_ignore_on_save}
 
+        shards, index = shard_checkpoint(state_dict, max_shard_size=max_shard_size)
+
+        # Remove the weights files of a previous save that would not be overwritten (e.g. with another number of shards),
+        # only the files written by this method: other weights like "pytorch_model_fp16.bin" are kept
+        if is_main_process:
+            shard_pattern = re.compile(re.escape(WEIGHTS_NAME.replace(".bin", "")) + r"-\d{5}-of-\d{5}\.bin")
+            for filename in os.listdir(save_directory):
+                full_filename = os.path.join(save_directory, filename)
+                if (
+                    (filename in (WEIGHTS_NAME, WEIGHTS_INDEX_NAME) or shard_pattern.fullmatch(filename))
+                    and filename not in shards
+                    and os.path.isfile(full_filename)
+                ):
+                    os.remove(full_filename)
+
         # If we save using the predefined names, we can load using `from_pretrained`
-        output_model_file = os.path.join(save_directory, WEIGHTS_NAME)
-        save_function(state_dict, output_model_file)
+        for shard_file, shard in shards.items():
+            save_function(shard, os.path.join(save_directory, shard_file))
 
-        logger.info(f"Model weights saved in {output_model_file}")
+        if index is None:
+            logger.info(f"Model weights saved in {os.path.join(save_directory, WEIGHTS_NAME)}")
+        else:
+            save_index_file = os.path.join(save_directory, WEIGHTS_INDEX_NAME)
+            with open(save_index_file, "w", encoding="utf-8") as f:
+                f.write(json.dumps(index, indent=2, sort_keys=True) + "\n")
+            logger.info(
+                f"The model is bigger than the maximum size per checkpoint ({max_shard_size}) and was split in "
+                f"{len(shards)} checkpoint shards. The index of the shard of each weight is saved in {save_index_file}."
+            )
 
         if push_to_hub:
             url = self._push_to_hub(repo, commit_message=commit_message)
@@ -1074,6 +1317,22 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
                     at the next major version. See `pull request 11471
                     <https://github.com/huggingface/transformers/pull/11471>`__ for more information.
 
+            use_mmap (:obj:`bool`, `optional`, defaults to :obj:`False`):
+                Whether or not to memory-map the PyTorch checkpoint and use its tensors directly as the weights of the
+                model, without copying them. The model is instantiated without allocating its parameters (unless some
+                of them are not in the checkpoint), so the memory used by the weights is the one of the mapped file,
+                which is shared through the page cache by all the processes loading the same checkpoint. Requires
+                PyTorch >= 2.1 and a checkpoint saved with PyTorch >= 1.6.
+            low_cpu_mem_usage (:obj:`bool`, `optional`, defaults to :obj:`False`):
+                Whether or not to instantiate the model without allocating its parameters, then to materialize each
+                of them from the corresponding weight of the checkpoint, already converted to ``torch_dtype``. The
+                checkpoint is memory-mapped when possible, so loading a model only needs about its size in RAM (and
+                a fp16 model is never allocated in fp32). Contrary to ``use_mmap``, the weights are copied in memory
+                owned by the model. Requires PyTorch >= 2.1.
+            num_loading_workers (:obj:`int`, `optional`, defaults to 1):
+                For a sharded checkpoint (see :func:`~transformers.PreTrainedModel.save_pretrained`), the number of
+                threads reading the next shards while the current one is loaded in the model. The shards are loaded
+                one at a time, so at most ``num_loading_workers + 1`` shards are in memory at once.
             kwargs (remaining dictionary of keyword arguments, `optional`):
                 Can be used to update the configuration object (after it being loaded) and initiate the model (e.g.,
                 :obj:`output_attentions=True`). Behaves differently depending on whether a ``config`` is provided or
@@ -1132,9 +1391,26 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
         from_auto_class = kwargs.pop("_from_auto", False)
         _fast_init = kwargs.pop("_fast_init", True)
         torch_dtype = kwargs.pop("torch_dtype", None)
+        use_mmap = kwargs.pop("use_mmap", False)
+        low_cpu_mem_usage = kwargs.pop("low_cpu_mem_usage", False)
+        num_loading_workers = kwargs.pop("num_loading_workers", 1)
 
         from_pt = not (from_tf | from_flax)
 
+        if use_mmap:
+            if not from_pt:
+                raise ValueError("`use_mmap=True` is only supported to load PyTorch checkpoints.")
+            if state_dict is not None:
+                raise ValueError("`use_mmap=True` can't be used when passing a `state_dict`.")
+            if is_deepspeed_zero3_enabled():
+                raise ValueError("`use_mmap=True` is not compatible with DeepSpeed ZeRO-3.")
+        if low_cpu_mem_usage:
+            require_version("torch>=2.1", "Loading a model with `low_cpu_mem_usage=True` needs a more recent PyTorch.")
+            if not from_pt:
+                raise ValueError("`low_cpu_mem_usage=True` is only supported to load PyTorch checkpoints.")
+            if is_deepspeed_zero3_enabled():
+                raise ValueError("`low_cpu_mem_usage=True` is not compatible with DeepSpeed ZeRO-3.")
+
         user_agent = {"file_type": "model", "framework": "pytorch", "from_auto_class": from_auto_class}
         if from_pipeline is not None:
             user_agent["using_pipeline"] = from_pipeline
@@ -1143,6 +1419,22 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
             logger.info("Offline mode: forcing local_files_only=True")
             local_files_only = True
 
+        # For a model id, check the ETags of the config and the weights at once, so that resolving them below doesn't
+        # need a request each
+        if (
+            pretrained_model_name_or_path is not None
+            and not local_files_only
+            and not force_download
+            and not os.path.exists(str(pretrained_model_name_or_path))
+            and not os.path.isfile(str(pretrained_model_name_or_path) + ".index")
+            and not is_remote_url(str(pretrained_model_name_or_path))
+        ):
+            filename = TF2_WEIGHTS_NAME if from_tf else (FLAX_WEIGHTS_NAME if from_flax else WEIGHTS_NAME)
+            urls = [hf_bucket_url(str(pretrained_model_name_or_path), filename, revision=revision, mirror=mirror)]
+            if config is None:
+                urls.append(hf_bucket_url(str(pretrained_model_name_or_path), CONFIG_NAME, revision=revision))
+            resolve_etags(urls, proxies=proxies, user_agent=user_agent, use_auth_token=use_auth_token)
+
         # Load config if we don't provide a configuration
         if not isinstance(config, PretrainedConfig):
             config_path = config if config is not None else pretrained_model_name_or_path
@@ -1165,6 +1457,7 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
             model_kwargs = kwargs
 
         # Load model
+        is_sharded = False
         if pretrained_model_name_or_path is not None:
             pretrained_model_name_or_path = str(pretrained_model_name_or_path)
             if os.path.isdir(pretrained_model_name_or_path):
@@ -1180,9 +1473,13 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
                 elif os.path.isfile(os.path.join(pretrained_model_name_or_path, WEIGHTS_NAME)):
                     # Load from a PyTorch checkpoint
                     archive_file = os.path.join(pretrained_model_name_or_path, WEIGHTS_NAME)
+                elif os.path.isfile(os.path.join(pretrained_model_name_or_path, WEIGHTS_INDEX_NAME)):
+                    # Load from a sharded PyTorch checkpoint
+                    archive_file = os.path.join(pretrained_model_name_or_path, WEIGHTS_INDEX_NAME)
+                    is_sharded = True
                 else:
                     raise EnvironmentError(
-                        f"Error no file named {[WEIGHTS_NAME, TF2_WEIGHTS_NAME, TF_WEIGHTS_NAME + '.index', FLAX_WEIGHTS_NAME]} found in "
+                        f"Error no file named {[WEIGHTS_NAME, WEIGHTS_INDEX_NAME, TF2_WEIGHTS_NAME, TF_WEIGHTS_NAME + '.index', FLAX_WEIGHTS_NAME]} found in "
                         f"directory {pretrained_model_name_or_path} or `from_tf` and `from_flax` set to False."
                     )
             elif os.path.isfile(pretrained_model_name_or_path) or is_remote_url(pretrained_model_name_or_path):
@@ -1223,47 +1520,111 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
                     user_agent=user_agent,
                 )
             except EnvironmentError as err:
-                logger.error(err)
-                msg = (
-                    f"Can't load weights for '{pretrained_model_name_or_path}'. Make sure that:\n\n"
-                    f"- '{pretrained_model_name_or_path}' is a correct model identifier listed on 'https://huggingface.co/models'\n\n"
-                    f"- or '{pretrained_model_name_or_path}' is the correct path to a directory containing a file named one of {WEIGHTS_NAME}, {TF2_WEIGHTS_NAME}, {TF_WEIGHTS_NAME}.\n\n"
-                )
-                raise EnvironmentError(msg)
+                resolved_archive_file = None
+                # The checkpoint may be sharded, in which case there is an index instead of the weights file
+                if archive_file == hf_bucket_url(
+                    pretrained_model_name_or_path, filename=WEIGHTS_NAME, revision=revision, mirror=mirror
+                ):
+                    archive_file = hf_bucket_url(
+                        pretrained_model_name_or_path, filename=WEIGHTS_INDEX_NAME, revision=revision, mirror=mirror
+                    )
+                    try:
+                        resolved_archive_file = cached_path(
+                            archive_file,
+                            cache_dir=cache_dir,
+                            force_download=force_download,
+                            proxies=proxies,
+                            resume_download=resume_download,
+                            local_files_only=local_files_only,
+                            use_auth_token=use_auth_token,
+                            user_agent=user_agent,
+                        )
+                        is_sharded = True
+                    except EnvironmentError:
+                        pass
+                if resolved_archive_file is None:
+                    logger.error(err)
+                    msg = (
+                        f"Can't load weights for '{pretrained_model_name_or_path}'. Make sure that:\n\n"
+                        f"- '{pretrained_model_name_or_path}' is a correct model identifier listed on 'https://huggingface.co/models'\n\n"
+                        f"- or '{pretrained_model_name_or_path}' is the correct path to a directory containing a file named one of {WEIGHTS_NAME}, {TF2_WEIGHTS_NAME}, {TF_WEIGHTS_NAME}.\n\n"
+                    )
+                    raise EnvironmentError(msg)
 
             if resolved_archive_file == archive_file:
                 logger.info(f"loading weights file {archive_file}")
             else:
                 logger.info(f"loading weights file {archive_file} from cache at {resolved_archive_file}")
+
+            if is_sharded:
+                # The index is replaced by the list of the shards
+                resolved_archive_file, weight_map = get_checkpoint_shard_files(
+                    pretrained_model_name_or_path,
+                    resolved_archive_file,
+                    cache_dir=cache_dir,
+                    force_download=force_download,
+                    proxies=proxies,
+                    resume_download=resume_download,
+                    local_files_only=local_files_only,
+                    use_auth_token=use_auth_token,
+                    user_agent=user_agent,
+                    revision=revision,
+                    mirror=mirror,
+                )
         else:
             resolved_archive_file = None
 
         # load pt weights early so that we know which dtype to init the model under
         if from_pt:
-            if state_dict is None:
+            # With `low_cpu_mem_usage`, the checkpoint is memory-mapped so that its tensors are only read when they are
+            # materialized in the model (checkpoints saved before PyTorch 1.6 can't be mapped)
+            mmap_checkpoint = use_mmap
+            if low_cpu_mem_usage and resolved_archive_file is not None:
+                first_file = resolved_archive_file[0] if is_sharded else resolved_archive_file
+                mmap_checkpoint = mmap_checkpoint or zipfile.is_zipfile(first_file)
+            if state_dict is not None:
+                is_sharded = False
+            elif is_sharded:
+                # The shards are only loaded one at a time, once the model is instantiated
+                loaded_keys = list(weight_map.keys())
+            else:
                 try:
-                    state_dict = torch.load(resolved_archive_file, map_location="cpu")
+                    state_dict = load_state_dict(resolved_archive_file, use_mmap=mmap_checkpoint)
+                except ImportError:
+                    raise
                 except Exception:
                     raise OSError(
                         f"Unable to load weights from pytorch checkpoint file for '{pretrained_model_name_or_path}' "
                         f"at '{resolved_archive_file}'"
                         "If you tried to load a PyTorch model from a TF 2.0 checkpoint, please set from_tf=True. "
                     )
+            if not is_sharded:
+                loaded_keys = list(state_dict.keys())
 
             # set dtype to instantiate the model under:
             # 1. If torch_dtype is not None, we use that dtype
             # 2. If torch_dtype is "auto", we auto-detect dtype from the loaded state_dict, by checking its first
-            #    weights entry - we assume all weights are of the same dtype
+            #    floating point weights entry (in the first shard having one for a sharded checkpoint) - we assume
+            #    all weights are of the same dtype. Without floating point weights, the default dtype is kept.
             # we also may have config.torch_dtype available, but we won't rely on it till v5
             dtype_orig = None
-            if torch_dtype is not None:
-                if isinstance(torch_dtype, str):
-                    if torch_dtype == "auto":
-                        torch_dtype = next(iter(state_dict.values())).dtype
+            if isinstance(torch_dtype, str):
+                if torch_dtype == "auto":
+                    if is_sharded:
+                        torch_dtype = None
+                        for shard_file in resolved_archive_file:
+                            torch_dtype = get_state_dict_float_dtype(
+                                load_state_dict(shard_file, use_mmap=mmap_checkpoint)
+                            )
+                            if torch_dtype is not None:
+                                break
                     else:
-                        raise ValueError(
-                            f"`torch_dtype` can be either a `torch.dtype` or `auto`, but received {torch_dtype}"
-                        )
+                        torch_dtype = get_state_dict_float_dtype(state_dict)
+                else:
+                    raise ValueError(
+                        f"`torch_dtype` can be either a `torch.dtype` or `auto`, but received {torch_dtype}"
+                    )
+            if torch_dtype is not None:
                 dtype_orig = cls._set_default_torch_dtype(torch_dtype)
 
         config.name_or_path = pretrained_model_name_or_path
@@ -1278,6 +1639,20 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
             with deepspeed.zero.Init(config=deepspeed_config()):
                 with no_init_weights(_enable=_fast_init):
                     model = cls(config, *model_args, **model_kwargs)
+        elif use_mmap or low_cpu_mem_usage:
+            # The parameters are taken from the checkpoint, so they are not allocated. If some are missing from the
+            # checkpoint, the model is instantiated normally as their values may be computed by the constructors of
+            # the modules (e.g. sinusoidal position embeddings)
+            with no_init_weights(_enable=_fast_init), init_empty_weights():
+                model = cls(config, *model_args, **model_kwargs)
+            parameters_not_in_checkpoint = cls._get_parameters_not_in_checkpoint(model, loaded_keys)
+            if len(parameters_not_in_checkpoint) > 0:
+                logger.info(
+                    f"Some parameters of {cls.__name__} are not in the checkpoint ({parameters_not_in_checkpoint}), "
+                    "allocating all the parameters of the model."
+                )
+                with no_init_weights(_enable=_fast_init):
+                    model = cls(config, *model_args, **model_kwargs)
         else:
             with no_init_weights(_enable=_fast_init):
                 model = cls(config, *model_args, **model_kwargs)
@@ -1315,8 +1690,21 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
                 )
                 raise
         elif from_pt:
+            if is_sharded:
+                shards = _iter_checkpoint_shards(
+                    resolved_archive_file, use_mmap=mmap_checkpoint, num_workers=num_loading_workers
+                )
+            else:
+                shards = None
             model, missing_keys, unexpected_keys, error_msgs = cls._load_state_dict_into_model(
-                model, state_dict, pretrained_model_name_or_path, _fast_init=_fast_init
+                model,
+                state_dict,
+                pretrained_model_name_or_path,
+                _fast_init=_fast_init,
+                assign=use_mmap or low_cpu_mem_usage,
+                copy_assigned=low_cpu_mem_usage and not use_mmap,
+                loaded_keys=loaded_keys,
+                shards=shards,
             )
 
         # make sure token embedding weights are still tied if needed
@@ -1336,26 +1724,51 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
         return model
 
     @classmethod
-    def _load_state_dict_into_model(cls, model, state_dict, pretrained_model_name_or_path, _fast_init=True):
-
-        # Convert old format to new format if needed from a PyTorch state_dict
-        old_keys = []
-        new_keys = []
-        for key in state_dict.keys():
-            new_key = None
-            if "gamma" in key:
-                new_key = key.replace("gamma", "weight")
-            if "beta" in key:
-                new_key = key.replace("beta", "bias")
-            if new_key:
-                old_keys.append(key)
-                new_keys.append(new_key)
-        for old_key, new_key in zip(old_keys, new_keys):
-            state_dict[new_key] = state_dict.pop(old_key)
+    def _load_state_dict_into_model(
+        cls,
+        model,
+        state_dict,
+        pretrained_model_name_or_path,
+        _fast_init=True,
+        assign=False,
+        copy_assigned=False,
+        loaded_keys=None,
+        shards=None,
+    ):
+        """
+        Loads ``state_dict`` in ``model``. For a sharded checkpoint, ``state_dict`` is :obj:`None` and the state dicts of
+        the shards, yielded one at a time by ``shards``, are loaded in turn, ``loaded_keys`` being the keys of the whole
+        checkpoint. With ``assign=True``, the tensors of the state dicts become the parameters and buffers of the model
+        instead of being copied in them, after a conversion to the dtype of the model. With ``copy_assigned=True``, the
+        tensors that don't need a conversion are copied as well, so the model doesn't share the memory of the state
+        dicts (e.g. when they are memory-mapped).
+        """
+        if shards is None:
+            shards = [state_dict]
+            loaded_keys = list(state_dict.keys())
+
+        def fix_keys(state_dict):
+            # Convert old format to new format if needed from a PyTorch state_dict
+            old_keys = []
+            new_keys = []
+            for key in state_dict.keys():
+                new_key = None
+                if "gamma" in key:
+                    new_key = key.replace("gamma", "weight")
+                if "beta" in key:
+                    new_key = key.replace("beta", "bias")
+                if new_key:
+                    old_keys.append(key)
+                    new_keys.append(new_key)
+            for old_key, new_key in zip(old_keys, new_keys):
+                state_dict[new_key] = state_dict.pop(old_key)
+
+        loaded_keys = {key: None for key in loaded_keys}
+        fix_keys(loaded_keys)
+        loaded_keys = list(loaded_keys.keys())
 
         # Retrieve missing & unexpected_keys
         expected_keys = list(model.state_dict().keys())
-        loaded_keys = list(state_dict.keys())
         prefix = model.base_model_prefix
 
         has_prefix_module = any(s.startswith(prefix) for s in loaded_keys)
@@ -1392,18 +1805,14 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
             for module in unintialized_modules:
                 model._init_weights(module)
 
-        # copy state_dict so _load_from_state_dict can modify it
-        metadata = getattr(state_dict, "_metadata", None)
-        state_dict = state_dict.copy()
-        if metadata is not None:
-            state_dict._metadata = metadata
-
         error_msgs = []
 
         # PyTorch's `_load_from_state_dict` does not copy parameters in a module's descendants
         # so we need to apply the function recursively.
-        def load(module: nn.Module, prefix=""):
+        def load(module: nn.Module, state_dict, metadata, prefix=""):
             local_metadata = {} if metadata is None else metadata.get(prefix[:-1], {})
+            if assign:
+                local_metadata = dict(local_metadata, assign_to_params_buffers=True)
             args = (state_dict, prefix, local_metadata, True, [], [], error_msgs)
             if is_deepspeed_zero3_enabled():
                 import deepspeed
@@ -1419,7 +1828,7 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
 
             for name, child in module._modules.items():
                 if child is not None:
-                    load(child, prefix + name + ".")
+                    load(child, state_dict, metadata, prefix + name + ".")
 
         # Make sure we are able to load base models as well as derived models (with heads)
         start_prefix = ""
@@ -1429,7 +1838,33 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
         if hasattr(model, cls.base_model_prefix) and not has_prefix_module:
             model_to_load = getattr(model, cls.base_model_prefix)
 
-        load(model_to_load, prefix=start_prefix)
+        if assign:
+            model_dtypes = {key: value.dtype for key, value in model_to_load.state_dict().items()}
+
+        for state_dict in shards:
+            # copy state_dict so the keys and tensors can be replaced without modifying the dict of the caller, and so
+            # _load_from_state_dict can modify it
+            metadata = getattr(state_dict, "_metadata", None)
+            state_dict = state_dict.copy()
+            if metadata is not None:
+                state_dict._metadata = metadata
+
+            fix_keys(state_dict)
+
+            if assign:
+                # The tensors of the state dict become the weights of the model, so they need to have its dtypes
+                for key, value in state_dict.items():
+                    model_key = key[len(start_prefix) :]
+                    if not key.startswith(start_prefix) or model_key not in model_dtypes:
+                        continue
+                    if value.is_floating_point() and value.dtype != model_dtypes[model_key]:
+                        state_dict[key] = value.to(model_dtypes[model_key])
+                    elif copy_assigned:
+                        state_dict[key] = value.clone()
+
+            load(model_to_load, state_dict, metadata, prefix=start_prefix)
+            # Release the shard before the next one is loaded
+            del state_dict
 
         if len(error_msgs) > 0:
             error_msg = "\n\t".join(error_msgs)
@@ -1461,6 +1896,32 @@ class PreTrainedModel(nn.Module, ModuleUtilsMixin, GenerationMixin, PushToHubMix
 
         return model, missing_keys, unexpected_keys, error_msgs
 
+    @classmethod
+    def _get_parameters_not_in_checkpoint(cls, model, loaded_keys):
+        """
+        Returns the names of the parameters of ``model`` that are not loaded from a checkpoint with the keys
+        ``loaded_keys`` by :meth:`~transformers.PreTrainedModel._load_state_dict_into_model`. Tied parameters are
+        considered loaded if one of their names is in the checkpoint.
+        """
+        loaded_keys = set(key.replace("gamma", "weight").replace("beta", "bias") for key in loaded_keys)
+        prefix = cls.base_model_prefix
+        has_prefix_module = any(key.startswith(prefix) for key in loaded_keys)
+        expects_prefix_module = any(key.startswith(prefix) for key in model.state_dict().keys())
+
+        names_of_parameters = {}
+        for name, param in model.named_parameters(remove_duplicate=False):
+            if not has_prefix_module and expects_prefix_module:
+                key = ".".join(name.split(".")[1:]) if name.startswith(prefix) else name
+            elif has_prefix_module and not expects_prefix_module:
+                key = ".".join([prefix, name])
+            else:
+                key = name
+            names_of_parameters.setdefault(param, []).append((name, key))
+
+        return [
+            names[0][0] for names in names_of_parameters.values() if not any(key in loaded_keys for _, key in names)
+        ]
+
     def retrieve_modules_from_names(self, names, add_prefix=False, remove_prefix=False):
         module_keys = set([".".join(key.split(".")[:-1]) for key in names])
 
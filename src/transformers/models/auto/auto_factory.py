@@ -14,10 +14,13 @@
 # limitations under the License.
 """Factory function to build auto-model classes."""
 
+import importlib
+from collections.abc import Mapping
+
 from ...configuration_utils import PretrainedConfig
 from ...file_utils import copy_func
 from ...utils import logging
-from .configuration_auto import AutoConfig, replace_list_option_in_docstrings
+from .configuration_auto import AutoConfig, model_type_to_module_name, replace_list_option_in_docstrings
 
 
 logger = logging.get_logger(__name__)
@@ -413,7 +416,7 @@ def auto_class_update(cls, checkpoint_for_example="bert-base-cased", head_doc=""
     from_config_docstring = from_config_docstring.replace("BaseAutoModelClass", name)
     from_config_docstring = from_config_docstring.replace("checkpoint_placeholder", checkpoint_for_example)
     from_config.__doc__ = from_config_docstring
-    from_config = replace_list_option_in_docstrings(model_mapping, use_model_types=False)(from_config)
+    from_config = replace_list_option_in_docstrings(model_mapping._model_mapping, use_model_types=False)(from_config)
     cls.from_config = classmethod(from_config)
 
     if name.startswith("TF"):
@@ -429,7 +432,7 @@ def auto_class_update(cls, checkpoint_for_example="bert-base-cased", head_doc=""
     shortcut = checkpoint_for_example.split("/")[-1].split("-")[0]
     from_pretrained_docstring = from_pretrained_docstring.replace("shortcut_placeholder", shortcut)
     from_pretrained.__doc__ = from_pretrained_docstring
-    from_pretrained = replace_list_option_in_docstrings(model_mapping)(from_pretrained)
+    from_pretrained = replace_list_option_in_docstrings(model_mapping._model_mapping)(from_pretrained)
     cls.from_pretrained = classmethod(from_pretrained)
     return cls
 
@@ -443,3 +446,69 @@ def get_values(model_mapping):
             result.append(model)
 
     return result
+
+
+def getattribute_from_module(module, attr):
+    if attr is None:
+        return None
+    if isinstance(attr, tuple):
+        return tuple(getattribute_from_module(module, a) for a in attr)
+    if hasattr(module, attr):
+        return getattr(module, attr)
+    # Some of the mappings have entries model_type -> object of another model type (e.g. the tokenizer of I-BERT is
+    # `RobertaTokenizer`). In that case we grab the object in the main init.
+    transformers_module = importlib.import_module("transformers")
+    if module is transformers_module:
+        raise ValueError(f"Could not find {attr} in transformers.")
+    return getattribute_from_module(transformers_module, attr)
+
+
+class _LazyAutoMapping(Mapping):
+    """
+    A mapping config class to model (or tokenizer, feature extractor) class(es) that only imports the module of a model
+    type when one of its classes is requested, so that the auto classes don't need to import all the models.
+
+    Args:
+        config_mapping (:obj:`OrderedDict`):
+            The mapping model type to config class name.
+        model_mapping (:obj:`OrderedDict`):
+            The mapping model type to model class name (or tuple of model class names).
+    """
+
+    def __init__(self, config_mapping, model_mapping):
+        self._config_mapping = config_mapping
+        self._reverse_config_mapping = {v: k for k, v in config_mapping.items()}
+        self._model_mapping = model_mapping
+        self._modules = {}
+
+    def _load_attr_from_module(self, model_type, attr):
+        module_name = model_type_to_module_name(model_type)
+        if module_name not in self._modules:
+            self._modules[module_name] = importlib.import_module(f".{module_name}", "transformers.models")
+        return getattribute_from_module(self._modules[module_name], attr)
+
+    def _get_model_type(self, config_class):
+        # Config classes are matched on their name first, to avoid importing the modules of all the model types.
+        model_type = self._reverse_config_mapping.get(getattr(config_class, "__name__", None))
+        if model_type is None or model_type not in self._model_mapping:
+            return None
+        if self._load_attr_from_module(model_type, self._config_mapping[model_type]) is not config_class:
+            return None
+        return model_type
+
+    def __getitem__(self, key):
+        model_type = self._get_model_type(key)
+        if model_type is None:
+            raise KeyError(key)
+        return self._load_attr_from_module(model_type, self._model_mapping[model_type])
+
+    def __contains__(self, item):
+        return self._get_model_type(item) is not None
+
+    def __iter__(self):
+        for model_type in self._model_mapping.keys():
+            if model_type in self._config_mapping:
+                yield self._load_attr_from_module(model_type, self._config_mapping[model_type])
+
+    def __len__(self):
+        return len([model_type for model_type in self._model_mapping.keys() if model_type in self._config_mapping])
@@ -14,34 +14,44 @@
 # limitations under the License.
 """ AutoFeatureExtractor class. """
 
+import importlib
 import os
 from collections import OrderedDict
 
-from transformers import DeiTFeatureExtractor, Speech2TextFeatureExtractor, ViTFeatureExtractor
-
-from ... import DeiTConfig, PretrainedConfig, Speech2TextConfig, ViTConfig, Wav2Vec2Config
+from ...configuration_utils import PretrainedConfig
 from ...feature_extraction_utils import FeatureExtractionMixin
 
 # Build the list of all feature extractors
 from ...file_utils import FEATURE_EXTRACTOR_NAME
-from ..wav2vec2.feature_extraction_wav2vec2 import Wav2Vec2FeatureExtractor
-from .configuration_auto import AutoConfig, replace_list_option_in_docstrings
+from .auto_factory import _LazyAutoMapping, getattribute_from_module
+from .configuration_auto import (
+    CONFIG_MAPPING_NAMES,
+    AutoConfig,
+    model_type_to_module_name,
+    replace_list_option_in_docstrings,
+)
 
 
-FEATURE_EXTRACTOR_MAPPING = OrderedDict(
+FEATURE_EXTRACTOR_MAPPING_NAMES = OrderedDict(
     [
-        (DeiTConfig, DeiTFeatureExtractor),
-        (Speech2TextConfig, Speech2TextFeatureExtractor),
-        (ViTConfig, ViTFeatureExtractor),
-        (Wav2Vec2Config, Wav2Vec2FeatureExtractor),
+        ("deit", "DeiTFeatureExtractor"),
+        ("speech_to_text", "Speech2TextFeatureExtractor"),
+        ("vit", "ViTFeatureExtractor"),
+        ("wav2vec2", "Wav2Vec2FeatureExtractor"),
     ]
 )
 
+FEATURE_EXTRACTOR_MAPPING = _LazyAutoMapping(CONFIG_MAPPING_NAMES, FEATURE_EXTRACTOR_MAPPING_NAMES)
+
 
 def feature_extractor_class_from_name(class_name: str):
-    for c in FEATURE_EXTRACTOR_MAPPING.values():
-        if c is not None and c.__name__ == class_name:
-            return c
+    for model_type, extractor in FEATURE_EXTRACTOR_MAPPING_NAMES.items():
+        if class_name == extractor:
+            module_name = model_type_to_module_name(model_type)
+            module = importlib.import_module(f".{module_name}", "transformers.models")
+            return getattribute_from_module(module, class_name)
+
+    return None
 
 
 class AutoFeatureExtractor:
@@ -59,7 +69,7 @@ class AutoFeatureExtractor:
         )
 
     @classmethod
-    @replace_list_option_in_docstrings(FEATURE_EXTRACTOR_MAPPING)
+    @replace_list_option_in_docstrings(FEATURE_EXTRACTOR_MAPPING_NAMES)
     def from_pretrained(cls, pretrained_model_name_or_path, **kwargs):
         r"""
         Instantiate one of the feature extractor classes of the library from a pretrained model vocabulary.
@@ -150,5 +160,5 @@ class AutoFeatureExtractor:
         raise ValueError(
             f"Unrecognized model in {pretrained_model_name_or_path}. Should have a `feature_extractor_type` key in "
             f"its {FEATURE_EXTRACTOR_NAME}, or contain one of the following strings "
-            f"in its name: {', '.join(FEATURE_EXTRACTOR_MAPPING.keys())}"
+            f"in its name: {', '.join(FEATURE_EXTRACTOR_MAPPING_NAMES.keys())}"
         )
@@ -178,8 +178,8 @@ class BartAttention(nn.Module):
             value_states = past_key_value[1]
         elif is_cross_attention:
             # cross_attentions
-            key_states = self._shape(self.k_proj(key_value_states), -1, bsz)
-            value_states = self._shape(self.v_proj(key_value_states), -1, bsz)
+            key_states = self._shape(self.k_proj(key_value_states), -1, key_value_states.size(0))
+            value_states = self._shape(self.v_proj(key_value_states), -1, key_value_states.size(0))
         elif past_key_value is not None:
             # reuse k, v, self_attention
             key_states = self._shape(self.k_proj(hidden_states), -1, bsz)
@@ -203,11 +203,22 @@ class BartAttention(nn.Module):
 
         proj_shape = (bsz * self.num_heads, -1, self.head_dim)
         query_states = self._shape(query_states, tgt_len, bsz).view(*proj_shape)
-        key_states = key_states.view(*proj_shape)
-        value_states = value_states.view(*proj_shape)
 
-        src_len = key_states.size(1)
-        attn_weights = torch.bmm(query_states, key_states.transpose(1, 2))
+        # the cross-attention key/value states can be shared by consecutive groups of queries, e.g. by the beams of
+        # the same input in beam search, in which case they are broadcast instead of being copied for each query
+        kv_bsz = key_states.size(0)
+        if kv_bsz != bsz:
+            src_len = key_states.size(2)
+            attn_weights = torch.matmul(
+                query_states.view(kv_bsz, bsz // kv_bsz, self.num_heads, tgt_len, self.head_dim),
+                key_states.unsqueeze(1).transpose(3, 4),
+            ).view(bsz * self.num_heads, tgt_len, src_len)
+        else:
+            key_states = key_states.view(*proj_shape)
+            value_states = value_states.view(*proj_shape)
+
+            src_len = key_states.size(1)
+            attn_weights = torch.bmm(query_states, key_states.transpose(1, 2))
 
         if attn_weights.size() != (bsz * self.num_heads, tgt_len, src_len):
             raise ValueError(
@@ -244,7 +255,12 @@ class BartAttention(nn.Module):
 
         attn_probs = nn.functional.dropout(attn_weights, p=self.dropout, training=self.training)
 
-        attn_output = torch.bmm(attn_probs, value_states)
+        if kv_bsz != bsz:
+            attn_output = torch.matmul(
+                attn_probs.view(kv_bsz, bsz // kv_bsz, self.num_heads, tgt_len, src_len), value_states.unsqueeze(1)
+            ).view(bsz * self.num_heads, tgt_len, self.head_dim)
+        else:
+            attn_output = torch.bmm(attn_probs, value_states)
 
         if attn_output.size() != (bsz * self.num_heads, tgt_len, self.head_dim):
             raise ValueError(
@@ -1216,6 +1232,7 @@ class BartModel(BartPretrainedModel):
 )
 class BartForConditionalGeneration(BartPretrainedModel):
     base_model_prefix = "model"
+    supports_cross_attention_broadcast = True
     _keys_to_ignore_on_load_missing = [r"final_logits_bias", r"lm_head\.weight"]
 
     def __init__(self, config: BartConfig):
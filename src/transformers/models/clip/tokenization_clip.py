@@ -22,7 +22,7 @@ from typing import List, Optional, Tuple
 import regex as re
 from transformers.models.bert.tokenization_bert import BasicTokenizer
 
-from ...tokenization_utils import AddedToken, PreTrainedTokenizer
+from ...tokenization_utils import AddedToken, BPECache, PreTrainedTokenizer, bpe_merge
 from ...utils import logging
 
 
@@ -188,7 +188,7 @@ class CLIPTokenizer(PreTrainedTokenizer):
             bpe_merges = merges_handle.read().split("\n")[1 : 49152 - 256 - 2 + 1]
         bpe_merges = [tuple(merge.split()) for merge in bpe_merges]
         self.bpe_ranks = dict(zip(bpe_merges, range(len(bpe_merges))))
-        self.cache = {"<|startoftext|>": "<|startoftext|>", "<|endoftext|>": "<|endoftext|>"}
+        self.cache = BPECache()
         self.add_prefix_space = add_prefix_space
 
         self.pat = re.compile(
@@ -265,43 +265,13 @@ class CLIPTokenizer(PreTrainedTokenizer):
         return [1] + ([0] * len(token_ids_0)) + ([0] * len(token_ids_1)) + [1]
 
     def bpe(self, token):
-        if token in self.cache:
-            return self.cache[token]
+        if token in ("<|startoftext|>", "<|endoftext|>"):
+            return token
+        cached_word = self.cache.get(token)
+        if cached_word is not None:
+            return cached_word
         word = tuple(token[:-1]) + (token[-1] + "</w>",)
-        pairs = get_pairs(word)
-
-        if not pairs:
-            return token + "</w>"
-
-        while True:
-            bigram = min(pairs, key=lambda pair: self.bpe_ranks.get(pair, float("inf")))
-            if bigram not in self.bpe_ranks:
-                break
-            first, second = bigram
-            new_word = []
-            i = 0
-            while i < len(word):
-                try:
-                    j = word.index(first, i)
-                except ValueError:
-                    new_word.extend(word[i:])
-                    break
-                else:
-                    new_word.extend(word[i:j])
-                    i = j
-
-                if word[i] == first and i < len(word) - 1 and word[i + 1] == second:
-                    new_word.append(first + second)
-                    i += 2
-                else:
-                    new_word.append(word[i])
-                    i += 1
-            new_word = tuple(new_word)
-            word = new_word
-            if len(word) == 1:
-                break
-            else:
-                pairs = get_pairs(word)
+        word = bpe_merge(word, self.bpe_ranks)
         word = " ".join(word)
         self.cache[token] = word
         return word
@@ -33,6 +33,7 @@ from ...tokenization_utils_base import (
     TextInput,
     TextInputPair,
     TruncationStrategy,
+    _get_bucket_length,
     _is_tensorflow,
     _is_torch,
     to_py_obj,
@@ -1238,6 +1239,7 @@ class LukeTokenizer(RobertaTokenizer):
         max_length: Optional[int] = None,
         max_entity_length: Optional[int] = None,
         pad_to_multiple_of: Optional[int] = None,
+        pad_to_buckets: Optional[List[int]] = None,
         return_attention_mask: Optional[bool] = None,
         return_tensors: Optional[Union[str, TensorType]] = None,
         verbose: bool = True,
@@ -1274,6 +1276,9 @@ class LukeTokenizer(RobertaTokenizer):
             pad_to_multiple_of (:obj:`int`, `optional`):
                 If set will pad the sequence to a multiple of the provided value. This is especially useful to enable
                 the use of Tensor Cores on NVIDIA hardware with compute capability >= 7.5 (Volta).
+            pad_to_buckets (:obj:`List[int]`, `optional`):
+                If set, when padding to the longest sequence, will pad the word sequences to the smallest of these
+                lengths that fits the longest sequence (or to the longest sequence if it doesn't fit any of them).
             return_attention_mask (:obj:`bool`, `optional`):
                 Whether to return the attention mask. If left to the default, will return the attention mask according
                 to the specific tokenizer's default, defined by the :obj:`return_outputs` attribute. `What are
@@ -1345,6 +1350,10 @@ class LukeTokenizer(RobertaTokenizer):
 
         required_input = encoded_inputs[self.model_input_names[0]]
         if required_input and not isinstance(required_input[0], (list, tuple)):
+            if padding_strategy == PaddingStrategy.LONGEST and pad_to_buckets:
+                max_length = _get_bucket_length(len(required_input), pad_to_buckets)
+                max_entity_length = len(encoded_inputs["entity_ids"]) if "entity_ids" in encoded_inputs else 0
+                padding_strategy = PaddingStrategy.MAX_LENGTH
             encoded_inputs = self._pad(
                 encoded_inputs,
                 max_length=max_length,
@@ -1362,6 +1371,8 @@ class LukeTokenizer(RobertaTokenizer):
 
         if padding_strategy == PaddingStrategy.LONGEST:
             max_length = max(len(inputs) for inputs in required_input)
+            if pad_to_buckets:
+                max_length = _get_bucket_length(max_length, pad_to_buckets)
             max_entity_length = (
                 max(len(inputs) for inputs in encoded_inputs["entity_ids"]) if "entity_ids" in encoded_inputs else 0
             )
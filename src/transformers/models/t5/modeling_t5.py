@@ -437,7 +437,11 @@ class T5Attention(nn.Module):
 
         key_length = real_seq_length if key_value_states is None else key_value_states.shape[1]
 
-        def shape(states):
+        # the cross-attention key/value states can be shared by consecutive groups of queries, e.g. by the beams of
+        # the same input in beam search, in which case they are broadcast instead of being copied for each query
+        kv_batch_size = batch_size if key_value_states is None else key_value_states.shape[0]
+
+        def shape(states, batch_size=batch_size):
             """projection"""
             return states.view(batch_size, -1, self.n_heads, self.key_value_proj_dim).transpose(1, 2)
 
@@ -453,8 +457,8 @@ class T5Attention(nn.Module):
                 hidden_states = shape(proj_layer(hidden_states))
             elif past_key_value is None:
                 # cross-attn
-                # (batch_size, n_heads, seq_length, dim_per_head)
-                hidden_states = shape(proj_layer(key_value_states))
+                # (kv_batch_size, n_heads, seq_length, dim_per_head)
+                hidden_states = shape(proj_layer(key_value_states), kv_batch_size)
 
             if past_key_value is not None:
                 if key_value_states is None:
@@ -478,9 +482,15 @@ class T5Attention(nn.Module):
         )
 
         # compute scores
-        scores = torch.matmul(
-            query_states, key_states.transpose(3, 2)
-        )  # equivalent of torch.einsum("bnqd,bnkd->bnqk", query_states, key_states), compatible with onnx op>9
+        if kv_batch_size != batch_size:
+            scores = torch.matmul(
+                query_states.view(kv_batch_size, -1, self.n_heads, int_seq_length, self.key_value_proj_dim),
+                key_states.unsqueeze(1).transpose(4, 3),
+            ).view(batch_size, self.n_heads, int_seq_length, -1)
+        else:
+            scores = torch.matmul(
+                query_states, key_states.transpose(3, 2)
+            )  # equivalent of torch.einsum("bnqd,bnkd->bnqk", query_states, key_states), compatible with onnx op>9
 
         if position_bias is None:
             if not self.has_relative_attention_bias:
@@ -512,7 +522,14 @@ class T5Attention(nn.Module):
         if layer_head_mask is not None:
             attn_weights = attn_weights * layer_head_mask
 
-        attn_output = unshape(torch.matmul(attn_weights, value_states))  # (batch_size, seq_length, dim)
+        if kv_batch_size != batch_size:
+            attn_output = torch.matmul(
+                attn_weights.view(kv_batch_size, -1, self.n_heads, int_seq_length, attn_weights.shape[-1]),
+                value_states.unsqueeze(1),
+            ).view(batch_size, self.n_heads, int_seq_length, self.key_value_proj_dim)
+        else:
+            attn_output = torch.matmul(attn_weights, value_states)
+        attn_output = unshape(attn_output)  # (batch_size, seq_length, dim)
         attn_output = self.o(attn_output)
 
         present_key_value_state = (key_states, value_states) if (self.is_decoder and use_cache) else None
@@ -1420,6 +1437,7 @@ class T5Model(T5PreTrainedModel):
 
 @add_start_docstrings("""T5 Model with a `language modeling` head on top. """, T5_START_DOCSTRING)
 class T5ForConditionalGeneration(T5PreTrainedModel):
+    supports_cross_attention_broadcast = True
     _keys_to_ignore_on_load_missing = [
         r"encoder\.embed_tokens\.weight",
         r"decoder\.embed_tokens\.weight",
@@ -1697,11 +1715,13 @@ class T5ForConditionalGeneration(T5PreTrainedModel):
             # get the correct batch idx from layer past batch dim
             # batch dim of `past` is at 2nd position
             reordered_layer_past_states = ()
-            for layer_past_state in layer_past_states:
-                # need to set correct `past` for each of the four key / value states
+            for layer_past_state in layer_past_states[:2]:
+                # need to set correct `past` for the self-attention key / value states
                 reordered_layer_past_states = reordered_layer_past_states + (
                     layer_past_state.index_select(0, beam_idx.to(layer_past_state.device)),
                 )
+            # cached cross_attention states don't have to be reordered -> they are always the same
+            reordered_layer_past_states = reordered_layer_past_states + layer_past_states[2:]
 
             assert reordered_layer_past_states[0].shape == layer_past_states[0].shape
             assert len(reordered_layer_past_states) == len(layer_past_states)
@@ -29,7 +29,16 @@ from typing import Callable, Dict, Generator, List, Optional, Text, Tuple, Union
 import numpy as np
 
 from ...file_utils import ExplicitEnum, PaddingStrategy, TensorType, add_end_docstrings, is_pandas_available
-from ...tokenization_utils import PreTrainedTokenizer, _is_control, _is_punctuation, _is_whitespace
+from ...tokenization_utils import (  # noqa: F401 - _is_control and _is_whitespace are imported by other modules
+    PreTrainedTokenizer,
+    _CharacterTranslationTable,
+    _clean_text_table,
+    _is_control,
+    _is_punctuation,
+    _is_whitespace,
+    _split_punctuation_table,
+    _strip_accents_table,
+)
 from ...tokenization_utils_base import (
     ENCODE_KWARGS_DOCSTRING,
     BatchEncoding,
@@ -1987,6 +1996,7 @@ class BasicTokenizer(object):
         self.never_split = set(never_split)
         self.tokenize_chinese_chars = tokenize_chinese_chars
         self.strip_accents = strip_accents
+        self._chinese_chars_table = _CharacterTranslationTable(self._space_chinese_char)
 
     def tokenize(self, text, never_split=None):
         """
@@ -2020,7 +2030,9 @@ class BasicTokenizer(object):
                         token = self._run_strip_accents(token)
                 elif self.strip_accents:
                     token = self._run_strip_accents(token)
-            split_tokens.extend(self._run_split_on_punc(token, never_split))
+                # split on punctuation by surrounding it with spaces, the tokens are split on spaces below
+                token = token.translate(_split_punctuation_table)
+            split_tokens.append(token)
 
         output_tokens = whitespace_tokenize(" ".join(split_tokens))
         return output_tokens
@@ -2028,13 +2040,7 @@ class BasicTokenizer(object):
     def _run_strip_accents(self, text):
         """Strips accents from a piece of text."""
         text = unicodedata.normalize("NFD", text)
-        output = []
-        for char in text:
-            cat = unicodedata.category(char)
-            if cat == "Mn":
-                continue
-            output.append(char)
-        return "".join(output)
+        return text.translate(_strip_accents_table)
 
     def _run_split_on_punc(self, text, never_split=None):
         """Splits punctuation on a piece of text."""
@@ -2060,16 +2066,10 @@ class BasicTokenizer(object):
 
     def _tokenize_chinese_chars(self, text):
         """Adds whitespace around any CJK character."""
-        output = []
-        for char in text:
-            cp = ord(char)
-            if self._is_chinese_char(cp):
-                output.append(" ")
-                output.append(char)
-                output.append(" ")
-            else:
-                output.append(char)
-        return "".join(output)
+        return text.translate(self._chinese_chars_table)
+
+    def _space_chinese_char(self, char):
+        return f" {char} " if self._is_chinese_char(ord(char)) else char
 
     def _is_chinese_char(self, cp):
         """Checks whether CP is the codepoint of a CJK character."""
@@ -2097,16 +2097,7 @@ class BasicTokenizer(object):
 
     def _clean_text(self, text):
         """Performs invalid character removal and whitespace cleanup on text."""
-        output = []
-        for char in text:
-            cp = ord(char)
-            if cp == 0 or cp == 0xFFFD or _is_control(char):
-                continue
-            if _is_whitespace(char):
-                output.append(" ")
-            else:
-                output.append(char)
-        return "".join(output)
+        return text.translate(_clean_text_table)
 
 
 # Copied from transformers.models.bert.tokenization_bert.WordpieceTokenizer
@@ -2117,6 +2108,30 @@ class WordpieceTokenizer(object):
         self.vocab = vocab
         self.unk_token = unk_token
         self.max_input_chars_per_word = max_input_chars_per_word
+        self._prefixes = None
+        self._prefixes_vocab_size = None
+
+    def _get_prefixes(self):
+        """
+        Returns the nodes of the prefix tries of the vocabulary, as mappings from each prefix of the tokens to whether
+        it is itself a token of the vocabulary. The first trie holds all the tokens, used at the start of the words,
+        the second one the tokens starting with "##" without it, used for the rest of the words.
+        """
+        if self._prefixes is None or self._prefixes_vocab_size != len(self.vocab):
+
+            def add_prefixes(prefixes, word):
+                for end in range(1, len(word)):
+                    prefixes.setdefault(word[:end], False)
+                prefixes[word] = True
+
+            word_prefixes, subword_prefixes = {}, {}
+            for token in self.vocab:
+                add_prefixes(word_prefixes, token)
+                if token.startswith("##"):
+                    add_prefixes(subword_prefixes, token[2:])
+            self._prefixes = (word_prefixes, subword_prefixes)
+            self._prefixes_vocab_size = len(self.vocab)
+        return self._prefixes
 
     def tokenize(self, text):
         """
@@ -2133,37 +2148,36 @@ class WordpieceTokenizer(object):
           A list of wordpiece tokens.
         """
 
+        word_prefixes, subword_prefixes = self._get_prefixes()
         output_tokens = []
         for token in whitespace_tokenize(text):
-            chars = list(token)
-            if len(chars) > self.max_input_chars_per_word:
+            if len(token) > self.max_input_chars_per_word:
                 output_tokens.append(self.unk_token)
                 continue
+            if token in self.vocab:
+                output_tokens.append(token)
+                continue
 
-            is_bad = False
             start = 0
             sub_tokens = []
-            while start < len(chars):
-                end = len(chars)
-                cur_substr = None
-                while start < end:
-                    substr = "".join(chars[start:end])
-                    if start > 0:
-                        substr = "##" + substr
-                    if substr in self.vocab:
-                        cur_substr = substr
+            prefixes = word_prefixes
+            while start < len(token):
+                # walk down the prefix trie to find the longest (sub)word starting at start
+                match_end = None
+                for end in range(start + 1, len(token) + 1):
+                    is_word = prefixes.get(token[start:end])
+                    if is_word is None:
                         break
-                    end -= 1
-                if cur_substr is None:
-                    is_bad = True
+                    if is_word:
+                        match_end = end
+                if match_end is None:
+                    sub_tokens = [self.unk_token]
                     break
-                sub_tokens.append(cur_substr)
-                start = end
+                sub_tokens.append(token[start:match_end] if start == 0 else "##" + token[start:match_end])
+                start = match_end
+                prefixes = subword_prefixes
 
-            if is_bad:
-                output_tokens.append(self.unk_token)
-            else:
-                output_tokens.extend(sub_tokens)
+            output_tokens.extend(sub_tokens)
         return output_tokens
 
 
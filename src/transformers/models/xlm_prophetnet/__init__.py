@@ -16,19 +16,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from ...file_utils import is_sentencepiece_available, is_torch_available
-from .configuration_xlm_prophetnet import XLM_PROPHETNET_PRETRAINED_CONFIG_ARCHIVE_MAP, XLMProphetNetConfig
+from typing import TYPE_CHECKING
 
+from ...file_utils import _LazyModule, is_sentencepiece_available, is_torch_available
+
+
+_import_structure = {
+    "configuration_xlm_prophetnet": ["XLM_PROPHETNET_PRETRAINED_CONFIG_ARCHIVE_MAP", "XLMProphetNetConfig"],
+}
 
 if is_sentencepiece_available():
-    from .tokenization_xlm_prophetnet import XLMProphetNetTokenizer
+    _import_structure["tokenization_xlm_prophetnet"] = ["XLMProphetNetTokenizer"]
 
 if is_torch_available():
-    from .modeling_xlm_prophetnet import (
-        XLM_PROPHETNET_PRETRAINED_MODEL_ARCHIVE_LIST,
-        XLMProphetNetDecoder,
-        XLMProphetNetEncoder,
-        XLMProphetNetForCausalLM,
-        XLMProphetNetForConditionalGeneration,
-        XLMProphetNetModel,
-    )
+    _import_structure["modeling_xlm_prophetnet"] = [
+        "XLM_PROPHETNET_PRETRAINED_MODEL_ARCHIVE_LIST",
+        "XLMProphetNetDecoder",
+        "XLMProphetNetEncoder",
+        "XLMProphetNetForCausalLM",
+        "XLMProphetNetForConditionalGeneration",
+        "XLMProphetNetModel",
+    ]
+
+
+if TYPE_CHECKING:
+    from .configuration_xlm_prophetnet import XLM_PROPHETNET_PRETRAINED_CONFIG_ARCHIVE_MAP, XLMProphetNetConfig
+
+    if is_sentencepiece_available():
+        from .tokenization_xlm_prophetnet import XLMProphetNetTokenizer
+
+    if is_torch_available():
+        from .modeling_xlm_prophetnet import (
+            XLM_PROPHETNET_PRETRAINED_MODEL_ARCHIVE_LIST,
+            XLMProphetNetDecoder,
+            XLMProphetNetEncoder,
+            XLMProphetNetForCausalLM,
+            XLMProphetNetForConditionalGeneration,
+            XLMProphetNetModel,
+        )
+
+else:
+    import sys
+
+    sys.modules[__name__] = _LazyModule(__name__, globals()["__file__"], _import_structure)
@@ -22,6 +22,7 @@ import warnings
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from os.path import abspath, exists
+from threading import Thread
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from ..feature_extraction_utils import PreTrainedFeatureExtractor
@@ -40,6 +41,7 @@ if is_tf_available():
 if is_torch_available():
     import torch
 
+    from ..generation_streamers import TextIteratorStreamer
     from ..models.auto.modeling_auto import AutoModel
 
 if TYPE_CHECKING:
@@ -785,3 +787,38 @@ class Pipeline(_ScikitCompat):
             return predictions
         else:
             return predictions.numpy()
+
+    def _stream_generated_text(self, generate_fn, *args, clean_up_tokenization_spaces=False, **kwargs):
+        """
+        Runs :obj:`generate_fn(*args, streamer=streamer, **kwargs)` in a background thread and returns an iterator
+        over the generated text, yielding each piece as soon as it is decoded by the
+        :class:`~transformers.TextIteratorStreamer` given to :obj:`generate_fn`.
+        """
+        if self.framework != "pt":
+            raise ValueError("Streaming the generated text is only supported with PyTorch models.")
+
+        streamer = TextIteratorStreamer(
+            self.tokenizer,
+            skip_prompt=True,
+            skip_special_tokens=True,
+            clean_up_tokenization_spaces=clean_up_tokenization_spaces,
+        )
+        errors = []
+
+        def generate():
+            try:
+                generate_fn(*args, streamer=streamer, **kwargs)
+            except Exception as e:
+                errors.append(e)
+                # unblock the consumer
+                streamer.queue.put(streamer.stop_signal)
+
+        def iterate():
+            yield from streamer
+            thread.join()
+            if len(errors) > 0:
+                raise errors[0]
+
+        thread = Thread(target=generate, daemon=True)
+        thread.start()
+        return iterate()
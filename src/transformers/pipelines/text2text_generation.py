@@ -81,6 +81,7 @@ class Text2TextGenerationPipeline(Pipeline):
         return_text=True,
         clean_up_tokenization_spaces=False,
         truncation=TruncationStrategy.DO_NOT_TRUNCATE,
+        stream=False,
         **generate_kwargs
     ):
         r"""
@@ -99,6 +100,9 @@ class Text2TextGenerationPipeline(Pipeline):
                 The truncation strategy for the tokenization within the pipeline.
                 :obj:`TruncationStrategy.DO_NOT_TRUNCATE` (default) will never truncate, but it is sometimes desirable
                 to truncate the input to fit the model's max_length instead of throwing an error down the line.
+            stream (:obj:`bool`, `optional`, defaults to :obj:`False`):
+                Whether or not to return an iterator over the text as it is generated instead of the outputs described
+                below. Only a single input can be streamed, and only with PyTorch models.
             generate_kwargs:
                 Additional keyword arguments to pass along to the generate method of the model (see the generate method
                 corresponding to your framework `here <./model.html#generative-models>`__).
@@ -110,6 +114,19 @@ class Text2TextGenerationPipeline(Pipeline):
             - **generated_token_ids** (:obj:`torch.Tensor` or :obj:`tf.Tensor`, present when ``return_tensors=True``)
               -- The token ids of the generated text.
         """
+        if stream:
+            if isinstance(args[0], list) and len(args[0]) != 1:
+                raise ValueError("Only a single input can be streamed.")
+            return self._stream_generated_text(
+                self.__call__,
+                *args,
+                return_text=False,
+                return_tensors=True,
+                truncation=truncation,
+                clean_up_tokenization_spaces=clean_up_tokenization_spaces,
+                **generate_kwargs,
+            )
+
         assert return_tensors or return_text, "You must specify return_tensors=True or return_text=True"
 
         with self.device_placement():
@@ -1,3 +1,5 @@
+import itertools
+
 from ..file_utils import add_end_docstrings
 from .base import PIPELINE_INIT_ARGS, Pipeline
 
@@ -70,6 +72,7 @@ class TextGenerationPipeline(Pipeline):
         return_full_text=None,
         clean_up_tokenization_spaces=False,
         prefix=None,
+        stream=False,
         **generate_kwargs
     ):
         """
@@ -89,6 +92,10 @@ class TextGenerationPipeline(Pipeline):
                 Whether or not to clean up the potential extra spaces in the text output.
             prefix (:obj:`str`, `optional`):
                 Prefix added to prompt.
+            stream (:obj:`bool`, `optional`, defaults to :obj:`False`):
+                Whether or not to return an iterator over the text as it is generated instead of the outputs described
+                below. Only a single prompt can be streamed, and only with PyTorch models. If ``return_full_text=True``,
+                the prompt is yielded first.
             generate_kwargs:
                 Additional keyword arguments to pass along to the generate method of the model (see the generate method
                 corresponding to your framework `here <./model.html#generative-models>`__).
@@ -100,6 +107,13 @@ class TextGenerationPipeline(Pipeline):
             - **generated_token_ids** (:obj:`torch.Tensor` or :obj:`tf.Tensor`, present when ``return_tensors=True``)
               -- The token ids of the generated text.
         """
+        if stream:
+            if not isinstance(text_inputs, str):
+                if len(text_inputs) != 1:
+                    raise ValueError("Only a single prompt can be streamed.")
+                text_inputs = text_inputs[0]
+            return self._stream(text_inputs, return_full_text, clean_up_tokenization_spaces, prefix, generate_kwargs)
+
         prefix = prefix if prefix is not None else self.model.config.prefix
         return_full_text = return_full_text if return_full_text is not None else self.return_full_text
 
@@ -189,3 +203,17 @@ class TextGenerationPipeline(Pipeline):
             return results[0]
 
         return results
+
+    def _stream(self, prompt_text, return_full_text, clean_up_tokenization_spaces, prefix, generate_kwargs):
+        return_full_text = return_full_text if return_full_text is not None else self.return_full_text
+        generated_text = self._stream_generated_text(
+            self,
+            prompt_text,
+            return_text=False,
+            prefix=prefix,
+            clean_up_tokenization_spaces=clean_up_tokenization_spaces,
+            **generate_kwargs,
+        )
+        if return_full_text:
+            return itertools.chain([prompt_text], generated_text)
+        return generated_text
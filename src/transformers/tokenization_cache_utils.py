@@ -0,0 +1,192 @@
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Persistent cache of the outputs of the tokenizers, stored in a SQLite database.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .file_utils import TRANSFORMERS_CACHE
+from .utils import logging
+
+
+logger = logging.get_logger(__name__)
+
+# SQLite limits the number of parameters of a query to 999 by default
+MAX_KEYS_PER_QUERY = 500
+
+
+class TokenizationCache:
+    """
+    Persistent cache of the encoded inputs of the tokenizers, stored in a SQLite database that can be shared between
+    processes and runs. Each example is stored under a key computed from the fingerprint of the tokenizer, the text
+    and the arguments of the encoding, so that any change to the vocabulary, the merges, the added tokens or the
+    configuration of the tokenizer gives new keys.
+
+    When the cache holds more than :obj:`max_size` examples, the least recently used ones are evicted.
+
+    Pass the cache to a tokenizer with the :obj:`tokenization_cache` argument of its ``__init__`` or
+    :meth:`~transformers.PreTrainedTokenizerBase.from_pretrained` methods, or set its :obj:`tokenization_cache`
+    attribute.
+
+    Args:
+        cache_file (:obj:`str`, `optional`):
+            The path to the SQLite database. Defaults to a ``tokenization_cache.sqlite`` file in the cache directory
+            of the library.
+        max_size (:obj:`int`, `optional`, defaults to 1000000):
+            The maximum number of examples kept in the cache.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None, max_size: int = 1000000):
+        if cache_file is None:
+            cache_file = os.path.join(TRANSFORMERS_CACHE, "tokenization_cache.sqlite")
+        self.cache_file = cache_file
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+
+    def __getstate__(self):
+        # SQLite connections and locks can't be pickled, they are recreated when needed
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_connection"] = None
+        state["_pid"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # A connection must not be used in a forked process, each process opens its own
+        if self._connection is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_file)), exist_ok=True)
+            connection = sqlite3.connect(self.cache_file, timeout=60, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tokenization_cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, last_access REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS tokenization_cache_last_access ON tokenization_cache (last_access)"
+            )
+            connection.commit()
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    @staticmethod
+    def get_key(fingerprint: str, text: Any, encode_kwargs: Dict[str, Any]) -> str:
+        """
+        Returns the key of an example in the cache.
+
+        Args:
+            fingerprint (:obj:`str`):
+                The fingerprint of the tokenizer.
+            text (:obj:`str`, :obj:`List[str]` or a pair of those):
+                The example to encode.
+            encode_kwargs (:obj:`Dict[str, Any]`):
+                The arguments of the encoding that change the encoded inputs.
+
+        Returns:
+            :obj:`str`: The SHA-256 digest of the fingerprint, the text and the arguments.
+        """
+        payload = json.dumps([fingerprint, text, encode_kwargs], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Returns the encoded inputs stored under :obj:`keys`, or :obj:`None` for the keys missing from the cache.
+        """
+        values = {}
+        with self._lock:
+            connection = self.connection
+            for start in range(0, len(keys), MAX_KEYS_PER_QUERY):
+                chunk = keys[start : start + MAX_KEYS_PER_QUERY]
+                placeholders = ",".join("?" * len(chunk))
+                values.update(
+                    connection.execute(
+                        f"SELECT key, value FROM tokenization_cache WHERE key IN ({placeholders})", chunk
+                    ).fetchall()
+                )
+                hit_keys = [key for key in chunk if key in values]
+                if hit_keys:
+                    connection.execute(
+                        f"UPDATE tokenization_cache SET last_access = ? WHERE key IN ({','.join('?' * len(hit_keys))})",
+                        [time.time()] + hit_keys,
+                    )
+            connection.commit()
+
+        outputs = [self._decode(values[key]) if key in values else None for key in keys]
+        num_hits = sum(output is not None for output in outputs)
+        with self._lock:
+            self.hits += num_hits
+            self.misses += len(keys) - num_hits
+        return outputs
+
+    @staticmethod
+    def _decode(value) -> Optional[Dict[str, Any]]:
+        # The encoded inputs are stored as JSON, never unpickled, since the database may be writable by other users.
+        # Values that can't be decoded (e.g. written by a previous version) count as missing.
+        try:
+            return json.loads(value)
+        except (UnicodeDecodeError, ValueError):
+            return None
+
+    def set_many(self, items: Dict[str, Dict[str, Any]]):
+        """
+        Stores the encoded inputs of :obj:`items` under their keys, then evicts the least recently used examples if
+        the cache holds more than :obj:`max_size` examples.
+        """
+        if not items:
+            return
+        last_access = time.time()
+        rows = [(key, json.dumps(value), last_access) for key, value in items.items()]
+        with self._lock:
+            connection = self.connection
+            connection.executemany("INSERT OR REPLACE INTO tokenization_cache VALUES (?, ?, ?)", rows)
+            num_evicted = connection.execute("SELECT COUNT(*) FROM tokenization_cache").fetchone()[0] - self.max_size
+            if num_evicted > 0:
+                logger.info(f"Evicting {num_evicted} examples from the tokenization cache {self.cache_file}")
+                connection.execute(
+                    "DELETE FROM tokenization_cache WHERE key IN "
+                    "(SELECT key FROM tokenization_cache ORDER BY last_access LIMIT ?)",
+                    (num_evicted,),
+                )
+            connection.commit()
+
+    def clear(self):
+        """
+        Removes all the examples from the cache.
+        """
+        with self._lock:
+            self.connection.execute("DELETE FROM tokenization_cache")
+            self.connection.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM tokenization_cache").fetchone()[0]
@@ -17,12 +17,17 @@
  tokenization_utils_fast.py
 """
 import bisect
+import heapq
 import itertools
 import re
+import threading
 import unicodedata
+from collections import OrderedDict
+from functools import partial
+from multiprocessing import Pool, cpu_count, current_process
 from typing import Any, Dict, List, Optional, Tuple, Union, overload
 
-from .file_utils import PaddingStrategy, TensorType, add_end_docstrings
+from .file_utils import PaddingStrategy, TensorType, add_end_docstrings, to_py_obj
 from .tokenization_utils_base import (
     ENCODE_KWARGS_DOCSTRING,
     ENCODE_PLUS_ADDITIONAL_KWARGS_DOCSTRING,
@@ -48,6 +53,9 @@ SPECIAL_TOKENS_MAP_FILE = "special_tokens_map.json"
 ADDED_TOKENS_FILE = "added_tokens.json"
 TOKENIZER_CONFIG_FILE = "tokenizer_config.json"
 
+# Minimum number of characters tokenized by each process when tokenizing a batch with several processes
+MIN_CHARACTERS_PER_PROCESS = 100000
+
 
 def _is_whitespace(char):
     """Checks whether `char` is a whitespace character."""
@@ -100,6 +108,47 @@ def _is_start_of_word(text):
     return bool(_is_control(first_char) | _is_punctuation(first_char) | _is_whitespace(first_char))
 
 
+class _CharacterTranslationTable(dict):
+    """
+    Translation table for :obj:`str.translate` computing the translation of each character the first time it is
+    translated, so the per-character checks (e.g. :obj:`unicodedata.category`) only run once per distinct character.
+    """
+
+    def __init__(self, translate_char):
+        super().__init__()
+        self.translate_char = translate_char
+
+    def __missing__(self, cp):
+        translation = self.translate_char(chr(cp))
+        self[cp] = translation
+        return translation
+
+
+def _clean_char(char):
+    """Removes the invalid and control characters and replaces the whitespaces with a space."""
+    cp = ord(char)
+    if cp == 0 or cp == 0xFFFD or _is_control(char):
+        return None
+    if _is_whitespace(char):
+        return " "
+    return char
+
+
+def _split_punctuation_char(char):
+    """Surrounds the punctuation characters with spaces."""
+    return f" {char} " if _is_punctuation(char) else char
+
+
+def _strip_accent_char(char):
+    """Removes the combining marks of a NFD-normalized text."""
+    return None if unicodedata.category(char) == "Mn" else char
+
+
+_clean_text_table = _CharacterTranslationTable(_clean_char)
+_split_punctuation_table = _CharacterTranslationTable(_split_punctuation_char)
+_strip_accents_table = _CharacterTranslationTable(_strip_accent_char)
+
+
 def _insert_one_token_to_ordered_list(token_list: List[str], new_token: str):
     """
     Inserts one token to an ordered list if it does not already exist. Note: token_list must be sorted.
@@ -113,6 +162,257 @@ def _insert_one_token_to_ordered_list(token_list: List[str], new_token: str):
         token_list.insert(insertion_idx, new_token)
 
 
+def _count_characters(text) -> int:
+    """
+    Counts the characters to tokenize in a sequence or pair of sequences, the ids of encoded inputs count for zero.
+    """
+    if isinstance(text, str):
+        return len(text)
+    if isinstance(text, (list, tuple)):
+        return sum(_count_characters(t) for t in text)
+    return 0
+
+
+def _batch_get_input_ids_init(tokenizer_for_batch: "PreTrainedTokenizer"):
+    global tokenizer
+    tokenizer = tokenizer_for_batch
+
+
+def _batch_get_input_ids_in_worker(batch_text_or_text_pairs, is_split_into_words=False, **kwargs):
+    return tokenizer._batch_get_input_ids(batch_text_or_text_pairs, is_split_into_words=is_split_into_words, **kwargs)
+
+
+class Trie:
+    """
+    Prefix tree of the added tokens, used to find all of them in a text in a single left-to-right pass instead of
+    splitting the text once per added token.
+    """
+
+    def __init__(self, words: Optional[List[str]] = None):
+        self.data = {}
+        self._num_words = 0
+        self._first_chars_pattern = None
+        for word in words or []:
+            self.add(word)
+
+    def __len__(self):
+        return self._num_words
+
+    def add(self, word: str):
+        """
+        Adds a word to the trie. Does nothing if the word is empty or already in the trie.
+        """
+        if not word:
+            return
+        ref = self.data
+        for char in word:
+            ref = ref.setdefault(char, {})
+        if "" not in ref:
+            # the empty string can't be a character of a word, we use it to mark the end of the words
+            ref[""] = 1
+            self._num_words += 1
+            self._first_chars_pattern = None
+
+    def split(self, text: str) -> List[str]:
+        """
+        Splits a text on the words of the trie, like splitting it once per word in alphabetical order (the order of
+        :obj:`unique_no_split_tokens`): when two occurrences overlap, the word that comes first in alphabetical order
+        is the one extracted.
+
+        Args:
+            text (:obj:`str`):
+                The text to split.
+
+        Returns:
+            :obj:`List[str]`: A list of :obj:`2 * n + 1` strings, with the :obj:`n` matched words at the odd indices
+            and the (possibly empty) parts of the text around them at the even indices.
+
+        Example::
+
+            >>> trie = Trie(["[CLS]", "extra_id_1", "extra_id_100"])
+            >>> trie.split("[CLS] This is a extra_id_100")
+            ['', '[CLS]', ' This is a ', 'extra_id_1', '00']
+        """
+        if not self.data:
+            return [text]
+        if self._first_chars_pattern is None:
+            # jumps directly to the positions where a word can start
+            self._first_chars_pattern = re.compile("[" + "".join(re.escape(char) for char in self.data) + "]")
+
+        # all the occurrences of the words, as (start, end) sorted by start
+        matches = []
+        has_overlaps = False
+        for match in self._first_chars_pattern.finditer(text):
+            start = match.start()
+            ref = self.data
+            for i in range(start, len(text)):
+                ref = ref.get(text[i])
+                if ref is None:
+                    break
+                if "" in ref:
+                    has_overlaps = has_overlaps or (len(matches) > 0 and start < matches[-1][1])
+                    matches.append((start, i + 1))
+
+        if has_overlaps:
+            # keeps the occurrences of the first words in alphabetical order, then the leftmost ones
+            matches.sort(key=lambda match: (text[match[0] : match[1]], match[0]))
+            taken = [False] * len(text)
+            kept_matches = []
+            for start, end in matches:
+                if not any(taken[start:end]):
+                    taken[start:end] = [True] * (end - start)
+                    kept_matches.append((start, end))
+            matches = sorted(kept_matches)
+
+        split_text = []
+        text_start = 0
+        for start, end in matches:
+            split_text.extend([text[text_start:start], text[start:end]])
+            text_start = end
+        split_text.append(text[text_start:])
+        return split_text
+
+
+class BPECache:
+    """
+    Bounded least-recently-used cache of the BPE merges of the words, used by the BPE-based slow tokenizers (GPT-2,
+    RoBERTa, OpenAI GPT, CTRL, XLM...) as their :obj:`cache` attribute.
+
+    The cache is thread-safe and keeps hit/miss statistics. It can be shared between several tokenizers using the same
+    merges, e.g. with :obj:`tokenizer_2.cache = tokenizer_1.cache`.
+
+    Args:
+        max_size (:obj:`int`, `optional`, defaults to 65536):
+            The maximum number of words kept in the cache. The least recently used words are evicted first. The cache
+            is unbounded if :obj:`None`.
+    """
+
+    def __init__(self, max_size: Optional[int] = 65536):
+        self.max_size = max_size
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.data
+
+    def __getitem__(self, word: str) -> str:
+        value = self.get(word)
+        if value is None:
+            raise KeyError(word)
+        return value
+
+    def get(self, word: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Returns the cached BPE of :obj:`word` and marks it as the most recently used, or :obj:`default` if it is not
+        in the cache.
+        """
+        with self._lock:
+            value = self.data.get(word)
+            if value is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self.data.move_to_end(word)
+            return value
+
+    def __setitem__(self, word: str, value: str):
+        with self._lock:
+            self.data[word] = value
+            self.data.move_to_end(word)
+            if self.max_size is not None and len(self.data) > self.max_size:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        """
+        Empties the cache and resets its statistics.
+        """
+        with self._lock:
+            self.data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def bpe_merge(word: Tuple[str, ...], bpe_ranks: Dict[Tuple[str, str], int]) -> Tuple[str, ...]:
+    """
+    Applies the BPE merges to the symbols of a word, merging the pair with the lowest rank first.
+
+    The pairs are kept in a priority queue ordered by rank and position, so each merge only updates the pairs around
+    the merged symbols instead of scanning the whole word. All the occurrences of a pair are merged from left to right
+    before the pairs they create are considered, which gives the same result as recomputing the pairs of the word
+    after each merge.
+
+    Args:
+        word (:obj:`Tuple[str]`):
+            The initial symbols of the word.
+        bpe_ranks (:obj:`Dict[Tuple[str, str], int]`):
+            The rank of each merge.
+
+    Returns:
+        :obj:`Tuple[str]`: The symbols of the word after all the merges.
+    """
+    symbols = list(word)
+    num_symbols = len(symbols)
+    if num_symbols < 2:
+        return tuple(symbols)
+    # doubly linked list over the positions of the remaining symbols, the merged symbol takes the left position
+    next_position = list(range(1, num_symbols)) + [-1]
+    previous_position = list(range(-1, num_symbols - 1))
+
+    queue = []
+    for i in range(num_symbols - 1):
+        rank = bpe_ranks.get((symbols[i], symbols[i + 1]))
+        if rank is not None:
+            queue.append((rank, i, symbols[i], symbols[i + 1]))
+    heapq.heapify(queue)
+
+    while queue:
+        rank = queue[0][0]
+        new_pairs = []
+        while queue and queue[0][0] == rank:
+            _, i, first, second = heapq.heappop(queue)
+            j = next_position[i]
+            # skip the pairs that don't exist anymore because one of their symbols was merged
+            if symbols[i] != first or j == -1 or symbols[j] != second:
+                continue
+            symbols[i] = first + second
+            symbols[j] = None
+            k = next_position[j]
+            next_position[i] = k
+            if k != -1:
+                previous_position[k] = i
+            new_pairs.append(i)
+
+        for i in new_pairs:
+            if symbols[i] is None:
+                continue
+            h = previous_position[i]
+            if h != -1:
+                new_rank = bpe_ranks.get((symbols[h], symbols[i]))
+                if new_rank is not None:
+                    heapq.heappush(queue, (new_rank, h, symbols[h], symbols[i]))
+            k = next_position[i]
+            if k != -1:
+                new_rank = bpe_ranks.get((symbols[i], symbols[k]))
+                if new_rank is not None:
+                    heapq.heappush(queue, (new_rank, i, symbols[i], symbols[k]))
+
+    return tuple(symbol for symbol in symbols if symbol is not None)
+
+
 @add_end_docstrings(INIT_TOKENIZER_DOCSTRING)
 class PreTrainedTokenizer(PreTrainedTokenizerBase):
     """
@@ -138,10 +438,34 @@ class PreTrainedTokenizer(PreTrainedTokenizerBase):
 
         self._decode_use_source_tokenizer = False
 
+        # Lookup table of the tokens of the ids seen by `_batch_decode`, filled lazily
+        self._ids_to_tokens_table: Dict[int, str] = {}
+        self._ids_to_tokens_table_size = None
+
+        # Special tokens structures used by `tokenize`, rebuilt when the special tokens change
+        self._tokenize_special_tokens_key = None
+        self._tokenize_special_tokens_extended: Dict[str, AddedToken] = {}
+        self._tokenize_special_tokens_pattern: Optional[re.Pattern] = None
+
     @property
     def is_fast(self) -> bool:
         return False
 
+    @property
+    def tokens_trie(self) -> Trie:
+        """
+        :class:`~transformers.tokenization_utils.Trie`: The trie of :obj:`unique_no_split_tokens` used by
+        :meth:`tokenize`, rebuilt when the list was modified or replaced since the last call.
+        """
+        # we keep a reference to the list rather than its id, a new list could get the id of a garbage collected one
+        no_split_tokens = self.unique_no_split_tokens
+        source = getattr(self, "_tokens_trie_source", None)
+        if source is not no_split_tokens or self._tokens_trie_source_len != len(no_split_tokens):
+            self._tokens_trie = Trie(no_split_tokens)
+            self._tokens_trie_source = no_split_tokens
+            self._tokens_trie_source_len = len(no_split_tokens)
+        return self._tokens_trie
+
     @property
     def vocab_size(self) -> int:
         """
@@ -226,6 +550,28 @@ class PreTrainedTokenizer(PreTrainedTokenizerBase):
 
         return len(tokens_to_add)
 
+    def _get_tokenize_special_tokens(self) -> Tuple[Dict[str, AddedToken], Optional[re.Pattern]]:
+        """
+        Returns the mapping string => AddedToken of the special tokens with specific tokenization behaviors and the
+        regex matching the special tokens, built once and reused by :meth:`tokenize` until the special tokens change
+        (e.g. with :meth:`~transformers.tokenization_utils_base.SpecialTokensMixin.add_special_tokens` or by setting
+        one of the special tokens attributes).
+        """
+        key = tuple(
+            tuple(value) if isinstance(value, (list, tuple)) else value
+            for value in (getattr(self, "_" + attr) for attr in self.SPECIAL_TOKENS_ATTRIBUTES)
+        )
+        if key != getattr(self, "_tokenize_special_tokens_key", None):
+            self._tokenize_special_tokens_extended = dict(
+                (str(t), t) for t in self.all_special_tokens_extended if isinstance(t, AddedToken)
+            )
+            escaped_special_toks = [re.escape(s_tok) for s_tok in self.all_special_tokens if s_tok]
+            self._tokenize_special_tokens_pattern = (
+                re.compile(r"(" + r"|".join(escaped_special_toks) + r")") if escaped_special_toks else None
+            )
+            self._tokenize_special_tokens_key = key
+        return self._tokenize_special_tokens_extended, self._tokenize_special_tokens_pattern
+
     def num_special_tokens_to_add(self, pair: bool = False) -> int:
         """
         Returns the number of added tokens when encoding a sequence with special tokens.
@@ -262,10 +608,7 @@ class PreTrainedTokenizer(PreTrainedTokenizerBase):
         Returns:
             :obj:`List[str]`: The list of tokens.
         """
-        # Simple mapping string => AddedToken for special tokens with specific tokenization behaviors
-        all_special_tokens_extended = dict(
-            (str(t), t) for t in self.all_special_tokens_extended if isinstance(t, AddedToken)
-        )
+        all_special_tokens_extended, special_tokens_pattern = self._get_tokenize_special_tokens()
 
         text, kwargs = self.prepare_for_tokenization(text, **kwargs)
 
@@ -274,92 +617,60 @@ class PreTrainedTokenizer(PreTrainedTokenizerBase):
 
         # TODO: should this be in the base class?
         if hasattr(self, "do_lower_case") and self.do_lower_case:
-            # convert non-special tokens to lowercase
-            escaped_special_toks = [re.escape(s_tok) for s_tok in self.all_special_tokens]
-            pattern = r"(" + r"|".join(escaped_special_toks) + r")|" + r"(.+?)"
-            text = re.sub(pattern, lambda m: m.groups()[0] or m.groups()[1].lower(), text)
-
-        def split_on_token(tok, text):
-            result = []
+            # convert non-special tokens to lowercase, the special tokens are at the odd indices of split_text
+            split_text = special_tokens_pattern.split(text) if special_tokens_pattern is not None else [text]
+            # lowercase the characters one by one: str.lower turns a final "\u03a3" into "\u03c2" instead of "\u03c3"
+            split_text[::2] = [chunk.replace("\u03a3", "\u03c3").lower() for chunk in split_text[::2]]
+            text = "".join(split_text)
+
+        if not text.strip():
+            return []
+        tokens_trie = self.tokens_trie
+        if not tokens_trie:
+            return self._tokenize(text)
+
+        # The added tokens are at the odd indices of split_text, e.g. ["This is", "<special_token_1>", "  else"]
+        split_text = tokens_trie.split(text)
+        tokens = [split_text[0]]
+        for i in range(1, len(split_text), 2):
+            tok, right = split_text[i], split_text[i + 1]
+            left = tokens[-1]
             tok_extended = all_special_tokens_extended.get(tok, None)
-            split_text = text.split(tok)
-            full_word = ""
-            for i, sub_text in enumerate(split_text):
-                # AddedToken can control whitespace stripping around them.
-                # We use them for GPT2 and Roberta to have different behavior depending on the special token
-                # Cf. https://github.com/huggingface/transformers/pull/2778
-                # and https://github.com/huggingface/transformers/issues/3788
-                if isinstance(tok_extended, AddedToken):
-                    if tok_extended.single_word:
-                        # Try to avoid splitting on token
-                        if (
-                            i < len(split_text) - 1
-                            and not _is_end_of_word(sub_text)
-                            and not _is_start_of_word(split_text[i + 1])
-                        ):
-                            # Don't extract the special token
-                            full_word += sub_text + tok
-                        elif full_word:
-                            full_word += sub_text
-                            result.append(full_word)
-                            full_word = ""
-                            continue
-                    # Strip white spaces on the right
-                    if tok_extended.rstrip and i > 0:
-                        # A bit counter-intuitive but we strip the left of the string
-                        # since tok_extended.rstrip means the special token is eating all white spaces on its right
-                        sub_text = sub_text.lstrip()
-                    # Strip white spaces on the left
-                    if tok_extended.lstrip and i < len(split_text) - 1:
-                        sub_text = sub_text.rstrip()  # Opposite here
-                else:
-                    # We strip left and right by default
-                    if i < len(split_text) - 1:
-                        sub_text = sub_text.rstrip()
-                    if i > 0:
-                        sub_text = sub_text.lstrip()
-
-                if i == 0 and not sub_text:
-                    result.append(tok)
-                elif i == len(split_text) - 1:
-                    if sub_text:
-                        result.append(sub_text)
-                    else:
-                        pass
-                else:
-                    if sub_text:
-                        result.append(sub_text)
-                    result.append(tok)
-            return result
-
-        def split_on_tokens(tok_list, text):
-            if not text.strip():
-                return []
-            if not tok_list:
-                return self._tokenize(text)
-
-            tokenized_text = []
-            text_list = [text]
-            for tok in tok_list:
-                tokenized_text = []
-                for sub_text in text_list:
-                    if sub_text not in self.unique_no_split_tokens:
-                        tokenized_text.extend(split_on_token(tok, sub_text))
-                    else:
-                        tokenized_text.append(sub_text)
-                text_list = tokenized_text
-
-            return list(
-                itertools.chain.from_iterable(
-                    (
-                        self._tokenize(token) if token not in self.unique_no_split_tokens else [token]
-                        for token in tokenized_text
-                    )
-                )
-            )
-
-        no_split_token = self.unique_no_split_tokens
-        tokenized_text = split_on_tokens(no_split_token, text)
+            # AddedToken can control whitespace stripping around them.
+            # We use them for GPT2 and Roberta to have different behavior depending on the special token
+            # Cf. https://github.com/huggingface/transformers/pull/2778
+            # and https://github.com/huggingface/transformers/issues/3788
+            if isinstance(tok_extended, AddedToken):
+                if (
+                    tok_extended.single_word
+                    and left
+                    and right
+                    and not _is_end_of_word(left)
+                    and not _is_start_of_word(right)
+                ):
+                    # Don't extract the special token from the middle of a word
+                    tokens[-1] = left + tok + right
+                    continue
+                # Strip white spaces on the right
+                if tok_extended.rstrip:
+                    # A bit counter-intuitive but we strip the left of the string
+                    # since tok_extended.rstrip means the special token is eating all white spaces on its right
+                    right = right.lstrip()
+                # Strip white spaces on the left
+                if tok_extended.lstrip:
+                    tokens[-1] = left.rstrip()  # Opposite here
+            else:
+                # We strip left and right by default
+                tokens[-1] = left.rstrip()
+                right = right.lstrip()
+            tokens.extend([tok, right])
+
+        tokenized_text = []
+        for i, token in enumerate(tokens):
+            if i % 2 == 1:
+                tokenized_text.append(token)
+            elif token:
+                tokenized_text.extend(self._tokenize(token))
         return tokenized_text
 
     def _tokenize(self, text, **kwargs):
@@ -505,8 +816,61 @@ class PreTrainedTokenizer(PreTrainedTokenizerBase):
         return_offsets_mapping: bool = False,
         return_length: bool = False,
         verbose: bool = True,
+        num_proc: Optional[int] = None,
         **kwargs
     ) -> BatchEncoding:
+        if return_offsets_mapping:
+            raise NotImplementedError(
+                "return_offset_mapping is not available when using Python tokenizers."
+                "To use this feature, change your tokenizer to one deriving from "
+                "transformers.PreTrainedTokenizerFast."
+            )
+
+        if num_proc is not None and num_proc > 1:
+            input_ids = self._batch_get_input_ids_with_pool(
+                batch_text_or_text_pairs, num_proc, is_split_into_words=is_split_into_words, **kwargs
+            )
+        else:
+            input_ids = self._batch_get_input_ids(
+                batch_text_or_text_pairs, is_split_into_words=is_split_into_words, **kwargs
+            )
+
+        batch_outputs = self._batch_prepare_for_model(
+            input_ids,
+            add_special_tokens=add_special_tokens,
+            padding_strategy=padding_strategy,
+            truncation_strategy=truncation_strategy,
+            max_length=max_length,
+            stride=stride,
+            pad_to_multiple_of=pad_to_multiple_of,
+            return_attention_mask=return_attention_mask,
+            return_token_type_ids=return_token_type_ids,
+            return_overflowing_tokens=return_overflowing_tokens,
+            return_special_tokens_mask=return_special_tokens_mask,
+            return_length=return_length,
+            return_tensors=return_tensors,
+            verbose=verbose,
+        )
+
+        return BatchEncoding(batch_outputs)
+
+    def _batch_get_input_ids(
+        self,
+        batch_text_or_text_pairs: Union[
+            List[TextInput],
+            List[TextInputPair],
+            List[PreTokenizedInput],
+            List[PreTokenizedInputPair],
+            List[EncodedInput],
+            List[EncodedInputPair],
+        ],
+        is_split_into_words: bool = False,
+        **kwargs
+    ) -> List[Tuple[List[int], Optional[List[int]]]]:
+        """
+        Tokenizes and converts to ids a batch of sequences or pairs of sequences, without adding special tokens.
+        """
+
         def get_input_ids(text):
             if isinstance(text, str):
                 tokens = self.tokenize(text, **kwargs)
@@ -526,13 +890,6 @@ class PreTrainedTokenizer(PreTrainedTokenizerBase):
                     "Input is not valid. Should be a string, a list/tuple of strings or a list/tuple of integers."
                 )
 
-        if return_offsets_mapping:
-            raise NotImplementedError(
-                "return_offset_mapping is not available when using Python tokenizers."
-                "To use this feature, change your tokenizer to one deriving from "
-                "transformers.PreTrainedTokenizerFast."
-            )
-
         input_ids = []
         for ids_or_pair_ids in batch_text_or_text_pairs:
             if not isinstance(ids_or_pair_ids, (list, tuple)):
@@ -545,25 +902,56 @@ class PreTrainedTokenizer(PreTrainedTokenizerBase):
             first_ids = get_input_ids(ids)
             second_ids = get_input_ids(pair_ids) if pair_ids is not None else None
             input_ids.append((first_ids, second_ids))
+        return input_ids
 
-        batch_outputs = self._batch_prepare_for_model(
-            input_ids,
-            add_special_tokens=add_special_tokens,
-            padding_strategy=padding_strategy,
-            truncation_strategy=truncation_strategy,
-            max_length=max_length,
-            stride=stride,
-            pad_to_multiple_of=pad_to_multiple_of,
-            return_attention_mask=return_attention_mask,
-            return_token_type_ids=return_token_type_ids,
-            return_overflowing_tokens=return_overflowing_tokens,
-            return_special_tokens_mask=return_special_tokens_mask,
-            return_length=return_length,
-            return_tensors=return_tensors,
-            verbose=verbose,
-        )
+    def _batch_get_input_ids_with_pool(
+        self,
+        batch_text_or_text_pairs: Union[
+            List[TextInput],
+            List[TextInputPair],
+            List[PreTokenizedInput],
+            List[PreTokenizedInputPair],
+            List[EncodedInput],
+            List[EncodedInputPair],
+        ],
+        num_proc: int,
+        is_split_into_words: bool = False,
+        **kwargs
+    ) -> List[Tuple[List[int], Optional[List[int]]]]:
+        """
+        Same as :meth:`_batch_get_input_ids`, with the batch split in contiguous chunks tokenized by :obj:`num_proc`
+        worker processes. Each worker is initialized once with a copy of the tokenizer.
 
-        return BatchEncoding(batch_outputs)
+        The chunks hold at least :obj:`MIN_CHARACTERS_PER_PROCESS` characters, so batches too small to make up for the
+        cost of starting the processes and sending them the tokenizer are tokenized in the current process.
+        """
+        num_characters = [_count_characters(example) for example in batch_text_or_text_pairs]
+        # a few chunks per process balance the load when the lengths of the examples vary
+        num_chunks = min(num_proc * 4, sum(num_characters) // MIN_CHARACTERS_PER_PROCESS)
+        num_proc = min(num_proc, cpu_count(), num_chunks)
+        if num_proc <= 1 or current_process().daemon:
+            # daemonic processes (e.g. data loader workers) can't start their own workers
+            return self._batch_get_input_ids(
+                batch_text_or_text_pairs, is_split_into_words=is_split_into_words, **kwargs
+            )
+
+        # split the batch in chunks holding the same number of characters
+        chunks = []
+        chunk_start = 0
+        chunk_num_characters = 0
+        characters_per_chunk = sum(num_characters) / num_chunks
+        for i, example_num_characters in enumerate(num_characters):
+            chunk_num_characters += example_num_characters
+            if chunk_num_characters >= characters_per_chunk * (len(chunks) + 1):
+                chunks.append(batch_text_or_text_pairs[chunk_start : i + 1])
+                chunk_start = i + 1
+        if chunk_start < len(batch_text_or_text_pairs):
+            chunks.append(batch_text_or_text_pairs[chunk_start:])
+
+        get_input_ids = partial(_batch_get_input_ids_in_worker, is_split_into_words=is_split_into_words, **kwargs)
+        with Pool(num_proc, initializer=_batch_get_input_ids_init, initargs=(self,)) as pool:
+            input_ids = pool.map(get_input_ids, chunks, chunksize=1)
+        return list(itertools.chain.from_iterable(input_ids))
 
     @add_end_docstrings(ENCODE_KWARGS_DOCSTRING, ENCODE_PLUS_ADDITIONAL_KWARGS_DOCSTRING)
     def _batch_prepare_for_model(
@@ -714,9 +1102,10 @@ class PreTrainedTokenizer(PreTrainedTokenizerBase):
             else:
                 return self._convert_id_to_token(ids)
         tokens = []
+        all_special_ids = set(self.all_special_ids) if skip_special_tokens else set()
         for index in ids:
             index = int(index)
-            if skip_special_tokens and index in self.all_special_ids:
+            if index in all_special_ids:
                 continue
             if index in self.added_tokens_decoder:
                 tokens.append(self.added_tokens_decoder[index])
@@ -741,15 +1130,95 @@ class PreTrainedTokenizer(PreTrainedTokenizerBase):
         self._decode_use_source_tokenizer = kwargs.pop("use_source_tokenizer", False)
 
         filtered_tokens = self.convert_ids_to_tokens(token_ids, skip_special_tokens=skip_special_tokens)
+        return self._convert_filtered_tokens_to_text(
+            filtered_tokens,
+            clean_up_tokenization_spaces=clean_up_tokenization_spaces,
+            spaces_between_special_tokens=spaces_between_special_tokens,
+        )
+
+    def _batch_decode(
+        self,
+        sequences: List[List[int]],
+        skip_special_tokens: bool = False,
+        clean_up_tokenization_spaces: bool = True,
+        **kwargs
+    ) -> List[str]:
+        # Tokenizers customizing the decoding decode each sequence on its own
+        if (
+            type(self)._decode is not PreTrainedTokenizer._decode
+            or type(self).convert_ids_to_tokens is not PreTrainedTokenizer.convert_ids_to_tokens
+            or type(self).decode is not PreTrainedTokenizerBase.decode
+        ):
+            return super()._batch_decode(
+                sequences,
+                skip_special_tokens=skip_special_tokens,
+                clean_up_tokenization_spaces=clean_up_tokenization_spaces,
+                **kwargs,
+            )
+
+        spaces_between_special_tokens = kwargs.pop("spaces_between_special_tokens", True)
+        use_source_tokenizer = kwargs.pop("use_source_tokenizer", False)
+        self._decode_use_source_tokenizer = use_source_tokenizer
+        if not isinstance(sequences, (list, tuple)):
+            sequences = to_py_obj(sequences)
+
+        # The special ids and the tokens of the ids are looked up once for the whole batch
+        if getattr(self, "_ids_to_tokens_table_size", None) != len(self):
+            self._ids_to_tokens_table = {}
+            self._ids_to_tokens_table_size = len(self)
+        ids_to_tokens = self._ids_to_tokens_table
+        all_special_ids = set(self.all_special_ids) if skip_special_tokens else set()
+
+        texts = []
+        for token_ids in sequences:
+            if not isinstance(token_ids, list):
+                token_ids = to_py_obj(token_ids)
+            if isinstance(token_ids, int):
+                texts.append(
+                    self._decode(
+                        token_ids,
+                        skip_special_tokens=skip_special_tokens,
+                        clean_up_tokenization_spaces=clean_up_tokenization_spaces,
+                        spaces_between_special_tokens=spaces_between_special_tokens,
+                        use_source_tokenizer=use_source_tokenizer,
+                    )
+                )
+                continue
+
+            filtered_tokens = []
+            for index in token_ids:
+                index = int(index)
+                if index in all_special_ids:
+                    continue
+                token = ids_to_tokens.get(index)
+                if token is None:
+                    if index in self.added_tokens_decoder:
+                        token = self.added_tokens_decoder[index]
+                    else:
+                        token = self._convert_id_to_token(index)
+                    ids_to_tokens[index] = token
+                filtered_tokens.append(token)
+            texts.append(
+                self._convert_filtered_tokens_to_text(
+                    filtered_tokens,
+                    clean_up_tokenization_spaces=clean_up_tokenization_spaces,
+                    spaces_between_special_tokens=spaces_between_special_tokens,
+                )
+            )
+        return texts
 
+    def _convert_filtered_tokens_to_text(
+        self,
+        filtered_tokens: List[str],
+        clean_up_tokenization_spaces: bool = True,
+        spaces_between_special_tokens: bool = True,
+    ) -> str:
         # To avoid mixing byte-level and unicode for byte-level BPT
         # we need to build string separately for added tokens and byte-level tokens
         # cf. https://github.com/huggingface/transformers/issues/1133
         sub_texts = []
         current_sub_text = []
         for token in filtered_tokens:
-            if skip_special_tokens and token in self.all_special_ids:
-                continue
             if token in self.added_tokens_encoder:
                 if current_sub_text:
                     sub_texts.append(self.convert_tokens_to_string(current_sub_text))
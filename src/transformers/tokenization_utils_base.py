@@ -18,9 +18,13 @@ fronting encoding methods) Special token mixing (host the special tokens logic)
 of output with special method for the Fast tokenizers)
 """
 
+import bisect
 import copy
+import hashlib
+import itertools
 import json
 import os
+import re
 import warnings
 from collections import OrderedDict, UserDict
 from contextlib import contextmanager
@@ -50,9 +54,11 @@ from .file_utils import (
     is_tf_available,
     is_tokenizers_available,
     is_torch_available,
+    resolve_etags,
     to_py_obj,
     torch_required,
 )
+from .tokenization_cache_utils import TokenizationCache
 from .utils import logging
 
 
@@ -86,6 +92,9 @@ else:
         def __getstate__(self):
             return self.__dict__
 
+        def __str__(self):
+            return self.content
+
     @dataclass
     class EncodingFast:
         """This is dummy class because without the `tokenizers` library we don't have these objects anyway"""
@@ -115,6 +124,19 @@ TOKENIZER_CONFIG_FILE = "tokenizer_config.json"
 # Fast tokenizers (provided by HuggingFace tokenizer's library) can be saved in a single file
 FULL_TOKENIZER_FILE = "tokenizer.json"
 
+# Spaces removed by `clean_up_tokenization`
+_CLEAN_UP_TOKENIZATION_PATTERN = re.compile(r" (?=[.?!,]|n't|'m|'s|'ve|'re)")
+
+
+def _get_bucket_length(length: int, buckets: List[int]) -> int:
+    """
+    Returns the smallest of the bucket lengths :obj:`buckets` greater than or equal to :obj:`length`, or
+    :obj:`length` if it is greater than all of them.
+    """
+    buckets = sorted(buckets)
+    index = bisect.bisect_left(buckets, length)
+    return buckets[index] if index < len(buckets) else length
+
 
 class TruncationStrategy(ExplicitEnum):
     """
@@ -1327,6 +1349,14 @@ ENCODE_PLUS_ADDITIONAL_KWARGS_DOCSTRING = r"""
                 Whether or not to return the lengths of the encoded inputs.
             verbose (:obj:`bool`, `optional`, defaults to :obj:`True`):
                 Whether or not to print more information and warnings.
+            num_proc (:obj:`int`, `optional`):
+                The number of processes used to tokenize a batch of sequences. Each process is initialized once with a
+                copy of the tokenizer and tokenizes a contiguous chunk of the batch. Batches too small to make up for
+                the cost of starting the processes are tokenized in the current process.
+
+                This is only used by Python tokenizers to encode batches. It is ignored with a warning for single
+                sequences and by fast tokenizers inheriting from :class:`~transformers.PreTrainedTokenizerFast`, which
+                already tokenize batches in parallel.
             **kwargs: passed to the :obj:`self.tokenize()` method
 
         Return:
@@ -1415,6 +1445,11 @@ INIT_TOKENIZER_DOCSTRING = r"""
             A tuple or a list of additional special tokens. Add them here to ensure they won't be split by the
             tokenization process. Will be associated to ``self.additional_special_tokens`` and
             ``self.additional_special_tokens_ids``.
+        tokenization_cache (:class:`~transformers.TokenizationCache`, `optional`):
+            A persistent cache of the encoded inputs. When provided, the examples already encoded by a tokenizer with
+            the same vocabulary, added tokens and configuration, with the same arguments, are read from the cache
+            instead of being tokenized again. Will be associated to ``self.tokenization_cache``. It is not saved with
+            the tokenizer.
 """
 
 
@@ -1438,6 +1473,11 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
     slow_tokenizer_class = None
 
     def __init__(self, **kwargs):
+        # The cache is not saved with the tokenizer
+        self.tokenization_cache = kwargs.pop("tokenization_cache", None)
+        self._tokenization_fingerprint = None
+        self._tokenization_fingerprint_state = None
+
         # inputs and kwargs for saving and re-loading (see ``from_pretrained`` and ``save_pretrained``)
         self.init_inputs = ()
         self.init_kwargs = copy.deepcopy(kwargs)
@@ -1661,6 +1701,11 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
 
                 vocab_files[file_id] = full_file_name
 
+        # Check the ETags of all the remote files at once, so that resolving them below doesn't need a request each
+        if not local_files_only and not force_download:
+            remote_files = [path for path in vocab_files.values() if path is not None and is_remote_url(path)]
+            resolve_etags(remote_files, proxies=proxies, user_agent=user_agent, use_auth_token=use_auth_token)
+
         # Get files from url, cache, or disk depending on the case
         resolved_vocab_files = {}
         unresolved_files = []
@@ -2095,6 +2140,14 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
     def num_special_tokens_to_add(self, pair: bool = False) -> int:
         raise NotImplementedError
 
+    def _ignore_num_proc(self, num_proc: Optional[int], reason: str):
+        """
+        Warns once that :obj:`num_proc` is ignored, it is only used to encode batches with Python tokenizers.
+        """
+        if num_proc is not None and not self.deprecation_warnings.get("num_proc-ignored", False):
+            logger.warning(f"`num_proc` is ignored {reason}, it is only used by Python tokenizers to encode batches.")
+            self.deprecation_warnings["num_proc-ignored"] = True
+
     def _get_padding_truncation_strategies(
         self, padding=False, truncation=False, max_length=None, pad_to_multiple_of=None, verbose=True, **kwargs
     ):
@@ -2387,6 +2440,9 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
                 ``convert_tokens_to_ids`` method).
         """
 
+        # num_proc only applies to batches
+        self._ignore_num_proc(kwargs.pop("num_proc", None), "when encoding a single sequence")
+
         # Backward compatibility for 'truncation_strategy', 'pad_to_max_length'
         padding_strategy, truncation_strategy, max_length, kwargs = self._get_padding_truncation_strategies(
             padding=padding,
@@ -2397,6 +2453,30 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
             **kwargs,
         )
 
+        if self.tokenization_cache is not None and not (
+            return_overflowing_tokens or return_offsets_mapping or return_length
+        ):
+            batch_outputs = self._batch_encode_plus_with_cache(
+                batch_text_or_text_pairs=[text] if text_pair is None else [(text, text_pair)],
+                add_special_tokens=add_special_tokens,
+                padding_strategy=padding_strategy,
+                truncation_strategy=truncation_strategy,
+                max_length=max_length,
+                stride=stride,
+                is_split_into_words=is_split_into_words,
+                pad_to_multiple_of=pad_to_multiple_of,
+                return_tensors=return_tensors,
+                return_token_type_ids=return_token_type_ids,
+                return_attention_mask=return_attention_mask,
+                return_special_tokens_mask=return_special_tokens_mask,
+                verbose=verbose,
+                **kwargs,
+            )
+            # Remove the batch axis, tensors keep it
+            if return_tensors is None:
+                batch_outputs = BatchEncoding({key: value[0] for key, value in batch_outputs.items()})
+            return batch_outputs
+
         return self._encode_plus(
             text=text,
             text_pair=text_pair,
@@ -2482,6 +2562,13 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
                 details in ``encode_plus``).
         """
 
+        num_proc = kwargs.pop("num_proc", None)
+        if self.is_fast:
+            # fast tokenizers already encode batches in parallel
+            self._ignore_num_proc(num_proc, "by fast tokenizers")
+        elif num_proc is not None:
+            kwargs["num_proc"] = num_proc
+
         # Backward compatibility for 'truncation_strategy', 'pad_to_max_length'
         padding_strategy, truncation_strategy, max_length, kwargs = self._get_padding_truncation_strategies(
             padding=padding,
@@ -2492,6 +2579,26 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
             **kwargs,
         )
 
+        if self.tokenization_cache is not None and not (
+            return_overflowing_tokens or return_offsets_mapping or return_length
+        ):
+            return self._batch_encode_plus_with_cache(
+                batch_text_or_text_pairs=batch_text_or_text_pairs,
+                add_special_tokens=add_special_tokens,
+                padding_strategy=padding_strategy,
+                truncation_strategy=truncation_strategy,
+                max_length=max_length,
+                stride=stride,
+                is_split_into_words=is_split_into_words,
+                pad_to_multiple_of=pad_to_multiple_of,
+                return_tensors=return_tensors,
+                return_token_type_ids=return_token_type_ids,
+                return_attention_mask=return_attention_mask,
+                return_special_tokens_mask=return_special_tokens_mask,
+                verbose=verbose,
+                **kwargs,
+            )
+
         return self._batch_encode_plus(
             batch_text_or_text_pairs=batch_text_or_text_pairs,
             add_special_tokens=add_special_tokens,
@@ -2541,6 +2648,129 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
     ) -> BatchEncoding:
         raise NotImplementedError
 
+    def _get_tokenization_fingerprint(self) -> str:
+        """
+        Returns a fingerprint of the vocabulary, the merges, the added tokens and the configuration of the tokenizer,
+        used in the keys of the :obj:`tokenization_cache`. It is computed again when tokens are added.
+        """
+        state = (len(self), str(self.special_tokens_map_extended))
+        if self._tokenization_fingerprint is not None and self._tokenization_fingerprint_state == state:
+            return self._tokenization_fingerprint
+
+        # The paths of the files don't change the tokenization
+        init_kwargs = {
+            key: value
+            for key, value in self.init_kwargs.items()
+            if key not in self.vocab_files_names and key not in ("name_or_path", "tokenizer_file")
+        }
+        hasher = hashlib.sha256()
+        for value in (
+            self.__class__.__name__,
+            json.dumps(init_kwargs, sort_keys=True, default=str),
+            str(self.special_tokens_map_extended),
+            str(self.model_input_names),
+        ):
+            hasher.update(value.encode("utf-8"))
+        if self.is_fast:
+            # The serialized backend holds the vocabulary, the merges, the added tokens and the pipeline
+            hasher.update(self.backend_tokenizer.to_str().encode("utf-8"))
+        else:
+            hasher.update(json.dumps(sorted(self.get_vocab().items())).encode("utf-8"))
+            hasher.update(json.dumps(sorted(self.added_tokens_encoder.items())).encode("utf-8"))
+            hasher.update(json.dumps(sorted(self.unique_no_split_tokens)).encode("utf-8"))
+            if hasattr(self, "bpe_ranks"):
+                merges = sorted((rank, " ".join(pair)) for pair, rank in self.bpe_ranks.items())
+                hasher.update(json.dumps(merges).encode("utf-8"))
+            if hasattr(self, "sp_model"):
+                hasher.update(self.sp_model.serialized_model_proto())
+
+        self._tokenization_fingerprint = hasher.hexdigest()
+        self._tokenization_fingerprint_state = state
+        return self._tokenization_fingerprint
+
+    def _batch_encode_plus_with_cache(
+        self,
+        batch_text_or_text_pairs: Union[
+            List[TextInput],
+            List[TextInputPair],
+            List[PreTokenizedInput],
+            List[PreTokenizedInputPair],
+            List[EncodedInput],
+            List[EncodedInputPair],
+        ],
+        add_special_tokens: bool = True,
+        padding_strategy: PaddingStrategy = PaddingStrategy.DO_NOT_PAD,
+        truncation_strategy: TruncationStrategy = TruncationStrategy.DO_NOT_TRUNCATE,
+        max_length: Optional[int] = None,
+        stride: int = 0,
+        is_split_into_words: bool = False,
+        pad_to_multiple_of: Optional[int] = None,
+        return_tensors: Optional[Union[str, TensorType]] = None,
+        return_token_type_ids: Optional[bool] = None,
+        return_attention_mask: Optional[bool] = None,
+        return_special_tokens_mask: bool = False,
+        verbose: bool = True,
+        **kwargs
+    ) -> BatchEncoding:
+        """
+        Encodes a batch with the :obj:`tokenization_cache`: the examples missing from the cache are encoded without
+        padding and stored, then the whole batch is padded and converted to tensors. The examples read from the cache
+        have no :obj:`encodings`, even with fast tokenizers.
+        """
+        # The arguments changing the encoded inputs of an example, padding is applied on the batch afterwards
+        encode_kwargs = {
+            "add_special_tokens": add_special_tokens,
+            "truncation_strategy": truncation_strategy.value,
+            "max_length": max_length,
+            "stride": stride,
+            "is_split_into_words": is_split_into_words,
+            "return_token_type_ids": return_token_type_ids,
+            "return_attention_mask": return_attention_mask,
+            "return_special_tokens_mask": return_special_tokens_mask,
+            **{key: value for key, value in kwargs.items() if key != "num_proc"},
+        }
+        fingerprint = self._get_tokenization_fingerprint()
+        keys = [
+            TokenizationCache.get_key(fingerprint, text_or_text_pair, encode_kwargs)
+            for text_or_text_pair in batch_text_or_text_pairs
+        ]
+        examples = self.tokenization_cache.get_many(keys)
+
+        missing_indices = [i for i, example in enumerate(examples) if example is None]
+        if missing_indices:
+            missing_outputs = self._batch_encode_plus(
+                [batch_text_or_text_pairs[i] for i in missing_indices],
+                add_special_tokens=add_special_tokens,
+                padding_strategy=PaddingStrategy.DO_NOT_PAD,
+                truncation_strategy=truncation_strategy,
+                max_length=max_length,
+                stride=stride,
+                is_split_into_words=is_split_into_words,
+                return_token_type_ids=return_token_type_ids,
+                return_attention_mask=return_attention_mask,
+                return_special_tokens_mask=return_special_tokens_mask,
+                verbose=verbose,
+                **kwargs,
+            )
+            missing_examples = {}
+            for batch_index, i in enumerate(missing_indices):
+                examples[i] = {key: value[batch_index] for key, value in missing_outputs.items()}
+                missing_examples[keys[i]] = examples[i]
+            self.tokenization_cache.set_many(missing_examples)
+
+        batch_outputs = {key: [example[key] for example in examples] for key in examples[0]} if examples else {}
+        if batch_outputs:
+            batch_outputs = self.pad(
+                batch_outputs,
+                padding=padding_strategy.value,
+                max_length=max_length,
+                pad_to_multiple_of=pad_to_multiple_of,
+                return_attention_mask=return_attention_mask,
+                verbose=verbose,
+            )
+
+        return BatchEncoding(batch_outputs, tensor_type=return_tensors)
+
     def pad(
         self,
         encoded_inputs: Union[
@@ -2553,6 +2783,7 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
         padding: Union[bool, str, PaddingStrategy] = True,
         max_length: Optional[int] = None,
         pad_to_multiple_of: Optional[int] = None,
+        pad_to_buckets: Optional[List[int]] = None,
         return_attention_mask: Optional[bool] = None,
         return_tensors: Optional[Union[str, TensorType]] = None,
         verbose: bool = True,
@@ -2596,6 +2827,12 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
 
                 This is especially useful to enable the use of Tensor Cores on NVIDIA hardware with compute capability
                 >= 7.5 (Volta).
+            pad_to_buckets (:obj:`List[int]`, `optional`):
+                If set, when padding to the longest sequence, will pad the sequences to the smallest of these lengths
+                that fits the longest sequence (or to the longest sequence if it doesn't fit any of them).
+
+                This limits the number of different shapes of the batches, and thus the recompilations of the models
+                traced with TorchScript, exported to ONNX or compiled with XLA.
             return_attention_mask (:obj:`bool`, `optional`):
                 Whether to return the attention mask. If left to the default, will return the attention mask according
                 to the specific tokenizer's default, defined by the :obj:`return_outputs` attribute.
@@ -2664,7 +2901,14 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
         )
 
         required_input = encoded_inputs[self.model_input_names[0]]
-        if required_input and not isinstance(required_input[0], (list, tuple)):
+        is_batched = bool(required_input) and isinstance(required_input[0], (list, tuple))
+
+        if padding_strategy == PaddingStrategy.LONGEST and pad_to_buckets:
+            longest = max(len(inputs) for inputs in required_input) if is_batched else len(required_input)
+            max_length = _get_bucket_length(longest, pad_to_buckets)
+            padding_strategy = PaddingStrategy.MAX_LENGTH
+
+        if required_input and not is_batched:
             encoded_inputs = self._pad(
                 encoded_inputs,
                 max_length=max_length,
@@ -2683,6 +2927,21 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
             max_length = max(len(inputs) for inputs in required_input)
             padding_strategy = PaddingStrategy.MAX_LENGTH
 
+        # Batches converted to NumPy arrays or PyTorch tensors are padded in preallocated arrays
+        if padding_strategy == PaddingStrategy.MAX_LENGTH and return_tensors in (
+            TensorType.NUMPY,
+            TensorType.PYTORCH,
+            "np",
+            "pt",
+        ):
+            if pad_to_multiple_of is not None and max_length % pad_to_multiple_of != 0:
+                max_length = ((max_length // pad_to_multiple_of) + 1) * pad_to_multiple_of
+            batch_outputs = self._pad_to_arrays(
+                encoded_inputs, max_length=max_length, return_attention_mask=return_attention_mask
+            )
+            if batch_outputs is not None:
+                return BatchEncoding(batch_outputs, tensor_type=return_tensors)
+
         batch_outputs = {}
         for i in range(batch_size):
             inputs = dict((k, v[i]) for k, v in encoded_inputs.items())
@@ -3029,6 +3288,68 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
 
         return encoded_inputs
 
+    def _pad_to_arrays(
+        self,
+        encoded_inputs: Dict[str, List[EncodedInput]],
+        max_length: int,
+        return_attention_mask: Optional[bool] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Pad a batch of tokenized inputs up to :obj:`max_length` like :meth:`_pad`, writing the inputs padded by
+        :meth:`_pad` directly in preallocated int64 NumPy arrays of shape (batch, :obj:`max_length`) instead of
+        extending the python lists of each example. The other inputs are returned unchanged.
+
+        Returns :obj:`None` if the batch can't be padded this way, e.g. if :meth:`_pad` is overridden or if some
+        sequences are longer than :obj:`max_length`.
+        """
+        if type(self)._pad is not PreTrainedTokenizerBase._pad or self.padding_side not in ("left", "right"):
+            return None
+        if return_attention_mask is None:
+            return_attention_mask = "attention_mask" in self.model_input_names
+
+        main_input_name = self.model_input_names[0]
+        lengths = np.array([len(inputs) for inputs in encoded_inputs[main_input_name]], dtype=np.int64)
+        if lengths.max() > max_length:
+            return None
+        pad_values = {main_input_name: self.pad_token_id}
+        for key, pad_value in (("token_type_ids", self.pad_token_type_id), ("special_tokens_mask", 1)):
+            if key in encoded_inputs and key != main_input_name:
+                pad_values[key] = pad_value
+        if "attention_mask" in encoded_inputs and not return_attention_mask:
+            return None
+        for key in pad_values:
+            if key != main_input_name and any(
+                len(inputs) != length for inputs, length in zip(encoded_inputs[key], lengths)
+            ):
+                return None
+        if any(pad_value is None for pad_value in pad_values.values()) and lengths.min() < max_length:
+            return None
+
+        # Positions of the tokens of each sequence in the padded arrays
+        positions = np.arange(max_length)
+        if self.padding_side == "right":
+            token_positions = positions < lengths[:, None]
+        else:
+            token_positions = positions >= (max_length - lengths)[:, None]
+
+        batch_outputs = dict(encoded_inputs)
+        for key, pad_value in pad_values.items():
+            values = np.array(list(itertools.chain.from_iterable(encoded_inputs[key])))
+            # e.g. the float input values of speech models
+            if values.size and values.dtype.kind not in "iu":
+                return None
+            array = np.full((len(lengths), max_length), pad_value if pad_value is not None else 0, dtype=np.int64)
+            array[token_positions] = values
+            batch_outputs[key] = array
+        if return_attention_mask:
+            attention_mask = token_positions.astype(np.int64)
+            # Like in `_pad`, the attention masks of the sequences that don't need padding are kept
+            if "attention_mask" in encoded_inputs:
+                for i in np.flatnonzero(lengths == max_length):
+                    attention_mask[i] = encoded_inputs["attention_mask"][i]
+            batch_outputs["attention_mask"] = attention_mask
+        return batch_outputs
+
     def convert_tokens_to_string(self, tokens: List[str]) -> str:
         """
         Converts a sequence of tokens in a single string. The most simple way to do it is ``" ".join(tokens)`` but we
@@ -3065,6 +3386,20 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
         Returns:
             :obj:`List[str]`: The list of decoded sentences.
         """
+        return self._batch_decode(
+            sequences,
+            skip_special_tokens=skip_special_tokens,
+            clean_up_tokenization_spaces=clean_up_tokenization_spaces,
+            **kwargs,
+        )
+
+    def _batch_decode(
+        self,
+        sequences: Union[List[int], List[List[int]], "np.ndarray", "torch.Tensor", "tf.Tensor"],
+        skip_special_tokens: bool = False,
+        clean_up_tokenization_spaces: bool = True,
+        **kwargs
+    ) -> List[str]:
         return [
             self.decode(
                 seq,
@@ -3162,6 +3497,10 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
         Returns:
             :obj:`str`: The cleaned-up string.
         """
+        # Removing " ' " can create new matches for the next replacements, otherwise they are all independent and
+        # are done in a single pass
+        if " ' " not in out_string:
+            return _CLEAN_UP_TOKENIZATION_PATTERN.sub("", out_string)
         out_string = (
             out_string.replace(" .", ".")
             .replace(" ?", "?")
@@ -3312,3 +3651,83 @@ class PreTrainedTokenizerBase(SpecialTokensMixin, PushToHubMixin):
             )
         model_inputs["labels"] = labels["input_ids"]
         return model_inputs
+
+
+class IncrementalDecoder:
+    """
+    Decodes a sequence of token ids as they are appended to it, returning only the text of the new ids.
+
+    The decoder keeps the ids of the last returned text as a prefix: the new ids are decoded together with this prefix
+    and the text of the prefix is removed, so the cost of each call does not grow with the length of the sequence.
+    Decoding with the prefix handles the tokens whose rendering depends on the previous ones (e.g. leading spaces of
+    byte-level BPE or SentencePiece tokens). New text is only returned once it does not end with an incomplete UTF-8
+    character, the remaining text is returned by :meth:`flush`.
+
+    Args:
+        tokenizer (:class:`~transformers.PreTrainedTokenizerBase`):
+            The tokenizer used to decode the ids.
+        prefix_token_ids (:obj:`List[int]`, `optional`):
+            Ids already decoded, e.g. the end of a prompt, used as prefix for the first appended ids.
+        decode_kwargs:
+            Additional keyword arguments passed to the :obj:`decode` method of the tokenizer, e.g.
+            :obj:`skip_special_tokens`.
+
+    Examples::
+
+        >>> from transformers import AutoTokenizer, IncrementalDecoder
+
+        >>> tokenizer = AutoTokenizer.from_pretrained("gpt2")
+        >>> decoder = IncrementalDecoder(tokenizer)
+        >>> text = ""
+        >>> for token_id in tokenizer.encode("Hello world, how are you?"):
+        ...     text += decoder.add([token_id])
+        >>> text += decoder.flush()
+    """
+
+    def __init__(
+        self, tokenizer: PreTrainedTokenizerBase, prefix_token_ids: Optional[List[int]] = None, **decode_kwargs
+    ):
+        self.tokenizer = tokenizer
+        self.decode_kwargs = decode_kwargs
+        self.reset(prefix_token_ids)
+
+    def reset(self, prefix_token_ids: Optional[List[int]] = None):
+        """
+        Forgets the ids appended so far and starts a new sequence after :obj:`prefix_token_ids`.
+        """
+        # ids of the last returned text followed by the ids not returned yet
+        self.token_ids = list(prefix_token_ids) if prefix_token_ids is not None else []
+        self.read_offset = len(self.token_ids)
+        self._prefix_text = None
+
+    def add(self, token_ids: List[int]) -> str:
+        """
+        Appends :obj:`token_ids` to the sequence.
+
+        Returns:
+            :obj:`str`: The new text, empty if the new ids don't complete any character yet.
+        """
+        self.token_ids.extend(token_ids)
+        return self._decode_new_text()
+
+    def flush(self) -> str:
+        """
+        Returns the text not returned yet, even if it ends with an incomplete UTF-8 character, and resets the decoder.
+        """
+        text = self._decode_new_text(final=True)
+        self.reset()
+        return text
+
+    def _decode_new_text(self, final: bool = False) -> str:
+        # the prefix only changes when some text is returned
+        if self._prefix_text is None:
+            self._prefix_text = self.tokenizer.decode(self.token_ids[: self.read_offset], **self.decode_kwargs)
+        text = self.tokenizer.decode(self.token_ids, **self.decode_kwargs)
+        # wait for the remaining bytes of an incomplete UTF-8 character
+        if len(text) <= len(self._prefix_text) or (text.endswith("\ufffd") and not final):
+            return ""
+        new_text = text[len(self._prefix_text) :]
+        self.token_ids = self.token_ids[self.read_offset :]
+        self.read_offset = len(self.token_ids)
+        self._prefix_text = None
+        return new_text
@@ -21,13 +21,15 @@ import os
 from collections import defaultdict
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
+
 from tokenizers import Encoding as EncodingFast
 from tokenizers import Tokenizer as TokenizerFast
 from tokenizers.decoders import Decoder as DecoderFast
 from tokenizers.trainers import BpeTrainer, UnigramTrainer, WordLevelTrainer, WordPieceTrainer
 
 from .convert_slow_tokenizer import convert_slow_tokenizer
-from .file_utils import PaddingStrategy, add_end_docstrings
+from .file_utils import PaddingStrategy, TensorType, add_end_docstrings, is_torch_available, to_py_obj
 from .tokenization_utils import PreTrainedTokenizer
 from .tokenization_utils_base import (
     INIT_TOKENIZER_DOCSTRING,
@@ -228,6 +230,55 @@ class PreTrainedTokenizerFast(PreTrainedTokenizerBase):
 
         return encoding_dict, encodings
 
+    def _convert_encodings_to_arrays(
+        self,
+        encodings: List[EncodingFast],
+        return_token_type_ids: Optional[bool] = None,
+        return_attention_mask: Optional[bool] = None,
+        return_special_tokens_mask: bool = False,
+        return_offsets_mapping: bool = False,
+        return_length: bool = False,
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Convert a batch of encodings of the same length (from low-level HuggingFace tokenizer output) to a python Dict
+        of int64 NumPy arrays, filling preallocated arrays row by row instead of building nested lists for the whole
+        batch.
+
+        Output shape: (batch, sequence length), (batch, sequence length, 2) for the offsets and (batch,) for the
+        lengths. Returns :obj:`None` if the encodings don't all have the same length.
+        """
+        if return_token_type_ids is None:
+            return_token_type_ids = "token_type_ids" in self.model_input_names
+        if return_attention_mask is None:
+            return_attention_mask = "attention_mask" in self.model_input_names
+
+        seq_len = len(encodings[0])
+        if any(len(encoding) != seq_len for encoding in encodings):
+            return None
+
+        # Only the requested fields are fetched from the encodings
+        fields = {"input_ids": "ids"}
+        if return_token_type_ids:
+            fields["token_type_ids"] = "type_ids"
+        if return_attention_mask:
+            fields["attention_mask"] = "attention_mask"
+        if return_special_tokens_mask:
+            fields["special_tokens_mask"] = "special_tokens_mask"
+        if return_offsets_mapping:
+            fields["offset_mapping"] = "offsets"
+
+        arrays = {}
+        for key, field in fields.items():
+            shape = (len(encodings), seq_len, 2) if key == "offset_mapping" else (len(encodings), seq_len)
+            array = np.empty(shape, dtype=np.int64)
+            for i, encoding in enumerate(encodings):
+                array[i] = getattr(encoding, field)
+            arrays[key] = array
+        if return_length:
+            arrays["length"] = np.full(len(encodings), seq_len, dtype=np.int64)
+
+        return arrays
+
     def convert_tokens_to_ids(self, tokens: Union[str, List[str]]) -> Union[int, List[int]]:
         """
         Converts a token string (or a sequence of tokens) in a single integer id (or a sequence of ids), using the
@@ -408,6 +459,30 @@ class PreTrainedTokenizerFast(PreTrainedTokenizerBase):
             is_pretokenized=is_split_into_words,
         )
 
+        # Fill NumPy arrays directly from the encodings when they are converted to tensors and have the same length.
+        # TensorFlow and JAX use int32 tensors by default, they keep the conversion from lists.
+        if (
+            encodings
+            and return_tensors in (TensorType.NUMPY, TensorType.PYTORCH, "np", "pt")
+            and not return_overflowing_tokens
+        ):
+            arrays = self._convert_encodings_to_arrays(
+                encodings,
+                return_token_type_ids=return_token_type_ids,
+                return_attention_mask=return_attention_mask,
+                return_special_tokens_mask=return_special_tokens_mask,
+                return_offsets_mapping=return_offsets_mapping,
+                return_length=return_length,
+            )
+            if arrays is not None:
+                self._eventual_warn_about_too_long_sequence(arrays["input_ids"][0], max_length, verbose)
+                if return_tensors in (TensorType.PYTORCH, "pt") and is_torch_available():
+                    import torch
+
+                    # the tensors share the memory of the arrays
+                    arrays = {key: torch.from_numpy(array) for key, array in arrays.items()}
+                return BatchEncoding(arrays, encodings, tensor_type=return_tensors)
+
         # Convert encoding to dict
         # `Tokens` has type: Tuple[
         #                       List[Dict[str, List[List[int]]]] or List[Dict[str, 2D-Tensor]],
@@ -532,6 +607,38 @@ class PreTrainedTokenizerFast(PreTrainedTokenizerBase):
         else:
             return text
 
+    def _batch_decode(
+        self,
+        sequences: List[List[int]],
+        skip_special_tokens: bool = False,
+        clean_up_tokenization_spaces: bool = True,
+        **kwargs
+    ) -> List[str]:
+        if not isinstance(sequences, (list, tuple)):
+            sequences = to_py_obj(sequences)
+        # Tokenizers customizing the decoding decode each sequence on its own
+        if (
+            type(self)._decode is not PreTrainedTokenizerFast._decode
+            or type(self).decode is not PreTrainedTokenizerBase.decode
+            or any(isinstance(token_ids, int) for token_ids in sequences)
+        ):
+            return super()._batch_decode(
+                sequences,
+                skip_special_tokens=skip_special_tokens,
+                clean_up_tokenization_spaces=clean_up_tokenization_spaces,
+                **kwargs,
+            )
+
+        self._decode_use_source_tokenizer = kwargs.pop("use_source_tokenizer", False)
+
+        # The whole batch is decoded in parallel by the backend
+        sequences = [token_ids if isinstance(token_ids, list) else to_py_obj(token_ids) for token_ids in sequences]
+        texts = self._tokenizer.decode_batch(sequences, skip_special_tokens=skip_special_tokens)
+
+        if clean_up_tokenization_spaces:
+            texts = [self.clean_up_tokenization(text) for text in texts]
+        return texts
+
     def _save_pretrained(
         self,
         save_directory: Union[str, os.PathLike],
@@ -586,7 +693,8 @@ class PreTrainedTokenizerFast(PreTrainedTokenizerBase):
         Args:
             text_iterator (generator of :obj:`List[str]`):
                 The training corpus. Should be a generator of batches of texts, for instance a list of lists of texts
-                if you have everything in memory.
+                if you have everything in memory, or a :class:`~transformers.StreamingCorpusReader` to stream large
+                text files.
             vocab_size (obj:`int`):
                 The size of the vocabulary you want for your tokenizer.
             new_special_tokens (list of :obj:`str` or :obj:`AddedToken`, `optional`):
@@ -62,6 +62,7 @@ from .deepspeed import deepspeed_init, is_deepspeed_zero3_enabled
 from .dependency_versions_check import dep_version_check
 from .file_utils import (
     CONFIG_NAME,
+    WEIGHTS_INDEX_NAME,
     WEIGHTS_NAME,
     PushToHubMixin,
     is_apex_available,
@@ -73,7 +74,8 @@ from .file_utils import (
     is_training_run_on_sagemaker,
 )
 from .modelcard import TrainingSummary
-from .modeling_utils import PreTrainedModel, unwrap_model
+from .modeling_utils import PreTrainedModel, load_sharded_checkpoint, unwrap_model
+from .models.auto.modeling_auto import MODEL_FOR_QUESTION_ANSWERING_MAPPING_NAMES
 from .optimization import Adafactor, AdamW, get_scheduler
 from .tokenization_utils_base import PreTrainedTokenizerBase
 from .trainer_callback import (
@@ -125,7 +127,6 @@ from .trainer_utils import (
 )
 from .training_args import ParallelMode, TrainingArguments
 from .utils import logging
-from .utils.modeling_auto_mapping import MODEL_FOR_QUESTION_ANSWERING_MAPPING_NAMES
 
 
 _is_torch_generator_available = False
@@ -1052,7 +1053,9 @@ class Trainer:
                 raise ValueError(f"No valid checkpoint found in output directory ({args.output_dir})")
 
         if resume_from_checkpoint is not None:
-            if not os.path.isfile(os.path.join(resume_from_checkpoint, WEIGHTS_NAME)):
+            if not os.path.isfile(os.path.join(resume_from_checkpoint, WEIGHTS_NAME)) and not os.path.isfile(
+                os.path.join(resume_from_checkpoint, WEIGHTS_INDEX_NAME)
+            ):
                 raise ValueError(f"Can't find a valid checkpoint at {resume_from_checkpoint}")
 
             logger.info(f"Loading model from {resume_from_checkpoint}).")
@@ -1071,10 +1074,7 @@ class Trainer:
                 # will be resumed in deepspeed_init
                 pass
             else:
-                # We load the model state dict on the CPU to avoid an OOM error.
-                state_dict = torch.load(os.path.join(resume_from_checkpoint, WEIGHTS_NAME), map_location="cpu")
-                # If the model is on the GPU, it still works!
-                self._load_state_dict_in_model(state_dict)
+                self._load_checkpoint_in_model(resume_from_checkpoint)
 
         # If model was re-initialized, put it on the right device and update self.model_wrapped
         if model_reloaded:
@@ -1365,11 +1365,9 @@ class Trainer:
             )
 
             best_model_path = os.path.join(self.state.best_model_checkpoint, WEIGHTS_NAME)
-            if os.path.exists(best_model_path):
-                # We load the model state dict on the CPU to avoid an OOM error.
-                state_dict = torch.load(best_model_path, map_location="cpu")
-                # If the model is on the GPU, it still works!
-                self._load_state_dict_in_model(state_dict)
+            best_model_index = os.path.join(self.state.best_model_checkpoint, WEIGHTS_INDEX_NAME)
+            if os.path.exists(best_model_path) or os.path.exists(best_model_index):
+                self._load_checkpoint_in_model(self.state.best_model_checkpoint)
             else:
                 logger.warn(
                     f"Could not locate the best model at {best_model_path}, if you are running a distributed training "
@@ -1400,9 +1398,22 @@ class Trainer:
 
         return TrainOutput(self.state.global_step, train_loss, metrics)
 
+    def _load_checkpoint_in_model(self, checkpoint):
+        if os.path.isfile(os.path.join(checkpoint, WEIGHTS_NAME)):
+            # We load the model state dict on the CPU to avoid an OOM error.
+            state_dict = torch.load(os.path.join(checkpoint, WEIGHTS_NAME), map_location="cpu")
+            # If the model is on the GPU, it still works!
+            self._load_state_dict_in_model(state_dict)
+        else:
+            # The checkpoint was sharded by `save_pretrained`, its shards are loaded one at a time
+            load_result = load_sharded_checkpoint(self.model, checkpoint, strict=False)
+            self._issue_warnings_after_load(load_result)
+
     def _load_state_dict_in_model(self, state_dict):
         load_result = self.model.load_state_dict(state_dict, strict=False)
+        self._issue_warnings_after_load(load_result)
 
+    def _issue_warnings_after_load(self, load_result):
         if len(load_result.missing_keys) != 0:
             if set(load_result.missing_keys) == set(self.model._keys_to_ignore_on_save):
                 self.model.tie_weights()
@@ -1897,13 +1908,19 @@ class Trainer:
                     save_config=self.args.should_save,
                     state_dict=self.model.state_dict(),
                     save_function=xm.save,
+                    is_main_process=self.args.should_save,
                 )
             else:
                 logger.info("Trainer.model is not a `PreTrainedModel`, only saving its state dict.")
                 state_dict = self.model.state_dict()
                 xm.save(state_dict, os.path.join(output_dir, WEIGHTS_NAME))
         else:
-            self.model.save_pretrained(output_dir, save_config=self.args.should_save, save_function=xm.save)
+            self.model.save_pretrained(
+                output_dir,
+                save_config=self.args.should_save,
+                save_function=xm.save,
+                is_main_process=self.args.should_save,
+            )
         if self.tokenizer is not None and self.args.should_save:
             self.tokenizer.save_pretrained(output_dir)
 
@@ -123,6 +123,31 @@ class BeamSearchScorer:
         requires_backends(self, ["torch"])
 
 
+class TensorizedBeamSearchScorer:
+    def __init__(self, *args, **kwargs):
+        requires_backends(self, ["torch"])
+
+
+class EncoderOutputCache:
+    def __init__(self, *args, **kwargs):
+        requires_backends(self, ["torch"])
+
+
+class ContinuousBatchingScheduler:
+    def __init__(self, *args, **kwargs):
+        requires_backends(self, ["torch"])
+
+
+class GenerationRequest:
+    def __init__(self, *args, **kwargs):
+        requires_backends(self, ["torch"])
+
+
+class GenerationResult:
+    def __init__(self, *args, **kwargs):
+        requires_backends(self, ["torch"])
+
+
 class ForcedBOSTokenLogitsProcessor:
     def __init__(self, *args, **kwargs):
         requires_backends(self, ["torch"])
@@ -237,6 +262,11 @@ class TopKLogitsWarper:
         requires_backends(self, ["torch"])
 
 
+class TopKTopPLogitsWarper:
+    def __init__(self, *args, **kwargs):
+        requires_backends(self, ["torch"])
+
+
 class TopPLogitsWarper:
     def __init__(self, *args, **kwargs):
         requires_backends(self, ["torch"])
@@ -262,6 +292,16 @@ class StoppingCriteriaList:
         requires_backends(self, ["torch"])
 
 
+class TextIteratorStreamer:
+    def __init__(self, *args, **kwargs):
+        requires_backends(self, ["torch"])
+
+
+class TextStreamer:
+    def __init__(self, *args, **kwargs):
+        requires_backends(self, ["torch"])
+
+
 def top_k_top_p_filtering(*args, **kwargs):
     requires_backends(top_k_top_p_filtering, ["torch"])
 
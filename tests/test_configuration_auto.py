@@ -16,8 +16,8 @@
 import os
 import unittest
 
-from transformers.models.auto.configuration_auto import CONFIG_MAPPING, AutoConfig
-from transformers.models.bert.configuration_bert import BertConfig
+from transformers.models.auto.configuration_auto import ALL_PRETRAINED_CONFIG_ARCHIVE_MAP, CONFIG_MAPPING, AutoConfig
+from transformers.models.bert.configuration_bert import BERT_PRETRAINED_CONFIG_ARCHIVE_MAP, BertConfig
 from transformers.models.roberta.configuration_roberta import RobertaConfig
 from transformers.testing_utils import DUMMY_UNKWOWN_IDENTIFIER
 
@@ -51,3 +51,17 @@ class AutoConfigTest(unittest.TestCase):
         keys = list(CONFIG_MAPPING.keys())
         for i, key in enumerate(keys):
             self.assertFalse(any(key in later_key for later_key in keys[i + 1 :]))
+
+    def test_lazy_config_mappings(self):
+        self.assertIn("bert", CONFIG_MAPPING)
+        self.assertNotIn("not-a-model-type", CONFIG_MAPPING)
+        self.assertIs(CONFIG_MAPPING["bert"], BertConfig)
+        self.assertIs(dict(CONFIG_MAPPING.items())["roberta"], RobertaConfig)
+        with self.assertRaises(KeyError):
+            CONFIG_MAPPING["not-a-model-type"]
+
+        self.assertIn("bert-base-uncased", ALL_PRETRAINED_CONFIG_ARCHIVE_MAP)
+        self.assertEqual(
+            ALL_PRETRAINED_CONFIG_ARCHIVE_MAP["bert-base-uncased"],
+            BERT_PRETRAINED_CONFIG_ARCHIVE_MAP["bert-base-uncased"],
+        )
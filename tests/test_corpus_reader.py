@@ -0,0 +1,118 @@
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from transformers import StreamingCorpusReader, is_tokenizers_available
+from transformers.testing_utils import require_tokenizers
+
+
+if is_tokenizers_available():
+    from transformers import BertTokenizerFast
+    from transformers.models.bert.tokenization_bert import VOCAB_FILES_NAMES
+
+
+class StreamingCorpusReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdirname = tempfile.mkdtemp()
+        self.lines = [f"line {i} of the corpus" for i in range(250)]
+        with open(os.path.join(self.tmpdirname, "shard-0.txt"), "w", encoding="utf-8") as f:
+            f.write("\n".join(self.lines[:100]) + "\n\n  \n")
+        with gzip.open(os.path.join(self.tmpdirname, "shard-1.txt.gz"), "wt", encoding="utf-8") as f:
+            f.write("\n".join(self.lines[100:200]))
+        with open(os.path.join(self.tmpdirname, "shard-2.txt"), "w", encoding="utf-8") as f:
+            f.write("\r\n".join(self.lines[200:]))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdirname)
+
+    def test_batches(self):
+        corpus = StreamingCorpusReader(os.path.join(self.tmpdirname, "shard-*"), batch_size=32)
+        batches = list(corpus)
+        self.assertTrue(all(len(batch) <= 32 for batch in batches))
+        self.assertListEqual([line for batch in batches for line in batch], self.lines)
+        self.assertEqual((corpus.num_lines, corpus.num_batches), (250, len(batches)))
+
+        # The corpus can be read again, memory-mapped
+        corpus.use_mmap = True
+        self.assertListEqual(list(corpus), batches)
+
+        files = [os.path.join(self.tmpdirname, f"shard-{i}.txt") for i in (2, 0)]
+        self.assertListEqual(
+            [line for batch in StreamingCorpusReader(files) for line in batch], self.lines[200:] + self.lines[:100]
+        )
+
+    def test_max_batch_chars(self):
+        corpus = StreamingCorpusReader(os.path.join(self.tmpdirname, "shard-0.txt"), max_batch_chars=100)
+        batches = list(corpus)
+        self.assertTrue(all(sum(len(line) for line in batch) <= 100 for batch in batches))
+        self.assertListEqual([line for batch in batches for line in batch], self.lines[:100])
+
+    def test_sample_fraction(self):
+        pattern = os.path.join(self.tmpdirname, "shard-*")
+        corpus = StreamingCorpusReader(pattern, sample_fraction=0.5, seed=42)
+        lines = [line for batch in corpus for line in batch]
+        self.assertTrue(50 < len(lines) < 200)
+        self.assertTrue(set(lines).issubset(self.lines))
+        self.assertListEqual([line for batch in corpus for line in batch], lines)
+
+        self.assertRaises(ValueError, StreamingCorpusReader, pattern, sample_fraction=0.0)
+        self.assertRaises(FileNotFoundError, StreamingCorpusReader, os.path.join(self.tmpdirname, "missing-*"))
+
+    def test_encodings(self):
+        # "\u010a" is encoded with a "\n" byte in UTF-16 and UTF-32
+        for encoding, lines in [
+            ("utf-16", ["first line \u010a", "", "second line \u00e9\u4e2d"]),
+            ("utf-32-le", ["first line \u010a", "", "second line \u00e9\u4e2d"]),
+            ("latin-1", ["first line \u00e9", "", "second line \u00ff"]),
+        ]:
+            text = "\n".join(lines) + "\r\n"
+            with open(os.path.join(self.tmpdirname, "encoded.txt"), "w", encoding=encoding, newline="") as f:
+                f.write(text)
+            with gzip.open(os.path.join(self.tmpdirname, "encoded.txt.gz"), "wt", encoding=encoding, newline="") as f:
+                f.write(text)
+
+            for use_mmap in [False, True]:
+                corpus = StreamingCorpusReader(
+                    os.path.join(self.tmpdirname, "encoded.txt*"), encoding=encoding, use_mmap=use_mmap
+                )
+                self.assertListEqual([line for batch in corpus for line in batch], [lines[0], lines[2]] * 2)
+                self.assertEqual(corpus.num_bytes, len(text.encode(encoding)) * 2)
+
+    def test_progress_bar_closed(self):
+        corpus = StreamingCorpusReader(os.path.join(self.tmpdirname, "shard-*"), batch_size=4)
+        with patch("transformers.data.corpus_reader.tqdm") as mock_tqdm:
+            batches = iter(corpus)
+            next(batches)
+            batches.close()
+        mock_tqdm.return_value.close.assert_called_once()
+
+    @require_tokenizers
+    def test_train_new_from_iterator(self):
+        vocab_file = os.path.join(self.tmpdirname, VOCAB_FILES_NAMES["vocab_file"])
+        with open(vocab_file, "w", encoding="utf-8") as vocab_writer:
+            vocab_writer.write("\n".join(["[UNK]", "[CLS]", "[SEP]", "[PAD]", "[MASK]", "line", "of"]))
+        tokenizer = BertTokenizerFast(vocab_file)
+
+        corpus = StreamingCorpusReader(os.path.join(self.tmpdirname, "shard-*"), batch_size=16)
+        new_tokenizer = tokenizer.train_new_from_iterator(corpus, 100)
+        self.assertLessEqual(len(new_tokenizer), 100)
+        input_ids = new_tokenizer.encode("line 12 of the corpus", add_special_tokens=False)
+        self.assertEqual(new_tokenizer.decode(input_ids), "line 12 of the corpus")
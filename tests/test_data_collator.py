@@ -115,6 +115,14 @@ class DataCollatorIntegrationTest(unittest.TestCase):
         batch = data_collator(features)
         self.assertEqual(batch["input_ids"].shape, torch.Size([2, 8]))
 
+        data_collator = DataCollatorWithPadding(tokenizer, pad_to_buckets=[4, 16, 8])
+        batch = data_collator(features)
+        self.assertEqual(batch["input_ids"].shape, torch.Size([2, 8]))
+        self.assertEqual(batch["attention_mask"][0].tolist(), [1] * 3 + [0] * 5)
+        batch = data_collator([{"input_ids": list(range(20)), "label": 1}, {"input_ids": [0, 1], "label": 0}])
+        self.assertEqual(batch["input_ids"].shape, torch.Size([2, 20]))
+        self.assertEqual(batch["labels"].tolist(), [1, 0])
+
     def test_data_collator_for_token_classification(self):
         tokenizer = BertTokenizer(self.vocab_file)
         features = [
@@ -12,14 +12,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import os
+import re
+import tempfile
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
 
 import requests
 
 # Try to import everything from transformers to ensure every object can be loaded.
 from transformers import *  # noqa F406
-from transformers.file_utils import CONFIG_NAME, WEIGHTS_NAME, filename_to_url, get_from_cache, hf_bucket_url
-from transformers.testing_utils import DUMMY_UNKWOWN_IDENTIFIER
+from transformers import BertConfig, BertModel
+from transformers.file_utils import (
+    CONFIG_NAME,
+    WEIGHTS_NAME,
+    clear_etag_cache,
+    filename_to_url,
+    get_from_cache,
+    get_session,
+    hf_bucket_url,
+    resolve_etags,
+)
+from transformers.testing_utils import DUMMY_UNKWOWN_IDENTIFIER, require_torch
 
 
 MODEL_ID = DUMMY_UNKWOWN_IDENTIFIER
@@ -78,3 +95,181 @@ class GetFromCacheTests(unittest.TestCase):
         filepath = get_from_cache(url, force_download=True)
         metadata = filename_to_url(filepath)
         self.assertEqual(metadata, (url, f'"{PINNED_SHA256}"'))
+
+
+class FileServerHandler(BaseHTTPRequestHandler):
+    """
+    Serves the files of ``server.files`` (a dict path -> (content, etag)) like huggingface.co, supporting HEAD and
+    range requests, and records the requests received in ``server.requests``.
+    """
+
+    def do_HEAD(self):
+        self.server.requests.append(("HEAD", self.path, None))
+        if self.path not in self.server.files:
+            self.send_error(404)
+            return
+        content, etag = self.server.files[self.path]
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+
+    def do_GET(self):
+        range_header = self.headers.get("Range") if self.server.supports_ranges else None
+        self.server.requests.append(("GET", self.path, range_header))
+        if self.path not in self.server.files:
+            self.send_error(404)
+            return
+        content, etag = self.server.files[self.path]
+        if range_header is None:
+            self.send_response(200)
+        else:
+            start, end = re.fullmatch(r"bytes=(\d+)-(\d*)", range_header).groups()
+            start, end = int(start), min(int(end) if end else len(content) - 1, len(content) - 1)
+            if start >= len(content):
+                self.send_error(416)
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(content)}")
+            content = content[start : end + 1]
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class GetFromCacheLocalServerTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FileServerHandler)
+        self.server.files = {}
+        self.server.requests = []
+        self.server.supports_ranges = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.cache_dir = tempfile.mkdtemp()
+        clear_etag_cache()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        clear_etag_cache()
+
+    def add_file(self, path, content, etag=None):
+        if etag is None:
+            etag = f'"{hashlib.sha256(content).hexdigest()}"'
+        self.server.files[path] = (content, etag)
+        return f"http://127.0.0.1:{self.server.server_port}{path}"
+
+    def get_requests(self, method):
+        return [request for request in self.server.requests if request[0] == method]
+
+    @patch("transformers.file_utils.DOWNLOAD_CHUNK_SIZE", 1000)
+    def test_parallel_download(self):
+        content = os.urandom(10500)
+        url = self.add_file("/model.bin", content)
+        with open(get_from_cache(url, cache_dir=self.cache_dir), "rb") as f:
+            self.assertEqual(f.read(), content)
+        # One request for each chunk of 1000 bytes
+        ranges = sorted(request[2] for request in self.get_requests("GET"))
+        self.assertEqual(len(ranges), 11)
+        self.assertIn("bytes=10000-10499", ranges)
+
+        # Same result when the server doesn't support range requests
+        self.server.supports_ranges = False
+        self.server.requests = []
+        with open(get_from_cache(url, cache_dir=self.cache_dir, force_download=True), "rb") as f:
+            self.assertEqual(f.read(), content)
+        self.assertEqual(len(self.get_requests("GET")), 1)
+
+    def test_download_empty_file(self):
+        url = self.add_file("/added_tokens.json", b"")
+        with open(get_from_cache(url, cache_dir=self.cache_dir), "rb") as f:
+            self.assertEqual(f.read(), b"")
+
+    @patch("transformers.file_utils.DOWNLOAD_CHUNK_SIZE", 1000)
+    def test_checksum_mismatch(self):
+        # The ETag is a SHA-256 which doesn't match the content
+        url = self.add_file("/model.bin", os.urandom(2500), etag=f'"{hashlib.sha256(b"other").hexdigest()}"')
+        with self.assertRaisesRegex(EnvironmentError, "corrupted"):
+            get_from_cache(url, cache_dir=self.cache_dir)
+        self.assertEqual([f for f in os.listdir(self.cache_dir) if not f.endswith(".lock")], [])
+
+        # Other ETags (e.g. the git sha-1 of the small files) are not checksums
+        url = self.add_file("/config.json", b"{}", etag='"d9e9f15bc825e4b2c9249e9578f884bbcb5e3684"')
+        self.assertIsNotNone(get_from_cache(url, cache_dir=self.cache_dir))
+
+    def test_etag_cache_disabled_by_default(self):
+        url = self.add_file("/config.json", b"{}")
+        get_from_cache(url, cache_dir=self.cache_dir)
+        get_from_cache(url, cache_dir=self.cache_dir)
+        self.assertEqual(len(self.get_requests("HEAD")), 2)
+
+    @patch("transformers.file_utils.ETAG_CACHE_TTL", 60)
+    def test_etag_cache(self):
+        url = self.add_file("/config.json", b"{}")
+        first_path = get_from_cache(url, cache_dir=self.cache_dir)
+        self.assertEqual(get_from_cache(url, cache_dir=self.cache_dir), first_path)
+        self.assertEqual(len(self.get_requests("HEAD")), 1)
+
+        # The ETag is checked again when forcing the download, or once it's expired
+        get_from_cache(url, cache_dir=self.cache_dir, force_download=True)
+        self.assertEqual(len(self.get_requests("HEAD")), 2)
+        with patch("transformers.file_utils.ETAG_CACHE_TTL", 0):
+            get_from_cache(url, cache_dir=self.cache_dir)
+        self.assertEqual(len(self.get_requests("HEAD")), 3)
+
+        # A new version of the file is seen once the cache is cleared
+        self.add_file("/config.json", b'{"a": 1}')
+        with open(get_from_cache(url, cache_dir=self.cache_dir)) as f:
+            self.assertEqual(f.read(), "{}")
+        clear_etag_cache()
+        with open(get_from_cache(url, cache_dir=self.cache_dir)) as f:
+            self.assertEqual(f.read(), '{"a": 1}')
+
+    @patch("transformers.file_utils.ETAG_CACHE_TTL", 60)
+    def test_resolve_etags(self):
+        urls = [self.add_file(f"/file_{i}.txt", str(i).encode()) for i in range(4)]
+        missing_url = urls[0].replace("file_0", "missing")
+        etags = resolve_etags(urls + [missing_url])
+        self.assertEqual(etags[urls[1]], self.server.files["/file_1.txt"][1])
+        self.assertIsNone(etags[missing_url])
+        self.assertEqual(len(self.get_requests("HEAD")), 5)
+
+        # The files are then fetched without checking their ETag again, the errors are not cached
+        for url in urls:
+            get_from_cache(url, cache_dir=self.cache_dir)
+        self.assertEqual(len(self.get_requests("HEAD")), 5)
+        self.add_file("/missing.txt", b"added")
+        with open(get_from_cache(missing_url, cache_dir=self.cache_dir)) as f:
+            self.assertEqual(f.read(), "added")
+        self.assertEqual(len(self.get_requests("HEAD")), 6)
+
+    def test_session_not_shared_with_forked_processes(self):
+        session = get_session()
+        self.assertIs(get_session(), session)
+        with patch("os.getpid", return_value=os.getpid() + 1):
+            forked_session = get_session()
+            self.assertIsNot(forked_session, session)
+            self.assertIs(get_session(), forked_session)
+
+    @require_torch
+    @patch("transformers.file_utils.ETAG_CACHE_TTL", 60)
+    def test_from_pretrained(self):
+        config = BertConfig(
+            vocab_size=99, hidden_size=32, num_hidden_layers=2, num_attention_heads=4, intermediate_size=37
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            BertModel(config).save_pretrained(tmp_dir)
+            for filename in (CONFIG_NAME, WEIGHTS_NAME):
+                with open(os.path.join(tmp_dir, filename), "rb") as f:
+                    self.add_file(f"/bert-tiny/resolve/main/{filename}", f.read())
+
+        prefix = f"http://127.0.0.1:{self.server.server_port}/{{model_id}}/resolve/{{revision}}/{{filename}}"
+        with patch("transformers.file_utils.HUGGINGFACE_CO_PREFIX", prefix):
+            BertModel.from_pretrained("bert-tiny", cache_dir=self.cache_dir)
+            # The ETags of the config and the weights are only checked once
+            BertModel.from_pretrained("bert-tiny", cache_dir=self.cache_dir)
+        self.assertEqual(len(self.get_requests("HEAD")), 2)
+        self.assertEqual(len(self.get_requests("GET")), 2)
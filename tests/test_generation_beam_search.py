@@ -25,7 +25,7 @@ from .test_modeling_common import floats_tensor, ids_tensor
 if is_torch_available():
     import torch
 
-    from transformers.generation_beam_search import BeamHypotheses, BeamSearchScorer
+    from transformers.generation_beam_search import BeamHypotheses, BeamSearchScorer, TensorizedBeamSearchScorer
 
 
 class BeamSearchTester:
@@ -231,6 +231,67 @@ class BeamSearchTester:
         self.parent.assertListEqual(list(sequences.shape), [self.num_beams * self.batch_size, max_length])
         self.parent.assertListEqual(list(sequence_scores.shape), [self.num_beams * self.batch_size])
 
+    def check_tensorized_beam_scorer_matches(self, input_ids, *args):
+        max_length = self.sequence_length + 8
+        for length_penalty, do_early_stopping in [(1.0, False), (2.0, False), (0.5, True)]:
+            kwargs = {
+                "num_beam_hyps_to_keep": self.num_beams,
+                "length_penalty": length_penalty,
+                "do_early_stopping": do_early_stopping,
+            }
+            beam_scorer = self.prepare_beam_scorer(**kwargs)
+            tensorized_beam_scorer = TensorizedBeamSearchScorer(
+                batch_size=self.batch_size, num_beams=self.num_beams, device=torch_device, **kwargs
+            )
+
+            current_input_ids = input_ids
+            while current_input_ids.shape[-1] < max_length and not beam_scorer.is_done:
+                next_tokens = ids_tensor((self.batch_size, 2 * self.num_beams), self.vocab_size).to(torch_device)
+                # up to `num_beams` end-of-sequence tokens per batch item
+                eos_positions = ids_tensor((self.batch_size, self.num_beams), 2 * self.num_beams).to(torch_device)
+                next_tokens.scatter_(-1, eos_positions, self.eos_token_id)
+                next_indices = ids_tensor((self.batch_size, 2 * self.num_beams), self.num_beams).to(torch_device)
+                # rounded scores to get ties
+                next_scores = (-5 * floats_tensor((self.batch_size, 2 * self.num_beams))).round().to(torch_device)
+                next_scores, _ = next_scores.sort(descending=True)
+
+                process_kwargs = {"pad_token_id": self.pad_token_id, "eos_token_id": self.eos_token_id}
+                beam_outputs = beam_scorer.process(
+                    current_input_ids, next_scores, next_tokens, next_indices, **process_kwargs
+                )
+                tensorized_beam_outputs = tensorized_beam_scorer.process(
+                    current_input_ids, next_scores, next_tokens, next_indices, **process_kwargs
+                )
+                for key in beam_outputs:
+                    self.parent.assertListEqual(beam_outputs[key].tolist(), tensorized_beam_outputs[key].tolist())
+                self.parent.assertEqual(bool(beam_scorer.is_done), bool(tensorized_beam_scorer.is_done))
+
+                current_input_ids = torch.cat(
+                    [
+                        current_input_ids[beam_outputs["next_beam_indices"], :],
+                        beam_outputs["next_beam_tokens"].unsqueeze(-1),
+                    ],
+                    dim=-1,
+                )
+
+            final_args = (
+                current_input_ids,
+                beam_outputs["next_beam_scores"],
+                beam_outputs["next_beam_tokens"],
+                beam_outputs["next_beam_indices"],
+            )
+            final_kwargs = {"pad_token_id": self.pad_token_id, "eos_token_id": self.eos_token_id}
+            sequence_output = beam_scorer.finalize(*final_args, max_length=max_length, **final_kwargs)
+            tensorized_sequence_output = tensorized_beam_scorer.finalize(
+                *final_args, max_length=max_length, **final_kwargs
+            )
+            self.parent.assertListEqual(
+                sequence_output["sequences"].tolist(), tensorized_sequence_output["sequences"].tolist()
+            )
+            self.parent.assertListEqual(
+                sequence_output["sequence_scores"].tolist(), tensorized_sequence_output["sequence_scores"].tolist()
+            )
+
 
 @require_torch
 class BeamSearchTest(unittest.TestCase):
@@ -248,3 +309,7 @@ class BeamSearchTest(unittest.TestCase):
     def test_beam_scorer_finalize(self):
         inputs = self.beam_search_tester.prepare_inputs()
         self.beam_search_tester.check_beam_scores_finalize(*inputs)
+
+    def test_tensorized_beam_scorer_matches(self):
+        inputs = self.beam_search_tester.prepare_inputs()
+        self.beam_search_tester.check_tensorized_beam_scorer_matches(*inputs)
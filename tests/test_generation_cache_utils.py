@@ -0,0 +1,190 @@
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import unittest
+import weakref
+
+from transformers import is_torch_available
+from transformers.testing_utils import require_torch, torch_device
+
+from .test_modeling_common import ids_tensor
+
+
+if is_torch_available():
+    import torch
+
+    from transformers import (
+        BartConfig,
+        BartForConditionalGeneration,
+        EncoderOutputCache,
+        T5Config,
+        T5ForConditionalGeneration,
+    )
+    from transformers.generation_cache_utils import StaticLayerKeyValueCache
+
+
+@require_torch
+class StaticKeyValueCacheTest(unittest.TestCase):
+    def test_reorder_cache(self):
+        cache = StaticLayerKeyValueCache(max_length=6)
+        key, value = torch.randn(3, 2, 4, 5, device=torch_device), torch.randn(3, 2, 4, 5, device=torch_device)
+        cache.update(key, value)
+        beam_idx = torch.tensor([2, 2, 0], device=torch_device)
+        cache.reorder_cache(beam_idx)
+        self.assertTrue(torch.equal(cache[0], key[beam_idx]))
+        self.assertTrue(torch.equal(cache[1], value[beam_idx]))
+
+        # the beams are reordered back and forth between the same two buffers
+        buffer_pointers = {cache.key.data_ptr(), cache._reordered_key.data_ptr()}
+        cache.reorder_cache(torch.tensor([1, 0, 2], device=torch_device))
+        self.assertSetEqual({cache.key.data_ptr(), cache._reordered_key.data_ptr()}, buffer_pointers)
+        self.assertTrue(torch.equal(cache[0], key[beam_idx][[1, 0, 2]]))
+
+        # the new positions are written after the reordered prefix
+        new_key, new_value = torch.randn(3, 2, 1, 5, device=torch_device), torch.randn(3, 2, 1, 5, device=torch_device)
+        key_states, value_states = cache.update(new_key, new_value)
+        self.assertTrue(torch.equal(key_states, torch.cat([key[beam_idx][[1, 0, 2]], new_key], dim=2)))
+        self.assertTrue(torch.equal(value_states, torch.cat([value[beam_idx][[1, 0, 2]], new_value], dim=2)))
+
+
+@require_torch
+class EncoderOutputCacheTest(unittest.TestCase):
+    vocab_size = 99
+
+    def _get_bart_model(self):
+        torch.manual_seed(0)
+        config = BartConfig(
+            vocab_size=self.vocab_size,
+            d_model=16,
+            encoder_layers=2,
+            decoder_layers=2,
+            encoder_attention_heads=4,
+            decoder_attention_heads=4,
+            encoder_ffn_dim=16,
+            decoder_ffn_dim=16,
+            init_std=0.5,
+        )
+        return BartForConditionalGeneration(config).to(torch_device).eval()
+
+    def _get_t5_model(self):
+        torch.manual_seed(0)
+        config = T5Config(
+            vocab_size=self.vocab_size,
+            d_model=16,
+            d_ff=32,
+            d_kv=4,
+            num_layers=2,
+            num_heads=4,
+            decoder_start_token_id=0,
+        )
+        return T5ForConditionalGeneration(config).to(torch_device).eval()
+
+    def _count_encoder_calls(self, model):
+        calls = []
+        model.get_encoder().register_forward_hook(lambda *args: calls.append(1))
+        return calls
+
+    def test_cache_skips_encoder(self):
+        model = self._get_bart_model()
+        input_ids = ids_tensor((2, 7), self.vocab_size - 3) + 3
+        cache = EncoderOutputCache()
+
+        encoder_calls = self._count_encoder_calls(model)
+        for generate_kwargs in [
+            {"num_beams": 1},
+            {"num_beams": 3},
+            {"num_beams": 1, "decoder_input_ids": input_ids[:, :2]},
+        ]:
+            output = model.generate(input_ids, max_length=10, encoder_output_cache=cache, **generate_kwargs)
+            expected_output = model.generate(input_ids, max_length=10, **generate_kwargs)
+            self.assertListEqual(output.tolist(), expected_output.tolist())
+
+        # the encoder only ran once for the 3 cached calls and 3 times for the uncached ones
+        self.assertEqual(len(encoder_calls), 4)
+        self.assertEqual(len(cache), 1)
+
+    def test_cache_eviction(self):
+        model = self._get_bart_model()
+        inputs = [ids_tensor((1, 5), self.vocab_size - 3) + 3 for _ in range(3)]
+        cache = EncoderOutputCache(max_size=2)
+
+        encoder_calls = self._count_encoder_calls(model)
+        for input_ids in inputs + inputs[-1:]:
+            model.generate(input_ids, max_length=5, encoder_output_cache=cache)
+        self.assertEqual(len(encoder_calls), 3)
+
+        # the first inputs were evicted
+        model.generate(inputs[0], max_length=5, encoder_output_cache=cache)
+        self.assertEqual(len(encoder_calls), 4)
+        self.assertEqual(len(cache), 2)
+
+        # a different attention mask is a different entry
+        attention_mask = torch.ones_like(inputs[0])
+        attention_mask[:, 0] = 0
+        model.generate(inputs[0], attention_mask=attention_mask, max_length=5, encoder_output_cache=cache)
+        self.assertEqual(len(encoder_calls), 5)
+
+    def test_cache_does_not_keep_model(self):
+        input_ids = ids_tensor((1, 5), self.vocab_size - 3) + 3
+        cache = EncoderOutputCache()
+
+        model = self._get_bart_model()
+        model.generate(input_ids, max_length=5, encoder_output_cache=cache)
+        model_ref = weakref.ref(model)
+        del model
+        gc.collect()
+        self.assertIsNone(model_ref())
+
+        # a new model doesn't get the outputs of the deleted one, which are dropped
+        model = self._get_bart_model()
+        encoder_calls = self._count_encoder_calls(model)
+        model.generate(input_ids, max_length=5, encoder_output_cache=cache)
+        self.assertEqual(len(encoder_calls), 1)
+        self.assertEqual(len(cache), 1)
+
+    def test_cache_decoder_only_raises(self):
+        with self.assertRaises(ValueError):
+            model = self._get_bart_model()
+            model.config.is_encoder_decoder = False
+            model.generate(ids_tensor((1, 5), self.vocab_size), encoder_output_cache=EncoderOutputCache())
+
+    def _check_broadcast_beam_search(self, model):
+        input_ids = ids_tensor((2, 7), self.vocab_size - 3) + 3
+        generate_kwargs = {
+            "max_length": 10,
+            "num_beams": 3,
+            "num_return_sequences": 2,
+            "output_scores": True,
+            "return_dict_in_generate": True,
+        }
+
+        self.assertTrue(model.supports_cross_attention_broadcast)
+        for do_sample in [False, True]:
+            torch.manual_seed(0)
+            output = model.generate(input_ids, do_sample=do_sample, **generate_kwargs)
+            model.supports_cross_attention_broadcast = False
+            torch.manual_seed(0)
+            expected_output = model.generate(input_ids, do_sample=do_sample, **generate_kwargs)
+            del model.supports_cross_attention_broadcast
+
+            self.assertListEqual(output.sequences.tolist(), expected_output.sequences.tolist())
+            self.assertTrue(torch.allclose(output.sequences_scores, expected_output.sequences_scores, atol=1e-5))
+
+    def test_bart_broadcast_beam_search(self):
+        self._check_broadcast_beam_search(self._get_bart_model())
+
+    def test_t5_broadcast_beam_search(self):
+        self._check_broadcast_beam_search(self._get_t5_model())
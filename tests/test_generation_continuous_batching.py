@@ -0,0 +1,143 @@
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import unittest
+
+from parameterized import parameterized
+from transformers import is_torch_available
+from transformers.testing_utils import require_torch, torch_device
+
+from .test_modeling_common import ids_tensor
+
+
+if is_torch_available():
+    import torch
+
+    from transformers import (
+        ContinuousBatchingScheduler,
+        GenerationRequest,
+        GPT2Config,
+        GPT2LMHeadModel,
+        LogitsProcessorList,
+        MaxLengthCriteria,
+        NoRepeatNGramLogitsProcessor,
+        StoppingCriteriaList,
+        T5Config,
+        T5ForConditionalGeneration,
+    )
+
+
+@require_torch
+class ContinuousBatchingSchedulerTest(unittest.TestCase):
+    vocab_size = 99
+
+    def _get_model(self):
+        torch.manual_seed(0)
+        config = GPT2Config(
+            vocab_size=self.vocab_size,
+            n_embd=32,
+            n_layer=2,
+            n_head=4,
+            n_positions=64,
+            bos_token_id=self.vocab_size - 1,
+            eos_token_id=self.vocab_size - 1,
+            pad_token_id=self.vocab_size - 1,
+        )
+        return GPT2LMHeadModel(config).to(torch_device).eval()
+
+    def _get_requests(self, num_requests):
+        requests = []
+        for request_idx in range(num_requests):
+            prompt_length = 3 + request_idx % 4
+            max_length = prompt_length + 2 + 3 * (request_idx % 3)
+            requests.append(
+                GenerationRequest(
+                    input_ids=ids_tensor((prompt_length,), self.vocab_size - 1),
+                    stopping_criteria=StoppingCriteriaList([MaxLengthCriteria(max_length=max_length)]),
+                    request_id=request_idx,
+                )
+            )
+        return requests
+
+    def _check_results(self, model, requests, results, **generate_kwargs):
+        self.assertListEqual(sorted(result.request_id for result in results), [r.request_id for r in requests])
+        for result in results:
+            request = requests[result.request_id]
+            expected = model.generate(
+                request.input_ids[None],
+                max_length=request.stopping_criteria[0].max_length,
+                **generate_kwargs,
+            )
+            self.assertListEqual(result.sequences.tolist(), expected[0].tolist())
+
+    def test_matches_generate(self):
+        model = self._get_model()
+        requests = self._get_requests(7)
+
+        scheduler = ContinuousBatchingScheduler(model, max_batch_size=3)
+        results = list(scheduler.generate(requests))
+
+        self._check_results(model, requests, results)
+        # the shortest requests are returned before the longest requests of the first batch
+        self.assertNotEqual([result.request_id for result in results], list(range(len(requests))))
+
+    def test_logits_processor(self):
+        model = self._get_model()
+        requests = self._get_requests(4)
+        for request in requests:
+            request.logits_processor = LogitsProcessorList([NoRepeatNGramLogitsProcessor(2)])
+
+        scheduler = ContinuousBatchingScheduler(model, max_batch_size=2)
+        results = list(scheduler.generate(requests))
+
+        self._check_results(model, requests, results, no_repeat_ngram_size=2)
+
+    def test_queue(self):
+        model = self._get_model()
+        requests = self._get_requests(5)
+
+        request_queue = queue.Queue()
+        for request in requests:
+            request_queue.put(request)
+        request_queue.put(None)
+
+        scheduler = ContinuousBatchingScheduler(model, max_batch_size=2)
+        results = list(scheduler.generate(request_queue))
+
+        self._check_results(model, requests, results)
+
+    @parameterized.expand(["cpu", "cuda"])
+    def test_prompts_on_cpu(self, device):
+        if device == "cuda" and not torch.cuda.is_available():
+            self.skipTest("test requires CUDA")
+        model = self._get_model().to(device)
+        requests = self._get_requests(4)
+        for request in requests:
+            request.input_ids = request.input_ids.cpu()
+
+        scheduler = ContinuousBatchingScheduler(model, max_batch_size=2)
+        results = list(scheduler.generate(requests))
+
+        for result in results:
+            self.assertEqual(result.sequences.device, model.device)
+        for request in requests:
+            request.input_ids = request.input_ids.to(device)
+        self._check_results(model, requests, results)
+
+    def test_encoder_decoder_raises(self):
+        config = T5Config(vocab_size=self.vocab_size, d_model=16, d_ff=32, d_kv=4, num_layers=1, num_heads=4)
+        with self.assertRaises(ValueError):
+            ContinuousBatchingScheduler(T5ForConditionalGeneration(config))
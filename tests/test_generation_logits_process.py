@@ -40,6 +40,7 @@ if is_torch_available():
         RepetitionPenaltyLogitsProcessor,
         TemperatureLogitsWarper,
         TopKLogitsWarper,
+        TopKTopPLogitsWarper,
         TopPLogitsWarper,
     )
 
@@ -191,6 +192,43 @@ class LogitsProcessorTest(unittest.TestCase):
         # first batch should keep three tokens, second batch would keep only 1, but due to `min_tokens_to_keep=2` keeps 2.
         self.assertListEqual((filtered_dist != 0.0).to(torch.long).sum(dim=-1).tolist(), [3, 2])
 
+    def test_top_k_top_p_dist_warper(self):
+        input_ids = None
+        vocab_size = 50
+        batch_size = 4
+
+        scores = torch.randn((batch_size, vocab_size), device=torch_device)
+        # ties at the k-th highest score are all kept by `TopKLogitsWarper`
+        scores[1, :8] = scores[1].max() + 1.0
+        # filtered scores, e.g. by `NoBadWordsLogitsProcessor`
+        scores[2, 5:] = -float("inf")
+
+        for kwargs in [
+            {"top_k": 5, "top_p": 0.8, "temperature": 0.7},
+            {"top_k": 10, "top_p": 0.5},
+            {"top_k": 3, "temperature": 1.3, "min_tokens_to_keep": 4},
+            {"top_k": 20, "top_p": 0.3, "min_tokens_to_keep": 2, "filter_value": 0.0},
+        ]:
+            warpers = LogitsProcessorList()
+            if "temperature" in kwargs:
+                warpers.append(TemperatureLogitsWarper(kwargs["temperature"]))
+            warper_kwargs = {key: kwargs[key] for key in ("filter_value", "min_tokens_to_keep") if key in kwargs}
+            warpers.append(TopKLogitsWarper(kwargs["top_k"], **warper_kwargs))
+            if "top_p" in kwargs:
+                warpers.append(TopPLogitsWarper(kwargs["top_p"], **warper_kwargs))
+            fused_warper = TopKTopPLogitsWarper(**kwargs)
+
+            expected_scores = warpers(input_ids, scores.clone())
+            fused_scores = fused_warper(input_ids, scores.clone())
+            self.assertTrue(torch.allclose(fused_scores, expected_scores))
+
+            # the sampled tokens are never filtered tokens
+            next_tokens = fused_warper.sample(input_ids, scores[:, None].expand(-1, 100, -1).reshape(-1, vocab_size))
+            if kwargs.get("filter_value", -float("inf")) == -float("inf"):
+                self.assertFalse(
+                    torch.isinf(expected_scores.repeat_interleave(100, dim=0).gather(-1, next_tokens[:, None])).any()
+                )
+
     def test_no_repeat_ngram_dist_processor(self):
         vocab_size = 3
         batch_size = 2
@@ -212,6 +250,33 @@ class LogitsProcessorTest(unittest.TestCase):
             torch.isinf(filtered_scores_3_gram).tolist(), [[False, False, False], [True, False, False]]
         )
 
+    def test_no_repeat_ngram_dist_processor_incremental(self):
+        vocab_size = 4
+        batch_size = 6
+        ngram_size = 2
+
+        input_ids = ids_tensor((batch_size, 3), vocab_size=vocab_size)
+        incremental_proc = NoRepeatNGramLogitsProcessor(ngram_size)
+
+        for step in range(8):
+            scores = self._get_uniform_logits(batch_size, vocab_size)
+            expected_scores = NoRepeatNGramLogitsProcessor(ngram_size)(input_ids, scores.clone())
+            filtered_scores = incremental_proc(input_ids, scores.clone())
+            self.assertListEqual(torch.isinf(filtered_scores).tolist(), torch.isinf(expected_scores).tolist())
+
+            # reorder the hypotheses as beam search does, duplicating some of them
+            beam_idx = ids_tensor((batch_size,), vocab_size=batch_size)
+            next_tokens = ids_tensor((batch_size, 1), vocab_size=vocab_size)
+            input_ids = torch.cat([input_ids[beam_idx, :], next_tokens], dim=-1)
+            incremental_proc.reorder_state(beam_idx)
+
+        # unrelated input_ids are handled from scratch
+        input_ids = ids_tensor((batch_size, 5), vocab_size=vocab_size)
+        scores = self._get_uniform_logits(batch_size, vocab_size)
+        expected_scores = NoRepeatNGramLogitsProcessor(ngram_size)(input_ids, scores.clone())
+        filtered_scores = incremental_proc(input_ids, scores.clone())
+        self.assertListEqual(torch.isinf(filtered_scores).tolist(), torch.isinf(expected_scores).tolist())
+
     def test_encoder_no_repeat_ngram_dist_processor(self):
         vocab_size = 3
         num_beams = 2
@@ -299,6 +364,39 @@ class LogitsProcessorTest(unittest.TestCase):
         filtered_scores = no_bad_words_dist_proc(input_ids, scores.clone())
         self.assertTrue(torch.allclose(scores, filtered_scores, atol=1e-3))
 
+    def test_no_bad_words_dist_processor_matches_all_suffixes(self):
+        vocab_size = 6
+        batch_size = 8
+        eos_token_id = 5
+
+        bad_word_tokens = [[2], [0, 1], [1, 0, 1], [0, 1, 0, 3], [1, 1, 4], [3, 0], [0, 3, 0, 2], [2, 2, 2, 2, 1]]
+
+        def banned_tokens(prev_tokens):
+            return {
+                seq[-1]
+                for seq in bad_word_tokens
+                if len(seq) - 1 <= len(prev_tokens) and prev_tokens[len(prev_tokens) - len(seq) + 1 :] == seq[:-1]
+            }
+
+        no_bad_words_dist_proc = NoBadWordsLogitsProcessor(bad_words_ids=bad_word_tokens, eos_token_id=eos_token_id)
+        input_ids = ids_tensor((batch_size, 1), vocab_size=4)
+
+        for step in range(12):
+            scores = self._get_uniform_logits(batch_size, vocab_size)
+            filtered_scores = no_bad_words_dist_proc(input_ids, scores)
+
+            expected = [
+                [token in banned_tokens(prev_tokens) for token in range(vocab_size)]
+                for prev_tokens in input_ids.tolist()
+            ]
+            self.assertListEqual(torch.isinf(filtered_scores).tolist(), expected)
+
+            # reorder the hypotheses as beam search does
+            beam_idx = ids_tensor((batch_size,), vocab_size=batch_size)
+            next_tokens = ids_tensor((batch_size, 1), vocab_size=4)
+            input_ids = torch.cat([input_ids[beam_idx, :], next_tokens], dim=-1)
+            no_bad_words_dist_proc.reorder_state(beam_idx)
+
     def test_processor_list(self):
         batch_size = 4
         sequence_length = 10
@@ -0,0 +1,177 @@
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import unittest
+
+from transformers import GPT2Tokenizer, is_torch_available
+from transformers.models.gpt2.tokenization_gpt2 import VOCAB_FILES_NAMES, bytes_to_unicode
+from transformers.testing_utils import require_torch, torch_device
+
+from .test_modeling_common import ids_tensor
+
+
+if is_torch_available():
+    import torch
+
+    from transformers import GPT2Config, GPT2LMHeadModel, TextIteratorStreamer, pipeline
+    from transformers.generation_beam_search import BeamScorer, BeamSearchScorer
+    from transformers.generation_stopping_criteria import MaxLengthCriteria, StoppingCriteriaList
+
+
+@require_torch
+class StreamerTest(unittest.TestCase):
+    def setUp(self):
+        # byte-level vocabulary, so that a multi-byte character can be split over several tokens
+        vocab = list(bytes_to_unicode().values()) + ["Ġl", "Ġlo", "<|endoftext|>"]
+        merges = ["#version: 0.2", "Ġ l", "Ġl o", ""]
+
+        self.tmpdirname = tempfile.mkdtemp()
+        vocab_file = os.path.join(self.tmpdirname, VOCAB_FILES_NAMES["vocab_file"])
+        merges_file = os.path.join(self.tmpdirname, VOCAB_FILES_NAMES["merges_file"])
+        with open(vocab_file, "w", encoding="utf-8") as fp:
+            fp.write(json.dumps(dict(zip(vocab, range(len(vocab))))) + "\n")
+        with open(merges_file, "w", encoding="utf-8") as fp:
+            fp.write("\n".join(merges))
+        self.tokenizer = GPT2Tokenizer(vocab_file, merges_file)
+
+    def _get_model(self):
+        torch.manual_seed(0)
+        eos_token_id = self.tokenizer.convert_tokens_to_ids("<|endoftext|>")
+        config = GPT2Config(
+            vocab_size=len(self.tokenizer),
+            n_embd=32,
+            n_layer=2,
+            n_head=4,
+            bos_token_id=eos_token_id,
+            eos_token_id=eos_token_id,
+            pad_token_id=eos_token_id,
+        )
+        return GPT2LMHeadModel(config).to(torch_device).eval()
+
+    def _stream(self, token_ids, **streamer_kwargs):
+        streamer = TextIteratorStreamer(self.tokenizer, clean_up_tokenization_spaces=False, **streamer_kwargs)
+        for token_id in token_ids:
+            streamer.put(torch.tensor([token_id]))
+        streamer.end()
+        return list(streamer)
+
+    def test_iterator_streamer_matches_decode(self):
+        token_ids = ids_tensor((200,), 256).tolist()
+
+        chunks = self._stream(token_ids)
+
+        self.assertEqual("".join(chunks), self.tokenizer.decode(token_ids, clean_up_tokenization_spaces=False))
+
+    def test_iterator_streamer_waits_for_complete_characters(self):
+        token_ids = self.tokenizer.encode("é lo")
+        self.assertEqual(len(token_ids), 3)
+
+        chunks = self._stream(token_ids, return_token_ids=True)
+
+        # the first byte of "é" is not decoded alone
+        self.assertListEqual(chunks, [([token_ids[0]], ""), ([token_ids[1]], "é"), ([token_ids[2]], " lo")])
+
+    def test_iterator_streamer_skip_prompt(self):
+        model = self._get_model()
+        input_ids = torch.tensor([self.tokenizer.encode("low lo")], device=torch_device)
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True)
+
+        output = model.generate(input_ids, max_length=20, streamer=streamer)
+
+        self.assertEqual("".join(streamer), self.tokenizer.decode(output[0, input_ids.shape[-1] :]))
+
+    def test_greedy_search_streamer(self):
+        model = self._get_model()
+        input_ids = ids_tensor((1, 5), 256)
+        streamer = TextIteratorStreamer(self.tokenizer)
+
+        output = model.generate(input_ids, max_length=30, streamer=streamer)
+
+        self.assertEqual("".join(streamer), self.tokenizer.decode(output[0]))
+
+    def test_sample_streamer(self):
+        model = self._get_model()
+        input_ids = ids_tensor((1, 5), 256)
+        streamer = TextIteratorStreamer(self.tokenizer)
+
+        output = model.generate(input_ids, max_length=30, do_sample=True, streamer=streamer)
+
+        self.assertEqual("".join(streamer), self.tokenizer.decode(output[0]))
+
+    def test_beam_search_streamer(self):
+        model = self._get_model()
+        input_ids = ids_tensor((1, 5), 256)
+        streamer = TextIteratorStreamer(self.tokenizer, return_token_ids=True)
+
+        output = model.generate(input_ids, max_length=30, num_beams=3, num_return_sequences=2, streamer=streamer)
+
+        chunks = list(streamer)
+        self.assertListEqual(sum((token_ids for token_ids, _ in chunks), []), output[0].tolist())
+        self.assertEqual("".join(text for _, text in chunks), self.tokenizer.decode(output[0]))
+
+    def test_beam_search_streamer_custom_beam_scorer(self):
+        class CustomBeamScorer(BeamScorer):
+            # only implements the `BeamScorer` interface
+            def __init__(self, **kwargs):
+                self._scorer = BeamSearchScorer(**kwargs)
+                self.num_beams = self._scorer.num_beams
+
+            @property
+            def is_done(self):
+                return self._scorer.is_done
+
+            def process(self, *args, **kwargs):
+                return self._scorer.process(*args, **kwargs)
+
+            def finalize(self, *args, **kwargs):
+                return self._scorer.finalize(*args, **kwargs)
+
+        model = self._get_model()
+        num_beams = 3
+        input_ids = ids_tensor((1, 5), 256).repeat_interleave(num_beams, dim=0)
+        streamer = TextIteratorStreamer(self.tokenizer, return_token_ids=True)
+
+        output = model.beam_search(
+            input_ids,
+            CustomBeamScorer(batch_size=1, num_beams=num_beams, device=torch_device),
+            stopping_criteria=StoppingCriteriaList([MaxLengthCriteria(max_length=30)]),
+            pad_token_id=model.config.pad_token_id,
+            eos_token_id=model.config.eos_token_id,
+            streamer=streamer,
+        )
+
+        # the generated tokens are streamed once the search is done
+        chunks = list(streamer)
+        self.assertListEqual(sum((token_ids for token_ids, _ in chunks), []), output[0, 5:].tolist())
+
+    def test_streamer_batch_raises(self):
+        model = self._get_model()
+        input_ids = ids_tensor((2, 5), 256)
+
+        with self.assertRaises(ValueError):
+            model.generate(input_ids, max_length=30, streamer=TextIteratorStreamer(self.tokenizer))
+
+    def test_text_generation_pipeline_stream(self):
+        model = self._get_model()
+        text_generator = pipeline("text-generation", model=model, tokenizer=self.tokenizer)
+
+        outputs = text_generator("low lo", max_length=20)
+        chunks = list(text_generator("low lo", max_length=20, stream=True))
+
+        self.assertEqual(chunks[0], "low lo")
+        self.assertEqual("".join(chunks), outputs[0]["generated_text"])
@@ -24,21 +24,26 @@ from transformers.testing_utils import require_torch, slow, torch_device
 if is_torch_available():
     import torch
 
-    from transformers import BartForConditionalGeneration, BartTokenizer, top_k_top_p_filtering
-    from transformers.generation_beam_search import BeamSearchScorer
+    from transformers import (
+        BartForConditionalGeneration,
+        BartTokenizer,
+        GPT2Config,
+        GPT2LMHeadModel,
+        top_k_top_p_filtering,
+    )
+    from transformers.generation_beam_search import BeamScorer, BeamSearchScorer
     from transformers.generation_logits_process import (
         ForcedBOSTokenLogitsProcessor,
         ForcedEOSTokenLogitsProcessor,
         HammingDiversityLogitsProcessor,
         InfNanRemoveLogitsProcessor,
+        LogitsProcessor,
         LogitsProcessorList,
         MinLengthLogitsProcessor,
         NoBadWordsLogitsProcessor,
         NoRepeatNGramLogitsProcessor,
         RepetitionPenaltyLogitsProcessor,
-        TemperatureLogitsWarper,
-        TopKLogitsWarper,
-        TopPLogitsWarper,
+        TopKTopPLogitsWarper,
     )
     from transformers.generation_stopping_criteria import MaxLengthCriteria, StoppingCriteriaList
     from transformers.generation_utils import (
@@ -46,12 +51,26 @@ if is_torch_available():
         BeamSampleEncoderDecoderOutput,
         BeamSearchDecoderOnlyOutput,
         BeamSearchEncoderDecoderOutput,
+        GenerationMixin,
         GreedySearchDecoderOnlyOutput,
         GreedySearchEncoderDecoderOutput,
         SampleDecoderOnlyOutput,
         SampleEncoderDecoderOutput,
     )
 
+    class ForceFirstRowEOSLogitsProcessor(LogitsProcessor):
+        # the first row ends at the first step, the other rows never end
+        def __init__(self, start_length, eos_token_id):
+            self.start_length = start_length
+            self.eos_token_id = eos_token_id
+
+        def __call__(self, input_ids, scores):
+            scores[:, self.eos_token_id] = -float("inf")
+            if input_ids.shape[-1] == self.start_length:
+                scores[0, :] = -float("inf")
+                scores[0, self.eos_token_id] = 0
+            return scores
+
 
 class GenerationTesterMixin:
     model_tester = None
@@ -132,9 +151,12 @@ class GenerationTesterMixin:
         warp_kwargs = {"top_k": 10, "top_p": 0.7, "temperature": 0.7}
         logits_warper = LogitsProcessorList(
             [
-                TemperatureLogitsWarper(warp_kwargs["temperature"]),
-                TopKLogitsWarper(top_k=warp_kwargs["top_k"], min_tokens_to_keep=(2 if num_beams > 1 else 1)),
-                TopPLogitsWarper(top_p=warp_kwargs["top_p"], min_tokens_to_keep=(2 if num_beams > 1 else 1)),
+                TopKTopPLogitsWarper(
+                    top_k=warp_kwargs["top_k"],
+                    top_p=warp_kwargs["top_p"],
+                    temperature=warp_kwargs["temperature"],
+                    min_tokens_to_keep=(2 if num_beams > 1 else 1),
+                )
             ]
         )
         return warp_kwargs, logits_warper
@@ -582,6 +604,37 @@ class GenerationTesterMixin:
             for output in (output_greedy, output_generate):
                 self._check_outputs(output, input_ids, model.config, use_cache=True)
 
+    def test_greedy_generate_prune_finished_sequences(self):
+        for model_class in self.all_generative_model_classes:
+            config, input_ids, attention_mask, _ = self._get_input_ids_and_config()
+            model = model_class(config).to(torch_device).eval()
+            eos_token_id = model.config.vocab_size - 1
+            kwargs = {"attention_mask": attention_mask}
+
+            outputs = []
+            for prune_finished_sequences in [False, True]:
+                if model.config.is_encoder_decoder:
+                    encoder_outputs, decoder_input_ids, _ = self._get_encoder_outputs(model, input_ids, attention_mask)
+                    kwargs["encoder_outputs"] = encoder_outputs
+                else:
+                    decoder_input_ids = input_ids
+                with torch.no_grad():
+                    output = model.greedy_search(
+                        decoder_input_ids,
+                        logits_processor=LogitsProcessorList(
+                            [ForceFirstRowEOSLogitsProcessor(decoder_input_ids.shape[-1], eos_token_id)]
+                        ),
+                        max_length=decoder_input_ids.shape[-1] + 3,
+                        pad_token_id=0,
+                        eos_token_id=eos_token_id,
+                        prune_finished_sequences=prune_finished_sequences,
+                        **kwargs,
+                    )
+                outputs.append(output)
+
+            self.assertEqual(outputs[1][0, decoder_input_ids.shape[-1]].item(), eos_token_id)
+            self.assertListEqual(outputs[0].tolist(), outputs[1].tolist())
+
     def test_sample_generate(self):
         for model_class in self.all_generative_model_classes:
             config, input_ids, attention_mask, max_length = self._get_input_ids_and_config()
@@ -1617,6 +1670,66 @@ class GenerationIntegrationTests(unittest.TestCase):
         # BeamSearchScorer max_length should not influence "real" max_length
         self.assertEqual(generated_ids.tolist(), generated_ids_no_max_len.tolist())
 
+    def test_beam_search_custom_beam_scorer(self):
+        class CustomBeamScorer(BeamScorer):
+            # only implements the `BeamScorer` interface, without `batch_size`
+            def __init__(self, **kwargs):
+                self._scorer = BeamSearchScorer(**kwargs)
+                self.num_beams = self._scorer.num_beams
+
+            @property
+            def is_done(self):
+                return self._scorer.is_done
+
+            def process(self, *args, **kwargs):
+                return self._scorer.process(*args, **kwargs)
+
+            def finalize(self, *args, **kwargs):
+                return self._scorer.finalize(*args, **kwargs)
+
+        torch.manual_seed(0)
+        config = GPT2Config(vocab_size=99, n_embd=32, n_layer=2, n_head=4, eos_token_id=98, pad_token_id=98)
+        model = GPT2LMHeadModel(config).to(torch_device).eval()
+        num_beams = 3
+        input_ids = torch.randint(config.vocab_size - 1, (2, 4), device=torch_device).repeat_interleave(num_beams, 0)
+        stopping_criteria = StoppingCriteriaList([MaxLengthCriteria(max_length=10)])
+
+        generated_ids = model.beam_search(
+            input_ids,
+            CustomBeamScorer(batch_size=2, num_beams=num_beams, device=torch_device),
+            stopping_criteria=stopping_criteria,
+        )
+        expected_ids = model.beam_search(
+            input_ids,
+            BeamSearchScorer(batch_size=2, num_beams=num_beams, device=torch_device),
+            stopping_criteria=stopping_criteria,
+        )
+        self.assertListEqual(generated_ids.tolist(), expected_ids.tolist())
+
+    def test_prune_finished_sequences_default_past_layout(self):
+        class GPT2WithoutReorderCache(GPT2LMHeadModel):
+            _reorder_cache = GenerationMixin._reorder_cache
+
+        torch.manual_seed(0)
+        config = GPT2Config(vocab_size=99, n_embd=32, n_layer=2, n_head=4)
+        model = GPT2WithoutReorderCache(config).to(torch_device).eval()
+        input_ids = torch.randint(config.vocab_size - 1, (3, 4), device=torch_device)
+
+        outputs = []
+        for prune_finished_sequences in [False, True]:
+            outputs.append(
+                model.greedy_search(
+                    input_ids,
+                    logits_processor=LogitsProcessorList([ForceFirstRowEOSLogitsProcessor(4, 98)]),
+                    stopping_criteria=StoppingCriteriaList([MaxLengthCriteria(max_length=8)]),
+                    pad_token_id=0,
+                    eos_token_id=98,
+                    attention_mask=torch.ones_like(input_ids),
+                    prune_finished_sequences=prune_finished_sequences,
+                )
+            )
+        self.assertListEqual(outputs[0].tolist(), outputs[1].tolist())
+
     def test_max_new_tokens(self):
         article = """Justin Timberlake and Jessica Biel, welcome to parenthood."""
         bart_tokenizer = BartTokenizer.from_pretrained("sshleifer/bart-tiny-random")
@@ -14,6 +14,8 @@
 # limitations under the License.
 
 import copy
+import subprocess
+import sys
 import tempfile
 import unittest
 
@@ -21,6 +23,7 @@ from transformers import is_torch_available
 from transformers.testing_utils import (
     DUMMY_UNKWOWN_IDENTIFIER,
     SMALL_MODEL_IDENTIFIER,
+    TestCasePlus,
     require_scatter,
     require_torch,
     slow,
@@ -236,6 +239,20 @@ class AutoModelTest(unittest.TestCase):
             model = AutoModel.from_pretrained(tmp_dir)
             self.assertIsInstance(model, FunnelBaseModel)
 
+    def test_lazy_mappings(self):
+        self.assertIn(BertConfig, MODEL_MAPPING)
+        self.assertIn(BertConfig, MODEL_MAPPING.keys())
+        self.assertIs(MODEL_MAPPING[BertConfig], BertModel)
+        self.assertIs(MODEL_FOR_PRETRAINING_MAPPING[BertConfig], BertForPreTraining)
+        self.assertNotIn(TapasConfig, MODEL_FOR_CAUSAL_LM_MAPPING)
+        self.assertEqual(len(MODEL_MAPPING), len(list(MODEL_MAPPING.keys())))
+
+        # Config classes are matched exactly, not by name or with `isinstance`
+        custom_config_class = type("BertConfig", (BertConfig,), {})
+        self.assertNotIn(custom_config_class, MODEL_MAPPING)
+        with self.assertRaises(KeyError):
+            MODEL_MAPPING[custom_config_class]
+
     def test_parents_and_children_in_mappings(self):
         # Test that the children are placed before the parents in the mappings, as the `instanceof` will be triggered
         # by the parents and will return the wrong configuration type when using auto models
@@ -269,3 +286,43 @@ class AutoModelTest(unittest.TestCase):
 
                     for child, parent in [(a, b) for a in child_model for b in parent_model]:
                         assert not issubclass(child, parent), f"{child.__name__} is child of {parent.__name__}"
+
+
+@require_torch
+class AutoModelImportTest(TestCasePlus):
+    def test_only_requested_model_is_imported(self):
+        # this has to run in an external program since the models may already be imported by other tests
+        script = """
+import sys
+from transformers import AutoModel, BertConfig
+def get_imported_models():
+    modules = [module for module in sys.modules if module.startswith("transformers.models.") and ".modeling_" in module]
+    return sorted(module for module in modules if not module.startswith("transformers.models.auto."))
+assert len(get_imported_models()) == 0, "A model was imported with AutoModel"
+config = BertConfig(vocab_size=99, hidden_size=32, num_hidden_layers=2, num_attention_heads=4, intermediate_size=37)
+model = AutoModel.from_config(config)
+print(get_imported_models())
+        """
+        cmd = [sys.executable, "-c", script]
+        result = subprocess.run(cmd, env=self.get_env(), check=False, capture_output=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.decode().strip(), "['transformers.models.bert.modeling_bert']")
+
+    def test_deprecated_modeling_auto_mapping(self):
+        # the module warns when it is imported, which has to happen in an external program to be the first import
+        script = """
+import warnings
+with warnings.catch_warnings(record=True) as caught_warnings:
+    warnings.simplefilter("always")
+    from transformers.utils.modeling_auto_mapping import MODEL_FOR_IMAGE_CLASSIFICATION_MAPPING_NAMES, MODEL_MAPPING_NAMES
+assert any(issubclass(w.category, FutureWarning) and "deprecated" in str(w.message) for w in caught_warnings)
+print(MODEL_MAPPING_NAMES["BertConfig"])
+print(MODEL_FOR_IMAGE_CLASSIFICATION_MAPPING_NAMES["DeiTConfig"])
+        """
+        cmd = [sys.executable, "-c", script]
+        result = subprocess.run(cmd, env=self.get_env(), check=False, capture_output=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertListEqual(
+            result.stdout.decode().strip().split("\n"),
+            ["BertModel", "('DeiTForImageClassification', 'DeiTForImageClassificationWithTeacher')"],
+        )
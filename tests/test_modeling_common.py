@@ -16,6 +16,7 @@
 import copy
 import gc
 import inspect
+import json
 import os.path
 import random
 import tempfile
@@ -23,10 +24,12 @@ import unittest
 import warnings
 from typing import Dict, List, Tuple
 
+from packaging import version
+
 from huggingface_hub import HfApi
 from requests.exceptions import HTTPError
 from transformers import AutoModel, is_torch_available, logging
-from transformers.file_utils import WEIGHTS_NAME, is_torch_fx_available
+from transformers.file_utils import WEIGHTS_INDEX_NAME, WEIGHTS_NAME, is_torch_fx_available
 from transformers.models.auto import get_values
 from transformers.testing_utils import (
     ENDPOINT_STAGING,
@@ -61,12 +64,15 @@ if is_torch_available():
         MODEL_MAPPING,
         AdaptiveEmbedding,
         BertConfig,
+        BertForMaskedLM,
+        BertForSequenceClassification,
         BertModel,
         PretrainedConfig,
         PreTrainedModel,
         T5Config,
         T5ForConditionalGeneration,
     )
+    from transformers.modeling_utils import get_state_dict_float_dtype, load_sharded_checkpoint, shard_checkpoint
 
 if is_torch_fx_available():
     from transformers.utils.fx import symbolic_trace
@@ -164,6 +170,56 @@ class ModelTesterMixin:
                 max_diff = np.amax(np.abs(out_1 - out_2))
                 self.assertLessEqual(max_diff, 1e-5)
 
+    @unittest.skipIf(
+        is_torch_available() and version.parse(torch.__version__) < version.parse("2.1"),
+        "use_mmap requires PyTorch >= 2.1",
+    )
+    def test_save_load_use_mmap(self):
+        config, inputs_dict = self.model_tester.prepare_config_and_inputs_for_common()
+
+        for model_class in self.all_model_classes:
+            model = model_class(config)
+            model.to(torch_device)
+            model.eval()
+            with torch.no_grad():
+                outputs = model(**self._prepare_for_class(inputs_dict, model_class))
+
+            out_2 = outputs[0].cpu().numpy()
+            out_2[np.isnan(out_2)] = 0
+
+            with tempfile.TemporaryDirectory() as tmpdirname:
+                model.save_pretrained(tmpdirname)
+                model = model_class.from_pretrained(tmpdirname, use_mmap=True)
+                for name, param in model.named_parameters():
+                    self.assertFalse(param.is_meta, msg=f"{name} was not loaded")
+                model.to(torch_device)
+                with torch.no_grad():
+                    after_outputs = model(**self._prepare_for_class(inputs_dict, model_class))
+
+                out_1 = after_outputs[0].cpu().numpy()
+                out_1[np.isnan(out_1)] = 0
+                max_diff = np.amax(np.abs(out_1 - out_2))
+                self.assertLessEqual(max_diff, 1e-5)
+
+    @unittest.skipIf(
+        is_torch_available() and version.parse(torch.__version__) < version.parse("2.1"),
+        "low_cpu_mem_usage requires PyTorch >= 2.1",
+    )
+    def test_save_load_low_cpu_mem_usage(self):
+        config, _ = self.model_tester.prepare_config_and_inputs_for_common()
+
+        for model_class in self.all_model_classes:
+            model = model_class(config)
+
+            with tempfile.TemporaryDirectory() as tmpdirname:
+                model.save_pretrained(tmpdirname)
+                new_model = model_class.from_pretrained(tmpdirname, low_cpu_mem_usage=True)
+
+            new_state_dict = new_model.state_dict()
+            for key, value in model.state_dict().items():
+                self.assertFalse(new_state_dict[key].is_meta, msg=f"{key} was not loaded")
+                self.assertTrue(torch.equal(value, new_state_dict[key]), msg=f"{key} was not loaded correctly")
+
     def test_save_load_keys_to_ignore_on_save(self):
         config, inputs_dict = self.model_tester.prepare_config_and_inputs_for_common()
 
@@ -1663,6 +1719,252 @@ class ModelUtilsTest(TestCasePlus):
         model = T5ForConditionalGeneration.from_pretrained(model_path, torch_dtype=torch.float16)
         self.assertEqual(model.dtype, torch.float16)
 
+    def test_model_from_pretrained_torch_dtype_auto(self):
+        config = BertConfig(
+            vocab_size=99, hidden_size=32, num_hidden_layers=2, num_attention_heads=4, intermediate_size=37
+        )
+        model = BertModel(config).half()
+        model_path = self.get_auto_remove_tmp_dir()
+
+        # the first entry of the state dict is the integer `position_ids` buffer
+        self.assertEqual(next(iter(model.state_dict().values())).dtype, torch.int64)
+        model.save_pretrained(model_path)
+        self.assertEqual(BertModel.from_pretrained(model_path, torch_dtype="auto").dtype, torch.float16)
+
+        # with one shard per weight, the first shard has no floating point weight
+        model.save_pretrained(model_path, max_shard_size=1)
+        self.assertEqual(BertModel.from_pretrained(model_path, torch_dtype="auto").dtype, torch.float16)
+
+        # without any floating point weight, the default dtype is kept
+        self.assertIsNone(get_state_dict_float_dtype({"position_ids": torch.arange(4)}))
+
+    @require_torch
+    @unittest.skipIf(
+        is_torch_available() and version.parse(torch.__version__) < version.parse("2.1"),
+        "use_mmap requires PyTorch >= 2.1",
+    )
+    def test_model_from_pretrained_use_mmap(self):
+        config = BertConfig(
+            vocab_size=99, hidden_size=32, num_hidden_layers=2, num_attention_heads=4, intermediate_size=37
+        )
+        model = BertForMaskedLM(config)
+        model_path = self.get_auto_remove_tmp_dir()
+        model.save_pretrained(model_path)
+
+        # the weights use the pages of the mapped file
+        new_model = BertForMaskedLM.from_pretrained(model_path, use_mmap=True)
+        for (name, param), new_param in zip(model.named_parameters(), new_model.parameters()):
+            self.assertTrue(torch.equal(param, new_param), msg=name)
+        if os.path.exists("/proc/self/maps"):
+            with open("/proc/self/maps") as f:
+                mapped_files = [line.split()[-1] for line in f]
+            self.assertIn(os.path.join(model_path, WEIGHTS_NAME), mapped_files)
+
+        # the weights are converted to `torch_dtype`
+        new_model = BertForMaskedLM.from_pretrained(model_path, use_mmap=True, torch_dtype=torch.float16)
+        self.assertEqual(set(param.dtype for param in new_model.parameters()), {torch.float16})
+
+        # the head is not in the checkpoint of the base model, it's initialized as usual
+        BertModel.from_pretrained(model_path).save_pretrained(model_path)
+        new_model = BertForSequenceClassification.from_pretrained(model_path, use_mmap=True)
+        for name, param in new_model.named_parameters():
+            self.assertFalse(param.is_meta, msg=name)
+        self.assertTrue(
+            torch.equal(new_model.bert.embeddings.word_embeddings.weight, model.bert.embeddings.word_embeddings.weight)
+        )
+
+        with self.assertRaises(ValueError):
+            BertModel.from_pretrained(model_path, use_mmap=True, from_tf=True)
+        with self.assertRaises(ValueError):
+            BertModel.from_pretrained(None, config=config, state_dict=model.state_dict(), use_mmap=True)
+
+    @require_torch
+    @unittest.skipIf(
+        is_torch_available() and version.parse(torch.__version__) < version.parse("2.1"),
+        "low_cpu_mem_usage requires PyTorch >= 2.1",
+    )
+    def test_model_from_pretrained_low_cpu_mem_usage(self):
+        config = BertConfig(
+            vocab_size=99, hidden_size=32, num_hidden_layers=2, num_attention_heads=4, intermediate_size=37
+        )
+        model = BertForMaskedLM(config)
+        model_path = self.get_auto_remove_tmp_dir()
+        model.save_pretrained(model_path)
+
+        # the weights are copied from the checkpoint, which is not mapped anymore once the model is loaded
+        new_model = BertForMaskedLM.from_pretrained(model_path, low_cpu_mem_usage=True)
+        for (name, param), new_param in zip(model.named_parameters(), new_model.parameters()):
+            self.assertTrue(torch.equal(param, new_param), msg=name)
+        if os.path.exists("/proc/self/maps"):
+            with open("/proc/self/maps") as f:
+                mapped_files = [line.split()[-1] for line in f]
+            self.assertNotIn(os.path.join(model_path, WEIGHTS_NAME), mapped_files)
+
+        # the weights are converted to `torch_dtype` when they are materialized
+        new_model = BertForMaskedLM.from_pretrained(model_path, low_cpu_mem_usage=True, torch_dtype=torch.float16)
+        self.assertEqual(set(param.dtype for param in new_model.parameters()), {torch.float16})
+        for (name, param), new_param in zip(model.named_parameters(), new_model.parameters()):
+            self.assertTrue(torch.equal(param.half(), new_param), msg=name)
+
+        # a state dict passed to `from_pretrained` is copied as well
+        state_dict = model.state_dict()
+        new_model = BertForMaskedLM.from_pretrained(None, config=config, state_dict=state_dict, low_cpu_mem_usage=True)
+        word_embeddings = new_model.bert.embeddings.word_embeddings.weight
+        self.assertTrue(torch.equal(word_embeddings, model.bert.embeddings.word_embeddings.weight))
+        self.assertNotEqual(word_embeddings.data_ptr(), model.bert.embeddings.word_embeddings.weight.data_ptr())
+
+        # the state dict passed to `from_pretrained` is not modified by the conversions
+        tensors = dict(state_dict)
+        new_model = BertForMaskedLM.from_pretrained(
+            None, config=config, state_dict=state_dict, low_cpu_mem_usage=True, torch_dtype=torch.float16
+        )
+        self.assertEqual(new_model.bert.embeddings.word_embeddings.weight.dtype, torch.float16)
+        self.assertListEqual(list(state_dict.keys()), list(tensors.keys()))
+        for key, value in state_dict.items():
+            self.assertIs(value, tensors[key], msg=key)
+
+        with self.assertRaises(ValueError):
+            BertModel.from_pretrained(model_path, low_cpu_mem_usage=True, from_tf=True)
+
+    def test_shard_checkpoint(self):
+        # This is the model we will use, total size 340,000 bytes.
+        model = nn.Sequential(
+            nn.Linear(100, 200, bias=False),  # size 80,000
+            nn.Linear(200, 200, bias=False),  # size 160,000
+            nn.Linear(200, 100, bias=False),  # size 80,000
+            nn.Linear(100, 50, bias=False),  # size 20,000
+        )
+        state_dict = model.state_dict()
+
+        # Everything fits in one shard
+        shards, index = shard_checkpoint(state_dict, max_shard_size="1MB")
+        self.assertIsNone(index)
+        self.assertDictEqual(shards, {WEIGHTS_NAME: state_dict})
+
+        # The second weight is bigger than the maximum size and has a shard of its own
+        shards, index = shard_checkpoint(state_dict, max_shard_size="150kB")
+        self.assertDictEqual(
+            index,
+            {
+                "metadata": {"total_size": 340000},
+                "weight_map": {
+                    "0.weight": "pytorch_model-00001-of-00003.bin",
+                    "1.weight": "pytorch_model-00002-of-00003.bin",
+                    "2.weight": "pytorch_model-00003-of-00003.bin",
+                    "3.weight": "pytorch_model-00003-of-00003.bin",
+                },
+            },
+        )
+        self.assertDictEqual(
+            shards,
+            {
+                "pytorch_model-00001-of-00003.bin": {"0.weight": state_dict["0.weight"]},
+                "pytorch_model-00002-of-00003.bin": {"1.weight": state_dict["1.weight"]},
+                "pytorch_model-00003-of-00003.bin": {
+                    "2.weight": state_dict["2.weight"],
+                    "3.weight": state_dict["3.weight"],
+                },
+            },
+        )
+
+    def test_checkpoint_sharding_local(self):
+        config = BertConfig(
+            vocab_size=1000, hidden_size=32, num_hidden_layers=5, num_attention_heads=4, intermediate_size=37
+        )
+        model = BertForMaskedLM(config)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # We use the same folder for various sizes to make sure a new save erases the old checkpoint.
+            for max_size in ["50kB", "100kB", "200kB"]:
+                model.save_pretrained(tmp_dir, max_shard_size=max_size)
+
+                # Get each shard file and its size
+                shard_to_size = {}
+                for shard in os.listdir(tmp_dir):
+                    if shard.endswith(".bin"):
+                        shard_file = os.path.join(tmp_dir, shard)
+                        shard_to_size[shard_file] = os.path.getsize(shard_file)
+
+                index_file = os.path.join(tmp_dir, WEIGHTS_INDEX_NAME)
+                # Check there is an index but no regular weight file
+                self.assertTrue(os.path.isfile(index_file))
+                self.assertFalse(os.path.isfile(os.path.join(tmp_dir, WEIGHTS_NAME)))
+
+                # Check a file is bigger than max_size only when it has a single weight
+                for shard_file, size in shard_to_size.items():
+                    if max_size.endswith("kB"):
+                        max_size_int = int(max_size[:-2]) * 10 ** 3
+                    # Note: pickle adds some junk so the weight of the file can end up being slightly bigger than
+                    # the size asked for (since we count parameters)
+                    if size >= max_size_int + 50000:
+                        state_dict = torch.load(shard_file)
+                        self.assertEqual(len(state_dict), 1)
+
+                # Check the index and the shard files found match
+                with open(index_file, "r", encoding="utf-8") as f:
+                    index = json.loads(f.read())
+
+                all_shards = set(index["weight_map"].values())
+                shards_found = set(f for f in os.listdir(tmp_dir) if f.endswith(".bin"))
+                self.assertSetEqual(all_shards, shards_found)
+
+                # Finally, check the model can be reloaded, the shards being read in parallel or memory-mapped
+                for kwargs in [{}, {"num_loading_workers": 2}, {"use_mmap": True}]:
+                    if kwargs.get("use_mmap") and version.parse(torch.__version__) < version.parse("2.1"):
+                        continue
+                    new_model = BertForMaskedLM.from_pretrained(tmp_dir, **kwargs)
+                    for p1, p2 in zip(model.parameters(), new_model.parameters()):
+                        self.assertTrue(torch.allclose(p1, p2))
+
+            # Saving without sharding removes the shards and the index, but not the other weights files
+            torch.save({}, os.path.join(tmp_dir, "pytorch_model_fp16.bin"))
+            model.save_pretrained(tmp_dir)
+            self.assertListEqual(
+                sorted(f for f in os.listdir(tmp_dir) if f.startswith("pytorch_model")),
+                [WEIGHTS_NAME, "pytorch_model_fp16.bin"],
+            )
+
+            # Only the main process removes the files of a previous save
+            model.save_pretrained(tmp_dir, max_shard_size="100kB", is_main_process=False)
+            self.assertTrue(os.path.isfile(os.path.join(tmp_dir, WEIGHTS_NAME)))
+
+    def test_load_sharded_checkpoint(self):
+        config = BertConfig(
+            vocab_size=1000, hidden_size=32, num_hidden_layers=5, num_attention_heads=4, intermediate_size=37
+        )
+        model = BertForMaskedLM(config)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model.save_pretrained(tmp_dir, max_shard_size="100kB")
+            new_model = BertForMaskedLM(config)
+            load_result = load_sharded_checkpoint(new_model, tmp_dir)
+            self.assertEqual(load_result.missing_keys, [])
+            self.assertEqual(load_result.unexpected_keys, [])
+            for p1, p2 in zip(model.parameters(), new_model.parameters()):
+                self.assertTrue(torch.equal(p1, p2))
+
+            # The base model of BertForMaskedLM has no pooler
+            model.bert.save_pretrained(tmp_dir, max_shard_size="100kB")
+            new_model = BertModel(config)
+            with self.assertRaises(RuntimeError):
+                load_sharded_checkpoint(new_model, tmp_dir)
+            load_result = load_sharded_checkpoint(new_model, tmp_dir, strict=False)
+            self.assertEqual(load_result.missing_keys, ["pooler.dense.weight", "pooler.dense.bias"])
+            self.assertEqual(load_result.unexpected_keys, [])
+            self.assertTrue(
+                torch.equal(new_model.embeddings.word_embeddings.weight, model.bert.embeddings.word_embeddings.weight)
+            )
+
+            # The error names the shard that can't be read
+            with open(os.path.join(tmp_dir, WEIGHTS_INDEX_NAME), "r", encoding="utf-8") as f:
+                shard_file = sorted(set(json.load(f)["weight_map"].values()))[-1]
+            with open(os.path.join(tmp_dir, shard_file), "w") as f:
+                f.write("not a checkpoint")
+            with self.assertRaisesRegex(OSError, shard_file):
+                load_sharded_checkpoint(new_model, tmp_dir, strict=False)
+            with self.assertRaisesRegex(OSError, shard_file):
+                BertModel.from_pretrained(tmp_dir)
+
 
 @require_torch
 @is_staging_test
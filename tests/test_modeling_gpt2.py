@@ -14,6 +14,7 @@
 # limitations under the License.
 
 
+import copy
 import datetime
 import unittest
 
@@ -310,6 +311,71 @@ class GPT2ModelTester:
         # test that outputs are equal for slice
         self.parent.assertTrue(torch.allclose(output_from_past_slice, output_from_no_past_slice, atol=1e-3))
 
+    def create_and_check_gpt2_static_cache_generation(
+        self, config, input_ids, input_mask, head_mask, token_type_ids, *args
+    ):
+        model = GPT2LMHeadModel(config)
+        model.to(torch_device)
+        model.eval()
+
+        max_length = input_ids.shape[-1] + 5
+        for generate_kwargs in [{}, {"num_beams": 2}, {"num_beams": 2, "num_return_sequences": 2}]:
+            output_dynamic_cache = model.generate(
+                input_ids, attention_mask=input_mask, max_length=max_length, **generate_kwargs
+            )
+            output_static_cache = model.generate(
+                input_ids,
+                attention_mask=input_mask,
+                max_length=max_length,
+                cache_implementation="static",
+                **generate_kwargs,
+            )
+            self.parent.assertListEqual(output_dynamic_cache.tolist(), output_static_cache.tolist())
+
+    def create_and_check_gpt2_assisted_generation(
+        self, config, input_ids, input_mask, head_mask, token_type_ids, *args
+    ):
+        torch.manual_seed(0)
+        model = GPT2LMHeadModel(config).to(torch_device).eval()
+        assistant_config = copy.deepcopy(config)
+        assistant_config.n_layer = 1
+        assistant_model = GPT2LMHeadModel(assistant_config).to(torch_device).eval()
+        input_ids = input_ids[:1]
+
+        max_length = input_ids.shape[-1] + 12
+        for generate_kwargs in [{}, {"no_repeat_ngram_size": 2}]:
+            output = model.generate(input_ids, max_length=max_length, **generate_kwargs)
+            output_assisted = model.generate(
+                input_ids, max_length=max_length, assistant_model=assistant_model, **generate_kwargs
+            )
+            self.parent.assertListEqual(output.tolist(), output_assisted.tolist())
+
+        # the other model inputs are rejected, tensors included
+        with self.parent.assertRaisesRegex(ValueError, "token_type_ids"):
+            model.generate(
+                input_ids,
+                max_length=max_length,
+                assistant_model=assistant_model,
+                token_type_ids=torch.zeros_like(input_ids),
+            )
+
+        # an assistant proposing the tokens of the model has all its candidates accepted
+        assistant_model = copy.deepcopy(model)
+        num_forward_passes = []
+        model.register_forward_hook(lambda *args: num_forward_passes.append(1))
+        for do_sample in [False, True]:
+            num_forward_passes.clear()
+            output = model.generate(
+                input_ids,
+                max_length=max_length,
+                do_sample=do_sample,
+                eos_token_id=None,
+                assistant_model=assistant_model,
+                num_assistant_tokens=3,
+            )
+            self.parent.assertEqual(output.shape[-1], max_length)
+            self.parent.assertEqual(len(num_forward_passes), 3)
+
     def create_and_check_lm_head_model(self, config, input_ids, input_mask, head_mask, token_type_ids, *args):
         model = GPT2LMHeadModel(config)
         model.to(torch_device)
@@ -448,6 +514,14 @@ class GPT2ModelTest(ModelTesterMixin, GenerationTesterMixin, unittest.TestCase):
         config_and_inputs = self.model_tester.prepare_config_and_inputs()
         self.model_tester.create_and_check_gpt2_model_past_large_inputs(*config_and_inputs)
 
+    def test_gpt2_static_cache_generation(self):
+        config_and_inputs = self.model_tester.prepare_config_and_inputs()
+        self.model_tester.create_and_check_gpt2_static_cache_generation(*config_and_inputs)
+
+    def test_gpt2_assisted_generation(self):
+        config_and_inputs = self.model_tester.prepare_config_and_inputs()
+        self.model_tester.create_and_check_gpt2_assisted_generation(*config_and_inputs)
+
     def test_gpt2_lm_head_model(self):
         config_and_inputs = self.model_tester.prepare_config_and_inputs()
         self.model_tester.create_and_check_lm_head_model(*config_and_inputs)
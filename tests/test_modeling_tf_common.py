@@ -1458,6 +1458,23 @@ class UtilsFunctionsTest(unittest.TestCase):
         tf.debugging.assert_near(non_inf_output, non_inf_expected_output, rtol=1e-12)
         tf.debugging.assert_equal(non_inf_idx, non_inf_expected_idx)
 
+    @is_pt_tf_cross_test
+    def test_load_sharded_pytorch_checkpoint(self):
+        from transformers import BertModel
+
+        config = BertConfig(
+            vocab_size=99, hidden_size=32, num_hidden_layers=2, num_attention_heads=4, intermediate_size=37
+        )
+        pt_model = BertModel(config)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pt_model.save_pretrained(tmp_dir, max_shard_size="10kB")
+            self.assertFalse(os.path.isfile(os.path.join(tmp_dir, "pytorch_model.bin")))
+            tf_model = TFBertModel.from_pretrained(tmp_dir, from_pt=True)
+
+        np.testing.assert_allclose(
+            tf_model.bert.embeddings.weight.numpy(), pt_model.embeddings.word_embeddings.weight.detach().numpy()
+        )
+
 
 @require_tf
 @is_staging_test
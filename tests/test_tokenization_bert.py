@@ -197,6 +197,34 @@ class BertTokenizationTest(TokenizerTesterMixin, unittest.TestCase):
 
         self.assertListEqual(tokenizer.tokenize("unwantedX running"), ["[UNK]", "runn", "##ing"])
 
+    def test_wordpiece_tokenizer_edge_cases(self):
+        vocab_tokens = ["[UNK]", "##ing", "##in", "run", "r", "##n", "##g"]
+
+        vocab = {}
+        for (i, token) in enumerate(vocab_tokens):
+            vocab[token] = i
+        tokenizer = WordpieceTokenizer(vocab=vocab, unk_token="[UNK]", max_input_chars_per_word=8)
+
+        # "##" tokens can start a word, longest matches are greedy
+        self.assertListEqual(tokenizer.tokenize("##ing running"), ["##ing", "run", "##n", "##ing"])
+        self.assertListEqual(tokenizer.tokenize("rung rng"), ["run", "##g", "r", "##n", "##g"])
+        self.assertListEqual(tokenizer.tokenize("runningrun ing"), ["[UNK]", "[UNK]"])
+
+        # the prefix tables follow the vocabulary
+        vocab["running"] = len(vocab)
+        self.assertListEqual(tokenizer.tokenize("running"), ["running"])
+
+    def test_basic_tokenizer_special_characters(self):
+        tokenizer = BasicTokenizer()
+
+        self.assertListEqual(tokenizer.tokenize("a\x00b\ufffdc\x05d e f"), ["abcd", "e", "f"])
+        self.assertListEqual(tokenizer.tokenize("中文abc中"), ["中", "文", "abc", "中"])
+        self.assertListEqual(tokenizer.tokenize("Ça-va? Crème"), ["ca", "-", "va", "?", "creme"])
+
+        tokenizer = BasicTokenizer(tokenize_chinese_chars=False, do_lower_case=False)
+        self.assertListEqual(tokenizer.tokenize("中文abc中"), ["中文abc中"])
+        self.assertListEqual(tokenizer.tokenize("Ça-va?"), ["Ça", "-", "va", "?"])
+
     def test_is_whitespace(self):
         self.assertTrue(_is_whitespace(" "))
         self.assertTrue(_is_whitespace("\t"))
@@ -0,0 +1,129 @@
+# coding=utf-8
+# Copyright 2021 The HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pickle
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from transformers import BertTokenizer, TokenizationCache
+from transformers.models.bert.tokenization_bert import VOCAB_FILES_NAMES
+from transformers.testing_utils import require_torch
+
+
+class TokenizationCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdirname = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.tmpdirname, "tokenization_cache.sqlite")
+
+        vocab_tokens = ["[UNK]", "[CLS]", "[SEP]", "[PAD]", "[MASK]", "want", "##want", "##ed", "wa", "un", "runn"]
+        vocab_tokens += ["##ing", ",", "low", "lowest"]
+        self.vocab_file = os.path.join(self.tmpdirname, VOCAB_FILES_NAMES["vocab_file"])
+        with open(self.vocab_file, "w", encoding="utf-8") as vocab_writer:
+            vocab_writer.write("".join([x + "\n" for x in vocab_tokens]))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdirname)
+
+    def test_get_and_set(self):
+        cache = TokenizationCache(self.cache_file)
+        key = TokenizationCache.get_key("fingerprint", "unwanted running", {"add_special_tokens": True})
+        self.assertNotEqual(key, TokenizationCache.get_key("fingerprint", "unwanted running", {}))
+        self.assertNotEqual(key, TokenizationCache.get_key("other", "unwanted running", {"add_special_tokens": True}))
+
+        self.assertListEqual(cache.get_many([key]), [None])
+        cache.set_many({key: {"input_ids": [9, 6, 7, 10, 11]}})
+        self.assertListEqual(cache.get_many([key, "missing"]), [{"input_ids": [9, 6, 7, 10, 11]}, None])
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        # The examples are stored on disk and the cache can be pickled
+        cache = pickle.loads(pickle.dumps(cache))
+        self.assertListEqual(cache.get_many([key]), [{"input_ids": [9, 6, 7, 10, 11]}])
+        self.assertListEqual(TokenizationCache(self.cache_file).get_many([key]), [{"input_ids": [9, 6, 7, 10, 11]}])
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_values_are_not_unpickled(self):
+        cache = TokenizationCache(self.cache_file)
+        cache.set_many({"a": {"input_ids": [0, 1]}})
+        with sqlite3.connect(self.cache_file) as connection:
+            connection.execute(
+                "INSERT INTO tokenization_cache VALUES (?, ?, ?)", ("b", pickle.dumps({"input_ids": [2]}), 0.0)
+            )
+
+        # the examples are stored as JSON, a pickled value is a miss
+        self.assertListEqual(cache.get_many(["a", "b"]), [{"input_ids": [0, 1]}, None])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_eviction(self):
+        cache = TokenizationCache(self.cache_file, max_size=3)
+        cache.set_many({"a": {"input_ids": [0]}, "b": {"input_ids": [1]}, "c": {"input_ids": [2]}})
+        # "a" becomes the most recently used example
+        cache.get_many(["a"])
+        cache.set_many({"d": {"input_ids": [3]}})
+
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get_many(["b"])[0])
+        self.assertIsNotNone(cache.get_many(["a"])[0])
+
+    def test_tokenizer_with_cache(self):
+        cache = TokenizationCache(self.cache_file)
+        tokenizer = BertTokenizer(self.vocab_file)
+        cached_tokenizer = BertTokenizer(self.vocab_file, tokenization_cache=cache)
+        sequences = ["UNwantéd,running", "low lowest", "unwanted", "low lowest"]
+
+        for kwargs in [{}, {"padding": True}, {"padding": "max_length", "max_length": 8, "truncation": True}]:
+            expected_encoding = tokenizer(sequences, **kwargs)
+            self.assertDictEqual(dict(cached_tokenizer(sequences, **kwargs)), dict(expected_encoding))
+            self.assertDictEqual(dict(cached_tokenizer(sequences, **kwargs)), dict(expected_encoding))
+            self.assertDictEqual(
+                dict(cached_tokenizer(sequences[0], sequences[1], **kwargs)),
+                dict(tokenizer(sequences[0], sequences[1], **kwargs)),
+            )
+        # Padding is applied to the batch, only the truncation gives new keys
+        self.assertEqual(len(cache), 8)
+        self.assertGreater(cache.hits, 0)
+
+        # The cache is not saved with the tokenizer
+        cached_tokenizer.save_pretrained(self.tmpdirname)
+        self.assertIsNone(BertTokenizer.from_pretrained(self.tmpdirname).tokenization_cache)
+
+    def test_added_tokens_invalidate_cache(self):
+        cache = TokenizationCache(self.cache_file)
+        tokenizer = BertTokenizer(self.vocab_file, tokenization_cache=cache)
+        self.assertListEqual(tokenizer.encode("lowest running", add_special_tokens=False), [14, 10, 11])
+
+        tokenizer.add_tokens(["running"])
+        self.assertListEqual(tokenizer.encode("lowest running", add_special_tokens=False), [14, 15])
+        self.assertEqual(len(cache), 2)
+
+    @require_torch
+    def test_tokenizer_with_cache_tensors(self):
+        cache = TokenizationCache(self.cache_file)
+        tokenizer = BertTokenizer(self.vocab_file)
+        cached_tokenizer = BertTokenizer(self.vocab_file, tokenization_cache=cache)
+        sequences = ["UNwantéd,running", "low lowest"]
+
+        for _ in range(2):
+            encoding = cached_tokenizer(sequences, padding=True, return_tensors="pt")
+            expected_encoding = tokenizer(sequences, padding=True, return_tensors="pt")
+            for key, value in expected_encoding.items():
+                self.assertListEqual(encoding[key].tolist(), value.tolist())
+
+            encoding = cached_tokenizer(sequences[0], return_tensors="pt")
+            self.assertEqual(encoding["input_ids"].shape, (1, 8))
@@ -25,6 +25,9 @@ import unittest
 from collections import OrderedDict
 from itertools import takewhile
 from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
+from unittest.mock import patch
+
+import numpy as np
 
 from huggingface_hub import HfApi
 from requests.exceptions import HTTPError
@@ -41,6 +44,7 @@ from transformers.testing_utils import (
     ENDPOINT_STAGING,
     PASS,
     USER,
+    CaptureLogger,
     get_tests_dir,
     is_pt_tf_cross_test,
     is_staging_test,
@@ -50,6 +54,7 @@ from transformers.testing_utils import (
     slow,
 )
 from transformers.tokenization_utils import AddedToken
+from transformers.utils import logging
 
 
 if TYPE_CHECKING:
@@ -736,6 +741,35 @@ class TokenizerTesterMixin:
 
                 self.assertEqual(text_2, output_text)
 
+    def test_batch_decode(self):
+        tokenizers = self.get_tokenizers()
+        for tokenizer in tokenizers:
+            with self.subTest(f"{tokenizer.__class__.__name__}"):
+                input_text, _ = self.get_input_output_texts(tokenizer)
+                sequences = [
+                    tokenizer.encode(input_text),
+                    tokenizer.encode(input_text, add_special_tokens=False)[:3],
+                    tokenizer.encode(input_text[: len(input_text) // 2]),
+                ]
+
+                for kwargs in [
+                    {},
+                    {"skip_special_tokens": True},
+                    {"clean_up_tokenization_spaces": False, "spaces_between_special_tokens": False},
+                ]:
+                    self.assertListEqual(
+                        tokenizer.batch_decode(sequences, **kwargs),
+                        [tokenizer.decode(sequence, **kwargs) for sequence in sequences],
+                    )
+
+                if is_torch_available():
+                    import torch
+
+                    self.assertListEqual(
+                        tokenizer.batch_decode(torch.tensor([sequences[0], sequences[0]])),
+                        [tokenizer.decode(sequences[0])] * 2,
+                    )
+
     @require_tokenizers
     def test_encode_decode_with_spaces(self):
         tokenizers = self.get_tokenizers(do_lower_case=False)
@@ -1400,6 +1434,46 @@ class TokenizerTesterMixin:
                         pad_to_multiple_of=8,
                     )
 
+    def test_pad_to_buckets(self):
+        tokenizers = self.get_tokenizers()
+        for tokenizer in tokenizers:
+            with self.subTest(f"{tokenizer.__class__.__name__}"):
+                if tokenizer.pad_token is None:
+                    self.skipTest("No padding token.")
+                encoded = tokenizer(["This", "This is a sample input"])
+                longest = max(len(input_ids) for input_ids in encoded["input_ids"])
+
+                padded = tokenizer.pad(encoded, pad_to_buckets=[longest + 10, longest + 3, 1])
+                self.assertEqual({len(input_ids) for input_ids in padded["input_ids"]}, {longest + 3})
+                padded = tokenizer.pad(encoded, pad_to_buckets=[1, 2], pad_to_multiple_of=8)
+                self.assertEqual({len(input_ids) for input_ids in padded["input_ids"]}, {-(-longest // 8) * 8})
+                padded = tokenizer.pad(encoded, padding="max_length", max_length=longest + 1, pad_to_buckets=[100])
+                self.assertEqual({len(input_ids) for input_ids in padded["input_ids"]}, {longest + 1})
+
+                single = tokenizer.pad({"input_ids": encoded["input_ids"][0]}, pad_to_buckets=[longest + 3])
+                self.assertEqual(len(single["input_ids"]), longest + 3)
+
+    def test_pad_to_arrays(self):
+        tokenizers = self.get_tokenizers()
+        for tokenizer in tokenizers:
+            with self.subTest(f"{tokenizer.__class__.__name__}"):
+                if tokenizer.pad_token is None:
+                    self.skipTest("No padding token.")
+                encoded = tokenizer(
+                    ["This", "This is a sample input", ""],
+                    return_special_tokens_mask=True,
+                    return_attention_mask=False,
+                )
+                for padding_side in ["right", "left"]:
+                    tokenizer.padding_side = padding_side
+                    for kwargs in [{}, {"pad_to_multiple_of": 8}, {"padding": "max_length", "max_length": 40}]:
+                        expected = tokenizer.pad(encoded, **kwargs)
+                        padded = tokenizer.pad(encoded, return_tensors="np", **kwargs)
+                        self.assertEqual(set(padded.keys()), set(expected.keys()))
+                        for key, value in expected.items():
+                            self.assertEqual(padded[key].dtype, np.int64)
+                            self.assertListEqual(padded[key].tolist(), value)
+
     def test_encode_plus_with_padding(self):
         tokenizers = self.get_tokenizers(do_lower_case=False)
         for tokenizer in tokenizers:
@@ -1626,6 +1700,38 @@ class TokenizerTesterMixin:
                         encoded_sequences_batch_padded_2[key],
                     )
 
+    def test_batch_encode_plus_num_proc(self):
+        if not self.test_slow_tokenizer:
+            return
+
+        tokenizer = self.get_tokenizer()
+        sequences = self._data.split("\n")
+        sequence_pairs = list(zip(sequences[1:], sequences[:-1]))
+
+        # use two processes whatever the size of the batch and the number of CPUs
+        with patch("transformers.tokenization_utils.MIN_CHARACTERS_PER_PROCESS", 1), patch(
+            "transformers.tokenization_utils.cpu_count", lambda: 2
+        ):
+            for batch in [sequences, sequence_pairs]:
+                encoded_sequences_batch = tokenizer.batch_encode_plus(batch, num_proc=2)
+                self.assertDictEqual(dict(encoded_sequences_batch), dict(tokenizer.batch_encode_plus(batch)))
+
+    def test_num_proc_ignored(self):
+        logger = logging.get_logger("transformers.tokenization_utils_base")
+        sequences = self._data.split("\n")[:4]
+
+        for tokenizer in self.get_tokenizers(do_lower_case=False):
+            with self.subTest(f"{tokenizer.__class__.__name__}"):
+                with CaptureLogger(logger) as cl:
+                    encoded_sequence = tokenizer(sequences[0], num_proc=2)
+                    tokenizer(sequences[1], num_proc=2)
+                self.assertDictEqual(dict(encoded_sequence), dict(tokenizer(sequences[0])))
+                self.assertEqual(cl.out.count("`num_proc` is ignored"), 1)
+
+                if tokenizer.is_fast:
+                    encoded_sequences_batch = tokenizer(sequences, num_proc=2)
+                    self.assertDictEqual(dict(encoded_sequences_batch), dict(tokenizer(sequences)))
+
     @require_tokenizers
     def test_added_token_serializable(self):
         tokenizers = self.get_tokenizers(do_lower_case=False)
@@ -2127,6 +2233,45 @@ class TokenizerTesterMixin:
                 self.assertRaises(TypeError, tokenizer_r.encode_plus, None)
                 self.assertRaises(TypeError, tokenizer_r.batch_encode_plus, None)
 
+    @require_torch
+    def test_batch_encode_plus_arrays_fast(self):
+        for tokenizer, pretrained_name, kwargs in self.tokenizers_list:
+            with self.subTest(f"{tokenizer.__class__.__name__} ({pretrained_name})"):
+                tokenizer_r = self.rust_tokenizer_class.from_pretrained(pretrained_name, **kwargs)
+                if tokenizer_r.pad_token is None:
+                    tokenizer_r.add_special_tokens({"pad_token": "<PAD>"})
+
+                sequences = ["Wonderful no inspiration", "Wonderful no inspiration example with subtoken"]
+                sequence_pairs = list(zip(sequences, sequences[::-1]))
+                return_kwargs = {
+                    "return_token_type_ids": True,
+                    "return_attention_mask": True,
+                    "return_special_tokens_mask": True,
+                    "return_offsets_mapping": True,
+                    "return_length": True,
+                }
+                for batch in [sequences, sequence_pairs]:
+                    encoded_lists = tokenizer_r.batch_encode_plus(batch, padding=True, **return_kwargs)
+                    encoded_arrays = tokenizer_r.batch_encode_plus(
+                        batch, padding=True, return_tensors="np", **return_kwargs
+                    )
+                    encoded_tensors = tokenizer_r.batch_encode_plus(
+                        batch, padding=True, return_tensors="pt", **return_kwargs
+                    )
+
+                    self.assertListEqual(list(encoded_arrays.keys()), list(encoded_lists.keys()))
+                    self.assertListEqual(list(encoded_tensors.keys()), list(encoded_lists.keys()))
+                    for key, value in encoded_lists.items():
+                        expected_value = (
+                            [list(map(list, item)) for item in value] if key == "offset_mapping" else value
+                        )
+                        self.assertEqual(encoded_arrays[key].tolist(), expected_value)
+                        self.assertEqual(encoded_tensors[key].tolist(), expected_value)
+                    self.assertEqual(len(encoded_arrays.encodings), len(batch))
+
+                # A Tensor still cannot be build by sequences which are not the same size
+                self.assertRaises(ValueError, tokenizer_r.batch_encode_plus, sequences, return_tensors="pt")
+
     def test_alignement_methods(self):
         for tokenizer, pretrained_name, kwargs in self.tokenizers_list:
             with self.subTest(f"{tokenizer.__class__.__name__} ({pretrained_name})"):
@@ -15,8 +15,10 @@
 """
 isort:skip_file
 """
+import json
 import os
 import pickle
+import random
 import tempfile
 import unittest
 from typing import Callable, Optional
@@ -27,15 +29,19 @@ import numpy as np
 from transformers import PreTrainedTokenizerFast
 
 from transformers import (
+    AddedToken,
     BatchEncoding,
     BertTokenizer,
     BertTokenizerFast,
+    IncrementalDecoder,
     PreTrainedTokenizer,
     TensorType,
     TokenSpan,
     is_tokenizers_available,
 )
+from transformers.models.bert.tokenization_bert import VOCAB_FILES_NAMES
 from transformers.models.gpt2.tokenization_gpt2 import GPT2Tokenizer
+from transformers.tokenization_utils import BPECache, Trie, bpe_merge
 from transformers.testing_utils import CaptureStderr, require_flax, require_tf, require_tokenizers, require_torch, slow
 
 
@@ -285,3 +291,335 @@ class TokenizerUtilsTest(unittest.TestCase):
         with tempfile.TemporaryDirectory() as tmpdirname:
             bert_tokenizer.save(os.path.join(tmpdirname, "tokenizer.json"))
             PreTrainedTokenizerFast(tokenizer_file=os.path.join(tmpdirname, "tokenizer.json"))
+
+
+class TrieTest(unittest.TestCase):
+    @staticmethod
+    def _get_tokenizer():
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            vocab_file = os.path.join(tmpdirname, VOCAB_FILES_NAMES["vocab_file"])
+            with open(vocab_file, "w", encoding="utf-8") as vocab_writer:
+                vocab_writer.write("\n".join(["[UNK]", "[CLS]", "[SEP]", "hello", "world", "!", "test", "##ing"]))
+            return BertTokenizer(vocab_file)
+
+    @staticmethod
+    def _reference_tokenize(tokenizer, text):
+        # tokenize before the trie: the text is split once per added token
+        all_special_tokens_extended = dict(
+            (str(t), t) for t in tokenizer.all_special_tokens_extended if isinstance(t, AddedToken)
+        )
+
+        def split_on_token(tok, text):
+            result = []
+            tok_extended = all_special_tokens_extended.get(tok, None)
+            split_text = text.split(tok)
+            for i, sub_text in enumerate(split_text):
+                if isinstance(tok_extended, AddedToken):
+                    if tok_extended.rstrip and i > 0:
+                        sub_text = sub_text.lstrip()
+                    if tok_extended.lstrip and i < len(split_text) - 1:
+                        sub_text = sub_text.rstrip()
+                else:
+                    if i < len(split_text) - 1:
+                        sub_text = sub_text.rstrip()
+                    if i > 0:
+                        sub_text = sub_text.lstrip()
+
+                if i == 0 and not sub_text:
+                    result.append(tok)
+                elif i == len(split_text) - 1:
+                    if sub_text:
+                        result.append(sub_text)
+                else:
+                    if sub_text:
+                        result.append(sub_text)
+                    result.append(tok)
+            return result
+
+        text_list = [text]
+        for tok in tokenizer.unique_no_split_tokens:
+            tokenized_text = []
+            for sub_text in text_list:
+                if sub_text not in tokenizer.unique_no_split_tokens:
+                    tokenized_text.extend(split_on_token(tok, sub_text))
+                else:
+                    tokenized_text.append(sub_text)
+            text_list = tokenized_text
+
+        tokens = []
+        for token in text_list:
+            tokens.extend(tokenizer._tokenize(token) if token not in tokenizer.unique_no_split_tokens else [token])
+        return tokens
+
+    def test_trie_split(self):
+        trie = Trie(["[CLS]", "extra_id_1", "extra_id_100"])
+        self.assertEqual(len(trie), 3)
+        self.assertListEqual(
+            trie.split("[CLS] This is a extra_id_100"), ["", "[CLS]", " This is a ", "extra_id_1", "00"]
+        )
+        self.assertListEqual(trie.split("extra_id_10extra_id_1"), ["", "extra_id_1", "0", "extra_id_1", ""])
+        self.assertListEqual(trie.split("no added token"), ["no added token"])
+        self.assertListEqual(Trie().split("no added token"), ["no added token"])
+
+    def test_trie_overlapping_words(self):
+        # the words are extracted in alphabetical order, each one in the text left by the previous ones
+        trie = Trie(["A", "AB", "ABC", "BCD"])
+        trie.add("AB")
+        self.assertEqual(len(trie), 4)
+        self.assertListEqual(trie.split("ABCD"), ["", "A", "", "BCD", ""])
+        self.assertListEqual(trie.split("xBCDA"), ["x", "BCD", "", "A", ""])
+        trie = Trie(["AB", "BC", "CD"])
+        self.assertListEqual(trie.split("BCD ABC"), ["", "BC", "D ", "AB", "C"])
+        self.assertListEqual(trie.split("ABCD"), ["", "AB", "", "CD", ""])
+        self.assertListEqual(Trie(["aa"]).split("aaa"), ["", "aa", "a"])
+
+    def test_tokenize_with_added_tokens(self):
+        tokenizer = self._get_tokenizer()
+        tokenizer.add_tokens(["<new>", "<new_token>"])
+        self.assertListEqual(
+            tokenizer.tokenize("hello <new_token> world<new>!"), ["hello", "<new_token>", "world", "<new>", "!"]
+        )
+
+        # many added tokens are handled in a single pass
+        tokenizer.add_tokens([f"<domain_{i}>" for i in range(2000)])
+        self.assertListEqual(
+            tokenizer.tokenize("hello<domain_1999> <domain_19>world"),
+            ["hello", "<domain_1999>", "<domain_19>", "world"],
+        )
+
+    def test_tokenize_overlapping_added_tokens(self):
+        tokenizer = self._get_tokenizer()
+        tokenizer.add_tokens(["extra_id_1", "extra_id_100", "id_10", "xtra", "abc", "bcd", "aa"])
+        texts = [
+            "hello extra_id_100 world",
+            "extra_id_10extra_id_1!",
+            "testextra_id_100 id_100",
+            "abcd bcd abc",
+            "aaa aaaa hello",
+            "[CLS] extra [SEP]",
+        ]
+        for text in texts:
+            self.assertListEqual(tokenizer.tokenize(text), self._reference_tokenize(tokenizer, text))
+
+    def test_tokenize_single_word_added_tokens(self):
+        tokenizer = self._get_tokenizer()
+        tokenizer.add_tokens(["<new>"])
+        tokenizer.add_tokens([AddedToken("<keep>", lstrip=False, rstrip=False)], special_tokens=True)
+        tokenizer.add_special_tokens(
+            {"additional_special_tokens": [AddedToken("ing", single_word=True), AddedToken("<keep>")]}
+        )
+        texts = [
+            "hello <keep> world",
+            "testing ing!",
+            "hello ingtest world",
+            "test ing test",
+            "hello!ing<new> world",
+        ]
+        for text in texts:
+            self.assertListEqual(tokenizer.tokenize(text), self._reference_tokenize(tokenizer, text))
+
+        # the token is kept in the word only when it is inside the word on both sides
+        self.assertListEqual(tokenizer.tokenize("testingtest"), ["[UNK]"])
+        # the split loop raised an IndexError when the token was at the start or the end of the text
+        self.assertListEqual(tokenizer.tokenize("ingtest"), ["ing", "test"])
+        self.assertListEqual(tokenizer.tokenize("testing"), ["test", "ing"])
+
+    def test_tokenize_modified_no_split_tokens(self):
+        tokenizer = self._get_tokenizer()
+        tokenizer.tokenize("hello world")
+        # the trie follows the direct modifications of unique_no_split_tokens
+        tokenizer.unique_no_split_tokens = ["lowor"]
+        self.assertListEqual(tokenizer.tokenize("hellowor"), ["[UNK]", "lowor"])
+        tokenizer.unique_no_split_tokens.append("hel")
+        self.assertListEqual(tokenizer.tokenize("hellowor"), ["hel", "lowor"])
+        tokenizer.unique_no_split_tokens = []
+        self.assertListEqual(tokenizer.tokenize("hellowor"), ["[UNK]"])
+
+    def test_tokenize_after_unpickling_without_trie(self):
+        tokenizer = self._get_tokenizer()
+        tokenizer.add_tokens(["<new>"])
+        # the attributes of a tokenizer pickled before the trie and the lookup tables were added
+        state = tokenizer.__dict__.copy()
+        for attr in list(state):
+            if attr.startswith(("_tokens_trie", "_tokenize_special_tokens", "_ids_to_tokens_table")):
+                del state[attr]
+        old_tokenizer = BertTokenizer.__new__(BertTokenizer)
+        old_tokenizer.__dict__.update(state)
+        old_tokenizer = pickle.loads(pickle.dumps(old_tokenizer))
+
+        self.assertListEqual(old_tokenizer.tokenize("hello<new> world"), ["hello", "<new>", "world"])
+        self.assertEqual(old_tokenizer.decode(old_tokenizer.encode("hello<new>")), "[CLS] hello <new> [SEP]")
+
+    def test_tokenize_lower_case_with_special_tokens(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            vocab_file = os.path.join(tmpdirname, VOCAB_FILES_NAMES["vocab_file"])
+            with open(vocab_file, "w", encoding="utf-8") as vocab_writer:
+                vocab_writer.write("\n".join(["[UNK]", "[CLS]", "[SEP]", "[MASK]", "hello", "world", "!"]))
+            tokenizer = BertTokenizer(vocab_file, do_lower_case=True)
+
+        self.assertListEqual(tokenizer.tokenize("HELLO [MASK] World!"), ["hello", "[MASK]", "world", "!"])
+        # the special tokens structures are rebuilt when the special tokens change
+        tokenizer.add_special_tokens({"additional_special_tokens": ["<NEW>"]})
+        self.assertListEqual(tokenizer.tokenize("HELLO<NEW>World"), ["hello", "<NEW>", "world"])
+        tokenizer.add_special_tokens({"mask_token": "<Mask>"})
+        self.assertListEqual(tokenizer.tokenize("HELLO <Mask>"), ["hello", "<Mask>"])
+        # "<NEW>" is lowercased once it is no longer a special token, so it doesn't match the added token anymore
+        tokenizer.additional_special_tokens = []
+        self.assertListEqual(tokenizer.tokenize("HELLO<NEW>"), ["hello", "[UNK]", "[UNK]", "[UNK]"])
+
+
+class DecodeUtilsTest(unittest.TestCase):
+    @staticmethod
+    def _reference_clean_up_tokenization(out_string):
+        # clean_up_tokenization before the single pass
+        return (
+            out_string.replace(" .", ".")
+            .replace(" ?", "?")
+            .replace(" !", "!")
+            .replace(" ,", ",")
+            .replace(" ' ", "'")
+            .replace(" n't", "n't")
+            .replace(" 'm", "'m")
+            .replace(" 's", "'s")
+            .replace(" 've", "'ve")
+            .replace(" 're", "'re")
+        )
+
+    def test_clean_up_tokenization(self):
+        texts = [
+            "Hello , world !",
+            "I do n't know , is n't it ?",
+            "you 're right , I 'm sure it 's what we 've said .",
+            "a  ' s",
+            "do ' n't",
+            " n ' ta ?",
+            "x ' .",
+            "rock ' n ' roll",
+            "  . .  ,",
+        ]
+        for text in texts:
+            self.assertEqual(
+                PreTrainedTokenizer.clean_up_tokenization(text), self._reference_clean_up_tokenization(text)
+            )
+
+    def test_incremental_decoder(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            vocab_file = os.path.join(tmpdirname, VOCAB_FILES_NAMES["vocab_file"])
+            with open(vocab_file, "w", encoding="utf-8") as vocab_writer:
+                vocab_writer.write("\n".join(["[UNK]", "[CLS]", "[SEP]", "hello", "world", "!", "test", "##ing", ","]))
+            tokenizer = BertTokenizer(vocab_file)
+
+        token_ids = tokenizer.encode("hello, world testing! hello test")
+        for decode_kwargs in [{}, {"skip_special_tokens": True}]:
+            decoder = IncrementalDecoder(tokenizer, **decode_kwargs)
+            text = "".join(decoder.add([token_id]) for token_id in token_ids) + decoder.flush()
+            self.assertEqual(text, tokenizer.decode(token_ids, **decode_kwargs))
+
+        # the text of the prefix is not returned
+        decoder = IncrementalDecoder(tokenizer, prefix_token_ids=token_ids[:3], skip_special_tokens=True)
+        text = decoder.add(token_ids[3:5]) + decoder.add(token_ids[5:]) + decoder.flush()
+        self.assertEqual(text, tokenizer.decode(token_ids, skip_special_tokens=True)[len("hello,") :])
+
+        decoder.reset()
+        self.assertEqual(decoder.add(token_ids[1:2]) + decoder.flush(), "hello")
+
+    def test_incremental_decoder_incomplete_characters(self):
+        # "Ã" and "©" are the byte-level tokens of the two bytes of "é"
+        vocab = ["Ã", "©", "a", "Ġ", "<|endoftext|>"]
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            vocab_file = os.path.join(tmpdirname, "vocab.json")
+            merges_file = os.path.join(tmpdirname, "merges.txt")
+            with open(vocab_file, "w", encoding="utf-8") as fp:
+                fp.write(json.dumps(dict(zip(vocab, range(len(vocab))))))
+            with open(merges_file, "w", encoding="utf-8") as fp:
+                fp.write("#version: 0.2\n")
+            tokenizer = GPT2Tokenizer(vocab_file, merges_file)
+
+        decoder = IncrementalDecoder(tokenizer)
+        self.assertEqual(decoder.add([2]), "a")
+        self.assertEqual(decoder.add([3, 0]), "")
+        self.assertEqual(decoder.add([1]), " é")
+        self.assertEqual(decoder.add([0]), "")
+        self.assertEqual(decoder.flush(), "�")
+
+
+class BPEUtilsTest(unittest.TestCase):
+    @staticmethod
+    def _reference_bpe_merge(word, bpe_ranks):
+        # the merge loop of the slow BPE tokenizers before bpe_merge
+        while len(word) > 1:
+            pairs = set(zip(word[:-1], word[1:]))
+            bigram = min(pairs, key=lambda pair: bpe_ranks.get(pair, float("inf")))
+            if bigram not in bpe_ranks:
+                break
+            first, second = bigram
+            new_word = []
+            i = 0
+            while i < len(word):
+                if word[i] == first and i < len(word) - 1 and word[i + 1] == second:
+                    new_word.append(first + second)
+                    i += 2
+                else:
+                    new_word.append(word[i])
+                    i += 1
+            word = tuple(new_word)
+        return word
+
+    def test_bpe_merge_matches_reference(self):
+        rng = random.Random(0)
+        alphabet = "abcd"
+        symbols = list(alphabet)
+        merges = []
+        for _ in range(30):
+            merge = (rng.choice(symbols), rng.choice(symbols))
+            if merge not in merges:
+                merges.append(merge)
+                symbols.append(merge[0] + merge[1])
+        for bpe_ranks in [dict(zip(merges, range(len(merges)))), dict(zip(merges[::-1], range(len(merges))))]:
+            for _ in range(300):
+                word = tuple(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+                self.assertEqual(bpe_merge(word, bpe_ranks), self._reference_bpe_merge(word, bpe_ranks))
+
+        bpe_ranks = {("a", "a"): 0, ("aa", "a"): 1, ("b", "aa"): 2}
+        self.assertEqual(bpe_merge(tuple("aaaaa"), bpe_ranks), ("aa", "aaa"))
+        self.assertEqual(bpe_merge(tuple("baaa"), bpe_ranks), ("b", "aaa"))
+
+    def test_bpe_cache(self):
+        cache = BPECache(max_size=2)
+        cache["hello"] = "hel lo"
+        cache["world"] = "wor ld"
+        self.assertEqual(cache.get("hello"), "hel lo")
+        self.assertIsNone(cache.get("unknown"))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # "world" is the least recently used word
+        cache["tokenizer"] = "token izer"
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn("world", cache)
+        self.assertEqual(cache["hello"], "hel lo")
+        with self.assertRaises(KeyError):
+            cache["world"]
+
+        restored_cache = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(restored_cache.get("tokenizer"), "token izer")
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_bpe_cache_shared_between_tokenizers(self):
+        vocab = ["l", "o", "w", "e", "r", "\u0120", "\u0120l", "\u0120lo", "\u0120low", "er", "<unk>"]
+        merges = ["#version: 0.2", "\u0120 l", "\u0120l o", "\u0120lo w", "e r", ""]
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            vocab_file = os.path.join(tmpdirname, "vocab.json")
+            merges_file = os.path.join(tmpdirname, "merges.txt")
+            with open(vocab_file, "w", encoding="utf-8") as fp:
+                fp.write(json.dumps(dict(zip(vocab, range(len(vocab))))))
+            with open(merges_file, "w", encoding="utf-8") as fp:
+                fp.write("\n".join(merges))
+            tokenizer = GPT2Tokenizer(vocab_file, merges_file, unk_token="<unk>")
+            other_tokenizer = GPT2Tokenizer(vocab_file, merges_file, unk_token="<unk>")
+
+        other_tokenizer.cache = tokenizer.cache
+        self.assertListEqual(tokenizer.tokenize(" lower"), ["\u0120low", "er"])
+        self.assertListEqual(other_tokenizer.tokenize(" lower"), ["\u0120low", "er"])
+        self.assertEqual((tokenizer.cache.hits, tokenizer.cache.misses), (1, 1))
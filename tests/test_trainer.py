@@ -20,7 +20,9 @@ import random
 import re
 import tempfile
 import unittest
+from functools import partialmethod
 from pathlib import Path
+from unittest.mock import patch
 
 import numpy as np
 
@@ -34,7 +36,7 @@ from transformers import (
     is_torch_available,
     logging,
 )
-from transformers.file_utils import WEIGHTS_NAME
+from transformers.file_utils import WEIGHTS_INDEX_NAME, WEIGHTS_NAME
 from transformers.testing_utils import (
     ENDPOINT_STAGING,
     PASS,
@@ -800,6 +802,30 @@ class TrainerIntegrationTest(TestCasePlus, TrainerIntegrationCommon):
         self.assertTrue("No valid checkpoint found in output directory" in str(context.exception))
 
     @require_torch_non_multi_gpu
+    def test_resume_training_with_shard_checkpoint(self):
+        # The checkpoints are saved with one shard per weight
+        save_sharded = partialmethod(PreTrainedModel.save_pretrained, max_shard_size=1)
+        with tempfile.TemporaryDirectory() as tmpdir, patch.object(PreTrainedModel, "save_pretrained", save_sharded):
+            kwargs = dict(output_dir=tmpdir, train_len=128, save_steps=5, learning_rate=0.1)
+            trainer = get_regression_trainer(**kwargs)
+            trainer.train()
+            (a, b) = trainer.model.a.item(), trainer.model.b.item()
+            state = dataclasses.asdict(trainer.state)
+
+            checkpoint = os.path.join(tmpdir, "checkpoint-5")
+            self.assertTrue(os.path.isfile(os.path.join(checkpoint, WEIGHTS_INDEX_NAME)))
+            self.assertFalse(os.path.isfile(os.path.join(checkpoint, WEIGHTS_NAME)))
+
+            # Reinitialize trainer
+            trainer = get_regression_trainer(**kwargs)
+
+            trainer.train(resume_from_checkpoint=checkpoint)
+            (a1, b1) = trainer.model.a.item(), trainer.model.b.item()
+            state1 = dataclasses.asdict(trainer.state)
+            self.assertEqual(a, a1)
+            self.assertEqual(b, b1)
+            self.check_trainer_state_are_the_same(state, state1)
+
     def test_resume_training_with_randomness(self):
         # This test will fail flakily for more than 1 GPUs since the result will be slightly more different
         # TODO: investigate why it fails for 2 GPUs?
@@ -905,6 +931,24 @@ class TrainerIntegrationTest(TestCasePlus, TrainerIntegrationCommon):
             self.assertEqual(b, b1)
             self.check_trainer_state_are_the_same(state, state1)
 
+    def test_load_best_model_at_end_with_shard_checkpoint(self):
+        total = int(self.n_epochs * 64 / self.batch_size)
+        # The checkpoints are saved with one shard per weight
+        save_sharded = partialmethod(PreTrainedModel.save_pretrained, max_shard_size=1)
+        with tempfile.TemporaryDirectory() as tmpdir, patch.object(PreTrainedModel, "save_pretrained", save_sharded):
+            trainer = get_regression_trainer(
+                a=1.5,
+                b=2.5,
+                output_dir=tmpdir,
+                learning_rate=0.1,
+                eval_steps=5,
+                evaluation_strategy="steps",
+                load_best_model_at_end=True,
+            )
+            trainer.train()
+            self.assertTrue(os.path.isfile(os.path.join(tmpdir, "checkpoint-5", WEIGHTS_INDEX_NAME)))
+            self.check_best_model_has_been_loaded(tmpdir, 5, total, trainer, "eval_loss")
+
     def test_load_best_model_at_end(self):
         total = int(self.n_epochs * 64 / self.batch_size)
         with tempfile.TemporaryDirectory() as tmpdir: